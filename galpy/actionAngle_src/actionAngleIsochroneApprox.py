@@ -18,10 +18,12 @@ import numpy as nu
 import numpy.linalg as linalg
 from scipy import optimize
 from galpy.potential import dvcircdR, vcirc, _isNonAxi
+from galpy.potential_src.Potential import _check_c
 from galpy.actionAngle_src.actionAngleIsochrone import actionAngleIsochrone
 from galpy.actionAngle_src.actionAngle import actionAngle
 from galpy.potential import IsochronePotential, MWPotential
-from galpy.util import bovy_plot, galpyWarning
+from galpy.util import galpyWarning, multi, LazyModule
+bovy_plot= LazyModule('galpy.util.bovy_plot')
 from galpy.util.bovy_conversion import physical_conversion, \
     potential_physical_input, time_in_Gyr
 _TWOPI= 2.*nu.pi
@@ -61,6 +63,8 @@ class actionAngleIsochroneApprox(actionAngle):
 
            maxn= (default: 3) Default value for all methods when using a grid in vec(n) up to this n (zero-based)
 
+           chunksize= (default: 100) maximum number of objects to integrate and angle-fit at once; larger inputs are processed in chunks of this size, such that the memory use stays bounded
+
            ro= distance from vantage point to GC (kpc; can be Quantity)
 
            vo= circular velocity at ro (km/s; can be Quantity)
@@ -108,6 +112,7 @@ class actionAngleIsochroneApprox(actionAngle):
         self._tsJ= nu.linspace(0.,self._tintJ,self._ntintJ)
         self._integrate_method= kwargs.get('integrate_method','dopr54_c')
         self._maxn= kwargs.get('maxn',3)
+        self._chunksize= kwargs.get('chunksize',100)
         self._c= False
         ext_loaded= False
         if ext_loaded and (('c' in kwargs and kwargs['c'])
@@ -133,14 +138,23 @@ class actionAngleIsochroneApprox(actionAngle):
                  3) numpy.ndarray: [N,M] phase-space values for N objects at M
                     times
               b) Orbit instance or list thereof; can be integrated already
+           numcores= (None) if set, integrate the orbits in a pool of this many threads
+           executor= (None) concurrent.futures.Executor to integrate the orbits with
            cumul= if True, return the cumulative average actions (to look 
                   at convergence)
         OUTPUT:
            (jr,lz,jz)
         HISTORY:
            2013-09-10 - Written - Bovy (IAS)
+           2026-10-17 - Process large inputs in chunks of objects
         """
-        R,vR,vT,z,vz,phi= self._parse_args(False,False,*args)
+        chunks= self._chunk_args(args,kwargs)
+        if not chunks is None:
+            return _concatenate_chunks([self._evaluate(*c,**kwargs)
+                                        for c in chunks])
+        R,vR,vT,z,vz,phi= self._parse_args(False,False,*args,
+                                           numcores=kwargs.get('numcores',None),
+                                           executor=kwargs.get('executor',None))
         if self._c: #pragma: no cover
             pass
         else:
@@ -195,6 +209,8 @@ class actionAngleIsochroneApprox(actionAngle):
                  3) numpy.ndarray: [N,M] phase-space values for N objects at M
                     times
               b) Orbit instance or list thereof; can be integrated already
+           numcores= (None) if set, integrate the orbits in a pool of this many threads
+           executor= (None) concurrent.futures.Executor to integrate the orbits with
         OUTPUT:
             (jr,lz,jz,Omegar,Omegaphi,Omegaz)
         HISTORY:
@@ -218,6 +234,8 @@ class actionAngleIsochroneApprox(actionAngle):
                  3) numpy.ndarray: [N,M] phase-space values for N objects at M
                     times
               b) Orbit instance or list thereof; can be integrated already
+           numcores= (None) if set, integrate the orbits in a pool of this many threads
+           executor= (None) concurrent.futures.Executor to integrate the orbits with
            maxn= (default: object-wide default) Use a grid in vec(n) up to this n (zero-based)
            ts= if set, the phase-space points correspond to these times (IF NOT SET, WE ASSUME THAT ts IS THAT THAT IS ASSOCIATED WITH THIS OBJECT)
            _firstFlip= (False) if True and Orbits are given, the backward part of the orbit is integrated first and stored in the Orbit object
@@ -225,8 +243,13 @@ class actionAngleIsochroneApprox(actionAngle):
             (jr,lz,jz,Omegar,Omegaphi,Omegaz,angler,anglephi,anglez)
         HISTORY:
            2013-09-10 - Written - Bovy (IAS)
+           2026-10-17 - Process large inputs in chunks of objects and do the angle-fit without tiling
         """
         from galpy.orbit import Orbit
+        chunks= self._chunk_args(args,kwargs)
+        if not chunks is None:
+            return _concatenate_chunks([self._actionsFreqsAngles(*c,**kwargs)
+                                        for c in chunks])
         _firstFlip= kwargs.get('_firstFlip',False)
         #If the orbit was already integrated, set ts to the integration times
         if isinstance(args[0],Orbit) and hasattr(args[0]._orb,'orbit') \
@@ -236,7 +259,9 @@ class actionAngleIsochroneApprox(actionAngle):
                 and hasattr(args[0][0]._orb,'orbit')  \
                 and not 'ts' in kwargs:
             kwargs['ts']= args[0][0]._orb.t
-        R,vR,vT,z,vz,phi= self._parse_args(True,_firstFlip,*args)
+        R,vR,vT,z,vz,phi= self._parse_args(True,_firstFlip,*args,
+                                           numcores=kwargs.get('numcores',None),
+                                           executor=kwargs.get('executor',None))
         if 'ts' in kwargs and not kwargs['ts'] is None:
             ts= kwargs['ts']
             if _APY_LOADED and isinstance(ts,units.Quantity):
@@ -301,7 +326,7 @@ class actionAngleIsochroneApprox(actionAngle):
                 nn= (2*maxn-1)**2*maxn-(maxn-1)*(2*maxn-1)-maxn
             else:
                 nn= maxn*(2*maxn-1)-maxn 
-            A= nu.zeros((no,nt,2+nn))
+            A= nu.empty((no,nt,2+nn))
             A[:,:,0]= 1.
             A[:,:,1]= ts
             #sorting the phi and Z grids this way makes it easy to exclude the origin
@@ -324,26 +349,20 @@ class actionAngleIsochroneApprox(actionAngle):
                 mask[:2*maxn-3:2]= False
             gridR= gridR[mask]
             gridZ= gridZ[mask]
-            tangleR= nu.tile(angleRT.T,(nn,1,1)).T
-            tgridR= nu.tile(gridR,(no,nt,1))
-            tangleZ= nu.tile(angleZT.T,(nn,1,1)).T
-            tgridZ= nu.tile(gridZ,(no,nt,1))
+            #Broadcast the angles [no,nt,1] against the n grid [nn]
             if _isNonAxi(self._pot):
                 gridphi= gridphi[mask]
-                tgridphi= nu.tile(gridphi,(no,nt,1))
-                tanglephi= nu.tile(anglephiT.T,(nn,1,1)).T
-                sinnR= nu.sin(tgridR*tangleR+tgridphi*tanglephi+tgridZ*tangleZ)
+                A[:,:,2:]= nu.sin(gridR*angleRT[:,:,None]
+                                  +gridphi*anglephiT[:,:,None]
+                                  +gridZ*angleZT[:,:,None])
             else:
-                sinnR= nu.sin(tgridR*tangleR+tgridZ*tangleZ)
-            A[:,:,2:]= sinnR
+                A[:,:,2:]= nu.sin(gridR*angleRT[:,:,None]
+                                  +gridZ*angleZT[:,:,None])
             #Matrix magic
-            atainv= nu.empty((no,2+nn,2+nn))
-            AT= nu.transpose(A,axes=(0,2,1))
-            for ii in range(no):
-                atainv[ii,:,:,]= linalg.inv(nu.dot(AT[ii,:,:],A[ii,:,:]))
-            ATAR= nu.sum(AT*nu.transpose(nu.tile(angleRT,(2+nn,1,1)),axes=(1,0,2)),axis=2)
-            ATAT= nu.sum(AT*nu.transpose(nu.tile(anglephiT,(2+nn,1,1)),axes=(1,0,2)),axis=2)
-            ATAZ= nu.sum(AT*nu.transpose(nu.tile(angleZT,(2+nn,1,1)),axes=(1,0,2)),axis=2)
+            atainv= linalg.inv(nu.einsum('ijk,ijl->ikl',A,A))
+            ATAR= nu.einsum('ijk,ij->ik',A,angleRT)
+            ATAT= nu.einsum('ijk,ij->ik',A,anglephiT)
+            ATAZ= nu.einsum('ijk,ij->ik',A,angleZT)
             angleR= nu.sum(atainv[:,0,:]*ATAR,axis=1)
             OmegaR= nu.sum(atainv[:,1,:]*ATAR,axis=1)
             anglephi= nu.sum(atainv[:,0,:]*ATAT,axis=1)
@@ -574,10 +593,9 @@ class actionAngleIsochroneApprox(actionAngle):
                                     **kwargs)           
         return None
 
-    def _parse_args(self,freqsAngles=True,_firstFlip=False,*args):
+    def _parse_args(self,freqsAngles=True,_firstFlip=False,*args,**kwargs):
         """Helper function to parse the arguments to the __call__ and actionsFreqsAngles functions"""
         from galpy.orbit import Orbit
-        RasOrbit= False
         integrated= True #whether the orbit was already integrated when given
         if len(args) == 5 or len(args) == 3: #pragma: no cover
             raise IOError("Must specify phi for actionAngleIsochroneApprox")
@@ -587,20 +605,26 @@ class actionAngleIsochroneApprox(actionAngle):
             else:
                 R,vR,vT, phi= args
                 z, vz= 0., 0.
-            if isinstance(R,float):
-                os= [Orbit([R,vR,vT,z,vz,phi])]
-                RasOrbit= True
-                integrated= False
-            elif len(R.shape) == 1: #not integrated yet
-                os= [Orbit([R[ii],vR[ii],vT[ii],z[ii],vz[ii],phi[ii]]) for ii in range(R.shape[0])]
-                RasOrbit= True
+            if isinstance(R,float) or len(R.shape) == 1: #not integrated yet
+                #Integrate all objects at once
+                vxvv= nu.empty((nu.size(R),6))
+                for ii,x in enumerate([R,vR,vT,z,vz,phi]):
+                    vxvv[:,ii]= x
+                if _firstFlip:
+                    vxvv[:,[1,2,4]]*= -1.
+                orbs= self._integrate_vxvv(vxvv,**kwargs)
+                if _firstFlip:
+                    orbs[:,:,[1,2,4]]*= -1.
+                R= orbs[:,:,0]
+                vR= orbs[:,:,1]
+                vT= orbs[:,:,2]
+                z= orbs[:,:,3]
+                vz= orbs[:,:,4]
+                phi= orbs[:,:,5]
                 integrated= False
         if isinstance(args[0],Orbit) \
-                or (isinstance(args[0],list) and isinstance(args[0][0],Orbit)) \
-                or RasOrbit:
-            if RasOrbit:
-                pass
-            elif not isinstance(args[0],list):
+                or (isinstance(args[0],list) and isinstance(args[0][0],Orbit)):
+            if not isinstance(args[0],list):
                 os= [args[0]]
                 if len(os[0]._orb.vxvv) == 3 or len(os[0]._orb.vxvv) == 5: #pragma: no cover
                     raise IOError("Must specify phi for actionAngleIsochroneApprox")
@@ -615,9 +639,7 @@ class actionAngleIsochroneApprox(actionAngle):
                         o._orb.vxvv[1]= -o._orb.vxvv[1]
                         o._orb.vxvv[2]= -o._orb.vxvv[2]
                         o._orb.vxvv[4]= -o._orb.vxvv[4]
-                [o.integrate(self._tsJ,pot=self._pot,
-                             method=self._integrate_method,
-                             dt=self._integrate_dt) for o in os]
+                self._integrate_orbits(os,**kwargs)
                 if _firstFlip:
                     for o in os:
                         o._orb.vxvv[1]= -o._orb.vxvv[1]
@@ -669,39 +691,69 @@ class actionAngleIsochroneApprox(actionAngle):
                 oz[:,nt-1:]= z
                 ovz[:,nt-1:]= vz
                 ophi[:,nt-1:]= phi
-            #load orbits
+            #integrate all orbits at once, starting from the first point
+            vxvv= nu.array([R[:,0],vR[:,0],vT[:,0],z[:,0],vz[:,0],phi[:,0]]).T
+            if not _firstFlip:
+                vxvv[:,[1,2,4]]*= -1.
+            #drop t=0, which we have already
+            orbs= self._integrate_vxvv(vxvv,**kwargs)[:,1:]
             if _firstFlip:
-                os= [Orbit([R[ii,0],vR[ii,0],vT[ii,0],z[ii,0],vz[ii,0],phi[ii,0]]) for ii in range(R.shape[0])]
-            else:
-                os= [Orbit([R[ii,0],-vR[ii,0],-vT[ii,0],z[ii,0],-vz[ii,0],phi[ii,0]]) for ii in range(R.shape[0])]
-            #integrate orbits
-            [o.integrate(self._tsJ,pot=self._pot,
-                         method=self._integrate_method,
-                         dt=self._integrate_dt) for o in os]
-            #extract phase-space points along the orbit
-            ts= self._tsJ
-            if _firstFlip:
-                for ii in range(no):
-                    oR[ii,nt:]= os[ii].R(ts[1:]) #drop t=0, which we have
-                    ovR[ii,nt:]= os[ii].vR(ts[1:]) #already
-                    ovT[ii,nt:]= os[ii].vT(ts[1:]) # reverse, such that 
-                    if os[ii].getOrbit().shape[1] == 6:
-                        oz[ii,nt:]= os[ii].z(ts[1:]) #everything is in the 
-                        ovz[ii,nt:]= os[ii].vz(ts[1:]) #right order
-                    ophi[ii,nt:]= os[ii].phi(ts[1:]) #!
-            else:
-                for ii in range(no):
-                    oR[ii,:nt-1]= os[ii].R(ts[1:])[::-1] #drop t=0, which we have
-                    ovR[ii,:nt-1]= -os[ii].vR(ts[1:])[::-1] #already
-                    ovT[ii,:nt-1]= -os[ii].vT(ts[1:])[::-1] # reverse, such that 
-                    if os[ii].getOrbit().shape[1] == 6:
-                        oz[ii,:nt-1]= os[ii].z(ts[1:])[::-1] #everything is in the 
-                        ovz[ii,:nt-1]= -os[ii].vz(ts[1:])[::-1] #right order
-                    ophi[ii,:nt-1]= os[ii].phi(ts[1:])[::-1] #!
+                oR[:,nt:]= orbs[:,:,0]
+                ovR[:,nt:]= orbs[:,:,1]
+                ovT[:,nt:]= orbs[:,:,2]
+                oz[:,nt:]= orbs[:,:,3]
+                ovz[:,nt:]= orbs[:,:,4]
+                ophi[:,nt:]= orbs[:,:,5]
+            else: # reverse, such that everything is in the right order
+                oR[:,:nt-1]= orbs[:,::-1,0]
+                ovR[:,:nt-1]= -orbs[:,::-1,1]
+                ovT[:,:nt-1]= -orbs[:,::-1,2]
+                oz[:,:nt-1]= orbs[:,::-1,3]
+                ovz[:,:nt-1]= -orbs[:,::-1,4]
+                ophi[:,:nt-1]= orbs[:,::-1,5]
             return (oR,ovR,ovT,oz,ovz,ophi)
         else:
             return (R,vR,vT,z,vz,phi)
 
+    def _integrate_vxvv(self,vxvv,numcores=None,executor=None):
+        """Helper function to integrate the [N,6] initial conditions vxvv for the times self._tsJ all at once (in a single OpenMP-parallel C call, or in chunks in a pool of threads if numcores or executor is set), returns [N,nt,6]"""
+        from galpy.orbit import Orbits
+        os= Orbits(vxvv)
+        os.integrate(self._tsJ,self._pot,method=self._integrate_method,
+                     dt=self._integrate_dt,numcores=numcores,executor=executor)
+        return os.orbit
+
+    def _chunk_args(self,args,kwargs):
+        """Helper function to split the input for more than self._chunksize objects into chunks of at most self._chunksize objects; returns None if the input does not need to be split"""
+        from galpy.orbit import Orbit
+        if kwargs.get('_retacfs',False) or '_acfs' in kwargs \
+                or isinstance(args[0],(Orbit,float)) or nu.ndim(args[0]) == 0:
+            return None
+        no= len(args[0])
+        if no <= self._chunksize: return None
+        return [tuple([a[ii:ii+self._chunksize] for a in args])
+                for ii in range(0,no,self._chunksize)]
+
+    def _integrate_orbits(self,os,numcores=None,executor=None):
+        """Helper function to integrate a list of Orbits, in a pool of threads if numcores or executor is set and the orbits are integrated in C (the C integrators release the GIL, scipy's odeint is not thread-safe)"""
+        from galpy.orbit_src.FullOrbit import ext_loaded
+        integrate= lambda o: o.integrate(self._tsJ,pot=self._pot,
+                                         method=self._integrate_method,
+                                         dt=self._integrate_dt)
+        if (numcores is None and executor is None) \
+                or not '_c' in self._integrate_method or not ext_loaded \
+                or not _check_c(self._pot):
+            [integrate(o) for o in os]
+        else:
+            # Each C call integrates a single orbit and therefore only uses
+            # a single OpenMP thread, so the pool does not oversubscribe
+            multi.thread_map(integrate,os,numcores=numcores,executor=executor)
+        return None
+
+def _concatenate_chunks(out):
+    """Helper function to concatenate the output for chunks of objects"""
+    return tuple([nu.concatenate(x) for x in zip(*out)])
+
 @potential_physical_input
 @physical_conversion('position',pop=True)
 def estimateBIsochrone(pot,R,z,phi=None):
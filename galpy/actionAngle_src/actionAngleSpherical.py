@@ -10,13 +10,17 @@
 #
 ###############################################################################
 import copy
+import warnings
 import math as m
 import numpy as nu
 from scipy import integrate
+from galpy.util import galpyWarning
 from galpy.potential import epifreq, omegac
-from galpy.potential_src.Potential import _evaluatePotentials
+from galpy.potential_src.Potential import _evaluatePotentials, _check_c
 from galpy.actionAngle_src.actionAngle import *
 from galpy.actionAngle_src.actionAngleAxi import actionAngleAxi, potentialAxi
+import galpy.actionAngle_src.actionAngleSpherical_c as actionAngleSpherical_c
+from galpy.actionAngle_src.actionAngleSpherical_c import _ext_loaded as ext_loaded
 class actionAngleSpherical(actionAngle):
     """Action-angle formalism for spherical potentials"""
     def __init__(self,*args,**kwargs):
@@ -33,6 +37,10 @@ class actionAngleSpherical(actionAngle):
 
            pot= a Spherical potential
 
+           c= (False) if True, use C to calculate the actions, frequencies, and angles for arrays of phase-space points at once (using Gauss-Legendre integration)
+
+           order= (10) number of points to use in the Gauss-Legendre integration when using C
+
            ro= distance from vantage point to GC (kpc; can be Quantity)
 
            vo= circular velocity at ro (km/s; can be Quantity)
@@ -45,6 +53,8 @@ class actionAngleSpherical(actionAngle):
 
            2013-12-28 - Written - Bovy (IAS)
 
+           2026-10-17 - Added C implementation
+
         """
         actionAngle.__init__(self,
                              ro=kwargs.get('ro',None),vo=kwargs.get('vo',None))
@@ -56,14 +66,13 @@ class actionAngleSpherical(actionAngle):
             self._2dpot= [p.toPlanar() for p in self._pot]
         else:
             self._2dpot= self._pot.toPlanar()
-        #The following for if we ever implement this code in C
-        self._c= False
-        ext_loaded= False
-        if ext_loaded and (('c' in kwargs and kwargs['c'])
-                           or not 'c' in kwargs):
-            self._c= True #pragma: no cover
+        if ext_loaded and 'c' in kwargs and kwargs['c']:
+            self._c= _check_c(self._pot)
+            if not self._c:
+                warnings.warn("C module not used because potential does not have a C implementation",galpyWarning) #pragma: no cover
         else:
             self._c= False
+        self._order= kwargs.get('order',10)
         # Check the units
         self._check_consistent_units()
         return None
@@ -80,6 +89,7 @@ class actionAngleSpherical(actionAngle):
               b) Orbit instance: initial condition used if that's it, orbit(t)
                  if there is a time given as well
            fixed_quad= (False) if True, use n=10 fixed_quad integration
+           c= True/False; overrides the object's c= keyword to use C or not
            scipy.integrate.quadrature keywords
         OUTPUT:
            (jr,lz,jz)
@@ -87,6 +97,7 @@ class actionAngleSpherical(actionAngle):
            2013-12-28 - Written - Bovy (IAS)
         """
         fixed_quad= kwargs.pop('fixed_quad',False)
+        c= self._use_c(kwargs)
         if len(args) == 5: #R,vR.vT, z, vz
             R,vR,vT, z, vz= args
         elif len(args) == 6: #R,vR.vT, z, vz, phi
@@ -104,8 +115,15 @@ class actionAngleSpherical(actionAngle):
             vT= nu.array([vT])
             z= nu.array([z])
             vz= nu.array([vz])
-        if self._c: #pragma: no cover
-            pass
+        if c:
+            Lz= R*vT
+            L= nu.sqrt((z*vT)**2.+(z*vR-R*vz)**2.+Lz**2.)
+            Jr, err= actionAngleSpherical_c.actionAngleSpherical_c(\
+                self._pot,R,vR,vT,z,vz,order=self._order)
+            if err == 0:
+                return (Jr,Lz,L-nu.fabs(Lz))
+            else: #pragma: no cover
+                raise RuntimeError("C-code for calculation actions failed; try with c=False")
         else:
             Lz= R*vT
             Lx= -z*vT
@@ -144,6 +162,7 @@ class actionAngleSpherical(actionAngle):
               b) Orbit instance: initial condition used if that's it, orbit(t)
                  if there is a time given as well
            fixed_quad= (False) if True, use n=10 fixed_quad integration
+           c= True/False; overrides the object's c= keyword to use C or not
            scipy.integrate.quadrature keywords
         OUTPUT:
             (jr,lz,jz,Omegar,Omegaphi,Omegaz)
@@ -151,6 +170,7 @@ class actionAngleSpherical(actionAngle):
            2013-12-28 - Written - Bovy (IAS)
         """
         fixed_quad= kwargs.pop('fixed_quad',False)
+        c= self._use_c(kwargs)
         if len(args) == 5: #R,vR.vT, z, vz
             R,vR,vT, z, vz= args
         elif len(args) == 6: #R,vR.vT, z, vz, phi
@@ -168,8 +188,15 @@ class actionAngleSpherical(actionAngle):
             vT= nu.array([vT])
             z= nu.array([z])
             vz= nu.array([vz])
-        if self._c: #pragma: no cover
-            pass
+        if c:
+            Lz= R*vT
+            L= nu.sqrt((z*vT)**2.+(z*vR-R*vz)**2.+Lz**2.)
+            Jr, Or, Op, Oz, err= actionAngleSpherical_c.actionAngleFreqSpherical_c(\
+                self._pot,R,vR,vT,z,vz,order=self._order)
+            if err == 0:
+                return (Jr,Lz,L-nu.fabs(Lz),Or,Op,Oz)
+            else: #pragma: no cover
+                raise RuntimeError("C-code for calculation actions failed; try with c=False")
         else:
             Lz= R*vT
             Lx= -z*vT
@@ -221,6 +248,7 @@ class actionAngleSpherical(actionAngle):
               b) Orbit instance: initial condition used if that's it, orbit(t)
                  if there is a time given as well
            fixed_quad= (False) if True, use n=10 fixed_quad integration
+           c= True/False; overrides the object's c= keyword to use C or not
            scipy.integrate.quadrature keywords
         OUTPUT:
             (jr,lz,jz,Omegar,Omegaphi,Omegaz,ar,aphi,az)
@@ -228,6 +256,7 @@ class actionAngleSpherical(actionAngle):
            2013-12-29 - Written - Bovy (IAS)
         """
         fixed_quad= kwargs.pop('fixed_quad',False)
+        c= self._use_c(kwargs)
         if len(args) == 5: #R,vR.vT, z, vz pragma: no cover
             raise IOError("You need to provide phi when calculating angles")
         elif len(args) == 6: #R,vR.vT, z, vz, phi
@@ -247,8 +276,15 @@ class actionAngleSpherical(actionAngle):
             z= nu.array([z])
             vz= nu.array([vz])
             phi= nu.array([phi])
-        if self._c: #pragma: no cover
-            pass
+        if c:
+            Lz= R*vT
+            L= nu.sqrt((z*vT)**2.+(z*vR-R*vz)**2.+Lz**2.)
+            Jr, Or, Op, Oz, ar, ap, az, err= actionAngleSpherical_c.actionAngleFreqAngleSpherical_c(\
+                self._pot,R,vR,vT,z,vz,phi,order=self._order)
+            if err == 0:
+                return (Jr,Lz,L-nu.fabs(Lz),Or,Op,Oz,ar,ap,az)
+            else: #pragma: no cover
+                raise RuntimeError("C-code for calculation actions failed; try with c=False")
         else:
             Lz= R*vT
             Lx= -z*vT
@@ -309,6 +345,14 @@ class actionAngleSpherical(actionAngle):
             return (nu.array(Jr),Jphi,Jz,nu.array(Or),Op,Oz,
                     ar,ap,az)
     
+    def _use_c(self,kwargs):
+        """Determine whether to use C, taking c= out of kwargs"""
+        c= kwargs.pop('c',self._c)
+        if c and not self._c and not (ext_loaded and _check_c(self._pot)):
+            warnings.warn("C module not used because potential does not have a C implementation",galpyWarning) #pragma: no cover
+            return False
+        return c
+
     def _calc_jr(self,rperi,rap,E,L,fixed_quad,**kwargs):
         if fixed_quad:
             return integrate.fixed_quad(_JrSphericalIntegrand,
@@ -417,7 +461,7 @@ class actionAngleSpherical(actionAngle):
                                             args=(E,L,self._2dpot,rap),
                                             n=10,**kwargs)[0]
             else:
-                wr= m.pi
+                wr= 0. #at apocenter
             if vr < 0.:
                 wr= m.pi+wr
             else:
@@ -0,0 +1,133 @@
+import os
+import sys
+import sysconfig
+import warnings
+import ctypes
+import ctypes.util
+import numpy
+from numpy.ctypeslib import ndpointer
+from galpy.util import galpyWarning
+from galpy.orbit_src.integrateFullOrbit import _parse_pot
+#Find and load the library
+_lib= None
+outerr= None
+PY3= sys.version > '3'
+if PY3: #pragma: no cover
+    _ext_suffix= sysconfig.get_config_var('EXT_SUFFIX')
+else:
+    _ext_suffix= '.so'
+for path in sys.path:
+    try:
+        _lib = ctypes.CDLL(os.path.join(path,'galpy_actionAngle_c%s' % _ext_suffix))
+    except OSError as e:
+        if os.path.exists(os.path.join(path,'galpy_actionAngle_c%s' % _ext_suffix)): #pragma: no cover
+            outerr= e
+        _lib = None
+    else:
+        break
+if _lib is None: #pragma: no cover
+    if not outerr is None:
+        warnings.warn("actionAngleSpherical_c extension module not loaded, because of error '%s' " % outerr,
+                      galpyWarning)
+    else:
+        warnings.warn("actionAngleSpherical_c extension module not loaded, because galpy_actionAngle_c%s image was not found" % _ext_suffix,
+                      galpyWarning)
+    _ext_loaded= False
+else:
+    _ext_loaded= True
+
+def actionAngleSpherical_c(pot,R,vR,vT,z,vz,order=10):
+    """
+    NAME:
+       actionAngleSpherical_c
+    PURPOSE:
+       Use C to calculate the radial action in a spherical potential
+    INPUT:
+       pot - Potential or list of such instances
+       R, vR, vT, z, vz - coordinates (arrays)
+       order= (10) order of the Gauss-Legendre integration
+    OUTPUT:
+       (jr,err)
+       jr : array, shape (len(R))
+       err - non-zero if error occured
+    HISTORY:
+       2026-10-17 - Written
+    """
+    return _call_actionAngleSpherical_c(\
+        _lib.actionAngleSpherical_actions,pot,[R,vR,vT,z,vz],1,order)
+
+def actionAngleFreqSpherical_c(pot,R,vR,vT,z,vz,order=10):
+    """
+    NAME:
+       actionAngleFreqSpherical_c
+    PURPOSE:
+       Use C to calculate the radial action and the frequencies in a
+       spherical potential
+    INPUT:
+       pot - Potential or list of such instances
+       R, vR, vT, z, vz - coordinates (arrays)
+       order= (10) order of the Gauss-Legendre integration
+    OUTPUT:
+       (jr,Omegar,Omegaphi,Omegaz,err)
+       jr,Omegar,Omegaphi,Omegaz : array, shape (len(R))
+       err - non-zero if error occured
+    HISTORY:
+       2026-10-17 - Written
+    """
+    return _call_actionAngleSpherical_c(\
+        _lib.actionAngleSpherical_actionsFreqs,pot,[R,vR,vT,z,vz],4,order)
+
+def actionAngleFreqAngleSpherical_c(pot,R,vR,vT,z,vz,phi,order=10):
+    """
+    NAME:
+       actionAngleFreqAngleSpherical_c
+    PURPOSE:
+       Use C to calculate the radial action, the frequencies, and the angles
+       in a spherical potential
+    INPUT:
+       pot - Potential or list of such instances
+       R, vR, vT, z, vz, phi - coordinates (arrays)
+       order= (10) order of the Gauss-Legendre integration
+    OUTPUT:
+       (jr,Omegar,Omegaphi,Omegaz,Angler,Anglephi,Anglez,err)
+       jr,Omegar,Omegaphi,Omegaz,Angler,Anglephi,Anglez : array, shape (len(R))
+       err - non-zero if error occured
+    HISTORY:
+       2026-10-17 - Written
+    """
+    return _call_actionAngleSpherical_c(\
+        _lib.actionAngleSpherical_actionsFreqsAngles,pot,
+        [R,vR,vT,z,vz,phi],7,order)
+
+def _call_actionAngleSpherical_c(func,pot,coords,nout,order):
+    """Run one of the C actionAngleSpherical functions for coordinate arrays coords, returning nout arrays and the error code"""
+    #Parse the potential
+    npot, pot_type, pot_args= _parse_pot(pot,potforactions=True)
+
+    #Set up result arrays
+    out= [numpy.empty(len(coords[0])) for ii in range(nout)]
+    err= ctypes.c_int(0)
+
+    #Set up the C code
+    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
+    func.argtypes= [ctypes.c_int]\
+        +[ndpointer(dtype=numpy.float64,flags=ndarrayFlags)
+          for ii in range(len(coords))]\
+        +[ctypes.c_int,
+          ndpointer(dtype=numpy.int32,flags=ndarrayFlags),
+          ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+          ctypes.c_int]\
+        +[ndpointer(dtype=numpy.float64,flags=ndarrayFlags)
+          for ii in range(nout)]\
+        +[ctypes.POINTER(ctypes.c_int)]
+
+    #Array requirements
+    coords= [numpy.require(x,dtype=numpy.float64,requirements=['C','W'])
+             for x in coords]
+
+    #Run the C code
+    func(*([len(coords[0])]+coords
+           +[ctypes.c_int(npot),pot_type,pot_args,ctypes.c_int(order)]
+           +out+[ctypes.byref(err)]))
+
+    return tuple(out)+(err.value,)
@@ -125,21 +125,14 @@ class actionAngleStaeckel(actionAngle):
                 z= nu.array([z])
                 vz= nu.array([vz])
             Lz= R*vT
-            if self._useu0:
-                #First calculate u0
-                if 'u0' in kwargs:
-                    u0= nu.asarray(kwargs['u0'])
-                else:
-                    E= nu.array([_evaluatePotentials(self._pot,R[ii],z[ii])
-                                 +vR[ii]**2./2.+vz[ii]**2./2.+vT[ii]**2./2. for ii in range(len(R))])
-                    u0= actionAngleStaeckel_c.actionAngleStaeckel_calcu0(E,Lz,
-                                                                         self._pot,
-                                                                         self._delta)[0]
-                kwargs.pop('u0',None)
-            else:
+            if self._useu0 and 'u0' in kwargs:
+                u0= nu.asarray(kwargs['u0'])
+            else: # u0 is computed in C if self._useu0
                 u0= None
+            kwargs.pop('u0',None)
             jr, jz, err= actionAngleStaeckel_c.actionAngleStaeckel_c(\
-                self._pot,self._delta,R,vR,vT,z,vz,u0=u0)
+                self._pot,self._delta,R,vR,vT,z,vz,u0=u0,
+                useu0=self._useu0)
             if err == 0:
                 return (jr,Lz,jz)
             else: #pragma: no cover
@@ -211,21 +204,14 @@ class actionAngleStaeckel(actionAngle):
                 z= nu.array([z])
                 vz= nu.array([vz])
             Lz= R*vT
-            if self._useu0:
-                #First calculate u0
-                if 'u0' in kwargs:
-                    u0= nu.asarray(kwargs['u0'])
-                else:
-                    E= nu.array([_evaluatePotentials(self._pot,R[ii],z[ii])
-                                 +vR[ii]**2./2.+vz[ii]**2./2.+vT[ii]**2./2. for ii in range(len(R))])
-                    u0= actionAngleStaeckel_c.actionAngleStaeckel_calcu0(E,Lz,
-                                                                         self._pot,
-                                                                         self._delta)[0]
-                kwargs.pop('u0',None)
-            else:
+            if self._useu0 and 'u0' in kwargs:
+                u0= nu.asarray(kwargs['u0'])
+            else: # u0 is computed in C if self._useu0
                 u0= None
+            kwargs.pop('u0',None)
             jr, jz, Omegar, Omegaphi, Omegaz, err= actionAngleStaeckel_c.actionAngleFreqStaeckel_c(\
-                self._pot,self._delta,R,vR,vT,z,vz,u0=u0)
+                self._pot,self._delta,R,vR,vT,z,vz,u0=u0,
+                useu0=self._useu0)
             # Adjustements for close-to-circular orbits
             indx= nu.isnan(Omegar)*(jr < 10.**-3.)+nu.isnan(Omegaz)*(jz < 10.**-3.) #Close-to-circular and close-to-the-plane orbits
             if nu.sum(indx) > 0:
@@ -282,21 +268,14 @@ class actionAngleStaeckel(actionAngle):
                 vz= nu.array([vz])
                 phi= nu.array([phi])
             Lz= R*vT
-            if self._useu0:
-                #First calculate u0
-                if 'u0' in kwargs:
-                    u0= nu.asarray(kwargs['u0'])
-                else:
-                    E= nu.array([_evaluatePotentials(self._pot,R[ii],z[ii])
-                                 +vR[ii]**2./2.+vz[ii]**2./2.+vT[ii]**2./2. for ii in range(len(R))])
-                    u0= actionAngleStaeckel_c.actionAngleStaeckel_calcu0(E,Lz,
-                                                                         self._pot,
-                                                                         self._delta)[0]
-                kwargs.pop('u0',None)
-            else:
+            if self._useu0 and 'u0' in kwargs:
+                u0= nu.asarray(kwargs['u0'])
+            else: # u0 is computed in C if self._useu0
                 u0= None
+            kwargs.pop('u0',None)
             jr, jz, Omegar, Omegaphi, Omegaz, angler, anglephi,anglez, err= actionAngleStaeckel_c.actionAngleFreqAngleStaeckel_c(\
-                self._pot,self._delta,R,vR,vT,z,vz,phi,u0=u0)
+                self._pot,self._delta,R,vR,vT,z,vz,phi,u0=u0,
+                useu0=self._useu0)
             # Adjustements for close-to-circular orbits
             indx= nu.isnan(Omegar)*(jr < 10.**-3.)+nu.isnan(Omegaz)*(jz < 10.**-3.) #Close-to-circular and close-to-the-plane orbits
             if nu.sum(indx) > 0:
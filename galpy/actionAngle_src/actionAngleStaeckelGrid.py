@@ -11,14 +11,15 @@
 #
 ###############################################################################
 import numpy
-from scipy import interpolate, optimize, ndimage
+from scipy import interpolate, optimize
 import galpy.actionAngle_src.actionAngleStaeckel as actionAngleStaeckel
 from galpy.actionAngle_src.actionAngle import actionAngle
 import galpy.actionAngle_src.actionAngleStaeckel_c as actionAngleStaeckel_c
 from galpy.actionAngle_src.actionAngleStaeckel_c import _ext_loaded as ext_loaded
 import galpy.potential
 from galpy.potential_src.Potential import _evaluatePotentials
-from galpy.util import multi, bovy_coords
+from galpy.util import multi, bovy_coords, LazyModule
+ndimage= LazyModule('scipy.ndimage')
 _PRINTOUTSIDEGRID= False
 _APY_LOADED= True
 try:
@@ -37,7 +37,7 @@ if _lib is None: #pragma: no cover
 else:
     _ext_loaded= True
 
-def actionAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
+def actionAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None,useu0=False):
     """
     NAME:
        actionAngleStaeckel_c
@@ -47,15 +47,22 @@ def actionAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
        pot - Potential or list of such instances
        delta - focal length of prolate spheroidal coordinates
        R, vR, vT, z, vz - coordinates (arrays)
+       u0= (None) if set, u0 to use
+       useu0= (False) if True and u0 is None, compute the u0 that minimizes the effective potential in C (otherwise the u of each phase-space point is used)
     OUTPUT:
        (jr,jz,err)
        jr,jz : array, shape (len(R))
        err - non-zero if error occured
     HISTORY:
        2012-12-01 - Written - Bovy (IAS)
+       2026-10-17 - Added useu0= to compute u0 in C
     """
-    if u0 is None:
+    if u0 is None and useu0:
+        u0= numpy.empty(len(R)) # computed in C
+    elif u0 is None:
         u0, dummy= bovy_coords.Rz_to_uv(R,z,delta=delta)
+    else:
+        useu0= False
     #Parse the potential
     npot, pot_type, pot_args= _parse_pot(pot,potforactions=True)
 
@@ -75,6 +82,7 @@ def actionAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
                                ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
                                ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
                                ctypes.c_int,
+                               ctypes.c_int,
                                ndpointer(dtype=numpy.int32,flags=ndarrayFlags),
                                ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
                                ctypes.c_double,
@@ -106,6 +114,7 @@ def actionAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
                                     z,
                                     vz,
                                     u0,
+                                    ctypes.c_int(useu0),
                                     ctypes.c_int(npot),
                                     pot_type,
                                     pot_args,
@@ -185,7 +194,7 @@ def actionAngleStaeckel_calcu0(E,Lz,pot,delta):
 
     return (u0,err.value)
 
-def actionAngleFreqStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
+def actionAngleFreqStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None,useu0=False):
     """
     NAME:
        actionAngleFreqStaeckel_c
@@ -196,15 +205,22 @@ def actionAngleFreqStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
        pot - Potential or list of such instances
        delta - focal length of prolate spheroidal coordinates
        R, vR, vT, z, vz - coordinates (arrays)
+       u0= (None) if set, u0 to use
+       useu0= (False) if True and u0 is None, compute the u0 that minimizes the effective potential in C (otherwise the u of each phase-space point is used)
     OUTPUT:
        (jr,jz,Omegar,Omegaphi,Omegaz,err)
        jr,jz,Omegar,Omegaphi,Omegaz : array, shape (len(R))
        err - non-zero if error occured
     HISTORY:
        2013-08-23 - Written - Bovy (IAS)
+       2026-10-17 - Added useu0= to compute u0 in C
     """
-    if u0 is None:
+    if u0 is None and useu0:
+        u0= numpy.empty(len(R)) # computed in C
+    elif u0 is None:
         u0, dummy= bovy_coords.Rz_to_uv(R,z,delta=delta)
+    else:
+        useu0= False
     #Parse the potential
     npot, pot_type, pot_args= _parse_pot(pot,potforactions=True)
 
@@ -227,6 +243,7 @@ def actionAngleFreqStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
                                ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
                                ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
                                ctypes.c_int,
+                               ctypes.c_int,
                                ndpointer(dtype=numpy.int32,flags=ndarrayFlags),
                                ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
                                ctypes.c_double,
@@ -265,6 +282,7 @@ def actionAngleFreqStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
                                     z,
                                     vz,
                                     u0,
+                                    ctypes.c_int(useu0),
                                     ctypes.c_int(npot),
                                     pot_type,
                                     pot_args,
@@ -286,7 +304,7 @@ def actionAngleFreqStaeckel_c(pot,delta,R,vR,vT,z,vz,u0=None):
 
     return (jr,jz,Omegar,Omegaphi,Omegaz,err.value)
 
-def actionAngleFreqAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,phi,u0=None):
+def actionAngleFreqAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,phi,u0=None,useu0=False):
     """
     NAME:
        actionAngleFreqAngleStaeckel_c
@@ -297,15 +315,22 @@ def actionAngleFreqAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,phi,u0=None):
        pot - Potential or list of such instances
        delta - focal length of prolate spheroidal coordinates
        R, vR, vT, z, vz, phi - coordinates (arrays)
+       u0= (None) if set, u0 to use
+       useu0= (False) if True and u0 is None, compute the u0 that minimizes the effective potential in C (otherwise the u of each phase-space point is used)
     OUTPUT:
        (jr,jz,Omegar,Omegaphi,Omegaz,Angler,Anglephi,Anglez,err)
        jr,jz,Omegar,Omegaphi,Omegaz,Angler,Anglephi,Anglez : array, shape (len(R))
        err - non-zero if error occured
     HISTORY:
        2013-08-27 - Written - Bovy (IAS)
+       2026-10-17 - Added useu0= to compute u0 in C
     """
-    if u0 is None:
+    if u0 is None and useu0:
+        u0= numpy.empty(len(R)) # computed in C
+    elif u0 is None:
         u0, dummy= bovy_coords.Rz_to_uv(R,z,delta=delta)
+    else:
+        useu0= False
     #Parse the potential
     npot, pot_type, pot_args= _parse_pot(pot,potforactions=True)
 
@@ -331,6 +356,7 @@ def actionAngleFreqAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,phi,u0=None):
                                ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
                                ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
                                ctypes.c_int,
+                               ctypes.c_int,
                                ndpointer(dtype=numpy.int32,flags=ndarrayFlags),
                                ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
                                ctypes.c_double,
@@ -376,6 +402,7 @@ def actionAngleFreqAngleStaeckel_c(pot,delta,R,vR,vT,z,vz,phi,u0=None):
                                     z,
                                     vz,
                                     u0,
+                                    ctypes.c_int(useu0),
                                     ctypes.c_int(npot),
                                     pot_type,
                                     pot_args,
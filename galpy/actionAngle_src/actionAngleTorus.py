@@ -9,9 +9,9 @@
 import warnings
 import numpy
 from galpy.potential import MWPotential, _isNonAxi
-from galpy.util import galpyWarning
-import galpy.actionAngle_src.actionAngleTorus_c as actionAngleTorus_c
-from galpy.actionAngle_src.actionAngleTorus_c import _ext_loaded as ext_loaded
+from galpy.util import galpyWarning, LazyModule
+# Only load the Torus extension when it is first used
+actionAngleTorus_c= LazyModule('galpy.actionAngle_src.actionAngleTorus_c')
 from galpy.potential_src.Potential import _check_c
 _autofit_errvals= {}
 _autofit_errvals[-1]= 'something wrong with input, usually bad starting values for the parameters'
@@ -55,7 +55,7 @@ class actionAngleTorus(object):
         if self._pot == MWPotential:
             warnings.warn("Use of MWPotential as a Milky-Way-like potential is deprecated; galpy.potential.MWPotential2014, a potential fit to a large variety of dynamical constraints (see Bovy 2015), is the preferred Milky-Way-like potential in galpy",
                           galpyWarning)
-        if ext_loaded:
+        if actionAngleTorus_c._ext_loaded:
             self._c= _check_c(self._pot)
             if not self._c:
                 raise RuntimeError('The given potential is not fully implemented in C; using the actionAngleTorus code is not supported in pure Python')
@@ -134,7 +134,7 @@ void parse_actionAngleArgs(int npot,
 	potentialArgs->Rforce= &interpRZPotentialRforce;
 	potentialArgs->zforce= &interpRZPotentialzforce;
       }
-      potentialArgs->nargs= 2;
+      potentialArgs->nargs= 3;
       //clean up
       free(Rgrid);
       free(zgrid);
@@ -0,0 +1,386 @@
+/*
+  C code for actions, frequencies, and angles in spherical potentials
+*/
+#include <stdio.h>
+#include <stdlib.h>
+#include <stdbool.h>
+#include <math.h>
+#include <gsl/gsl_math.h>
+#include <gsl/gsl_errno.h>
+#include <gsl/gsl_roots.h>
+#include <gsl/gsl_integration.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+#define CHUNKSIZE 10
+//Potentials
+#include <galpy_potentials.h>
+#include <actionAngle.h>
+#ifndef M_PI
+#define M_PI 3.14159265358979323846
+#endif
+/*
+  Structure Declarations
+*/
+struct JRSphericalArg{
+  double E;
+  double L2;
+  double r0; //rperi or rap, depending on the integral
+  int nargs;
+  struct potentialArg * actionAngleArgs;
+};
+/*
+  Function Declarations
+*/
+void actionAngleSpherical_actions(int,double *,double *,double *,double *,
+				  double *,int,int *,double *,int,
+				  double *,int *);
+void actionAngleSpherical_actionsFreqs(int,double *,double *,double *,
+				       double *,double *,int,int *,double *,
+				       int,double *,double *,double *,
+				       double *,int *);
+void actionAngleSpherical_actionsFreqsAngles(int,double *,double *,double *,
+					     double *,double *,double *,
+					     int,int *,double *,int,
+					     double *,double *,double *,
+					     double *,double *,double *,
+					     double *,int *);
+void actionAngleSpherical_calc(int,double *,double *,double *,double *,
+			       double *,double *,int,int *,double *,int,
+			       double *,double *,double *,double *,double *,
+			       double *,double *,int *);
+void calcRapRperi(int,double *,double *,double *,double *,double *,
+		  int,struct potentialArg *); //in actionAngleAdiabatic.c
+double JRSphericalIntegrandSquared(double,struct JRSphericalArg *);
+double JRSphericalIntegrandSmall(double,void *);
+double JRSphericalIntegrandLarge(double,void *);
+double TrSphericalIntegrandSmall(double,void *);
+double TrSphericalIntegrandLarge(double,void *);
+double ISphericalIntegrandSmall(double,void *);
+double ISphericalIntegrandLarge(double,void *);
+/*
+  Actual functions, inlines first
+*/
+static inline double integrateSpherical(double (*func)(double,void *),
+					double tmax,
+					gsl_function * Int,
+					struct JRSphericalArg * params,
+					gsl_integration_glfixed_table * T){
+  //Integrate func from 0 to tmax
+  if ( tmax <= 0. ) return 0.;
+  Int->function= func;
+  Int->params= params;
+  return gsl_integration_glfixed (Int,0.,tmax,T);
+}
+static inline double mod2pi(double x){
+  x= fmod(x,2.*M_PI);
+  return ( x < 0. ) ? x + 2. * M_PI : x;
+}
+/*
+  MAIN FUNCTIONS
+ */
+void actionAngleSpherical_actions(int ndata,
+				  double *R,
+				  double *vR,
+				  double *vT,
+				  double *z,
+				  double *vz,
+				  int npot,
+				  int * pot_type,
+				  double * pot_args,
+				  int order,
+				  double *jr,
+				  int * err){
+  actionAngleSpherical_calc(ndata,R,vR,vT,z,vz,NULL,npot,pot_type,pot_args,
+			    order,jr,NULL,NULL,NULL,NULL,NULL,NULL,err);
+}
+void actionAngleSpherical_actionsFreqs(int ndata,
+				       double *R,
+				       double *vR,
+				       double *vT,
+				       double *z,
+				       double *vz,
+				       int npot,
+				       int * pot_type,
+				       double * pot_args,
+				       int order,
+				       double *jr,
+				       double *Omegar,
+				       double *Omegaphi,
+				       double *Omegaz,
+				       int * err){
+  actionAngleSpherical_calc(ndata,R,vR,vT,z,vz,NULL,npot,pot_type,pot_args,
+			    order,jr,Omegar,Omegaphi,Omegaz,NULL,NULL,NULL,
+			    err);
+}
+void actionAngleSpherical_actionsFreqsAngles(int ndata,
+					     double *R,
+					     double *vR,
+					     double *vT,
+					     double *z,
+					     double *vz,
+					     double *phi,
+					     int npot,
+					     int * pot_type,
+					     double * pot_args,
+					     int order,
+					     double *jr,
+					     double *Omegar,
+					     double *Omegaphi,
+					     double *Omegaz,
+					     double *Angler,
+					     double *Anglephi,
+					     double *Anglez,
+					     int * err){
+  actionAngleSpherical_calc(ndata,R,vR,vT,z,vz,phi,npot,pot_type,pot_args,
+			    order,jr,Omegar,Omegaphi,Omegaz,
+			    Angler,Anglephi,Anglez,err);
+}
+void actionAngleSpherical_calc(int ndata,
+			       double *R,
+			       double *vR,
+			       double *vT,
+			       double *z,
+			       double *vz,
+			       double *phi,
+			       int npot,
+			       int * pot_type,
+			       double * pot_args,
+			       int order,
+			       double *jr,
+			       double *Omegar,
+			       double *Omegaphi,
+			       double *Omegaz,
+			       double *Angler,
+			       double *Anglephi,
+			       double *Anglez,
+			       int * err){
+  //Frequencies are computed when Omegar != NULL, angles when Angler != NULL
+  int ii, tid, nthreads;
+  bool freqs= Omegar != NULL || Angler != NULL;
+  double Lz, Lx, Ly, Rmean, Tr, I, Or, Op, dpsi, wr, wz, psi, inc, u, s;
+  double Fp, Fm, dr;
+#ifdef _OPENMP
+  nthreads = omp_get_max_threads();
+#else
+  nthreads = 1;
+#endif
+  //Set up the potentials
+  struct potentialArg * actionAngleArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
+  parse_actionAngleArgs(npot,actionAngleArgs,pot_type,pot_args,false);
+  //Spherical coordinates r, vr, vtheta, E, and L
+  double *r= (double *) malloc ( ndata * sizeof(double) );
+  double *vr= (double *) malloc ( ndata * sizeof(double) );
+  double *vtheta= (double *) malloc ( ndata * sizeof(double) );
+  double *E= (double *) malloc ( ndata * sizeof(double) );
+  double *L= (double *) malloc ( ndata * sizeof(double) );
+  UNUSED int chunk= CHUNKSIZE;
+#pragma omp parallel for schedule(static,chunk) private(ii,Lz,Lx,Ly)
+  for (ii=0; ii < ndata; ii++){
+    Lz= *(R+ii) * *(vT+ii);
+    Lx= - *(z+ii) * *(vT+ii);
+    Ly= *(z+ii) * *(vR+ii) - *(R+ii) * *(vz+ii);
+    *(L+ii)= sqrt(Lx * Lx + Ly * Ly + Lz * Lz);
+    *(r+ii)= sqrt(*(R+ii) * *(R+ii) + *(z+ii) * *(z+ii));
+    *(vr+ii)= ( *(R+ii) * *(vR+ii) + *(z+ii) * *(vz+ii) ) / *(r+ii);
+    *(vtheta+ii)= ( *(z+ii) * *(vR+ii) - *(R+ii) * *(vz+ii) ) / *(r+ii);
+    *(E+ii)= evaluatePotentials(*(r+ii),0.,npot,actionAngleArgs)
+      + 0.5 * *(vr+ii) * *(vr+ii)
+      + 0.5 * *(L+ii) * *(L+ii) / *(r+ii) / *(r+ii);
+  }
+  //Calculate peri and apocenters
+  double *rperi= (double *) malloc ( ndata * sizeof(double) );
+  double *rap= (double *) malloc ( ndata * sizeof(double) );
+  calcRapRperi(ndata,rperi,rap,r,E,L,npot,actionAngleArgs);
+  //Calculate the actions, frequencies, and angles
+  gsl_function * Int= (gsl_function *) malloc ( nthreads * sizeof(gsl_function) );
+  struct JRSphericalArg * params= (struct JRSphericalArg *) malloc ( nthreads * sizeof (struct JRSphericalArg) );
+  for (tid=0; tid < nthreads; tid++){
+    (params+tid)->nargs= npot;
+    (params+tid)->actionAngleArgs= actionAngleArgs;
+  }
+  gsl_integration_glfixed_table * T= gsl_integration_glfixed_table_alloc (order);
+#pragma omp parallel for schedule(static,chunk)				\
+  private(tid,ii,Lz,Rmean,Tr,I,Or,Op,dpsi,wr,wz,psi,inc,u,s,Fp,Fm,dr)	\
+  shared(jr,Omegar,Omegaphi,Omegaz,Angler,Anglephi,Anglez,Int,params,T, \
+	 r,vr,vtheta,E,L,rperi,rap)
+  for (ii=0; ii < ndata; ii++){
+#ifdef _OPENMP
+    tid= omp_get_thread_num();
+#else
+    tid = 0;
+#endif
+    if ( *(rperi+ii) == -9999.99 || *(rap+ii) == -9999.99 ){
+      *(jr+ii)= 9999.99;
+      if ( Omegar != NULL ) {
+	*(Omegar+ii)= 9999.99;
+	*(Omegaphi+ii)= 9999.99;
+	*(Omegaz+ii)= 9999.99;
+      }
+      if ( Angler != NULL ) {
+	*(Angler+ii)= 9999.99;
+	*(Anglephi+ii)= 9999.99;
+	*(Anglez+ii)= 9999.99;
+      }
+      continue;
+    }
+    (params+tid)->E= *(E+ii);
+    (params+tid)->L2= *(L+ii) * *(L+ii);
+    //Split the integrals at the geometric mean of peri and apocenter, using
+    //r= rperi+t^2 below and r= rap-t^2 above to remove the singularities
+    Rmean= sqrt(*(rperi+ii) * *(rap+ii));
+    (params+tid)->r0= *(rperi+ii);
+    *(jr+ii)= integrateSpherical(&JRSphericalIntegrandSmall,
+				 sqrt(Rmean - *(rperi+ii)),
+				 Int+tid,params+tid,T);
+    if ( freqs ) {
+      Tr= integrateSpherical(&TrSphericalIntegrandSmall,
+			     sqrt(Rmean - *(rperi+ii)),Int+tid,params+tid,T);
+      I= integrateSpherical(&ISphericalIntegrandSmall,
+			    sqrt(Rmean - *(rperi+ii)),Int+tid,params+tid,T);
+    }
+    (params+tid)->r0= *(rap+ii);
+    *(jr+ii)+= integrateSpherical(&JRSphericalIntegrandLarge,
+				  sqrt(*(rap+ii) - Rmean),
+				  Int+tid,params+tid,T);
+    *(jr+ii)/= M_PI;
+    if ( ! freqs ) continue;
+    Tr+= integrateSpherical(&TrSphericalIntegrandLarge,
+			    sqrt(*(rap+ii) - Rmean),Int+tid,params+tid,T);
+    I+= integrateSpherical(&ISphericalIntegrandLarge,
+			   sqrt(*(rap+ii) - Rmean),Int+tid,params+tid,T);
+    if ( *(jr+ii) < 0.000000001
+	 || ( *(rap+ii) - *(rperi+ii) ) / *(rap+ii) < 0.000001 ) {
+      //Circular orbit: epicycle and circular frequency at r
+      dr= 0.0001 * *(r+ii);
+      Fp= calcRforce(*(r+ii)+dr,0.,0.,0.,npot,actionAngleArgs);
+      Fm= calcRforce(*(r+ii)-dr,0.,0.,0.,npot,actionAngleArgs);
+      Op= sqrt(-calcRforce(*(r+ii),0.,0.,0.,npot,actionAngleArgs) / *(r+ii));
+      Or= sqrt(-( Fp - Fm ) / 2. / dr + 3. * Op * Op);
+    }
+    else {
+      Or= M_PI / Tr;
+      Op= *(L+ii) * I * Or / M_PI;
+    }
+    if ( Omegar != NULL ) {
+      *(Omegar+ii)= Or;
+      *(Omegaz+ii)= Op;
+      *(Omegaphi+ii)= ( *(vT+ii) < 0. ) ? -Op : Op;
+    }
+    if ( Angler == NULL ) continue;
+    //Radial angle
+    if ( *(r+ii) < Rmean ) {
+      (params+tid)->r0= *(rperi+ii);
+      s= ( *(r+ii) > *(rperi+ii) ) ? sqrt(*(r+ii) - *(rperi+ii)) : 0.;
+      wr= Or * integrateSpherical(&TrSphericalIntegrandSmall,
+				  s,Int+tid,params+tid,T);
+      wz= *(L+ii) * integrateSpherical(&ISphericalIntegrandSmall,
+				       s,Int+tid,params+tid,T);
+      if ( *(vr+ii) < 0. ) {
+	wr= 2. * M_PI - wr;
+	wz= Op / Or * 2. * M_PI - wz;
+      }
+    }
+    else {
+      (params+tid)->r0= *(rap+ii);
+      s= ( *(r+ii) < *(rap+ii) ) ? sqrt(*(rap+ii) - *(r+ii)) : 0.;
+      wr= Or * integrateSpherical(&TrSphericalIntegrandLarge,
+				  s,Int+tid,params+tid,T);
+      wz= *(L+ii) * integrateSpherical(&ISphericalIntegrandLarge,
+				       s,Int+tid,params+tid,T);
+      dpsi= Op / Or * 2. * M_PI;
+      if ( *(vr+ii) < 0. ) {
+	wr= M_PI + wr;
+	wz= dpsi / 2. + wz;
+      }
+      else {
+	wr= M_PI - wr;
+	wz= dpsi / 2. - wz;
+      }
+    }
+    //Angle in the orbital plane and longitude of the ascending node
+    Lz= *(R+ii) * *(vT+ii);
+    inc= acos(Lz / *(L+ii));
+    psi= *(z+ii) / *(r+ii) / sin(inc);
+    if ( psi > 1. && psi < 1.0000001 ) psi= 1.;
+    if ( psi < -1. && psi > -1.0000001 ) psi= -1.;
+    psi= asin(psi);
+    if ( *(vtheta+ii) > 0. ) psi= M_PI - psi;
+    psi= mod2pi(psi);
+    u= *(z+ii) / *(R+ii) / tan(inc);
+    if ( u > 1. && u < 1.0000001 ) u= 1.;
+    if ( u < -1. && u > -1.0000001 ) u= -1.;
+    u= asin(u);
+    if ( *(vtheta+ii) > 0. ) u= M_PI - u;
+    wz= -wz + psi + Op / Or * wr;
+    *(Angler+ii)= mod2pi(wr);
+    *(Anglephi+ii)= mod2pi(( Lz < 0. ) ? *(phi+ii) - u - wz
+			   : *(phi+ii) - u + wz);
+    *(Anglez+ii)= mod2pi(wz);
+  }
+  free(Int);
+  free(params);
+  gsl_integration_glfixed_table_free ( T );
+  for (ii=0; ii < npot; ii++) {
+    if ( (actionAngleArgs+ii)->i2d )
+      interp_2d_free((actionAngleArgs+ii)->i2d) ;
+    if ((actionAngleArgs+ii)->accx )
+      gsl_interp_accel_free ((actionAngleArgs+ii)->accx);
+    if ((actionAngleArgs+ii)->accy )
+      gsl_interp_accel_free ((actionAngleArgs+ii)->accy);
+    free((actionAngleArgs+ii)->args);
+  }
+  free(actionAngleArgs);
+  free(r);
+  free(vr);
+  free(vtheta);
+  free(E);
+  free(L);
+  free(rperi);
+  free(rap);
+  *err= 0;
+}
+double JRSphericalIntegrandSquared(double r,
+				   struct JRSphericalArg * params){
+  return 2. * ( params->E - evaluatePotentials(r,0.,params->nargs,
+					       params->actionAngleArgs) )
+    - params->L2 / r / r;
+}
+double JRSphericalIntegrandSmall(double t,
+				 void * p){
+  struct JRSphericalArg * params= (struct JRSphericalArg *) p;
+  double r= params->r0 + t * t;
+  double out= JRSphericalIntegrandSquared(r,params);
+  return ( out > 0. ) ? 2. * t * sqrt(out) : 0.;
+}
+double JRSphericalIntegrandLarge(double t,
+				 void * p){
+  struct JRSphericalArg * params= (struct JRSphericalArg *) p;
+  double r= params->r0 - t * t;
+  double out= JRSphericalIntegrandSquared(r,params);
+  return ( out > 0. ) ? 2. * t * sqrt(out) : 0.;
+}
+double TrSphericalIntegrandSmall(double t,
+				 void * p){
+  struct JRSphericalArg * params= (struct JRSphericalArg *) p;
+  double r= params->r0 + t * t;
+  return 2. * t / sqrt(JRSphericalIntegrandSquared(r,params));
+}
+double TrSphericalIntegrandLarge(double t,
+				 void * p){
+  struct JRSphericalArg * params= (struct JRSphericalArg *) p;
+  double r= params->r0 - t * t;
+  return 2. * t / sqrt(JRSphericalIntegrandSquared(r,params));
+}
+double ISphericalIntegrandSmall(double t,
+				void * p){
+  struct JRSphericalArg * params= (struct JRSphericalArg *) p;
+  double r= params->r0 + t * t;
+  return 2. * t / sqrt(JRSphericalIntegrandSquared(r,params)) / r / r;
+}
+double ISphericalIntegrandLarge(double t,
+				void * p){
+  struct JRSphericalArg * params= (struct JRSphericalArg *) p;
+  double r= params->r0 - t * t;
+  return 2. * t / sqrt(JRSphericalIntegrandSquared(r,params)) / r / r;
+}
@@ -87,17 +87,19 @@ struct u0EqArg{
   Function Declarations
 */
 void calcu0(int,double *,double *,int,int *,double *,double,double *,int *);
+int calcu0_solve(int,double *,double *,int,struct potentialArg *,double,
+		 double *);
 void actionAngleStaeckel_actions(int,double *,double *,double *,double *,
-				 double *,double *,int,int *,double *,double,
-				 double *,double *,int *);
+				 double *,double *,int,int,int *,double *,
+				 double,double *,double *,int *);
 void actionAngleStaeckel_actionsFreqsAngles(int,double *,double *,double *,
-					    double *,double *,double *,
+					    double *,double *,double *,int,
 					    int,int *,double *,
 					    double,double *,double *,double *,
 					    double *,double *,double *,
 					    double *,double *,int *);
 void actionAngleStaeckel_actionsFreqs(int,double *,double *,double *,double *,
-				      double *,double *,int,int *,double *,
+				      double *,double *,int,int,int *,double *,
 				      double,double *,double *,double *,
 				      double *,double *,int *);
 void calcAnglesStaeckel(int,double *,double *,double *,double *,double *,
@@ -218,6 +220,29 @@ void calcu0(int ndata,
   //Set up the potentials
   struct potentialArg * actionAngleArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
   parse_actionAngleArgs(npot,actionAngleArgs,pot_type,pot_args,false);
+  //Solve for u0
+  *err= calcu0_solve(ndata,E,Lz,npot,actionAngleArgs,delta,u0);
+  for (ii=0; ii < npot; ii++) {
+    if ( (actionAngleArgs+ii)->i2d )
+      interp_2d_free((actionAngleArgs+ii)->i2d) ;
+    if ((actionAngleArgs+ii)->accx )
+      gsl_interp_accel_free ((actionAngleArgs+ii)->accx);
+    if ((actionAngleArgs+ii)->accy )
+      gsl_interp_accel_free ((actionAngleArgs+ii)->accy);
+    free((actionAngleArgs+ii)->args);
+  }
+  free(actionAngleArgs);
+}
+int calcu0_solve(int ndata,
+		 double *E,
+		 double *Lz,
+		 int npot,
+		 struct potentialArg * actionAngleArgs,
+		 double delta,
+		 double *u0){
+  //Find the u0 that minimizes the effective potential for each (E,Lz),
+  //for already set-up potentials; returns the status of the last solve
+  int ii;
   //setup the function to be minimized
   gsl_function u0Eq;
   struct u0EqArg * params= (struct u0EqArg *) malloc ( sizeof (struct u0EqArg) );
@@ -225,7 +250,7 @@ void calcu0(int ndata,
   params->nargs= npot;
   params->actionAngleArgs= actionAngleArgs;
   //Setup solver
-  int status;
+  int status= 0;
   int iter, max_iter = 100;
   const gsl_min_fminimizer_type *T;
   gsl_min_fminimizer *s;
@@ -267,17 +292,7 @@ void calcu0(int ndata,
   }
   gsl_min_fminimizer_free (s);
   free(params);
-  for (ii=0; ii < npot; ii++) {
-    if ( (actionAngleArgs+ii)->i2d )
-      interp_2d_free((actionAngleArgs+ii)->i2d) ;
-    if ((actionAngleArgs+ii)->accx )
-      gsl_interp_accel_free ((actionAngleArgs+ii)->accx);
-    if ((actionAngleArgs+ii)->accy )
-      gsl_interp_accel_free ((actionAngleArgs+ii)->accy);
-    free((actionAngleArgs+ii)->args);
-  }
-  free(actionAngleArgs);
-  *err= status;
+  return status;
 }
 void actionAngleStaeckel_actions(int ndata,
 				 double *R,
@@ -286,6 +301,7 @@ void actionAngleStaeckel_actions(int ndata,
 				 double *z,
 				 double *vz,
 				 double *u0,
+				 int useu0,
 				 int npot,
 				 int * pot_type,
 				 double * pot_args,
@@ -301,6 +317,8 @@ void actionAngleStaeckel_actions(int ndata,
   double *E= (double *) malloc ( ndata * sizeof(double) );
   double *Lz= (double *) malloc ( ndata * sizeof(double) );
   calcEL(ndata,R,vR,vT,z,vz,E,Lz,npot,actionAngleArgs);
+  //u0 that minimizes the effective potential, if it is not given
+  if ( useu0 ) calcu0_solve(ndata,E,Lz,npot,actionAngleArgs,delta,u0);
   //Calculate all necessary parameters
   double *ux= (double *) malloc ( ndata * sizeof(double) );
   double *vx= (double *) malloc ( ndata * sizeof(double) );
@@ -539,6 +557,7 @@ void actionAngleStaeckel_actionsFreqs(int ndata,
 				      double *z,
 				      double *vz,
 				      double *u0,
+				      int useu0,
 				      int npot,
 				      int * pot_type,
 				      double * pot_args,
@@ -557,6 +576,8 @@ void actionAngleStaeckel_actionsFreqs(int ndata,
   double *E= (double *) malloc ( ndata * sizeof(double) );
   double *Lz= (double *) malloc ( ndata * sizeof(double) );
   calcEL(ndata,R,vR,vT,z,vz,E,Lz,npot,actionAngleArgs);
+  //u0 that minimizes the effective potential, if it is not given
+  if ( useu0 ) calcu0_solve(ndata,E,Lz,npot,actionAngleArgs,delta,u0);
   //Calculate all necessary parameters
   double *ux= (double *) malloc ( ndata * sizeof(double) );
   double *vx= (double *) malloc ( ndata * sizeof(double) );
@@ -686,6 +707,7 @@ void actionAngleStaeckel_actionsFreqsAngles(int ndata,
 					    double *z,
 					    double *vz,
 					    double *u0,
+					    int useu0,
 					    int npot,
 					    int * pot_type,
 					    double * pot_args,
@@ -707,6 +729,8 @@ void actionAngleStaeckel_actionsFreqsAngles(int ndata,
   double *E= (double *) malloc ( ndata * sizeof(double) );
   double *Lz= (double *) malloc ( ndata * sizeof(double) );
   calcEL(ndata,R,vR,vT,z,vz,E,Lz,npot,actionAngleArgs);
+  //u0 that minimizes the effective potential, if it is not given
+  if ( useu0 ) calcu0_solve(ndata,E,Lz,npot,actionAngleArgs,delta,u0);
   //Calculate all necessary parameters
   double *ux= (double *) malloc ( ndata * sizeof(double) );
   double *vx= (double *) malloc ( ndata * sizeof(double) );
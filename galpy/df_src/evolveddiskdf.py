@@ -17,14 +17,14 @@ import time as time_module
 import warnings
 import numpy as nu
 from scipy import integrate
-from galpy.util import galpyWarning
+from galpy.util import galpyWarning, LazyModule
 from galpy.orbit import Orbit
 from galpy.potential import calcRotcurve
 from galpy.df_src.df import df, _APY_LOADED
 from galpy.util.bovy_quadpack import dblquad
-from galpy.util import bovy_plot
 from galpy.util.bovy_conversion import physical_conversion, \
     potential_physical_input, time_in_Gyr
+bovy_plot= LazyModule('galpy.util.bovy_plot')
 if _APY_LOADED:
     from astropy import units
 _DEGTORAD= math.pi/180.
@@ -3,19 +3,33 @@ import math as m
 import numpy as nu
 from scipy import integrate, optimize
 import scipy
-if int(scipy.__version__.split('.')[1]) < 10: #pragma: no cover
-    from scipy.maxentropy import logsumexp
-else:
-    from scipy.misc import logsumexp
+try:
+    from scipy.special import logsumexp
+except ImportError: #pragma: no cover
+    # scipy < 0.19 (scipy.misc is slow to import)
+    if int(scipy.__version__.split('.')[1]) < 10:
+        from scipy.maxentropy import logsumexp
+    else:
+        from scipy.misc import logsumexp
 from galpy.potential_src.Potential import _evaluateRforces, _evaluatezforces,\
     evaluatePotentials, _evaluatephiforces, evaluateDensities
-from galpy.util import galpyWarning
-import galpy.util.bovy_plot as plot
+from galpy.util import galpyWarning, LazyModule
+plot= LazyModule('galpy.util.bovy_plot')
 import galpy.util.bovy_symplecticode as symplecticode
+import galpy.util.bovy_rk as bovy_rk
 import galpy.util.bovy_coords as coords
 #try:
-from galpy.orbit_src.integrateFullOrbit import integrateFullOrbit_c, _ext_loaded
+from galpy.orbit_src.integrateFullOrbit import integrateFullOrbit_c, \
+    integrateFullOrbit_dxdv_c, _ext_loaded
 ext_loaded= _ext_loaded
+#The vectorized python integrators
+_PYTHON_METHODS= ['leapfrog','symplec4','rk4','dopr54','dop853']
+# Integrators that can integrate in a rotating frame (the Coriolis force 
+# depends on the velocity, so the symplectic integrators cannot be used)
+_ROTATING_METHODS= ['rk4','dopr54','dop853','rk4_c','rk6_c','dopr54_c']
+# Relative step of the finite difference of the force that gives the 
+# variational equations in integrate_dxdv (same as in the C code)
+_DXDV_FD_EPS= 10.**-5.
 from galpy.util.bovy_conversion import physical_conversion
 from galpy.orbit_src.OrbitTop import OrbitTop
 _ORBFITNORMRADEC= 360.
@@ -62,7 +76,7 @@ class FullOrbit(OrbitTop):
                           ro=ro,zo=zo,vo=vo,solarmotion=solarmotion)
         return None
 
-    def integrate(self,t,pot,method='symplec4_c',dt=None):
+    def integrate(self,t,pot,method='symplec4_c',dt=None,OmegaP=None):
         """
         NAME:
            integrate
@@ -73,22 +87,64 @@ class FullOrbit(OrbitTop):
            pot - potential instance or list of instances
            method= 'odeint' for scipy's odeint
                    'leapfrog' for a simple leapfrog implementation
+                   'symplec4' for a 4th order symplectic integrator
+                   'rk4' for a 4th-order Runge-Kutta integrator
+                   'dopr54' for a Dormand-Prince integrator
+                   'dop853' for an 8th order Dormand-Prince integrator
                    'leapfrog_c' for a simple leapfrog implementation in C
                    'rk4_c' for a 4th-order Runge-Kutta integrator in C
                    'rk6_c' for a 6-th order Runge-Kutta integrator in C
                    'dopr54_c' for a Dormand-Prince integrator in C (generally the fastest)
            dt= (None) if set, force the integrator to use this basic stepsize; must be an integer divisor of output stepsize
+           OmegaP= (None) if set, integrate in the frame rotating with this pattern speed (the orbit is returned in the inertial frame); only for the Runge-Kutta integrators
         OUTPUT:
            (none) (get the actual orbit using getOrbit()
         HISTORY:
            2010-08-01 - Written - Bovy (NYU)
+           2026-10-16 - Added OmegaP
         """
         #Reset things that may have been defined by a previous integration
         if hasattr(self,'_orbInterp'): delattr(self,'_orbInterp')
         if hasattr(self,'rs'): delattr(self,'rs')
         self.t= nu.array(t)
         self._pot= pot
-        self.orbit= _integrateFullOrbit(self.vxvv,pot,t,method,dt)
+        self.orbit= _integrateFullOrbit(self.vxvv,pot,t,method,dt,
+                                         OmegaP=OmegaP)
+
+    def integrate_dxdv(self,dxdv,t,pot,method='dopr54_c',
+                       rectIn=False,rectOut=False):
+        """
+        NAME:
+           integrate_dxdv
+        PURPOSE:
+           integrate the orbit and a small area of phase space
+        INPUT:
+           dxdv - [dR,dvR,dvT,dz,dvz,dphi]
+           t - list of times at which to output (0 has to be in this!)
+           pot - potential instance or list of instances
+           method= 'odeint' for scipy's odeint
+                   'rk4' for a 4th-order Runge-Kutta integrator
+                   'dopr54' for a Dormand-Prince integrator
+                   'dop853' for an 8th order Dormand-Prince integrator
+                   'rk4_c' for a 4th-order Runge-Kutta integrator in C
+                   'rk6_c' for a 6-th order Runge-Kutta integrator in C
+                   'dopr54_c' for a Dormand-Prince integrator in C (generally the fastest)
+           rectIn= (False) if True, input dxdv is in rectangular coordinates
+           rectOut= (False) if True, output dxdv (that in orbit_dxdv) is in rectangular coordinates
+        OUTPUT:
+           (none) (get the actual orbit using getOrbit_dxdv()
+        HISTORY:
+           2026-10-16 - Written
+        """
+        if hasattr(self,'_orbInterp'): delattr(self,'_orbInterp')
+        if hasattr(self,'rs'): delattr(self,'rs')
+        self.t= nu.array(t)
+        self._pot_dxdv= pot
+        self._pot= pot
+        self.orbit_dxdv, msg= _integrateFullOrbit_dxdv(self.vxvv,dxdv,pot,t,
+                                                       method,rectIn,rectOut)
+        self.orbit= self.orbit_dxdv[:,:6]
+        return msg
 
     @physical_conversion('energy')
     def Jacobi(self,*args,**kwargs):
@@ -298,7 +354,8 @@ class FullOrbit(OrbitTop):
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
-            self.rs= nu.sqrt(self.orbit[:,0]**2.+self.orbit[:,3]**2.)
+            self.rs= self._add_event_rs(nu.sqrt(self.orbit[:,0]**2.
+                                                    +self.orbit[:,3]**2.))
         return (nu.amax(self.rs)-nu.amin(self.rs))/(nu.amax(self.rs)+nu.amin(self.rs))
 
     @physical_conversion('position')
@@ -323,7 +380,8 @@ class FullOrbit(OrbitTop):
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
-            self.rs= nu.sqrt(self.orbit[:,0]**2.+self.orbit[:,3]**2.)
+            self.rs= self._add_event_rs(nu.sqrt(self.orbit[:,0]**2.
+                                                    +self.orbit[:,3]**2.))
         return nu.amax(self.rs)
 
     @physical_conversion('position')
@@ -348,7 +406,8 @@ class FullOrbit(OrbitTop):
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
-            self.rs= nu.sqrt(self.orbit[:,0]**2.+self.orbit[:,3]**2.)
+            self.rs= self._add_event_rs(nu.sqrt(self.orbit[:,0]**2.
+                                                    +self.orbit[:,3]**2.))
         return nu.amin(self.rs)
 
     @physical_conversion('position')
@@ -373,12 +432,12 @@ class FullOrbit(OrbitTop):
             return zmax
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
-        return nu.amax(nu.fabs(self.orbit[:,3]))
+        return nu.amax(self._zs())
 
     def fit(self,vxvv,vxvv_err=None,pot=None,radec=False,lb=False,
             customsky=False,lb_to_customsky=None,pmllpmbb_to_customsky=None,
             tintJ=10,ntintJ=1000,integrate_method='dopr54_c',
-            disp=False,
+            disp=False,gradient=False,
             **kwargs):
         """
         NAME:
@@ -410,11 +469,13 @@ class FullOrbit(OrbitTop):
                ntintJ= (default: 1000) number of time-integration points
                integrate_method= (default: 'dopr54_c') integration method to use
            disp= (False) display the optimizer's convergence message
+           gradient= (False) if True, maximize the likelihood with BFGS using its gradient, obtained by integrating the orbit's phase-space deviations (integrate_dxdv; integrate_method needs to be a Runge-Kutta integrator) rather than with Powell's method
 
         OUTPUT:
            max of log likelihood
         HISTORY:
            2014-06-17 - Written - Bovy (IAS)
+           2026-10-16 - Added gradient
 
         TEST:
         from galpy.potential import LogarithmicHaloPotential; lp= LogarithmicHaloPotential(normalize=1.); from galpy.orbit import Orbit; o= Orbit(vxvv=[1.,0.1,1.1,0.1,0.02,0.]); ts= numpy.linspace(0,10,1000); o.integrate(ts,lp); outts= [0.,0.1,0.2,0.3,0.4]; vxvv= numpy.array([o.R(outts),o.vR(outts),o.vT(outts),o.z(outts),o.vz(outts),o.phi(outts)]).T; of= Orbit(vxvv=[1.02,0.101,1.101,0.101,0.0201,0.001]); of._orb.fit(vxvv,pot=lp,radec=False,tintJ=10,ntintJ=1000)
@@ -438,7 +499,8 @@ class FullOrbit(OrbitTop):
                                       pmllpmbb_to_customsky=pmllpmbb_to_customsky,
                                       tintJ=tintJ,ntintJ=ntintJ,
                                       integrate_method=integrate_method,
-                                      ro=ro,vo=vo,obs=obs,disp=disp)
+                                      ro=ro,vo=vo,obs=obs,disp=disp,
+                                      gradient=gradient)
         #Setup with these new initial conditions
         self.vxvv= new_vxvv
         return maxLogL
@@ -542,7 +604,7 @@ class FullOrbit(OrbitTop):
             plot.bovy_plot(self.orbit[:,4],nu.array(self.EzJz)/self.EzJz[0],
                            *args,**kwargs)
 
-def _integrateFullOrbit(vxvv,pot,t,method,dt):
+def _integrateFullOrbit(vxvv,pot,t,method,dt,nthreads=None,OmegaP=None):
     """
     NAME:
        _integrateFullOrbit
@@ -550,51 +612,56 @@ def _integrateFullOrbit(vxvv,pot,t,method,dt):
        integrate an orbit in a Phi(R,z,phi) potential
     INPUT:
        vxvv - array with the initial conditions stacked like
-              [R,vR,vT,z,vz,phi]; vR outward!
+              [R,vR,vT,z,vz,phi]; vR outward!; shape [6] or [N,6] for N orbits
        pot - Potential instance
        t - list of times at which to output (0 has to be in this!)
-       method - 'odeint' or 'leapfrog'
+       method - 'odeint', 'leapfrog', 'symplec4', 'rk4', 'dopr54', 'dop853', or one of the C integrators
        dt - if set, force the integrator to use this basic stepsize; must be an integer divisor of output stepsize
+       nthreads= (None) number of OpenMP threads for the C integrators (default: OpenMP's default)
+       OmegaP= (None) if set, integrate in the frame rotating with this pattern speed (only for the Runge-Kutta integrators); the output is in the inertial frame
     OUTPUT:
-       [:,5] array of [R,vR,vT,z,vz,phi] at each t
+       [:,6] array of [R,vR,vT,z,vz,phi] at each t ([N,:,6] for N orbits)
     HISTORY:
        2010-08-01 - Written - Bovy (NYU)
+       2026-10-16 - Allow multiple orbits, integrated in a single C call
+       2026-10-16 - Added vectorized python integrators
+       2026-10-16 - Added integration in a rotating frame
     """
+    vxvv= nu.array(vxvv)
+    if not OmegaP is None:
+        _check_rotating_method(method)
     #First check that the potential has C
     if '_c' in method:
         if isinstance(pot,list):
             allHasC= nu.prod([p.hasC for p in pot])
         else:
             allHasC= pot.hasC
-        if not allHasC:
-            if ('leapfrog' in method or 'symplec' in method):
-                method= 'leapfrog'
-            else:
-                method= 'odeint'
-            warnings.warn("Cannot use C integration because some of the potentials are not implemented in C (using %s instead)" % (method), galpyWarning)
-    if method.lower() == 'leapfrog':
+        if not allHasC or not ext_loaded:
+            method= _python_fallback_method(method,len(vxvv.shape) > 1 
+                                            or not OmegaP is None)
+            if not allHasC:
+                warnings.warn("Cannot use C integration because some of the potentials are not implemented in C (using %s instead)" % (method), galpyWarning)
+    if method.lower() in _PYTHON_METHODS:
         #go to the rectangular frame
-        this_vxvv= nu.array([vxvv[0]*nu.cos(vxvv[5]),
-                             vxvv[0]*nu.sin(vxvv[5]),
-                             vxvv[3],
-                             vxvv[1]*nu.cos(vxvv[5])-vxvv[2]*nu.sin(vxvv[5]),
-                             vxvv[2]*nu.cos(vxvv[5])+vxvv[1]*nu.sin(vxvv[5]),
-                             vxvv[4]])
-        #integrate
-        out= symplecticode.leapfrog(_rectForce,this_vxvv,
-                                    t,args=(pot,),rtol=10.**-8)
-        #go back to the cylindrical frame
-        R= nu.sqrt(out[:,0]**2.+out[:,1]**2.)
-        phi= nu.arccos(out[:,0]/R)
-        phi[(out[:,1] < 0.)]= 2.*nu.pi-phi[(out[:,1] < 0.)]
-        vR= out[:,3]*nu.cos(phi)+out[:,4]*nu.sin(phi)
-        vT= out[:,4]*nu.cos(phi)-out[:,3]*nu.sin(phi)
-        out[:,3]= out[:,2]
-        out[:,4]= out[:,5]
-        out[:,0]= R
-        out[:,1]= vR
-        out[:,2]= vT
-        out[:,5]= phi
+        this_vxvv= _rotating_frame(_cyl_to_rect_vxvv(vxvv),OmegaP,t[0])
+        #Decide once which potentials can be evaluated for all orbits at once
+        if len(vxvv.shape) > 1:
+            pot_args= _split_array_pots(pot,[_evaluateRforces,
+                                             _evaluatezforces,
+                                             _evaluatephiforces],
+                                        t[0],vxvv[:,0],vxvv[:,3],vxvv[:,5])
+        else:
+            pot_args= (pot,[])
+        #integrate, all orbits at once
+        if OmegaP is None:
+            eom= _rectEOM
+        else:
+            eom= _rotatingEOM(_rectForce,OmegaP)
+        out, msg= _python_integrate(method,_rectForce,eom,this_vxvv,t,
+                                    pot_args)
+        _parse_python_warnmessage(msg)
+        #go back to the inertial, cylindrical frame
+        out= _rect_to_cyl_orbit(_rotating_frame(out,OmegaP,t,inverse=True))
     elif ext_loaded and \
             (method.lower() == 'leapfrog_c' or method.lower() == 'rk4_c' \
             or method.lower() == 'rk6_c' or method.lower() == 'symplec4_c' \
@@ -602,29 +669,18 @@ def _integrateFullOrbit(vxvv,pot,t,method,dt):
         warnings.warn("Using C implementation to integrate orbits",
                       galpyWarning)
         #go to the rectangular frame
-        this_vxvv= nu.array([vxvv[0]*nu.cos(vxvv[5]),
-                             vxvv[0]*nu.sin(vxvv[5]),
-                             vxvv[3],
-                             vxvv[1]*nu.cos(vxvv[5])-vxvv[2]*nu.sin(vxvv[5]),
-                             vxvv[2]*nu.cos(vxvv[5])+vxvv[1]*nu.sin(vxvv[5]),
-                             vxvv[4]])
-        #integrate
+        this_vxvv= _rotating_frame(_cyl_to_rect_vxvv(vxvv),OmegaP,t[0])
+        #integrate, all orbits at once
         tmp_out, msg= integrateFullOrbit_c(pot,this_vxvv,
-                                           t,method,dt=dt)
-        #go back to the cylindrical frame
-        R= nu.sqrt(tmp_out[:,0]**2.+tmp_out[:,1]**2.)
-        phi= nu.arccos(tmp_out[:,0]/R)
-        phi[(tmp_out[:,1] < 0.)]= 2.*nu.pi-phi[(tmp_out[:,1] < 0.)]
-        vR= tmp_out[:,3]*nu.cos(phi)+tmp_out[:,4]*nu.sin(phi)
-        vT= tmp_out[:,4]*nu.cos(phi)-tmp_out[:,3]*nu.sin(phi)
-        out= nu.zeros((len(t),6))
-        out[:,0]= R
-        out[:,1]= vR
-        out[:,2]= vT
-        out[:,5]= phi
-        out[:,3]= tmp_out[:,2]
-        out[:,4]= tmp_out[:,5]
-    elif method.lower() == 'odeint' or not ext_loaded:
+                                           t,method,dt=dt,nthreads=nthreads,
+                                           OmegaP=OmegaP)
+        #go back to the inertial, cylindrical frame
+        out= _rect_to_cyl_orbit(_rotating_frame(tmp_out,OmegaP,t,
+                                                inverse=True))
+    elif method.lower() == 'odeint':
+        if len(vxvv.shape) > 1:
+            return nu.array([_integrateFullOrbit(vxvv[ii],pot,t,'odeint',dt)
+                             for ii in range(len(vxvv))])
         vphi= vxvv[2]/vxvv[0]
         init= [vxvv[0],vxvv[1],vxvv[5],vphi,vxvv[3],vxvv[4]]
         intOut= integrate.odeint(_FullEOM,init,t,args=(pot,),
@@ -637,11 +693,226 @@ def _integrateFullOrbit(vxvv,pot,t,method,dt):
         out[:,4]= intOut[:,5]
         out[:,5]= intOut[:,2]
     #post-process to remove negative radii
-    neg_radii= (out[:,0] < 0.)
+    neg_radii= (out[...,0] < 0.)
     out[neg_radii,0]= -out[neg_radii,0]
     out[neg_radii,5]+= m.pi
     return out
 
+def _integrateFullOrbit_dxdv(vxvv,dxdv,pot,t,method,rectIn,rectOut,
+                             nthreads=None):
+    """
+    NAME:
+       _integrateFullOrbit_dxdv
+    PURPOSE:
+       integrate an orbit and area of phase space in a Phi(R,z,phi) potential
+    INPUT:
+       vxvv - array with the initial conditions stacked like
+              [R,vR,vT,z,vz,phi]; vR outward!; shape [6] or [N,6] for N orbits
+       dxdv - difference to integrate [dR,dvR,dvT,dz,dvz,dphi], same shape as vxvv
+       pot - Potential instance
+       t - list of times at which to output (0 has to be in this!)
+       method - 'odeint', 'rk4', 'dopr54', 'dop853', 'rk4_c', 'rk6_c', or 'dopr54_c'
+       rectIn= (False) if True, input dxdv is in rectangular coordinates
+       rectOut= (False) if True, output dxdv (that in orbit_dxdv) is in rectangular coordinates
+       nthreads= (None) number of OpenMP threads for the C integrators (default: OpenMP's default)
+    OUTPUT:
+       [:,12] array of [R,vR,vT,z,vz,phi,dR,dvR,dvT,dz,dvz,dphi] at each t ([N,:,12] for N orbits)
+       error message from integrator
+    HISTORY:
+       2026-10-16 - Written
+    """
+    vxvv= nu.array(vxvv)
+    dxdv= nu.array(dxdv,dtype='float')
+    if 'leapfrog' in method.lower() or 'symplec' in method.lower():
+        raise TypeError('Symplectic integration for phase-space volume is not possible')
+    #First check that the potential has C
+    if '_c' in method:
+        if isinstance(pot,list):
+            allHasC= nu.prod([p.hasC for p in pot])
+        else:
+            allHasC= pot.hasC
+        if not allHasC or not ext_loaded:
+            method= _python_fallback_method(method,len(vxvv.shape) > 1)
+            if not allHasC:
+                warnings.warn("Cannot use C integration because some of the potentials are not implemented in C (using %s instead)" % (method), galpyWarning)
+    #go to the rectangular frame
+    this_vxvv= _cyl_to_rect_vxvv(vxvv)
+    if not rectIn:
+        this_dxdv= _cyl_to_rect_dxdv(vxvv,dxdv)
+    else:
+        this_dxdv= dxdv
+    if method.lower() in _PYTHON_METHODS:
+        #Decide once which potentials can be evaluated for all orbits at once
+        if len(vxvv.shape) > 1:
+            pot_args= _split_array_pots(pot,[_evaluateRforces,
+                                             _evaluatezforces,
+                                             _evaluatephiforces],
+                                        t[0],vxvv[:,0],vxvv[:,3],vxvv[:,5])
+        else:
+            pot_args= (pot,[])
+        tmp_out, msg= _python_integrate(method,None,_rectEOM_dxdv,
+                                        nu.concatenate((this_vxvv,this_dxdv),
+                                                       axis=-1),
+                                        t,pot_args)
+        _parse_python_warnmessage(msg)
+    elif ext_loaded and \
+            (method.lower() == 'rk4_c' or method.lower() == 'rk6_c' \
+            or method.lower() == 'dopr54_c'):
+        warnings.warn("Using C implementation to integrate orbits",
+                      galpyWarning)
+        #integrate, all orbits at once
+        tmp_out, msg= integrateFullOrbit_dxdv_c(pot,this_vxvv,this_dxdv,
+                                                t,method,nthreads=nthreads)
+    elif method.lower() == 'odeint':
+        if len(vxvv.shape) > 1:
+            out= [_integrateFullOrbit_dxdv(vxvv[ii],dxdv[ii],pot,t,'odeint',
+                                           rectIn,rectOut)
+                  for ii in range(len(vxvv))]
+            return (nu.array([o[0] for o in out]),
+                    nu.array([o[1] for o in out]))
+        #integrate
+        tmp_out= integrate.odeint(lambda y,t: _rectEOM_dxdv(y,t,pot),
+                                  nu.concatenate((this_vxvv,this_dxdv)),t,
+                                  rtol=10.**-8.)#,mxstep=100000000)
+        msg= 0
+    else:
+        raise NotImplementedError("requested integration method does not exist")
+    #go back to the cylindrical frame
+    out= _rect_to_cyl_orbit_dxdv(tmp_out,rectOut=rectOut)
+    return (out,msg)
+
+def _python_fallback_method(method,multi):
+    """Python integrator to use when the C integrator method cannot be used; 
+    multi= True when integrating multiple orbits at once, for which odeint 
+    is replaced by the vectorized dop853"""
+    if 'leapfrog' in method or 'symplec' in method:
+        return 'leapfrog'
+    elif multi:
+        return 'dop853'
+    else:
+        return 'odeint'
+
+def _python_integrate(method,force,eom,yo,t,pot_args):
+    """Integrate the rectangular initial conditions yo ([...,2d]) with one of 
+    the vectorized python integrators, using the force (symplectic 
+    integrators) or the equations of motion eom (Runge-Kutta integrators); 
+    returns (out,msg)"""
+    msg= 0
+    if method.lower() == 'leapfrog':
+        out= symplecticode.leapfrog(force,yo,t,args=pot_args,rtol=10.**-8)
+    elif method.lower() == 'symplec4':
+        out= symplecticode.symplec4(force,yo,t,args=pot_args,rtol=10.**-8)
+    elif method.lower() == 'rk4':
+        out= bovy_rk.rk4(eom,yo,t,args=pot_args,rtol=10.**-8,atol=10.**-8)
+    elif method.lower() == 'dopr54':
+        out, msg= bovy_rk.dopr54(eom,yo,t,args=pot_args,
+                                 rtol=10.**-8,atol=10.**-8)
+    elif method.lower() == 'dop853':
+        out, msg= bovy_rk.dop853(eom,yo,t,args=pot_args,
+                                 rtol=10.**-8,atol=10.**-8)
+    return (out,msg)
+
+def _parse_python_warnmessage(msg):
+    if msg == 1: #pragma: no cover
+        warnings.warn("During numerical integration, the maximum number of steps was reached; integration might not be accurate",galpyWarning)
+    elif msg == 2:
+        warnings.warn("Numerical integration failed for some orbits (e.g., because the force became NaN); these orbits are set to NaN from the time of failure",galpyWarning)
+
+def _split_array_pots(pot,forces,t,*args):
+    """Split the (list of) potential(s) pot into those whose forces can be 
+    evaluated for arrays of positions args (e.g., R,z,phi for the initial 
+    conditions of all orbits; phi last) and those whose forces need to be 
+    evaluated one orbit at a time; this is decided once at the start of 
+    the integration by evaluating the forces for the initial conditions"""
+    if not isinstance(pot,list): pot= [pot]
+    apot, spot= [], []
+    for p in pot:
+        try:
+            array_ok= nu.all([nu.shape(f(p,*args[:-1],phi=args[-1],t=t))
+                              == nu.shape(args[0]) for f in forces])
+        except (ValueError,TypeError):
+            array_ok= False
+        if array_ok:
+            apot.append(p)
+        else:
+            spot.append(p)
+    return (apot,spot)
+
+def _split_eval(func,pot,spot,*args,**kwargs):
+    """Evaluate func(pot,*args,**kwargs) for the potentials pot, which can 
+    be evaluated for arrays, at once and for the potentials spot one orbit 
+    at a time"""
+    if isinstance(pot,list) and len(pot) == 0:
+        out= 0.
+    else:
+        out= func(pot,*args,**kwargs)
+    if len(spot) > 0:
+        phi= kwargs.pop('phi')
+        out= out+nu.array([func(spot,*[a[ii] for a in args],phi=phi[ii],
+                                **kwargs)
+                           for ii in range(len(args[0]))])
+    return out
+
+def _cyl_to_rect_vxvv(vxvv):
+    """Convert [...,6] initial conditions [R,vR,vT,z,vz,phi] to [x,y,z,vx,vy,vz]"""
+    return nu.array([vxvv[...,0]*nu.cos(vxvv[...,5]),
+                     vxvv[...,0]*nu.sin(vxvv[...,5]),
+                     vxvv[...,3],
+                     vxvv[...,1]*nu.cos(vxvv[...,5])
+                     -vxvv[...,2]*nu.sin(vxvv[...,5]),
+                     vxvv[...,2]*nu.cos(vxvv[...,5])
+                     +vxvv[...,1]*nu.sin(vxvv[...,5]),
+                     vxvv[...,4]]).T
+
+def _rect_to_cyl_orbit(rect_out):
+    """Convert a [...,nt,6] integrated orbit [x,y,z,vx,vy,vz] to [R,vR,vT,z,vz,phi]"""
+    R= nu.sqrt(rect_out[...,0]**2.+rect_out[...,1]**2.)
+    phi= nu.arccos(rect_out[...,0]/R)
+    phi[(rect_out[...,1] < 0.)]= 2.*nu.pi-phi[(rect_out[...,1] < 0.)]
+    out= nu.empty_like(rect_out)
+    out[...,0]= R
+    out[...,1]= rect_out[...,3]*nu.cos(phi)+rect_out[...,4]*nu.sin(phi)
+    out[...,2]= rect_out[...,4]*nu.cos(phi)-rect_out[...,3]*nu.sin(phi)
+    out[...,3]= rect_out[...,2]
+    out[...,4]= rect_out[...,5]
+    out[...,5]= phi
+    return out
+
+def _cyl_to_rect_dxdv(vxvv,dxdv):
+    """Convert [...,6] differences [dR,dvR,dvT,dz,dvz,dphi] around the 
+    initial conditions [R,vR,vT,z,vz,phi] to [dx,dy,dz,dvx,dvy,dvz]"""
+    R, vR, vT, phi= vxvv[...,0], vxvv[...,1], vxvv[...,2], vxvv[...,5]
+    cp, sp= nu.cos(phi), nu.sin(phi)
+    return nu.array([cp*dxdv[...,0]-R*sp*dxdv[...,5],
+                     sp*dxdv[...,0]+R*cp*dxdv[...,5],
+                     dxdv[...,3],
+                     cp*dxdv[...,1]-sp*dxdv[...,2]
+                     -(vR*sp+vT*cp)*dxdv[...,5],
+                     sp*dxdv[...,1]+cp*dxdv[...,2]
+                     +(vR*cp-vT*sp)*dxdv[...,5],
+                     dxdv[...,4]]).T
+
+def _rect_to_cyl_orbit_dxdv(rect_out,rectOut=False):
+    """Convert a [...,nt,12] integrated orbit and difference 
+    [x,y,z,vx,vy,vz,dx,dy,dz,dvx,dvy,dvz] to 
+    [R,vR,vT,z,vz,phi,dR,dvR,dvT,dz,dvz,dphi] (rectOut= True: keep the 
+    rectangular differences)"""
+    out= nu.empty_like(rect_out)
+    out[...,:6]= _rect_to_cyl_orbit(rect_out[...,:6])
+    if rectOut:
+        out[...,6:]= rect_out[...,6:]
+        return out
+    R, vR, vT, phi= out[...,0], out[...,1], out[...,2], out[...,5]
+    cp, sp= nu.cos(phi), nu.sin(phi)
+    dphi= (cp*rect_out[...,7]-sp*rect_out[...,6])/R
+    out[...,6]= cp*rect_out[...,6]+sp*rect_out[...,7]
+    out[...,7]= cp*rect_out[...,9]+sp*rect_out[...,10]+vT*dphi
+    out[...,8]= cp*rect_out[...,10]-sp*rect_out[...,9]-vR*dphi
+    out[...,9]= rect_out[...,8]
+    out[...,10]= rect_out[...,11]
+    out[...,11]= dphi
+    return out
+
 def _FullEOM(y,t,pot):
     """
     NAME:
@@ -667,42 +938,139 @@ def _FullEOM(y,t,pot):
             y[5],
             _evaluatezforces(pot,y[0],y[4],phi=y[2],t=t)]
 
-def _rectForce(x,pot,t=0.):
+def _rectForce(x,pot,spot=[],t=0.):
     """
     NAME:
        _rectForce
     PURPOSE:
        returns the force in the rectangular frame
     INPUT:
-       x - current position
+       x - current position; shape [3] or [N,3]
        t - current time
        pot - (list of) Potential instance(s)
+       spot= ([]) list of Potential instances that need to be evaluated one orbit at a time (for [N,3] x)
     OUTPUT:
        force
     HISTORY:
        2011-02-02 - Written - Bovy (NYU)
+       2026-10-16 - Allow multiple orbits
     """
     #x is rectangular so calculate R and phi
-    R= nu.sqrt(x[0]**2.+x[1]**2.)
-    phi= nu.arccos(x[0]/R)
-    sinphi= x[1]/R
-    cosphi= x[0]/R
-    if x[1] < 0.: phi= 2.*nu.pi-phi
+    R= nu.sqrt(x[...,0]**2.+x[...,1]**2.)
+    phi= nu.arccos(x[...,0]/R)
+    sinphi= x[...,1]/R
+    cosphi= x[...,0]/R
+    # [()] turns the 0-d arrays for a single orbit into scalars
+    phi= nu.where(x[...,1] < 0.,2.*nu.pi-phi,phi)[()]
+    z= x[...,2][()]
     #calculate forces
-    Rforce= _evaluateRforces(pot,R,x[2],phi=phi,t=t)
-    phiforce= _evaluatephiforces(pot,R,x[2],phi=phi,t=t)
-    return nu.array([cosphi*Rforce-1./R*sinphi*phiforce,
-                     sinphi*Rforce+1./R*cosphi*phiforce,
-                     _evaluatezforces(pot,R,x[2],phi=phi,t=t)])
+    Rforce= _split_eval(_evaluateRforces,pot,spot,R,z,phi=phi,t=t)
+    phiforce= _split_eval(_evaluatephiforces,pot,spot,R,z,phi=phi,t=t)
+    zforce= _split_eval(_evaluatezforces,pot,spot,R,z,phi=phi,t=t)
+    out= nu.empty(x.shape)
+    out[...,0]= cosphi*Rforce-1./R*sinphi*phiforce
+    out[...,1]= sinphi*Rforce+1./R*cosphi*phiforce
+    out[...,2]= zforce
+    return out
+
+def _rectEOM(y,t,pot,spot=[]):
+    """Equations of motion in the rectangular frame, y= [...,6] [x,y,z,vx,vy,vz]"""
+    return nu.concatenate((y[...,3:],_rectForce(y[...,:3],pot,spot,t=t)),
+                          axis=-1)
+
+def _rectEOM_dxdv(y,t,pot,spot=[]):
+    """Equations of motion and their variational equations in the 
+    rectangular frame, y= [...,12] [x,y,z,vx,vy,vz,dx,dy,dz,dvx,dvy,dvz]; 
+    the Jacobian of the force times dx is computed as a central finite 
+    difference of the force in the direction of dx"""
+    x, dx= y[...,:3], y[...,6:9]
+    r= nu.sqrt(nu.sum(x**2.,axis=-1))
+    dxnorm= nu.sqrt(nu.sum(dx**2.,axis=-1))
+    h= _DXDV_FD_EPS*nu.where(r > 0.,r,1.)\
+        /nu.where(dxnorm > 0.,dxnorm,1.)
+    h= h[...,None]
+    df= 0.5*(_rectForce(x+h*dx,pot,spot,t=t)
+             -_rectForce(x-h*dx,pot,spot,t=t))/h
+    return nu.concatenate((y[...,3:6],_rectForce(x,pot,spot,t=t),
+                           y[...,9:],df),axis=-1)
+
+def _check_rotating_method(method):
+    """Raise a ValueError if method cannot integrate in a rotating frame"""
+    if not method.lower() in _ROTATING_METHODS:
+        raise ValueError("Integration in a rotating frame (OmegaP=) requires one of the Runge-Kutta integrators %s" % (', '.join(_ROTATING_METHODS)))
+
+def _rotating_frame(y,OmegaP,t,inverse=False):
+    """Transform the rectangular phase-space points y ([...,2d] 
+    [x,y,(z),vx,vy,(vz)]) at times t (scalar or broadcastable with 
+    y[...,0]) from the inertial frame to the frame rotating with pattern 
+    speed OmegaP, which coincides with the inertial frame at t=0, or from 
+    the rotating to the inertial frame (inverse=True); OmegaP=None 
+    returns y"""
+    if OmegaP is None: return y
+    d= y.shape[-1]//2
+    cosot= nu.cos(OmegaP*t)
+    sinot= nu.sin(OmegaP*t)
+    out= nu.array(y,dtype='float')
+    if inverse:
+        vx= y[...,d]-OmegaP*y[...,1]
+        vy= y[...,d+1]+OmegaP*y[...,0]
+        out[...,0]= cosot*y[...,0]-sinot*y[...,1]
+        out[...,1]= sinot*y[...,0]+cosot*y[...,1]
+        out[...,d]= cosot*vx-sinot*vy
+        out[...,d+1]= sinot*vx+cosot*vy
+    else:
+        out[...,0]= cosot*y[...,0]+sinot*y[...,1]
+        out[...,1]= -sinot*y[...,0]+cosot*y[...,1]
+        out[...,d]= cosot*y[...,d]+sinot*y[...,d+1]+OmegaP*out[...,1]
+        out[...,d+1]= -sinot*y[...,d]+cosot*y[...,d+1]-OmegaP*out[...,0]
+    return out
+
+def _rotatingEOM(force,OmegaP):
+    """Return the equations of motion eom(y,t,*args) for rectangular 
+    phase-space points y ([...,2d]) in the frame rotating with pattern speed 
+    OmegaP, for the inertial rectangular force(x,*args,t=t)"""
+    def eom(y,t,*args):
+        d= y.shape[-1]//2
+        cosot= nu.cos(OmegaP*t)
+        sinot= nu.sin(OmegaP*t)
+        #Inertial force at the inertial position
+        x= nu.array(y[...,:d],dtype='float')
+        x[...,0]= cosot*y[...,0]-sinot*y[...,1]
+        x[...,1]= sinot*y[...,0]+cosot*y[...,1]
+        f= force(x,*args,t=t)
+        #Rotate back and add the centrifugal and Coriolis forces
+        out= nu.empty_like(x)
+        out[...,0]= cosot*f[...,0]+sinot*f[...,1]\
+            +OmegaP**2.*y[...,0]+2.*OmegaP*y[...,d+1]
+        out[...,1]= -sinot*f[...,0]+cosot*f[...,1]\
+            +OmegaP**2.*y[...,1]-2.*OmegaP*y[...,d]
+        out[...,2:]= f[...,2:]
+        return nu.concatenate((y[...,d:],out),axis=-1)
+    return eom
 
 def _fit_orbit(orb,vxvv,vxvv_err,pot,radec=False,lb=False,
                customsky=False,lb_to_customsky=None,
                pmllpmbb_to_customsky=None,
                tintJ=100,ntintJ=1000,integrate_method='dopr54_c',
-               ro=None,vo=None,obs=None,disp=False):
+               ro=None,vo=None,obs=None,disp=False,gradient=False):
     """Fit an orbit to data in a given potential"""
     # Need to turn this off for speed
     coords._APY_COORDS= False
+    if gradient:
+        tintegrator= _fitOrbitIntegrator(pot,tintJ,ntintJ,
+                                         integrate_method=integrate_method)
+        args= (vxvv,vxvv_err,radec,lb,customsky,lb_to_customsky,
+               pmllpmbb_to_customsky,tintegrator,ro,vo,obs)
+        # The likelihood and its gradient at the same initial condition 
+        # share the cached integration
+        opt_vxvv= optimize.fmin_bfgs(\
+            lambda x: _fit_orbit_mlogl_grad(x,*args)[0],
+            nu.array(orb.vxvv,dtype='float'),
+            fprime=lambda x: _fit_orbit_mlogl_grad(x,*args)[1],
+            disp=disp)
+        maxLogL= -_fit_orbit_mlogl_grad(opt_vxvv,*args)[0]
+        coords._APY_COORDS= True
+        return (opt_vxvv,maxLogL)
     #Import here, because otherwise there is an infinite loop of imports
     from galpy.actionAngle import actionAngleIsochroneApprox, actionAngle
     #Mock this up, bc we want to use its orbit-integration routines
@@ -745,15 +1113,35 @@ def _fit_orbit_mlogl(new_vxvv,vxvv,vxvv_err,pot,radec,lb,
                                                 new_vxvv[3],
                                                 new_vxvv[4],
                                                 new_vxvv[5])
+    orb_vxvv= _fit_orbit_obs(nu.array([iR.flatten(),ivR.flatten(),
+                                       ivT.flatten(),iz.flatten(),
+                                       ivz.flatten(),iphi.flatten()]).T,
+                             radec,lb,customsky,lb_to_customsky,
+                             pmllpmbb_to_customsky,ro,vo,obs)
+    out= 0.
+    for ii in range(vxvv.shape[0]):
+        sub_vxvv= (orb_vxvv-vxvv[ii,:].flatten())**2.
+        #print(sub_vxvv[nu.argmin(nu.sum(sub_vxvv,axis=1))])
+        if not vxvv_err is None:
+            sub_vxvv/= vxvv_err[ii,:]**2.
+        else:
+            sub_vxvv/= 0.01**2.
+        out+= logsumexp(-0.5*nu.sum(sub_vxvv,axis=1))
+    return -out
+
+def _fit_orbit_obs(orb,radec,lb,customsky,lb_to_customsky,
+                   pmllpmbb_to_customsky,ro,vo,obs):
+    """Transform the [K,6] points [R,vR,vT,z,vz,phi] along the orbit to the 
+    coordinates of the data"""
     if radec or lb or customsky:
         #Need to transform to (l,b), (ra,dec), or a custom set
         #First transform to X,Y,Z,vX,vY,vZ (Galactic)
-        X,Y,Z = coords.galcencyl_to_XYZ(iR.flatten(),iphi.flatten(),
-                                        iz.flatten(),
+        X,Y,Z = coords.galcencyl_to_XYZ(orb[:,0],orb[:,5],
+                                        orb[:,3],
                                         Xsun=obs[0]/ro,
                                         Zsun=obs[2]/ro).T
-        vX,vY,vZ = coords.galcencyl_to_vxvyvz(ivR.flatten(),ivT.flatten(),
-                                              ivz.flatten(),iphi.flatten(),
+        vX,vY,vZ = coords.galcencyl_to_vxvyvz(orb[:,1],orb[:,2],
+                                              orb[:,4],orb[:,5],
                                               vsun=nu.array(\
                 obs[3:6])/vo,Xsun=obs[0]/ro,Zsun=obs[2]/ro).T
         bad_indx= (X == 0.)*(Y == 0.)*(Z == 0.)
@@ -795,17 +1183,82 @@ def _fit_orbit_mlogl(new_vxvv,vxvv,vxvv_err,pot,radec,lb,
                                 custompmrapmdec[:,0],custompmrapmdec[:,1],
                                 lbdvrpmllpmbb[:,3]]).T
     else:
-        #shape=(2tintJ-1,6)
-        orb_vxvv= nu.array([iR.flatten(),ivR.flatten(),ivT.flatten(),
-                            iz.flatten(),ivz.flatten(),iphi.flatten()]).T 
-    out= 0.
-    for ii in range(vxvv.shape[0]):
-        sub_vxvv= (orb_vxvv-vxvv[ii,:].flatten())**2.
-        #print(sub_vxvv[nu.argmin(nu.sum(sub_vxvv,axis=1))])
-        if not vxvv_err is None:
-            sub_vxvv/= vxvv_err[ii,:]**2.
-        else:
-            sub_vxvv/= 0.01**2.
-        out+= logsumexp(-0.5*nu.sum(sub_vxvv,axis=1))
-    return -out
+        orb_vxvv= orb
+    return orb_vxvv
+
+class _fitOrbitIntegrator(object):
+    """Integrates an orbit forward and backward in time together with the 
+    Jacobian of the flow with respect to its initial condition, caching the 
+    integrations of the most recently requested initial conditions (the 
+    optimizer evaluates the likelihood and its gradient at the same 
+    initial conditions)"""
+    def __init__(self,pot,tintJ,ntintJ,integrate_method='dopr54_c',
+                 ncache=4):
+        self._pot= pot
+        self._tsJ= nu.linspace(0.,tintJ,ntintJ)
+        self._integrate_method= integrate_method
+        self._ncache= ncache
+        self._cache= []
+        return None
+
+    def __call__(self,vxvv):
+        """Return the [2ntintJ-1,6] points along the orbit and the 
+        [2ntintJ-1,6,6] Jacobian of these with respect to vxvv"""
+        for cvxvv, out in self._cache:
+            if nu.all(cvxvv == vxvv):
+                return out
+        # Integrate the six unit deviations forward and, with flipped 
+        # velocities, backward in time, all in a single call
+        flip= nu.array([1.,-1.,-1.,1.,-1.,1.])
+        ivxvv= nu.tile(vxvv,(12,1))
+        ivxvv[6:]*= flip
+        idxdv= nu.concatenate((nu.eye(6),nu.eye(6)*flip),axis=0)
+        iout= _integrateFullOrbit_dxdv(ivxvv,idxdv,self._pot,self._tsJ,
+                                       self._integrate_method,False,False)[0]
+        iout[6:,:,:6]*= flip
+        iout[6:,:,6:]*= flip
+        forb= iout[0,:,:6]
+        borb= iout[6,::-1,:6]
+        fjac= nu.transpose(iout[:6,:,6:],axes=(1,2,0))
+        bjac= nu.transpose(iout[6:,::-1,6:],axes=(1,2,0))
+        out= (nu.concatenate((borb[:-1],forb),axis=0),
+              nu.concatenate((bjac[:-1],fjac),axis=0))
+        self._cache.append((nu.array(vxvv,dtype='float'),out))
+        if len(self._cache) > self._ncache: self._cache.pop(0)
+        return out
 
+def _fit_orbit_mlogl_grad(new_vxvv,vxvv,vxvv_err,radec,lb,
+                          customsky,lb_to_customsky,pmllpmbb_to_customsky,
+                          tintegrator,ro,vo,obs):
+    """The log likelihood for fitting an orbit and its gradient with respect 
+    to the initial condition, returns (-logL,-dlogL/dvxvv)"""
+    orb, jac= tintegrator(new_vxvv)
+    orb_vxvv= _fit_orbit_obs(orb,radec,lb,customsky,lb_to_customsky,
+                             pmllpmbb_to_customsky,ro,vo,obs)
+    if radec or lb or customsky:
+        # Jacobian of the transformation to the coordinates of the data, 
+        # using central finite differences
+        dobs= nu.empty((len(orb),6,6))
+        for ii in range(6):
+            h= 10.**-6.*(1.+nu.fabs(orb[:,ii]))
+            orbp= nu.copy(orb)
+            orbp[:,ii]+= h
+            orbm= nu.copy(orb)
+            orbm[:,ii]-= h
+            dd= _fit_orbit_obs(orbp,radec,lb,customsky,lb_to_customsky,
+                               pmllpmbb_to_customsky,ro,vo,obs)\
+                -_fit_orbit_obs(orbm,radec,lb,customsky,lb_to_customsky,
+                                pmllpmbb_to_customsky,ro,vo,obs)
+            dd[:,0]= (dd[:,0]+180.) % 360.-180. # longitudes can wrap
+            dobs[:,:,ii]= 0.5*dd/h[:,None]
+        jac= nu.einsum('kdc,kcj->kdj',dobs,jac)
+    if vxvv_err is None:
+        ivar= nu.ones_like(vxvv)/0.01**2.
+    else:
+        ivar= 1./vxvv_err**2.
+    diff= (orb_vxvv[None,:,:]-vxvv[:,None,:])*ivar[:,None,:]
+    lnl= -0.5*nu.sum(diff*(orb_vxvv[None,:,:]-vxvv[:,None,:]),axis=2)
+    lse= logsumexp(lnl,axis=1)
+    # Weight of each point along the orbit for each data point
+    w= nu.exp(lnl-lse[:,None])
+    return (-nu.sum(lse),nu.einsum('nk,nkd,kdj->j',w,diff,jac))
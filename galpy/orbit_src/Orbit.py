@@ -16,6 +16,7 @@ from galpy.orbit_src.RZOrbit import RZOrbit
 from galpy.orbit_src.planarOrbit import planarOrbit, planarROrbit, \
     planarOrbitTop
 from galpy.orbit_src.linearOrbit import linearOrbit
+from galpy.orbit_src.denseOutput import denseOutput
 _K=4.74047
 if _APY_LOADED:
     vxvv_units= [units.kpc,units.km/units.s,units.km/units.s,
@@ -365,7 +366,8 @@ class Orbit(object):
             self._vo= vo
         self._orb.turn_physical_on(ro=ro,vo=vo)
 
-    def integrate(self,t,pot,method='symplec4_c',dt=None):
+    def integrate(self,t,pot,method='symplec4_c',dt=None,dense_output=False,
+                  OmegaP=None):
         """
         NAME:
 
@@ -383,6 +385,10 @@ class Orbit(object):
 
            method= 'odeint' for scipy's odeint
                    'leapfrog' for a simple leapfrog implementation
+                   'symplec4' for a 4th order symplectic integrator
+                   'rk4' for a 4th-order Runge-Kutta integrator
+                   'dopr54' for a Dormand-Prince integrator
+                   'dop853' for an 8th order Dormand-Prince integrator
                    'leapfrog_c' for a simple leapfrog implementation in C
                    'symplec4_c' for a 4th order symplectic integrator in C
                    'symplec6_c' for a 6th order symplectic integrator in C
@@ -392,6 +398,10 @@ class Orbit(object):
 
            dt= (None) if set, force the integrator to use this basic stepsize; must be an integer divisor of output stepsize (only works for the C integrators that use a fixed stepsize) (can be Quantity)
 
+           dense_output= (False) if True, evaluate the orbit at times that are not in t by quintic Hermite interpolation between the stored phase-space points using the forces at these points (rather than by spline interpolation of the whole orbit), such that the orbit can be stored on a coarse time grid
+
+           OmegaP= (None) if set, integrate the orbit in the frame rotating with this pattern speed (e.g., that of a bar or spiral; can be Quantity), in which a potential rotating with this pattern speed is static, such that the adaptive integrators can take larger steps; the orbit is returned in the inertial frame; only for orbits that track the azimuth and for the Runge-Kutta integrators ('rk4', 'dopr54', 'dop853', 'rk4_c', 'rk6_c', 'dopr54_c')
+
         OUTPUT:
 
            (none) (get the actual orbit using getOrbit()
@@ -402,6 +412,10 @@ class Orbit(object):
 
            2015-06-28 - Added dt keyword - Bovy (IAS)
 
+           2026-10-16 - Added dense_output keyword
+
+           2026-10-16 - Added OmegaP keyword
+
         """
         _check_potential_dim(self,pot)
         _check_consistent_units(self,pot)
@@ -419,7 +433,20 @@ class Orbit(object):
                           galpyWarning)
         if not _check_integrate_dt(t,dt):
             raise ValueError('dt input (integrator stepsize) for Orbit.integrate must be an integer divisor of the output stepsize')
-        self._orb.integrate(t,pot,method=method,dt=dt)
+        if OmegaP is None:
+            self._orb.integrate(t,pot,method=method,dt=dt)
+        else:
+            if not len(self._orb.vxvv) in (4,6):
+                raise ValueError('Integration in a rotating frame (OmegaP=) requires an orbit that tracks the azimuth')
+            if _APY_LOADED and isinstance(OmegaP,units.Quantity):
+                OmegaP= OmegaP.to(units.km/units.s/units.kpc).value\
+                    /bovy_conversion.freq_in_kmskpc(self._vo,self._ro)
+            self._orb.integrate(t,pot,method=method,dt=dt,OmegaP=OmegaP)
+        if dense_output:
+            self._orb._denseOutput= denseOutput(self._orb.t,self._orb.orbit,
+                                                self._orb._pot)
+        else:
+            self._orb._denseOutput= None
 
     def integrate_dxdv(self,dxdv,t,pot,method='dopr54_c',
                        rectIn=False,rectOut=False):
@@ -434,7 +461,7 @@ class Orbit(object):
 
         INPUT:
 
-           dxdv - [dR,dvR,dvT,dphi]
+           dxdv - [dR,dvR,dvT,dphi] for a planar orbit or [dR,dvR,dvT,dz,dvz,dphi] for a 3D orbit
 
            t - list of times at which to output (0 has to be in this!) (can be Quantity)
 
@@ -442,6 +469,8 @@ class Orbit(object):
 
            method= 'odeint' for scipy's odeint
 
+                   'rk4', 'dopr54', and 'dop853' for the python Runge-Kutta integrators (3D orbits)
+
                    'rk4_c' for a 4th-order Runge-Kutta integrator in C
 
                    'rk6_c' for a 6-th order Runge-Kutta integrator in C
@@ -465,7 +494,11 @@ class Orbit(object):
 
            2014-06-29 - Added rectIn and rectOut - Bovy (IAS)
 
+           2026-10-16 - Added 3D orbits
+
         """
+        if not len(self._orb.vxvv) in (4,6):
+            raise AttributeError('integrate_dxdv is only implemented for planar orbits and 3D orbits that track the azimuth')
         _check_potential_dim(self,pot)
         _check_consistent_units(self,pot)
         # Parse t
@@ -475,6 +508,7 @@ class Orbit(object):
                 /bovy_conversion.time_in_Gyr(self._vo,self._ro)
         self._orb.integrate_dxdv(dxdv,t,pot,method=method,
                                  rectIn=rectIn,rectOut=rectOut)
+        self._orb._denseOutput= None
 
     def reverse(self):
         """
@@ -503,6 +537,9 @@ class Orbit(object):
         sortindx.sort(key=lambda x: self._orb.t[x],reverse=True)
         for ii in range(self._orb.orbit.shape[1]):
             self._orb.orbit[:,ii]= self._orb.orbit[sortindx,ii]
+        if getattr(self._orb,'_denseOutput',None) is not None:
+            self._orb._denseOutput= denseOutput(self._orb.t,self._orb.orbit,
+                                                self._orb._pot)
         return None
 
     def flip(self,inplace=False):
@@ -675,6 +712,8 @@ class Orbit(object):
 
            disp= (False) display the optimizer's convergence message
 
+           gradient= (False) if True, maximize the likelihood with BFGS using its gradient, obtained by integrating the orbit's phase-space deviations (see integrate_dxdv; integrate_method then needs to be a Runge-Kutta integrator), rather than with Powell's method without gradients; this requires far fewer orbit integrations
+
         OUTPUT:
 
            max of log likelihood
@@ -683,6 +722,8 @@ class Orbit(object):
 
            2014-06-17 - Written - Bovy (IAS)
 
+           2026-10-16 - Added gradient
+
         """
         _check_potential_dim(self,pot)
         _check_consistent_units(self,pot)
@@ -982,6 +1023,38 @@ class Orbit(object):
         _check_consistent_units(self,pot)
         return self._orb.zmax(analytic=analytic,pot=pot,**kwargs)
 
+    def events(self,event,direction=0):
+        """
+        NAME:
+
+           events
+
+        PURPOSE:
+
+           find the events along an integrated orbit (e.g., all pericenters), located precisely using the dense output of the orbit (see integrate)
+
+        INPUT:
+
+           event - 'rperi' (pericenters), 'rap' (apocenters), 'zmax' (maxima of |z|), 'zcross' (disk crossings), or a function event(t,vxvv) that returns the event function for arrays of times t [n] and phase-space points vxvv [n,ndim] (in natural units); events are zero crossings of the event function
+
+           direction= (0) for a function event, only find crossings from negative to positive (+1), from positive to negative (-1), or both (0)
+
+        OUTPUT:
+
+           (t,vxvv): times [nev] and phase-space points [nev,ndim] of the events (in natural units)
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        if not hasattr(self._orb,'orbit'):
+            raise AttributeError("Integrate the orbit first")
+        dense= getattr(self._orb,'_denseOutput',None)
+        if dense is None:
+            dense= denseOutput(self._orb.t,self._orb.orbit,self._orb._pot)
+        return dense.events(event,direction=direction)[1:]
+
     def resetaA(self,pot=None,type=None):
         """
         NAME:
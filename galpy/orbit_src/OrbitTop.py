@@ -9,11 +9,11 @@ try:
 except ImportError:
     _APY_LOADED= False
 from galpy import actionAngle
-import galpy.util.bovy_plot as plot
 import galpy.util.bovy_coords as coords
 from galpy.util.bovy_conversion import physical_conversion
-from galpy.util import bovy_conversion, galpyWarning
+from galpy.util import bovy_conversion, galpyWarning, LazyModule
 from galpy.util import config
+plot= LazyModule('galpy.util.bovy_plot')
 if int(scipy.__version__.split('.')[0]) < 1 and \
         int(scipy.__version__.split('.')[1]) < 15: #pragma: no cover
     _OLD_SCIPY= True
@@ -157,7 +157,7 @@ class OrbitTop(object):
         HISTORY:
            2010-07-10 - Written - Bovy (NYU)
         """
-        return self.orbit_dxdv[:,4:]
+        return self.orbit_dxdv[...,len(self.vxvv):]
 
     @physical_conversion('time')
     def time(self,*args,**kwargs):
@@ -1295,6 +1295,12 @@ class OrbitTop(object):
             else: 
                 nt= len(t)
             dim= len(self.vxvv)
+            if getattr(self,'_denseOutput',None) is not None:
+                out= self._denseOutput(t)
+                if nt == 1:
+                    return out[0]
+                else:
+                    return out.T
             try:
                 self._setupOrbitInterp()
             except:
@@ -2054,6 +2060,24 @@ class OrbitTop(object):
             kwargs['d2']= 'Jacobi'
         self.plot(*args,**kwargs)
         
+    def _add_event_rs(self,rs):
+        """Add the radii of the peri- and apocenters found using the dense output (if the orbit has dense output) to the radii rs along the orbit"""
+        if getattr(self,'_denseOutput',None) is None:
+            return rs
+        ev= nu.concatenate((self._denseOutput.events('rperi')[2],
+                            self._denseOutput.events('rap')[2]))
+        if len(self.vxvv) > 4:
+            return nu.concatenate((rs,nu.sqrt(ev[:,0]**2.+ev[:,3]**2.)))
+        else:
+            return nu.concatenate((rs,ev[:,0]))
+
+    def _zs(self):
+        """|z| along the orbit, including the maxima found using the dense output (if the orbit has dense output)"""
+        zs= nu.fabs(self.orbit[:,3])
+        if getattr(self,'_denseOutput',None) is None:
+            return zs
+        return nu.concatenate((zs,nu.fabs(self._denseOutput.events('zmax')[2][:,3])))
+
     def _setupOrbitInterp(self):
         if not hasattr(self,"_orbInterp"):
             # First check that times increase
@@ -0,0 +1,2724 @@
+###############################################################################
+#   Orbits.py: class that holds many orbits in a single array and integrates
+#              them all at once
+###############################################################################
+import warnings
+import numpy as nu
+from scipy import interpolate
+_APY_LOADED= True
+try:
+    from astropy import units
+except ImportError:
+    _APY_LOADED= False
+from galpy import actionAngle
+import galpy.util.bovy_coords as coords
+from galpy.util.bovy_conversion import physical_conversion
+from galpy.util import bovy_conversion, galpyWarning
+from galpy.util import config, multi
+from galpy.potential_src.Potential import evaluatePotentials
+from galpy.potential_src.planarPotential import toPlanarPotential, \
+    _evaluateplanarPotentials
+from galpy.orbit_src.Orbit import Orbit, _check_integrate_dt, \
+    _check_potential_dim, _check_consistent_units, _K
+from galpy.orbit_src.OrbitTop import _check_roSet, _check_voSet
+from galpy.orbit_src.FullOrbit import _integrateFullOrbit, \
+    _integrateFullOrbit_dxdv, ext_loaded
+from galpy.orbit_src.RZOrbit import _integrateRZOrbit
+from galpy.orbit_src.planarOrbit import _integrateOrbit, _integrateOrbit_dxdv
+from galpy.orbit_src.denseOutput import denseOutput
+class Orbits(object):
+    """Class representing many orbits, stored in a single array"""
+    def __init__(self,vxvv=None,ro=None,vo=None,zo=0.025,solarmotion='hogg'):
+        """
+        NAME:
+
+           __init__
+
+        PURPOSE:
+
+           Initialize an Orbits instance
+
+        INPUT:
+
+           vxvv - initial conditions; either
+
+              1) array with shape [N,ndim] of Galactocentric cylindrical coordinates [R,vR,vT(,z,vz),phi] or [R,vR,vT,z,vz] (ndim= 4, 5, or 6) in natural units
+
+              2) list of Orbit instances of the same dimensionality
+
+        OPTIONAL INPUTS:
+
+           ro= distance from vantage point to GC (kpc; can be Quantity)
+
+           vo= circular velocity at ro (km/s; can be Quantity)
+
+           zo= offset toward the NGP of the Sun wrt the plane (kpc; can be Quantity)
+
+           solarmotion= 'hogg' or 'dehnen', or 'schoenrich', or value in [-U,V,W]; can be Quantity
+
+        If ro and/or vo are specified, outputs involving distances or velocities will by default be displayed in the physical coordinates implied by these scales. This can be overwritten for each individual method by using use_physical=False as a keyword for the method.
+
+        OUTPUT:
+
+           instance
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        if _APY_LOADED and isinstance(ro,units.Quantity):
+            ro= ro.to(units.kpc).value
+        if _APY_LOADED and isinstance(vo,units.Quantity):
+            vo= vo.to(units.km/units.s).value
+        if _APY_LOADED and isinstance(zo,units.Quantity):
+            zo= zo.to(units.kpc).value
+        if isinstance(solarmotion,str) and solarmotion.lower() == 'hogg':
+            vsolar= nu.array([-10.1,4.0,6.7])
+        elif isinstance(solarmotion,str) and solarmotion.lower() == 'dehnen':
+            vsolar= nu.array([-10.,5.25,7.17])
+        elif isinstance(solarmotion,str) \
+                and solarmotion.lower() == 'schoenrich':
+            vsolar= nu.array([-11.1,12.24,7.25])
+        elif _APY_LOADED and isinstance(solarmotion,units.Quantity):
+            vsolar= solarmotion.to(units.km/units.s).value
+        else:
+            vsolar= nu.array(solarmotion)
+        if isinstance(vxvv,(list,tuple)) and len(vxvv) > 0 \
+                and isinstance(vxvv[0],Orbit):
+            if ro is None and vxvv[0]._roSet: ro= vxvv[0]._ro
+            if vo is None and vxvv[0]._voSet: vo= vxvv[0]._vo
+            zo= vxvv[0]._orb._zo
+            vsolar= vxvv[0]._orb._solarmotion
+            vxvv= nu.array([o._orb.vxvv for o in vxvv])
+        vxvv= nu.array(vxvv,dtype='float')
+        if len(vxvv.shape) != 2 or not vxvv.shape[1] in [4,5,6]:
+            raise ValueError("Orbits vxvv input needs to have shape [N,ndim] with ndim= 4, 5, or 6")
+        self.vxvv= vxvv
+        self._zo= zo
+        self._solarmotion= vsolar
+        if vo is None:
+            self._vo= config.__config__.getfloat('normalization','vo')
+            self._voSet= False
+        else:
+            self._vo= vo
+            self._voSet= True
+        if ro is None:
+            self._ro= config.__config__.getfloat('normalization','ro')
+            self._roSet= False
+        else:
+            self._ro= ro
+            self._roSet= True
+        return None
+
+    def __len__(self):
+        return self.vxvv.shape[0]
+
+    def __getitem__(self,key):
+        """
+        NAME:
+
+           __getitem__
+
+        PURPOSE:
+
+           get a subset of the orbits
+
+        INPUT:
+
+           key - integer index or slice/index array
+
+        OUTPUT:
+
+           Orbit instance for an integer index, otherwise an Orbits instance; for slices, the phase-space arrays of the new instance are views of those of this instance
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        if isinstance(key,(int,nu.integer)):
+            out= Orbit(vxvv=list(self.vxvv[key]),
+                       ro=self._ro if self._roSet else None,
+                       vo=self._vo if self._voSet else None,
+                       zo=self._zo,solarmotion=self._solarmotion)
+            if not self._roSet: out._orb._ro= self._ro
+            if not self._voSet: out._orb._vo= self._vo
+            if hasattr(self,'orbit'):
+                out._orb.t= self.t
+                out._orb._pot= self._pot
+                out._orb.orbit= self.orbit[key]
+                if hasattr(self,'orbit_dxdv'):
+                    out._orb.orbit_dxdv= self.orbit_dxdv[key]
+                if getattr(self,'_denseOutput',None) is not None:
+                    out._orb._denseOutput= denseOutput(self.t,
+                                                       out._orb.orbit,
+                                                       self._pot)
+                if hasattr(self,'_integrate_t_asQuantity'):
+                    out._orb._integrate_t_asQuantity= \
+                        self._integrate_t_asQuantity
+            return out
+        out= Orbits.__new__(Orbits)
+        out.__dict__.update(self.__dict__)
+        out.vxvv= self.vxvv[key]
+        if hasattr(self,'orbit'):
+            out.orbit= self.orbit[key]
+            if hasattr(self,'orbit_dxdv'):
+                out.orbit_dxdv= self.orbit_dxdv[key]
+            if getattr(self,'_denseOutput',None) is not None:
+                out._denseOutput= denseOutput(self.t,out.orbit,self._pot)
+        return out
+
+    def dim(self):
+        """
+        NAME:
+
+           dim
+
+        PURPOSE:
+
+           return the dimension of the problem
+
+        INPUT:
+
+           (none)
+
+        OUTPUT:
+
+           dimension
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        ndim= self.vxvv.shape[1]
+        if ndim == 4: return 2
+        else: return 3
+
+    def turn_physical_off(self):
+        """
+        NAME:
+
+           turn_physical_off
+
+        PURPOSE:
+
+           turn off automatic returning of outputs in physical units
+
+        INPUT:
+
+           (none)
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        self._roSet= False
+        self._voSet= False
+        return None
+
+    def turn_physical_on(self,ro=None,vo=None):
+        """
+        NAME:
+
+           turn_physical_on
+
+        PURPOSE:
+
+           turn on automatic returning of outputs in physical units
+
+        INPUT:
+
+           ro= reference distance (kpc; can be Quantity)
+
+           vo= reference velocity (km/s; can be Quantity)
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        self._roSet= True
+        self._voSet= True
+        if not ro is None:
+            if _APY_LOADED and isinstance(ro,units.Quantity):
+                ro= ro.to(units.kpc).value
+            self._ro= ro
+        if not vo is None:
+            if _APY_LOADED and isinstance(vo,units.Quantity):
+                vo= vo.to(units.km/units.s).value
+            self._vo= vo
+        return None
+
+    def integrate(self,t,pot,method='symplec4_c',dt=None,numcores=None,
+                  executor=None,dense_output=False,OmegaP=None):
+        """
+        NAME:
+
+           integrate
+
+        PURPOSE:
+
+           integrate all orbits at once; when using a C integrator, all orbits are integrated in a single (OpenMP parallel) C call
+
+        INPUT:
+
+           t - list of times at which to output (0 has to be in this!) (can be Quantity)
+
+           pot - potential instance or list of instances
+
+           method= 'odeint' for scipy's odeint (one orbit at a time; the other python integrators below integrate all orbits at once)
+                   'leapfrog' for a simple leapfrog implementation
+                   'symplec4' for a 4th order symplectic integrator
+                   'rk4' for a 4th-order Runge-Kutta integrator
+                   'dopr54' for a Dormand-Prince integrator
+                   'dop853' for an 8th order Dormand-Prince integrator
+                   'leapfrog_c' for a simple leapfrog implementation in C
+                   'symplec4_c' for a 4th order symplectic integrator in C
+                   'symplec6_c' for a 6th order symplectic integrator in C
+                   'rk4_c' for a 4th-order Runge-Kutta integrator in C
+                   'rk6_c' for a 6-th order Runge-Kutta integrator in C
+                   'dopr54_c' for a Dormand-Prince integrator in C (generally the fastest)
+
+           dt= (None) if set, force the integrator to use this basic stepsize; must be an integer divisor of output stepsize (only works for the C integrators that use a fixed stepsize) (can be Quantity)
+
+           numcores= (None) if set, split the orbits into this many chunks and integrate them in a pool of threads (the C integrators release the GIL, so this avoids the overhead of spawning processes), each chunk using a single OpenMP thread; only used for the C integrators (without numcores and executor, all orbits are integrated in a single C call that is parallelized using OpenMP)
+
+           executor= (None) concurrent.futures.Executor (e.g., a long-lived ThreadPoolExecutor) to submit the chunks of orbits to; the orbits are split into numcores chunks (default: the number of cpus)
+
+           dense_output= (False) if True, evaluate the orbits at times that are not in t by quintic Hermite interpolation between the stored phase-space points using the forces at these points (rather than by cubic interpolation), such that the orbits can be stored on a coarse time grid
+
+           OmegaP= (None) if set, integrate the orbits in the frame rotating with this pattern speed (e.g., that of a bar or spiral; can be Quantity), in which a potential rotating with this pattern speed is static, such that the adaptive integrators can take larger steps; the orbits are returned in the inertial frame; only for orbits that track the azimuth and for the Runge-Kutta integrators ('rk4', 'dopr54', 'dop853', 'rk4_c', 'rk6_c', 'dopr54_c')
+
+        OUTPUT:
+
+           (none) (get the actual orbits using getOrbit())
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_potential_dim(self,pot)
+        _check_consistent_units(self,pot)
+        # Parse t
+        if _APY_LOADED and isinstance(t,units.Quantity):
+            self._integrate_t_asQuantity= True
+            t= t.to(units.Gyr).value\
+                /bovy_conversion.time_in_Gyr(self._vo,self._ro)
+        elif hasattr(self,'_integrate_t_asQuantity'):
+            delattr(self,'_integrate_t_asQuantity')
+        if _APY_LOADED and not dt is None and isinstance(dt,units.Quantity):
+            dt= dt.to(units.Gyr).value\
+                /bovy_conversion.time_in_Gyr(self._vo,self._ro)
+        if not _check_integrate_dt(t,dt):
+            raise ValueError('dt input (integrator stepsize) for Orbits.integrate must be an integer divisor of the output stepsize')
+        if not OmegaP is None:
+            if not self.vxvv.shape[1] in (4,6):
+                raise ValueError('Integration in a rotating frame (OmegaP=) requires orbits that track the azimuth')
+            if _APY_LOADED and isinstance(OmegaP,units.Quantity):
+                OmegaP= OmegaP.to(units.km/units.s/units.kpc).value\
+                    /bovy_conversion.freq_in_kmskpc(self._vo,self._ro)
+        self.t= nu.array(t)
+        if self.vxvv.shape[1] == 4:
+            self._pot= toPlanarPotential(pot)
+        else:
+            self._pot= pot
+        # Only the C integrators release the GIL (and scipy's odeint is not
+        # thread-safe), so only use threads for those
+        if (numcores is None and executor is None) or not '_c' in method \
+                or not ext_loaded \
+                or not nu.all([p.hasC for p in nu.atleast_1d(self._pot)]):
+            self.orbit= _integrate_vxvv(self.vxvv,self._pot,t,method,dt,
+                                        OmegaP=OmegaP)
+        else:
+            self.orbit= self._integrate_threads(t,method,dt,numcores,executor,
+                                                OmegaP)
+        if dense_output:
+            self._denseOutput= denseOutput(self.t,self.orbit,self._pot)
+        else:
+            self._denseOutput= None
+        return None
+
+    def _integrate_threads(self,t,method,dt,numcores,executor,OmegaP):
+        # Integrate chunks of orbits in different threads, all threads share
+        # the arguments for the C code cached on the potential; each C call
+        # uses a single OpenMP thread, such that the pool's threads are the
+        # only source of parallelism and the CPU is not oversubscribed
+        if numcores is None:
+            numcores= multi._ncpus
+        chunks= nu.array_split(self.vxvv,min(numcores,len(self)))
+        return nu.concatenate(\
+            multi.thread_map(lambda x: _integrate_vxvv(x,self._pot,t,
+                                                       method,dt,
+                                                       nthreads=1,
+                                                       OmegaP=OmegaP),
+                             chunks,numcores=numcores,executor=executor))
+
+    def integrate_dxdv(self,dxdv,t,pot,method='dopr54_c',
+                       rectIn=False,rectOut=False,numcores=None,
+                       executor=None):
+        """
+        NAME:
+
+           integrate_dxdv
+
+        PURPOSE:
+
+           integrate all orbits and a small area of phase space around each of them; for 3D orbits and a C integrator, all orbits are integrated in a single (OpenMP parallel) C call
+
+        INPUT:
+
+           dxdv - array with shape [N,ndim] (or [ndim] for the same difference for all orbits) of [dR,dvR,dvT,dphi] for planar orbits or [dR,dvR,dvT,dz,dvz,dphi] for 3D orbits; to obtain the Jacobian of the flow of an orbit, integrate ndim copies of the orbit with the unit vectors in phase space
+
+           t - list of times at which to output (0 has to be in this!) (can be Quantity)
+
+           pot - potential instance or list of instances
+
+           method= 'odeint' for scipy's odeint
+
+                   'rk4', 'dopr54', and 'dop853' for the python Runge-Kutta integrators (3D orbits; all orbits at once)
+
+                   'rk4_c' for a 4th-order Runge-Kutta integrator in C
+
+                   'rk6_c' for a 6-th order Runge-Kutta integrator in C
+
+                   'dopr54_c' for a Dormand-Prince integrator in C (generally the fastest)
+
+           rectIn= (False) if True, input dxdv is in rectangular coordinates
+
+           rectOut= (False) if True, output dxdv (that in orbit_dxdv) is in rectangular coordinates
+
+           numcores= (None) if set, split the orbits into this many chunks and integrate them in a pool of threads, each chunk using a single OpenMP thread (3D orbits and C integrators)
+
+           executor= (None) concurrent.futures.Executor to submit the chunks of orbits to
+
+        OUTPUT:
+
+           (none) (get the actual differences using getOrbit_dxdv(), the orbits that are integrated alongside with dxdv are stored as usual, any previous regular orbit integration will be erased!)
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        ndim= self.vxvv.shape[1]
+        if not ndim in (4,6):
+            raise AttributeError('integrate_dxdv is only implemented for planar orbits and 3D orbits that track the azimuth')
+        _check_potential_dim(self,pot)
+        _check_consistent_units(self,pot)
+        # Parse t
+        if _APY_LOADED and isinstance(t,units.Quantity):
+            self._integrate_t_asQuantity= True
+            t= t.to(units.Gyr).value\
+                /bovy_conversion.time_in_Gyr(self._vo,self._ro)
+        elif hasattr(self,'_integrate_t_asQuantity'):
+            delattr(self,'_integrate_t_asQuantity')
+        dxdv= nu.array(dxdv,dtype='float')*nu.ones_like(self.vxvv)
+        self.t= nu.array(t)
+        if ndim == 4:
+            self._pot= toPlanarPotential(pot)
+            self.orbit_dxdv= nu.array(\
+                [_integrateOrbit_dxdv(self.vxvv[ii],dxdv[ii],self._pot,t,
+                                      method,rectIn,rectOut)[0]
+                 for ii in range(len(self))])
+        else:
+            self._pot= pot
+            if (numcores is None and executor is None) \
+                    or not '_c' in method or not ext_loaded \
+                    or not nu.all([p.hasC for p in nu.atleast_1d(pot)]):
+                self.orbit_dxdv= _integrateFullOrbit_dxdv(self.vxvv,dxdv,pot,
+                                                          t,method,rectIn,
+                                                          rectOut)[0]
+            else:
+                if numcores is None:
+                    numcores= multi._ncpus
+                indx= nu.array_split(nu.arange(len(self)),
+                                     min(numcores,len(self)))
+                self.orbit_dxdv= nu.concatenate(\
+                    multi.thread_map(\
+                        lambda ii: _integrateFullOrbit_dxdv(self.vxvv[ii],
+                                                            dxdv[ii],pot,t,
+                                                            method,rectIn,
+                                                            rectOut,
+                                                            nthreads=1)[0],
+                        indx,numcores=numcores,executor=executor))
+        self.orbit= self.orbit_dxdv[...,:ndim]
+        self._denseOutput= None
+        return None
+
+    def getOrbit(self):
+        """
+        NAME:
+
+           getOrbit
+
+        PURPOSE:
+
+           return the integrated orbits
+
+        INPUT:
+
+           (none)
+
+        OUTPUT:
+
+           array with shape [N,nt,ndim] of [R,vR,vT,z,vz,phi], [R,vR,vT,z,vz], or [R,vR,vT,phi]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        return self.orbit
+
+    def getOrbit_dxdv(self):
+        """
+        NAME:
+
+           getOrbit_dxdv
+
+        PURPOSE:
+
+           return the small phase-space differences integrated with integrate_dxdv
+
+        INPUT:
+
+           (none)
+
+        OUTPUT:
+
+           array with shape [N,nt,ndim] of [dR,dvR,dvT,dz,dvz,dphi] or [dR,dvR,dvT,dphi] (rectangular if integrated with rectOut=True)
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        return self.orbit_dxdv[...,self.vxvv.shape[1]:]
+
+    def fit(self,vxvv,vxvv_err=None,pot=None,numcores=None,**kwargs):
+        """
+        NAME:
+
+           fit
+
+        PURPOSE:
+
+           fit each orbit to its own data (e.g., a set of independent streams) using the current orbits as the initial conditions, fitting the orbits in parallel
+
+        INPUT:
+
+           vxvv - list of N [:,6] arrays of positions and velocities along each orbit (see Orbit.fit for the coordinates)
+
+           vxvv_err= (None) list of N [:,6] arrays of errors on positions and velocities along each orbit
+
+           pot= Potential to fit the orbits in
+
+           numcores= (None) number of processes to fit the orbits in (default: the number of cpus)
+
+           Any other keyword of Orbit.fit (e.g., radec=, lb=, tintJ=, gradient=True to maximize the likelihood using its gradient from integrating the phase-space deviations of the orbit)
+
+        OUTPUT:
+
+           array of the maximum of the log likelihood of each orbit (the initial conditions of the orbits are set to the best fits; any previous orbit integration is erased)
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        if self.vxvv.shape[1] != 6:
+            raise AttributeError('Orbits.fit is only implemented for 3D orbits that track the azimuth')
+        if vxvv_err is None:
+            vxvv_err= [None for ii in range(len(self))]
+        def _fit_one(ii):
+            o= self[ii]
+            maxLogL= o.fit(vxvv[ii],vxvv_err=vxvv_err[ii],pot=pot,**kwargs)
+            return (o._orb.vxvv,maxLogL)
+        out= multi.parallel_map(_fit_one,range(len(self)),numcores=numcores)
+        self.vxvv= nu.array([o[0] for o in out])
+        if hasattr(self,'orbit'): delattr(self,'orbit')
+        self._denseOutput= None
+        return nu.array([o[1] for o in out])
+
+    def __call__(self,*args,**kwargs):
+        """
+        NAME:
+
+           __call__
+
+        PURPOSE:
+
+           return the phase-space coordinates of all orbits at time t
+
+        INPUT:
+
+           t - desired time or array of times (can be Quantity); times that are not integration times are obtained using cubic interpolation (or using the dense output, see integrate)
+
+        OUTPUT:
+
+           [N,ndim] array for a single time, [N,nt,ndim] for an array of times
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        if len(args) == 0:
+            return nu.array(self.vxvv)
+        else:
+            t= args[0]
+        # Parse t
+        if _APY_LOADED and isinstance(t,units.Quantity):
+            t= t.to(units.Gyr).value\
+                /bovy_conversion.time_in_Gyr(self._vo,self._ro)
+        elif hasattr(self,'_integrate_t_asQuantity') \
+                    and self._integrate_t_asQuantity \
+                    and not nu.all(t == self.t):
+            warnings.warn("You specified integration times as a Quantity, but are evaluating at times not specified as a Quantity; assuming that time given is in natural (internal) units (multiply time by unit to get output at physical time)",galpyWarning)
+        if not hasattr(self,'orbit'):
+            raise AttributeError("Orbits must be integrated before they can be evaluated at time t")
+        t= nu.array(t)
+        # Directly return integration times
+        sindx= nu.argsort(self.t)
+        indx= nu.searchsorted(self.t[sindx],nu.atleast_1d(t))
+        indx[indx >= len(self.t)]= len(self.t)-1
+        indx= sindx[indx]
+        if nu.all(self.t[indx] == nu.atleast_1d(t)):
+            return self.orbit[:,indx.reshape(t.shape)]
+        if getattr(self,'_denseOutput',None) is not None:
+            return self._denseOutput(t.flatten())\
+                .reshape((len(self),)+t.shape+(self.vxvv.shape[1],))
+        # Interpolate, phi through x and y
+        ndim= self.vxvv.shape[1]
+        if ndim == 4 or ndim == 6:
+            tosp= nu.array(self.orbit)
+            tosp[...,0]= self.orbit[...,0]*nu.cos(self.orbit[...,-1])
+            tosp[...,-1]= self.orbit[...,0]*nu.sin(self.orbit[...,-1])
+        else:
+            tosp= self.orbit
+        out= interpolate.interp1d(self.t,tosp,axis=1,kind='cubic',
+                                  assume_sorted=False)(t)
+        if ndim == 4 or ndim == 6:
+            x= nu.array(out[...,0])
+            y= out[...,-1]
+            out[...,0]= nu.sqrt(x*x+y*y)
+            out[...,-1]= nu.arctan2(y,x) % (2.*nu.pi)
+        return out
+
+    @physical_conversion('time')
+    def time(self,*args,**kwargs):
+        """
+        NAME:
+
+           time
+
+        PURPOSE:
+
+           return the times at which the orbits are sampled
+
+        INPUT:
+
+           t - (default: integration times) time at which to get the time (for consistency reasons)
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           t(t)
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        if len(args) == 0:
+            try:
+                return self.t
+            except AttributeError:
+                return 0.
+        else: return args[0]
+
+    @physical_conversion('position')
+    def R(self,*args,**kwargs):
+        """
+        NAME:
+
+           R
+
+        PURPOSE:
+
+           return cylindrical radius at time t
+
+        INPUT:
+
+           t - (optional) time at which to get the radius (can be Quantity)
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           R(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        return self(*args,**kwargs)[...,0]
+
+    @physical_conversion('position')
+    def r(self,*args,**kwargs):
+        """
+        NAME:
+
+           r
+
+        PURPOSE:
+
+           return spherical radius at time t
+
+        INPUT:
+
+           t - (optional) time at which to get the radius (can be Quantity)
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           r(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        thiso= self(*args,**kwargs)
+        if self.dim() == 3:
+            return nu.sqrt(thiso[...,0]**2.+thiso[...,3]**2.)
+        else:
+            return nu.fabs(thiso[...,0])
+
+    @physical_conversion('velocity')
+    def vR(self,*args,**kwargs):
+        """
+        NAME:
+
+           vR
+
+        PURPOSE:
+
+           return radial velocity at time t
+
+        INPUT:
+
+           t - (optional) time at which to get the radial velocity (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           vR(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        return self(*args,**kwargs)[...,1]
+
+    @physical_conversion('velocity')
+    def vT(self,*args,**kwargs):
+        """
+        NAME:
+
+           vT
+
+        PURPOSE:
+
+           return tangential velocity at time t
+
+        INPUT:
+
+           t - (optional) time at which to get the tangential velocity (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           vT(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        return self(*args,**kwargs)[...,2]
+
+    @physical_conversion('position')
+    def z(self,*args,**kwargs):
+        """
+        NAME:
+
+           z
+
+        PURPOSE:
+
+           return vertical height
+
+        INPUT:
+
+           t - (optional) time at which to get the vertical height (can be Quantity)
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           z(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        if self.vxvv.shape[1] < 5:
+            raise AttributeError("orbit must track z to use z()")
+        return self(*args,**kwargs)[...,3]
+
+    @physical_conversion('velocity')
+    def vz(self,*args,**kwargs):
+        """
+        NAME:
+
+           vz
+
+        PURPOSE:
+
+           return vertical velocity
+
+        INPUT:
+
+           t - (optional) time at which to get the vertical velocity (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           vz(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        if self.vxvv.shape[1] < 5:
+            raise AttributeError("orbit must track vz to use vz()")
+        return self(*args,**kwargs)[...,4]
+
+    @physical_conversion('angle')
+    def phi(self,*args,**kwargs):
+        """
+        NAME:
+
+           phi
+
+        PURPOSE:
+
+           return azimuth
+
+        INPUT:
+
+           t - (optional) time at which to get the azimuth (can be Quantity)
+
+        OUTPUT:
+
+           phi(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        if self.vxvv.shape[1] != 4 and self.vxvv.shape[1] != 6:
+            raise AttributeError("orbit must track azimuth to use phi()")
+        return self(*args,**kwargs)[...,-1]
+
+    @physical_conversion('frequency')
+    def vphi(self,*args,**kwargs):
+        """
+        NAME:
+
+           vphi
+
+        PURPOSE:
+
+           return angular velocity
+
+        INPUT:
+
+           t - (optional) time at which to get the angular velocity (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           vphi(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        thiso= self(*args,**kwargs)
+        return thiso[...,2]/thiso[...,0]
+
+    @physical_conversion('position')
+    def x(self,*args,**kwargs):
+        """
+        NAME:
+
+           x
+
+        PURPOSE:
+
+           return x
+
+        INPUT:
+
+           t - (optional) time at which to get x (can be Quantity)
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           x(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        thiso= self(*args,**kwargs)
+        if self.vxvv.shape[1] != 4 and self.vxvv.shape[1] != 6:
+            raise AttributeError("orbit must track azimuth to use x()")
+        return thiso[...,0]*nu.cos(thiso[...,-1])
+
+    @physical_conversion('position')
+    def y(self,*args,**kwargs):
+        """
+        NAME:
+
+           y
+
+        PURPOSE:
+
+           return y
+
+        INPUT:
+
+           t - (optional) time at which to get y (can be Quantity)
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           y(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        thiso= self(*args,**kwargs)
+        if self.vxvv.shape[1] != 4 and self.vxvv.shape[1] != 6:
+            raise AttributeError("orbit must track azimuth to use y()")
+        return thiso[...,0]*nu.sin(thiso[...,-1])
+
+    @physical_conversion('velocity')
+    def vx(self,*args,**kwargs):
+        """
+        NAME:
+
+           vx
+
+        PURPOSE:
+
+           return x velocity at time t
+
+        INPUT:
+
+           t - (optional) time at which to get the velocity (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           vx(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        thiso= self(*args,**kwargs)
+        if self.vxvv.shape[1] != 4 and self.vxvv.shape[1] != 6:
+            raise AttributeError("orbit must track azimuth to use vx()")
+        return thiso[...,1]*nu.cos(thiso[...,-1])\
+            -thiso[...,2]*nu.sin(thiso[...,-1])
+
+    @physical_conversion('velocity')
+    def vy(self,*args,**kwargs):
+        """
+        NAME:
+
+           vy
+
+        PURPOSE:
+
+           return y velocity at time t
+
+        INPUT:
+
+           t - (optional) time at which to get the velocity (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           vy(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        thiso= self(*args,**kwargs)
+        if self.vxvv.shape[1] != 4 and self.vxvv.shape[1] != 6:
+            raise AttributeError("orbit must track azimuth to use vy()")
+        return thiso[...,2]*nu.cos(thiso[...,-1])\
+            +thiso[...,1]*nu.sin(thiso[...,-1])
+
+    @physical_conversion('action')
+    def Lz(self,*args,**kwargs):
+        """
+        NAME:
+
+           Lz
+
+        PURPOSE:
+
+           calculate the z-component of the angular momentum
+
+        INPUT:
+
+           t - (optional) time at which to get the angular momentum (can be Quantity)
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           Lz(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        thiso= self(*args,**kwargs)
+        return thiso[...,0]*thiso[...,2]
+
+    @physical_conversion('energy')
+    def E(self,*args,**kwargs):
+        """
+        NAME:
+
+           E
+
+        PURPOSE:
+
+           calculate the energy, evaluating the potential for all orbits and times at once (the potential therefore needs to support array input)
+
+        INPUT:
+
+           t - (optional) time at which to get the energy (can be Quantity)
+
+           pot= Potential instance or list of such instances (default: potential used to integrate the orbits)
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           energy [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        if not 'pot' in kwargs or kwargs['pot'] is None:
+            try:
+                pot= self._pot
+            except AttributeError:
+                raise AttributeError("Integrate orbits or specify pot=")
+            if 'pot' in kwargs and kwargs['pot'] is None:
+                kwargs.pop('pot')
+        else:
+            pot= kwargs.pop('pot')
+        thiso= self(*args,**kwargs)
+        if len(args) > 0:
+            t= args[0]
+            if _APY_LOADED and isinstance(t,units.Quantity):
+                t= t.to(units.Gyr).value\
+                    /bovy_conversion.time_in_Gyr(self._vo,self._ro)
+            t= nu.ones(thiso.shape[:-1])*t
+        else:
+            t= 0.
+        ndim= self.vxvv.shape[1]
+        if ndim == 4:
+            return _evaluateplanarPotentials(toPlanarPotential(pot),
+                                             thiso[...,0],phi=thiso[...,3],
+                                             t=t)\
+                                             +thiso[...,1]**2./2.\
+                                             +thiso[...,2]**2./2.
+        elif ndim == 5:
+            return evaluatePotentials(pot,thiso[...,0],thiso[...,3],
+                                      t=t,use_physical=False)\
+                                      +thiso[...,1]**2./2.\
+                                      +thiso[...,2]**2./2.\
+                                      +thiso[...,4]**2./2.
+        else:
+            return evaluatePotentials(pot,thiso[...,0],thiso[...,3],
+                                      phi=thiso[...,5],t=t,
+                                      use_physical=False)\
+                                      +thiso[...,1]**2./2.\
+                                      +thiso[...,2]**2./2.\
+                                      +thiso[...,4]**2./2.
+
+    def e(self,analytic=False,pot=None):
+        """
+        NAME:
+
+           e
+
+        PURPOSE:
+
+           calculate the eccentricity of all orbits
+
+        INPUT:
+
+           analytic - compute this analytically (using actionAngleAdiabatic, one orbit at a time)
+
+           pot - potential to use for analytical calculation
+
+        OUTPUT:
+
+           eccentricity [N]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        if analytic:
+            rperi,rap= self._calcRapRperi(pot)
+        else:
+            rperi, rap= self._rperirap()
+        return (rap-rperi)/(rap+rperi)
+
+    @physical_conversion('position')
+    def rap(self,analytic=False,pot=None,**kwargs):
+        """
+        NAME:
+
+           rap
+
+        PURPOSE:
+
+           calculate the apocenter radius of all orbits
+
+        INPUT:
+
+           analytic - compute this analytically (using actionAngleAdiabatic, one orbit at a time)
+
+           pot - potential to use for analytical calculation
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           R_ap [N]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        if analytic:
+            return self._calcRapRperi(pot)[1]
+        return self._rperirap()[1]
+
+    @physical_conversion('position')
+    def rperi(self,analytic=False,pot=None,**kwargs):
+        """
+        NAME:
+
+           rperi
+
+        PURPOSE:
+
+           calculate the pericenter radius of all orbits
+
+        INPUT:
+
+           analytic - compute this analytically (using actionAngleAdiabatic, one orbit at a time)
+
+           pot - potential to use for analytical calculation
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           R_peri [N]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        if analytic:
+            return self._calcRapRperi(pot)[0]
+        return self._rperirap()[0]
+
+    @physical_conversion('position')
+    def zmax(self,analytic=False,pot=None,**kwargs):
+        """
+        NAME:
+
+           zmax
+
+        PURPOSE:
+
+           calculate the maximum vertical height of all orbits
+
+        INPUT:
+
+           analytic - compute this analytically (using actionAngleAdiabatic, one orbit at a time)
+
+           pot - potential to use for analytical calculation
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           Z_max [N]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        if self.dim() == 2:
+            raise AttributeError("planar orbits do not have a maximum vertical height")
+        if analytic:
+            _check_consistent_units(self,pot)
+            self._setupaA(pot=pot,type='adiabatic')
+            return nu.array([self._aA.calczmax(*v[:5]) for v in self.vxvv])
+        if not hasattr(self,'orbit'):
+            raise AttributeError("Integrate the orbits first")
+        zmax= nu.amax(nu.fabs(self.orbit[...,3]),axis=1)
+        if getattr(self,'_denseOutput',None) is not None:
+            indx,_,ev= self._denseOutput.events('zmax')
+            nu.maximum.at(zmax,indx,nu.fabs(ev[:,3]))
+        return zmax
+
+    def events(self,event,direction=0):
+        """
+        NAME:
+
+           events
+
+        PURPOSE:
+
+           find the events along all integrated orbits (e.g., all pericenters), located precisely using the dense output of the orbits (see integrate); the events of all orbits are found at once
+
+        INPUT:
+
+           event - 'rperi' (pericenters), 'rap' (apocenters), 'zmax' (maxima of |z|), 'zcross' (disk crossings), or a function event(t,vxvv) that returns the event function for arrays of times t [n] and phase-space points vxvv [n,ndim] (in natural units); events are zero crossings of the event function
+
+           direction= (0) for a function event, only find crossings from negative to positive (+1), from positive to negative (-1), or both (0)
+
+        OUTPUT:
+
+           list of (t,vxvv) for each orbit: times [nev] and phase-space points [nev,ndim] of the events (in natural units)
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        if not hasattr(self,'orbit'):
+            raise AttributeError("Integrate the orbits first")
+        dense= getattr(self,'_denseOutput',None)
+        if dense is None:
+            dense= denseOutput(self.t,self.orbit,self._pot)
+        indx,t,vxvv= dense.events(event,direction=direction)
+        split= nu.searchsorted(indx,nu.arange(1,len(self)))
+        return list(zip(nu.split(t,split),nu.split(vxvv,split)))
+
+    def _rs(self):
+        """Spherical radii along the integrated orbits [N,nt]"""
+        if not hasattr(self,'orbit'):
+            raise AttributeError("Integrate the orbits first")
+        if self.dim() == 2:
+            return nu.fabs(self.orbit[...,0])
+        return nu.sqrt(self.orbit[...,0]**2.+self.orbit[...,3]**2.)
+
+    def _rperirap(self):
+        """Numerical (rperi,rap) for all orbits, including the peri- and apocenters found using the dense output (if the orbits have dense output)"""
+        rs= self._rs()
+        rperi, rap= nu.amin(rs,axis=1), nu.amax(rs,axis=1)
+        if getattr(self,'_denseOutput',None) is not None:
+            for event,ufunc,out in [('rperi',nu.minimum,rperi),
+                                    ('rap',nu.maximum,rap)]:
+                indx,_,ev= self._denseOutput.events(event)
+                if self.dim() == 2:
+                    ufunc.at(out,indx,nu.fabs(ev[:,0]))
+                else:
+                    ufunc.at(out,indx,nu.sqrt(ev[:,0]**2.+ev[:,3]**2.))
+        return (rperi,rap)
+
+    def _calcRapRperi(self,pot):
+        """Analytic (rperi,rap) for all orbits"""
+        _check_consistent_units(self,pot)
+        self._setupaA(pot=pot,type='adiabatic')
+        if self.dim() == 2:
+            out= [self._aA.calcRapRperi(v[0],v[1],v[2],0.,0.)
+                  for v in self.vxvv]
+        else:
+            out= [self._aA.calcRapRperi(*v[:5]) for v in self.vxvv]
+        out= nu.array(out)
+        return (out[:,0],out[:,1])
+
+    def resetaA(self,pot=None,type=None):
+        """
+        NAME:
+
+           resetaA
+
+        PURPOSE:
+
+           re-set up the actionAngle module used for the actions, frequencies, and angles of these orbits
+
+        INPUT:
+
+           (none)
+
+        OUTPUT:
+
+           True if reset happened, False otherwise
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        try:
+            delattr(self,'_aA')
+        except AttributeError:
+            return False
+        else:
+            return True
+
+    def _setupaA(self,pot=None,type='adiabatic',**kwargs):
+        """
+        NAME:
+
+           _setupaA
+
+        PURPOSE:
+
+           set up an actionAngle module for these orbits
+
+        INPUT:
+
+           pot - potential
+
+           type= ('adiabatic') type of actionAngle module to use
+
+              1) 'adiabatic'
+
+              2) 'staeckel'
+
+              3) 'isochroneApprox'
+
+              4) 'spherical'
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        if hasattr(self,'_aA'):
+            if (pot is None or pot == self._aAPot) \
+                    and type.lower() == self._aAType.lower():
+                return None
+            delattr(self,'_aA')
+        if pot is None:
+            try:
+                pot= self._pot
+            except AttributeError:
+                raise AttributeError("Integrate orbits or specify pot=")
+        self._aAPot= pot
+        self._aAType= type
+        if self._aAType.lower() == 'adiabatic':
+            self._aA= actionAngle.actionAngleAdiabatic(pot=self._aAPot,
+                                                       **kwargs)
+        elif self._aAType.lower() == 'staeckel':
+            self._aA= actionAngle.actionAngleStaeckel(pot=self._aAPot,
+                                                      **kwargs)
+        elif self._aAType.lower() == 'isochroneapprox':
+            from galpy.actionAngle_src.actionAngleIsochroneApprox import actionAngleIsochroneApprox
+            self._aA= actionAngleIsochroneApprox(pot=self._aAPot,
+                                                 **kwargs)
+        elif self._aAType.lower() == 'spherical':
+            self._aA= actionAngle.actionAngleSpherical(pot=self._aAPot,
+                                                       **kwargs)
+        return None
+
+    def _aAeval(self,func,pot,kwargs):
+        """Evaluate the actionAngle method func (__call__, actionsFreqs, or actionsFreqsAngles) for all orbits at once, at their initial conditions"""
+        _check_consistent_units(self,pot)
+        for key in ['ro','vo','use_physical','quantity']:
+            kwargs.pop(key,None)
+        self._setupaA(pot=pot,**kwargs)
+        ndim= self.vxvv.shape[1]
+        if ndim == 4:
+            zeros= nu.zeros(len(self))
+            args= (self.vxvv[:,0],self.vxvv[:,1],self.vxvv[:,2],
+                   zeros,zeros,self.vxvv[:,3])
+        else:
+            args= tuple(self.vxvv.T)
+        if func == '__call__':
+            return self._aA(*args,use_physical=False)
+        return getattr(self._aA,func)(*args,use_physical=False)
+
+    @physical_conversion('action')
+    def jr(self,pot=None,**kwargs):
+        """
+        NAME:
+
+           jr
+
+        PURPOSE:
+
+           calculate the radial action of all orbits (in a single call to the actionAngle module)
+
+        INPUT:
+
+           pot - potential
+
+           type= ('adiabatic') type of actionAngle module to use ('adiabatic', 'staeckel', 'isochroneApprox', or 'spherical')
+
+           +actionAngle module setup kwargs
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           jr [N]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        return self._aAeval('__call__',pot,kwargs)[0]
+
+    @physical_conversion('action')
+    def jp(self,pot=None,**kwargs):
+        """
+        NAME:
+
+           jp
+
+        PURPOSE:
+
+           calculate the azimuthal action of all orbits (in a single call to the actionAngle module)
+
+        INPUT:
+
+           pot - potential
+
+           type= ('adiabatic') type of actionAngle module to use ('adiabatic', 'staeckel', 'isochroneApprox', or 'spherical')
+
+           +actionAngle module setup kwargs
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           jp [N]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        return self._aAeval('__call__',pot,kwargs)[1]
+
+    @physical_conversion('action')
+    def jz(self,pot=None,**kwargs):
+        """
+        NAME:
+
+           jz
+
+        PURPOSE:
+
+           calculate the vertical action of all orbits (in a single call to the actionAngle module)
+
+        INPUT:
+
+           pot - potential
+
+           type= ('adiabatic') type of actionAngle module to use ('adiabatic', 'staeckel', 'isochroneApprox', or 'spherical')
+
+           +actionAngle module setup kwargs
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           jz [N]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        return self._aAeval('__call__',pot,kwargs)[2]
+
+    @physical_conversion('angle')
+    def wr(self,pot=None,**kwargs):
+        """
+        NAME:
+
+           wr
+
+        PURPOSE:
+
+           calculate the radial angle of all orbits (in a single call to the actionAngle module)
+
+        INPUT:
+
+           pot - potential
+
+           type= ('adiabatic') type of actionAngle module to use ('adiabatic', 'staeckel', 'isochroneApprox', or 'spherical')
+
+           +actionAngle module setup kwargs
+
+        OUTPUT:
+
+           wr [N]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        return self._aAeval('actionsFreqsAngles',pot,kwargs)[6]
+
+    @physical_conversion('angle')
+    def wp(self,pot=None,**kwargs):
+        """
+        NAME:
+
+           wp
+
+        PURPOSE:
+
+           calculate the azimuthal angle of all orbits (in a single call to the actionAngle module)
+
+        INPUT:
+
+           pot - potential
+
+           type= ('adiabatic') type of actionAngle module to use ('adiabatic', 'staeckel', 'isochroneApprox', or 'spherical')
+
+           +actionAngle module setup kwargs
+
+        OUTPUT:
+
+           wp [N]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        return self._aAeval('actionsFreqsAngles',pot,kwargs)[7]
+
+    @physical_conversion('angle')
+    def wz(self,pot=None,**kwargs):
+        """
+        NAME:
+
+           wz
+
+        PURPOSE:
+
+           calculate the vertical angle of all orbits (in a single call to the actionAngle module)
+
+        INPUT:
+
+           pot - potential
+
+           type= ('adiabatic') type of actionAngle module to use ('adiabatic', 'staeckel', 'isochroneApprox', or 'spherical')
+
+           +actionAngle module setup kwargs
+
+        OUTPUT:
+
+           wz [N]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        return self._aAeval('actionsFreqsAngles',pot,kwargs)[8]
+
+    @physical_conversion('time')
+    def Tr(self,pot=None,**kwargs):
+        """
+        NAME:
+
+           Tr
+
+        PURPOSE:
+
+           calculate the radial period of all orbits (in a single call to the actionAngle module)
+
+        INPUT:
+
+           pot - potential
+
+           type= ('adiabatic') type of actionAngle module to use ('adiabatic', 'staeckel', 'isochroneApprox', or 'spherical')
+
+           +actionAngle module setup kwargs
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           Tr [N]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        return 2.*nu.pi/self._aAeval('actionsFreqs',pot,kwargs)[3]
+
+    @physical_conversion('time')
+    def Tp(self,pot=None,**kwargs):
+        """
+        NAME:
+
+           Tp
+
+        PURPOSE:
+
+           calculate the azimuthal period of all orbits (in a single call to the actionAngle module)
+
+        INPUT:
+
+           pot - potential
+
+           type= ('adiabatic') type of actionAngle module to use ('adiabatic', 'staeckel', 'isochroneApprox', or 'spherical')
+
+           +actionAngle module setup kwargs
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           Tp [N]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        return 2.*nu.pi/self._aAeval('actionsFreqs',pot,kwargs)[4]
+
+    def TrTp(self,pot=None,**kwargs):
+        """
+        NAME:
+
+           TrTp
+
+        PURPOSE:
+
+           the 'ratio' between the radial and azimuthal period Tr/Tphi*pi of all orbits
+
+        INPUT:
+
+           pot - potential
+
+           type= ('adiabatic') type of actionAngle module to use ('adiabatic', 'staeckel', 'isochroneApprox', or 'spherical')
+
+           +actionAngle module setup kwargs
+
+        OUTPUT:
+
+           Tr/Tp*pi [N]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        out= self._aAeval('actionsFreqs',pot,kwargs)
+        return out[4]/out[3]*nu.pi
+
+    @physical_conversion('time')
+    def Tz(self,pot=None,**kwargs):
+        """
+        NAME:
+
+           Tz
+
+        PURPOSE:
+
+           calculate the vertical period of all orbits (in a single call to the actionAngle module)
+
+        INPUT:
+
+           pot - potential
+
+           type= ('adiabatic') type of actionAngle module to use ('adiabatic', 'staeckel', 'isochroneApprox', or 'spherical')
+
+           +actionAngle module setup kwargs
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           Tz [N]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        return 2.*nu.pi/self._aAeval('actionsFreqs',pot,kwargs)[5]
+
+    @physical_conversion('frequency')
+    def Or(self,pot=None,**kwargs):
+        """
+        NAME:
+
+           Or
+
+        PURPOSE:
+
+           calculate the radial frequency of all orbits (in a single call to the actionAngle module)
+
+        INPUT:
+
+           pot - potential
+
+           type= ('adiabatic') type of actionAngle module to use ('adiabatic', 'staeckel', 'isochroneApprox', or 'spherical')
+
+           +actionAngle module setup kwargs
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           Or [N]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        return self._aAeval('actionsFreqs',pot,kwargs)[3]
+
+    @physical_conversion('frequency')
+    def Op(self,pot=None,**kwargs):
+        """
+        NAME:
+
+           Op
+
+        PURPOSE:
+
+           calculate the azimuthal frequency of all orbits (in a single call to the actionAngle module)
+
+        INPUT:
+
+           pot - potential
+
+           type= ('adiabatic') type of actionAngle module to use ('adiabatic', 'staeckel', 'isochroneApprox', or 'spherical')
+
+           +actionAngle module setup kwargs
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           Op [N]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        return self._aAeval('actionsFreqs',pot,kwargs)[4]
+
+    @physical_conversion('frequency')
+    def Oz(self,pot=None,**kwargs):
+        """
+        NAME:
+
+           Oz
+
+        PURPOSE:
+
+           calculate the vertical frequency of all orbits (in a single call to the actionAngle module)
+
+        INPUT:
+
+           pot - potential
+
+           type= ('adiabatic') type of actionAngle module to use ('adiabatic', 'staeckel', 'isochroneApprox', or 'spherical')
+
+           +actionAngle module setup kwargs
+
+           ro= (Object-wide default) physical scale for distances to use to convert (can be Quantity)
+
+           vo= (Object-wide default) physical scale for velocities to use to convert (can be Quantity)
+
+           use_physical= use to override Object-wide default for using a physical scale for output
+
+        OUTPUT:
+
+           Oz [N]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        return self._aAeval('actionsFreqs',pot,kwargs)[5]
+
+    @physical_conversion('angle_deg')
+    def ra(self,*args,**kwargs):
+        """
+        NAME:
+
+           ra
+
+        PURPOSE:
+
+           return the right ascension
+
+        INPUT:
+
+           t - (optional) time at which to get ra (can be Quantity)
+
+           obs=[X,Y,Z] - (optional) position of observer (in kpc; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           ra(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'ra')
+        return self._radec(*args,**kwargs)[...,0]
+
+    @physical_conversion('angle_deg')
+    def dec(self,*args,**kwargs):
+        """
+        NAME:
+
+           dec
+
+        PURPOSE:
+
+           return the declination
+
+        INPUT:
+
+           t - (optional) time at which to get dec (can be Quantity)
+
+           obs=[X,Y,Z] - (optional) position of observer (in kpc; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           dec(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'dec')
+        return self._radec(*args,**kwargs)[...,1]
+
+    @physical_conversion('angle_deg')
+    def ll(self,*args,**kwargs):
+        """
+        NAME:
+
+           ll
+
+        PURPOSE:
+
+           return Galactic longitude
+
+        INPUT:
+
+           t - (optional) time at which to get ll (can be Quantity)
+
+           obs=[X,Y,Z] - (optional) position of observer (in kpc; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           l(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'ll')
+        return self._lbd(*args,**kwargs)[...,0]
+
+    @physical_conversion('angle_deg')
+    def bb(self,*args,**kwargs):
+        """
+        NAME:
+
+           bb
+
+        PURPOSE:
+
+           return Galactic latitude
+
+        INPUT:
+
+           t - (optional) time at which to get bb (can be Quantity)
+
+           obs=[X,Y,Z] - (optional) position of observer (in kpc; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           b(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'bb')
+        return self._lbd(*args,**kwargs)[...,1]
+
+    @physical_conversion('position_kpc')
+    def dist(self,*args,**kwargs):
+        """
+        NAME:
+
+           dist
+
+        PURPOSE:
+
+           return distance from the observer in kpc
+
+        INPUT:
+
+           t - (optional) time at which to get dist (can be Quantity)
+
+           obs=[X,Y,Z] - (optional) position of observer (in kpc; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           dist(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'dist')
+        return self._lbd(*args,**kwargs)[...,2]
+
+    @physical_conversion('proper-motion_masyr')
+    def pmra(self,*args,**kwargs):
+        """
+        NAME:
+
+           pmra
+
+        PURPOSE:
+
+           return proper motion in right ascension (in mas/yr)
+
+        INPUT:
+
+           t - (optional) time at which to get pmra (can be Quantity)
+
+           obs=[X,Y,Z,vx,vy,vz] - (optional) position and velocity of observer (in kpc and km/s; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+           vo= velocity in km/s corresponding to v=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           pm_ra(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'pmra')
+        _check_voSet(self,kwargs,'pmra')
+        return self._pmrapmdec(*args,**kwargs)[...,0]
+
+    @physical_conversion('proper-motion_masyr')
+    def pmdec(self,*args,**kwargs):
+        """
+        NAME:
+
+           pmdec
+
+        PURPOSE:
+
+           return proper motion in declination (in mas/yr)
+
+        INPUT:
+
+           t - (optional) time at which to get pmdec (can be Quantity)
+
+           obs=[X,Y,Z,vx,vy,vz] - (optional) position and velocity of observer (in kpc and km/s; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+           vo= velocity in km/s corresponding to v=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           pm_dec(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'pmdec')
+        _check_voSet(self,kwargs,'pmdec')
+        return self._pmrapmdec(*args,**kwargs)[...,1]
+
+    @physical_conversion('proper-motion_masyr')
+    def pmll(self,*args,**kwargs):
+        """
+        NAME:
+
+           pmll
+
+        PURPOSE:
+
+           return proper motion in Galactic longitude (in mas/yr)
+
+        INPUT:
+
+           t - (optional) time at which to get pmll (can be Quantity)
+
+           obs=[X,Y,Z,vx,vy,vz] - (optional) position and velocity of observer (in kpc and km/s; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+           vo= velocity in km/s corresponding to v=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           pm_l(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'pmll')
+        _check_voSet(self,kwargs,'pmll')
+        return self._lbdvrpmllpmbb(*args,**kwargs)[...,4]
+
+    @physical_conversion('proper-motion_masyr')
+    def pmbb(self,*args,**kwargs):
+        """
+        NAME:
+
+           pmbb
+
+        PURPOSE:
+
+           return proper motion in Galactic latitude (in mas/yr)
+
+        INPUT:
+
+           t - (optional) time at which to get pmbb (can be Quantity)
+
+           obs=[X,Y,Z,vx,vy,vz] - (optional) position and velocity of observer (in kpc and km/s; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+           vo= velocity in km/s corresponding to v=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           pm_b(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'pmbb')
+        _check_voSet(self,kwargs,'pmbb')
+        return self._lbdvrpmllpmbb(*args,**kwargs)[...,5]
+
+    @physical_conversion('velocity_kms')
+    def vlos(self,*args,**kwargs):
+        """
+        NAME:
+
+           vlos
+
+        PURPOSE:
+
+           return the line-of-sight velocity (in km/s)
+
+        INPUT:
+
+           t - (optional) time at which to get vlos (can be Quantity)
+
+           obs=[X,Y,Z,vx,vy,vz] - (optional) position and velocity of observer (in kpc and km/s; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+           vo= velocity in km/s corresponding to v=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           vlos(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'vlos')
+        _check_voSet(self,kwargs,'vlos')
+        return self._lbdvrpmllpmbb(*args,**kwargs)[...,3]
+
+    @physical_conversion('velocity_kms')
+    def vra(self,*args,**kwargs):
+        """
+        NAME:
+
+           vra
+
+        PURPOSE:
+
+           return velocity in right ascension (km/s)
+
+        INPUT:
+
+           t - (optional) time at which to get vra (can be Quantity)
+
+           obs=[X,Y,Z,vx,vy,vz] - (optional) position and velocity of observer (in kpc and km/s; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+           vo= velocity in km/s corresponding to v=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           v_ra(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'vra')
+        _check_voSet(self,kwargs,'vra')
+        lbdvrpmllpmbb= self._lbdvrpmllpmbb(*args,**kwargs)
+        return lbdvrpmllpmbb[...,2]*_K\
+            *self._pmrapmdec(*args,lbdvrpmllpmbb=lbdvrpmllpmbb)[...,0]
+
+    @physical_conversion('velocity_kms')
+    def vdec(self,*args,**kwargs):
+        """
+        NAME:
+
+           vdec
+
+        PURPOSE:
+
+           return velocity in declination (km/s)
+
+        INPUT:
+
+           t - (optional) time at which to get vdec (can be Quantity)
+
+           obs=[X,Y,Z,vx,vy,vz] - (optional) position and velocity of observer (in kpc and km/s; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+           vo= velocity in km/s corresponding to v=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           v_dec(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'vdec')
+        _check_voSet(self,kwargs,'vdec')
+        lbdvrpmllpmbb= self._lbdvrpmllpmbb(*args,**kwargs)
+        return lbdvrpmllpmbb[...,2]*_K\
+            *self._pmrapmdec(*args,lbdvrpmllpmbb=lbdvrpmllpmbb)[...,1]
+
+    @physical_conversion('velocity_kms')
+    def vll(self,*args,**kwargs):
+        """
+        NAME:
+
+           vll
+
+        PURPOSE:
+
+           return the velocity in Galactic longitude (km/s)
+
+        INPUT:
+
+           t - (optional) time at which to get vll (can be Quantity)
+
+           obs=[X,Y,Z,vx,vy,vz] - (optional) position and velocity of observer (in kpc and km/s; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+           vo= velocity in km/s corresponding to v=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           v_l(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'vll')
+        _check_voSet(self,kwargs,'vll')
+        lbdvrpmllpmbb= self._lbdvrpmllpmbb(*args,**kwargs)
+        return lbdvrpmllpmbb[...,2]*_K*lbdvrpmllpmbb[...,4]
+
+    @physical_conversion('velocity_kms')
+    def vbb(self,*args,**kwargs):
+        """
+        NAME:
+
+           vbb
+
+        PURPOSE:
+
+           return the velocity in Galactic latitude (km/s)
+
+        INPUT:
+
+           t - (optional) time at which to get vbb (can be Quantity)
+
+           obs=[X,Y,Z,vx,vy,vz] - (optional) position and velocity of observer (in kpc and km/s; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+           vo= velocity in km/s corresponding to v=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           v_b(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'vbb')
+        _check_voSet(self,kwargs,'vbb')
+        lbdvrpmllpmbb= self._lbdvrpmllpmbb(*args,**kwargs)
+        return lbdvrpmllpmbb[...,2]*_K*lbdvrpmllpmbb[...,5]
+
+    @physical_conversion('position_kpc')
+    def helioX(self,*args,**kwargs):
+        """
+        NAME:
+
+           helioX
+
+        PURPOSE:
+
+           return Heliocentric Galactic rectangular x-coordinate (aka "X")
+
+        INPUT:
+
+           t - (optional) time at which to get X (can be Quantity)
+
+           obs=[X,Y,Z] - (optional) position of observer (in kpc; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           helioX(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'helioX')
+        return self._helioXYZ(*args,**kwargs)[...,0]
+
+    @physical_conversion('position_kpc')
+    def helioY(self,*args,**kwargs):
+        """
+        NAME:
+
+           helioY
+
+        PURPOSE:
+
+           return Heliocentric Galactic rectangular y-coordinate (aka "Y")
+
+        INPUT:
+
+           t - (optional) time at which to get Y (can be Quantity)
+
+           obs=[X,Y,Z] - (optional) position of observer (in kpc; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           helioY(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'helioY')
+        return self._helioXYZ(*args,**kwargs)[...,1]
+
+    @physical_conversion('position_kpc')
+    def helioZ(self,*args,**kwargs):
+        """
+        NAME:
+
+           helioZ
+
+        PURPOSE:
+
+           return Heliocentric Galactic rectangular z-coordinate (aka "Z")
+
+        INPUT:
+
+           t - (optional) time at which to get Z (can be Quantity)
+
+           obs=[X,Y,Z] - (optional) position of observer (in kpc; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           helioZ(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'helioZ')
+        return self._helioXYZ(*args,**kwargs)[...,2]
+
+    @physical_conversion('velocity_kms')
+    def U(self,*args,**kwargs):
+        """
+        NAME:
+
+           U
+
+        PURPOSE:
+
+           return Heliocentric Galactic rectangular x-velocity (aka "U")
+
+        INPUT:
+
+           t - (optional) time at which to get U (can be Quantity)
+
+           obs=[X,Y,Z,vx,vy,vz] - (optional) position and velocity of observer (in kpc and km/s; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+           vo= velocity in km/s corresponding to v=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           U(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'U')
+        _check_voSet(self,kwargs,'U')
+        return self._XYZvxvyvz(*args,**kwargs)[...,3]
+
+    @physical_conversion('velocity_kms')
+    def V(self,*args,**kwargs):
+        """
+        NAME:
+
+           V
+
+        PURPOSE:
+
+           return Heliocentric Galactic rectangular y-velocity (aka "V")
+
+        INPUT:
+
+           t - (optional) time at which to get V (can be Quantity)
+
+           obs=[X,Y,Z,vx,vy,vz] - (optional) position and velocity of observer (in kpc and km/s; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+           vo= velocity in km/s corresponding to v=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           V(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'V')
+        _check_voSet(self,kwargs,'V')
+        return self._XYZvxvyvz(*args,**kwargs)[...,4]
+
+    @physical_conversion('velocity_kms')
+    def W(self,*args,**kwargs):
+        """
+        NAME:
+
+           W
+
+        PURPOSE:
+
+           return Heliocentric Galactic rectangular z-velocity (aka "W")
+
+        INPUT:
+
+           t - (optional) time at which to get W (can be Quantity)
+
+           obs=[X,Y,Z,vx,vy,vz] - (optional) position and velocity of observer (in kpc and km/s; default=Object-wide default) OR Orbit object that corresponds to the orbit of the observer; Y is ignored and always assumed to be zero
+
+           ro= distance in kpc corresponding to R=1. (default=Object-wide default)
+
+           vo= velocity in km/s corresponding to v=1. (default=Object-wide default)
+
+        OUTPUT:
+
+           W(t) [N] or [N,nt]
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        _check_roSet(self,kwargs,'W')
+        _check_voSet(self,kwargs,'W')
+        return self._XYZvxvyvz(*args,**kwargs)[...,5]
+
+    def _radec(self,*args,**kwargs):
+        """Calculate ra and dec"""
+        lbd= self._lbd(*args,**kwargs)
+        return coords.lb_to_radec(lbd[...,0].flatten(),lbd[...,1].flatten(),
+                                  degree=True).reshape(lbd.shape[:-1]+(2,))
+
+    def _pmrapmdec(self,*args,**kwargs):
+        """Calculate pmra and pmdec"""
+        lbdvrpmllpmbb= kwargs.pop('lbdvrpmllpmbb',None)
+        if lbdvrpmllpmbb is None:
+            lbdvrpmllpmbb= self._lbdvrpmllpmbb(*args,**kwargs)
+        return coords.pmllpmbb_to_pmrapmdec(\
+            lbdvrpmllpmbb[...,4].flatten(),lbdvrpmllpmbb[...,5].flatten(),
+            lbdvrpmllpmbb[...,0].flatten(),lbdvrpmllpmbb[...,1].flatten(),
+            degree=True).reshape(lbdvrpmllpmbb.shape[:-1]+(2,))
+
+    def _lbd(self,*args,**kwargs):
+        """Calculate l,b, and d"""
+        obs, ro, vo= self._parse_radec_kwargs(kwargs,dontpop=True)
+        XYZ= self._helioXYZ(*args,**kwargs)
+        X,Y,Z= XYZ[...,0].flatten(), XYZ[...,1].flatten(), XYZ[...,2].flatten()
+        bad_indx= (X == 0.)*(Y == 0.)*(Z == 0.)
+        if True in bad_indx:
+            X[bad_indx]+= ro/10000.
+        return coords.XYZ_to_lbd(X,Y,Z,degree=True).reshape(XYZ.shape)
+
+    def _lbdvrpmllpmbb(self,*args,**kwargs):
+        """Calculate l,b,d,vr,pmll,pmbb"""
+        obs, ro, vo= self._parse_radec_kwargs(kwargs,dontpop=True)
+        XYZvxvyvz= self._XYZvxvyvz(*args,**kwargs)
+        X,Y,Z,vX,vY,vZ= [XYZvxvyvz[...,ii].flatten() for ii in range(6)]
+        bad_indx= (X == 0.)*(Y == 0.)*(Z == 0.)
+        if True in bad_indx:
+            X[bad_indx]+= ro/10000.
+        return coords.rectgal_to_sphergal(X,Y,Z,vX,vY,vZ,degree=True)\
+            .reshape(XYZvxvyvz.shape)
+
+    def _helioXYZ(self,*args,**kwargs):
+        """Calculate heliocentric rectangular coordinates, [N(,nt),3]"""
+        obs, ro, vo= self._parse_radec_kwargs(kwargs)
+        return self._XYZvxvyvz(*args,obs=obs,ro=ro,vo=vo,
+                               _novel=True,**kwargs)
+
+    def _XYZvxvyvz(self,*args,**kwargs):
+        """Calculate X,Y,Z,U,V,W, [N(,nt),6] (X,Y,Z only, [N(,nt),3], when _novel=True)"""
+        novel= kwargs.pop('_novel',False)
+        obs, ro, vo= self._parse_radec_kwargs(kwargs,vel=not novel)
+        ndim= self.vxvv.shape[1]
+        if ndim != 4 and ndim != 6:
+            raise AttributeError("orbit must track azimuth to use radeclbduvw functions")
+        thiso= self(*args)
+        R, vR, vT, phi= thiso[...,0], thiso[...,1], thiso[...,2], \
+            thiso[...,-1]
+        if ndim == 4:
+            z= nu.zeros_like(R)
+            vz= nu.zeros_like(R)
+        else:
+            z= thiso[...,3]
+            vz= thiso[...,4]
+        # Observer's position and velocity, natural units
+        if isinstance(obs,(nu.ndarray,list)):
+            Xsun, Zsun= obs[0]/ro, obs[2]/ro
+            if not novel:
+                vsun= nu.array(obs[3:6])/vo
+        else: #Orbit instance
+            obs.turn_physical_off()
+            Xsun= obs.x(*args)
+            if obs.dim() == 2:
+                Zsun= 0.*Xsun
+            else:
+                Zsun= obs.z(*args)
+            if not novel:
+                vsun= nu.array([obs.vx(*args),obs.vy(*args),
+                                0.*Xsun if obs.dim() == 2
+                                else obs.vz(*args)])
+            obs.turn_physical_on()
+        out= nu.empty(R.shape+(3 if novel else 6,))
+        if nu.ndim(Xsun) == 0:
+            # Same observer for all points: transform all at once
+            out[...,:3]= coords.galcencyl_to_XYZ(\
+                R.flatten(),phi.flatten(),z.flatten(),
+                Xsun=Xsun,Zsun=Zsun).reshape(R.shape+(3,))
+            if not novel:
+                out[...,3:]= coords.galcencyl_to_vxvyvz(\
+                    vR.flatten(),vT.flatten(),vz.flatten(),phi.flatten(),
+                    vsun=vsun,Xsun=Xsun,Zsun=Zsun).reshape(R.shape+(3,))
+        else:
+            # Observer moves: transform all orbits at once for each time
+            for ii in range(len(Xsun)):
+                out[:,ii,:3]= coords.galcencyl_to_XYZ(\
+                    R[:,ii],phi[:,ii],z[:,ii],Xsun=Xsun[ii],Zsun=Zsun[ii])
+                if not novel:
+                    out[:,ii,3:]= coords.galcencyl_to_vxvyvz(\
+                        vR[:,ii],vT[:,ii],vz[:,ii],phi[:,ii],
+                        vsun=vsun[:,ii],Xsun=Xsun[ii],Zsun=Zsun[ii])
+        out[...,:3]*= ro
+        if not novel:
+            out[...,3:]*= vo
+        return out
+
+    def _parse_radec_kwargs(self,kwargs,vel=False,dontpop=False):
+        if 'obs' in kwargs:
+            obs= kwargs['obs']
+            if not dontpop:
+                kwargs.pop('obs')
+            if isinstance(obs,(list,nu.ndarray)):
+                if len(obs) == 2:
+                    obs= [obs[0],obs[1],0.]
+                elif len(obs) == 4:
+                    obs= [obs[0],obs[1],0.,obs[2],obs[3],0.]
+                else:
+                    obs= list(obs)
+                for ii in range(len(obs)):
+                    if _APY_LOADED and isinstance(obs[ii],units.Quantity):
+                        if ii < 3:
+                            obs[ii]= obs[ii].to(units.kpc).value
+                        else:
+                            obs[ii]= obs[ii].to(units.km/units.s).value
+        else:
+            if vel:
+                obs= [self._ro,0.,self._zo,
+                      self._solarmotion[0],self._solarmotion[1]+self._vo,
+                      self._solarmotion[2]]
+            else:
+                obs= [self._ro,0.,self._zo]
+        if 'ro' in kwargs:
+            ro= kwargs['ro']
+            if _APY_LOADED and isinstance(ro,units.Quantity):
+                ro= ro.to(units.kpc).value
+            if not dontpop:
+                kwargs.pop('ro')
+        else:
+            ro= self._ro
+        if 'vo' in kwargs:
+            vo= kwargs['vo']
+            if _APY_LOADED and isinstance(vo,units.Quantity):
+                vo= vo.to(units.km/units.s).value
+            if not dontpop:
+                kwargs.pop('vo')
+        else:
+            vo= self._vo
+        return (obs,ro,vo)
+
+
+def _integrate_vxvv(vxvv,pot,t,method,dt,nthreads=None,OmegaP=None):
+    """Integrate the [N,ndim] initial conditions vxvv, returns [N,nt,ndim]; 
+    nthreads= number of OpenMP threads used by the C integrators; OmegaP= 
+    pattern speed of the frame to integrate in (6D and 4D orbits)"""
+    ndim= vxvv.shape[1]
+    if ndim == 6:
+        return _integrateFullOrbit(vxvv,pot,t,method,dt,nthreads=nthreads,
+                                   OmegaP=OmegaP)
+    elif ndim == 5:
+        return _integrateRZOrbit(vxvv,pot,t,method,dt,nthreads=nthreads)
+    else:
+        return _integrateOrbit(vxvv,pot,t,method,dt,nthreads=nthreads,
+                               OmegaP=OmegaP)[0]
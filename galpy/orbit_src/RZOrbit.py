@@ -4,10 +4,11 @@ import numpy as nu
 from scipy import integrate
 from galpy.potential_src.Potential import _evaluateRforces, _evaluatezforces,\
     evaluatePotentials, evaluateDensities
-from galpy.util import galpyWarning
-import galpy.util.bovy_plot as plot
+from galpy.util import galpyWarning, LazyModule
+plot= LazyModule('galpy.util.bovy_plot')
 import galpy.util.bovy_symplecticode as symplecticode
-from galpy.orbit_src.FullOrbit import _integrateFullOrbit
+from galpy.orbit_src.FullOrbit import _integrateFullOrbit, _PYTHON_METHODS, \
+    _python_fallback_method
 from galpy.util.bovy_conversion import physical_conversion
 from galpy.orbit_src.OrbitTop import OrbitTop
 class RZOrbit(OrbitTop):
@@ -62,6 +63,10 @@ class RZOrbit(OrbitTop):
            pot - potential instance or list of instances
            method= 'odeint' for scipy's odeint
                    'leapfrog' for a simple leapfrog implementation
+                   'symplec4' for a 4th order symplectic integrator
+                   'rk4' for a 4th-order Runge-Kutta integrator
+                   'dopr54' for a Dormand-Prince integrator
+                   'dop853' for an 8th order Dormand-Prince integrator
                    'leapfrog_c' for a simple leapfrog implementation in C
                    'rk4_c' for a 4th-order Runge-Kutta integrator in C
                    'rk6_c' for a 6-th order Runge-Kutta integrator in C
@@ -277,7 +282,8 @@ class RZOrbit(OrbitTop):
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
-            self.rs= nu.sqrt(self.orbit[:,0]**2.+self.orbit[:,3]**2.)
+            self.rs= self._add_event_rs(nu.sqrt(self.orbit[:,0]**2.
+                                                    +self.orbit[:,3]**2.))
         return (nu.amax(self.rs)-nu.amin(self.rs))/(nu.amax(self.rs)+nu.amin(self.rs))
 
     @physical_conversion('position')
@@ -302,7 +308,8 @@ class RZOrbit(OrbitTop):
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
-            self.rs= nu.sqrt(self.orbit[:,0]**2.+self.orbit[:,3]**2.)
+            self.rs= self._add_event_rs(nu.sqrt(self.orbit[:,0]**2.
+                                                    +self.orbit[:,3]**2.))
         return nu.amax(self.rs)
 
     @physical_conversion('position')
@@ -327,7 +334,8 @@ class RZOrbit(OrbitTop):
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
-            self.rs= nu.sqrt(self.orbit[:,0]**2.+self.orbit[:,3]**2.)
+            self.rs= self._add_event_rs(nu.sqrt(self.orbit[:,0]**2.
+                                                    +self.orbit[:,3]**2.))
         return nu.amin(self.rs)
 
     @physical_conversion('position')
@@ -349,7 +357,7 @@ class RZOrbit(OrbitTop):
             return zmax
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
-        return nu.amax(nu.fabs(self.orbit[:,3]))
+        return nu.amax(self._zs())
 
     def plotEz(self,*args,**kwargs):
         """
@@ -448,7 +456,7 @@ class RZOrbit(OrbitTop):
             plot.bovy_plot(self.orbit[:,4],nu.array(self.EzJz)/self.EzJz[0],
                            *args,**kwargs)
 
-def _integrateRZOrbit(vxvv,pot,t,method,dt):
+def _integrateRZOrbit(vxvv,pot,t,method,dt,nthreads=None):
     """
     NAME:
        _integrateRZOrbit
@@ -456,15 +464,18 @@ def _integrateRZOrbit(vxvv,pot,t,method,dt):
        integrate an orbit in a Phi(R,z) potential in the (R,z) plane
     INPUT:
        vxvv - array with the initial conditions stacked like
-              [R,vR,vT,z,vz]; vR outward!
+              [R,vR,vT,z,vz]; vR outward!; shape [5] or [N,5] for N orbits
        pot - Potential instance
        t - list of times at which to output (0 has to be in this!)
-       method - 'odeint' or 'leapfrog'
+       method - 'odeint', 'leapfrog', 'symplec4', 'rk4', 'dopr54', 'dop853', or one of the C integrators
        dt - if set, force the integrator to use this basic stepsize; must be an integer divisor of output stepsize
+       nthreads= (None) number of OpenMP threads for the C integrators (default: OpenMP's default)
     OUTPUT:
-       [:,5] array of [R,vR,vT,z,vz] at each t
+       [:,5] array of [R,vR,vT,z,vz] at each t ([N,:,5] for N orbits)
     HISTORY:
        2010-04-16 - Written - Bovy (NYU)
+       2026-10-16 - Allow multiple orbits
+       2026-10-16 - Added vectorized python integrators
     """
     #First check that the potential has C
     if '_c' in method:
@@ -473,22 +484,24 @@ def _integrateRZOrbit(vxvv,pot,t,method,dt):
         else:
             allHasC= pot.hasC
         if not allHasC:
-            if ('leapfrog' in method or 'symplec' in method):
-                method= 'leapfrog'
-            else:
-                method= 'odeint'
+            method= _python_fallback_method(method,len(nu.shape(vxvv)) > 1)
             warnings.warn("Cannot use C integration because some of the potentials are not implemented in C (using %s instead)" % (method), galpyWarning)
-    if method.lower() == 'leapfrog' \
+    if method.lower() in _PYTHON_METHODS \
             or method.lower() == 'leapfrog_c' or method.lower() == 'rk4_c' \
             or method.lower() == 'rk6_c' or method.lower() == 'symplec4_c' \
             or method.lower() == 'symplec6_c' or method.lower() == 'dopr54_c':
         #We hack this by upgrading to a FullOrbit
-        this_vxvv= nu.zeros(len(vxvv)+1)
-        this_vxvv[0:len(vxvv)]= vxvv
-        tmp_out= _integrateFullOrbit(this_vxvv,pot,t,method,dt)
-        #tmp_out is (nt,6)
-        out= tmp_out[:,0:5]
+        vxvv= nu.array(vxvv)
+        this_vxvv= nu.zeros(vxvv.shape[:-1]+(6,))
+        this_vxvv[...,0:5]= vxvv
+        tmp_out= _integrateFullOrbit(this_vxvv,pot,t,method,dt,
+                                     nthreads=nthreads)
+        #tmp_out is ([N,]nt,6)
+        out= tmp_out[...,0:5]
     elif method.lower() == 'odeint':
+        if len(nu.shape(vxvv)) > 1:
+            return nu.array([_integrateRZOrbit(vxvv[ii],pot,t,'odeint',dt)
+                             for ii in range(len(vxvv))])
         l= vxvv[0]*vxvv[2]
         l2= l**2.
         init= [vxvv[0],vxvv[1],vxvv[3],vxvv[4]]
@@ -501,7 +514,7 @@ def _integrateRZOrbit(vxvv,pot,t,method,dt):
         out[:,4]= intOut[:,3]
         out[:,2]= l/out[:,0]
     #post-process to remove negative radii
-    neg_radii= (out[:,0] < 0.)
+    neg_radii= (out[...,0] < 0.)
     out[neg_radii,0]= -out[neg_radii,0]
     return out
 
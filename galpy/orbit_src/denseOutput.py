@@ -0,0 +1,306 @@
+###############################################################################
+#   denseOutput.py: dense output for integrated orbits: evaluate an orbit
+#                   at arbitrary times by quintic Hermite interpolation
+#                   between the stored phase-space points, using the
+#                   accelerations from the equations of motion at the
+#                   bracketing points
+###############################################################################
+import numpy as nu
+from galpy.potential_src.Potential import _evaluateRforces, _evaluatezforces,\
+    _evaluatephiforces
+from galpy.potential_src.planarPotential import _evaluateplanarRforces,\
+    _evaluateplanarphiforces
+from galpy.potential_src.linearPotential import _evaluatelinearForces
+class denseOutput(object):
+    """Class that evaluates an integrated orbit at arbitrary times using the stored phase-space points and the forces at these points"""
+    def __init__(self,t,orbit,pot):
+        """
+        NAME:
+           __init__
+        PURPOSE:
+           set up the dense output for an integrated orbit
+        INPUT:
+           t - times at which the orbit was stored [nt]
+           orbit - integrated orbit(s) [nt,ndim] or [N,nt,ndim] (not copied)
+           pot - potential instance or list of instances used in the integration (planar for ndim=3 or 4, linear for ndim=2)
+        OUTPUT:
+           (none)
+        HISTORY:
+           2026-10-16 - Written
+        """
+        self._single= orbit.ndim == 2
+        if self._single: orbit= orbit[nu.newaxis]
+        self._t= nu.array(t)
+        self._orbit= orbit
+        self._pot= pot
+        self._ndim= orbit.shape[-1]
+        # Sort the times (backward integrations) without copying the orbit
+        if len(self._t) > 1 and self._t[1] < self._t[0]:
+            self._sindx= nu.arange(len(self._t))[::-1]
+        else:
+            self._sindx= nu.arange(len(self._t))
+        self._tsorted= self._t[self._sindx]
+        # Accelerations are only computed when they are needed
+        self._acc= None
+        return None
+
+    def __call__(self,t):
+        """
+        NAME:
+           __call__
+        PURPOSE:
+           evaluate the orbit(s) at times t
+        INPUT:
+           t - time or array of times (anywhere within the integrated range)
+        OUTPUT:
+           [len(t),ndim] (or [N,len(t),ndim]) array of phase-space coordinates in the same coordinates as the stored orbit
+        HISTORY:
+           2026-10-16 - Written
+        """
+        t= nu.atleast_1d(t).astype('float')
+        if nu.any(t < self._tsorted[0]) or nu.any(t > self._tsorted[-1]):
+            raise ValueError("One or more requested time is not within the integrated range")
+        norb= self._orbit.shape[0]
+        out= self._interp(nu.repeat(nu.arange(norb),len(t)),
+                          nu.tile(t,norb))\
+                          .reshape((norb,len(t),self._ndim))
+        if self._single: return out[0]
+        else: return out
+
+    def events(self,event,direction=0):
+        """
+        NAME:
+           events
+        PURPOSE:
+           find the times at which an event function crosses zero along the orbit(s)
+        INPUT:
+           event - 'rperi' (pericenters), 'rap' (apocenters), 'zmax' (maximum |z|, i.e., vz=0), 'zcross' (z=0), or a function event(t,vxvv) that returns the event function for arrays t [n] and vxvv [n,ndim] (in the coordinates of the stored orbit)
+           direction= (0) only find crossings from negative to positive (+1), from positive to negative (-1), or both (0) (ignored for the named events)
+        OUTPUT:
+           (indx,t,vxvv): index of the orbit [nev], event time [nev], and phase-space coordinates at the event [nev,ndim], sorted by orbit and time
+        HISTORY:
+           2026-10-16 - Written
+        """
+        if isinstance(event,str):
+            try:
+                event, direction= _EVENTS[event]
+            except KeyError:
+                raise ValueError("Event %s not recognized" % event)
+            if self._ndim < 5 and not event is _drdt:
+                raise ValueError("Event requires an orbit with a vertical component")
+        norb, nt= self._orbit.shape[:2]
+        # Find the brackets from the event function at the stored points
+        gs= event(nu.tile(self._tsorted,norb),
+                  self._orbit[:,self._sindx].reshape((-1,self._ndim)))\
+                  .reshape((norb,nt))
+        g0, g1= gs[:,:-1], gs[:,1:]
+        if direction >= 0:
+            up= (g0 < 0.)*(g1 >= 0.)
+        else:
+            up= nu.zeros(g0.shape,dtype='bool')
+        if direction <= 0:
+            down= (g0 > 0.)*(g1 <= 0.)
+        else:
+            down= nu.zeros(g0.shape,dtype='bool')
+        # Crossings that happen exactly at the first stored point
+        first= (gs[:,0] == 0.)*(((direction >= 0)*(g1[:,0] > 0.))
+                                +((direction <= 0)*(g1[:,0] < 0.)))
+        kf= nu.arange(norb)[first]
+        kk, jj= nu.nonzero(up+down)
+        # Refine by bisection on the interpolated orbit, all events at once
+        ta= self._tsorted[jj]
+        tb= self._tsorted[jj+1]
+        ga= g0[kk,jj]
+        for ii in range(60):
+            tm= 0.5*(ta+tb)
+            if nu.all(tm == ta) or nu.all(tm == tb): break
+            gm= event(tm,self._interp(kk,tm))
+            left= (gm == 0.)+(nu.sign(gm) != nu.sign(ga))
+            tb= nu.where(left,tm,tb)
+            ta= nu.where(left,ta,tm)
+            ga= nu.where(left,ga,gm)
+        tev= 0.5*(ta+tb)
+        kk= nu.concatenate((kf,kk))
+        tev= nu.concatenate((nu.tile(self._tsorted[0],len(kf)),tev))
+        sindx= nu.lexsort((tev,kk))
+        kk, tev= kk[sindx], tev[sindx]
+        return (kk,tev,self._interp(kk,tev))
+
+    def _interp(self,k,t):
+        """Interpolate orbits k [n] at times t [n] (within the integrated range)"""
+        # O(log nt) look-up of the interval that each time is in
+        jj= nu.searchsorted(self._tsorted,t,side='right')-1
+        jj[jj >= len(self._tsorted)-1]= len(self._tsorted)-2
+        i0= self._sindx[jj]
+        i1= self._sindx[jj+1]
+        self._fill_acc(nu.unique(nu.concatenate((i0,i1))))
+        h= self._t[i1]-self._t[i0]
+        s= (t-self._t[i0])/h
+        q0, p0= self._qp(self._orbit[k,i0])
+        q1, p1= self._qp(self._orbit[k,i1])
+        a0= self._acc[k,i0]
+        a1= self._acc[k,i1]
+        # Quintic Hermite interpolation of the positions, velocities are
+        # given by its derivative
+        s= s[:,nu.newaxis]
+        h= h[:,nu.newaxis]
+        s2= s*s
+        s3= s2*s
+        s4= s3*s
+        s5= s4*s
+        q= (1.-10.*s3+15.*s4-6.*s5)*q0\
+            +(s-6.*s3+8.*s4-3.*s5)*h*p0\
+            +0.5*(s2-3.*s3+3.*s4-s5)*h**2.*a0\
+            +(10.*s3-15.*s4+6.*s5)*q1\
+            +(-4.*s3+7.*s4-3.*s5)*h*p1\
+            +0.5*(s3-2.*s4+s5)*h**2.*a1
+        p= 30.*(s4-2.*s3+s2)*(q1-q0)/h\
+            +(1.-18.*s2+32.*s3-15.*s4)*p0\
+            +0.5*(2.*s-9.*s2+12.*s3-5.*s4)*h*a0\
+            +(-12.*s2+28.*s3-15.*s4)*p1\
+            +0.5*(3.*s2-8.*s3+5.*s4)*h*a1
+        # Angular momentum for the R(,z) orbits: linearly interpolated (it
+        # is conserved for the axisymmetric potentials that these are
+        # integrated in)
+        if self._ndim == 3 or self._ndim == 5:
+            L0= self._orbit[k,i0,0]*self._orbit[k,i0,2]
+            L1= self._orbit[k,i1,0]*self._orbit[k,i1,2]
+            Lz= (1.-s[:,0])*L0+s[:,0]*L1
+        else:
+            Lz= None
+        return self._to_orbit(q,p,Lz)
+
+    def _qp(self,y):
+        """Positions and velocities [...,nq] in the interpolation coordinates (rectangular for 2D and 3D orbits, R(,z) otherwise)"""
+        if self._ndim == 6:
+            cp, sp= nu.cos(y[...,5]), nu.sin(y[...,5])
+            q= nu.stack((y[...,0]*cp,y[...,0]*sp,y[...,3]),axis=-1)
+            p= nu.stack((y[...,1]*cp-y[...,2]*sp,y[...,2]*cp+y[...,1]*sp,
+                         y[...,4]),axis=-1)
+        elif self._ndim == 5:
+            q= nu.stack((y[...,0],y[...,3]),axis=-1)
+            p= nu.stack((y[...,1],y[...,4]),axis=-1)
+        elif self._ndim == 4:
+            cp, sp= nu.cos(y[...,3]), nu.sin(y[...,3])
+            q= nu.stack((y[...,0]*cp,y[...,0]*sp),axis=-1)
+            p= nu.stack((y[...,1]*cp-y[...,2]*sp,y[...,2]*cp+y[...,1]*sp),
+                        axis=-1)
+        else: # 3 or 2, R and vR or x and vx
+            q= y[...,:1]
+            p= y[...,1:2]
+        return (q,p)
+
+    def _to_orbit(self,q,p,Lz):
+        """Convert interpolated positions and velocities back to the coordinates of the stored orbit"""
+        out= nu.empty(q.shape[:-1]+(self._ndim,))
+        if self._ndim == 6 or self._ndim == 4:
+            R= nu.sqrt(q[...,0]**2.+q[...,1]**2.)
+            phi= nu.arctan2(q[...,1],q[...,0])
+            cp, sp= nu.cos(phi), nu.sin(phi)
+            out[...,0]= R
+            out[...,1]= p[...,0]*cp+p[...,1]*sp
+            out[...,2]= p[...,1]*cp-p[...,0]*sp
+            out[...,-1]= phi % (2.*nu.pi)
+            if self._ndim == 6:
+                out[...,3]= q[...,2]
+                out[...,4]= p[...,2]
+        elif self._ndim == 5:
+            out[...,0]= q[...,0]
+            out[...,1]= p[...,0]
+            out[...,2]= Lz/q[...,0]
+            out[...,3]= q[...,1]
+            out[...,4]= p[...,1]
+        elif self._ndim == 3:
+            out[...,0]= q[...,0]
+            out[...,1]= p[...,0]
+            out[...,2]= Lz/q[...,0]
+        else:
+            out[...,0]= q[...,0]
+            out[...,1]= p[...,0]
+        return out
+
+    def _fill_acc(self,indx):
+        """Compute the accelerations at the stored times indx that have not been computed yet"""
+        nq= {6:3,5:2,4:2,3:1,2:1}[self._ndim]
+        if self._acc is None:
+            self._acc= nu.empty(self._orbit.shape[:2]+(nq,))
+            self._acc_set= nu.zeros(self._orbit.shape[1],dtype='bool')
+        indx= indx[True^self._acc_set[indx]]
+        if len(indx) == 0: return None
+        # Evaluate all orbits at all new times at once
+        y= self._orbit[:,indx].reshape((-1,self._ndim))
+        t= nu.tile(self._t[indx],self._orbit.shape[0])
+        if self._ndim == 6 or self._ndim == 4:
+            q, _= self._qp(y)
+            R= nu.sqrt(q[:,0]**2.+q[:,1]**2.)
+            phi= nu.arctan2(q[:,1],q[:,0])
+            cp, sp= q[:,0]/R, q[:,1]/R
+            if self._ndim == 6:
+                Rforce= _eval_force(_evaluateRforces,self._pot,t,R,q[:,2],
+                                    phi=phi)
+                phiforce= _eval_force(_evaluatephiforces,self._pot,t,
+                                      R,q[:,2],phi=phi)
+            else:
+                Rforce= _eval_force(_evaluateplanarRforces,self._pot,t,
+                                    R,phi=phi)
+                phiforce= _eval_force(_evaluateplanarphiforces,self._pot,t,
+                                      R,phi=phi)
+            acc= nu.empty((len(y),nq))
+            acc[:,0]= cp*Rforce-sp*phiforce/R
+            acc[:,1]= sp*Rforce+cp*phiforce/R
+            if self._ndim == 6:
+                acc[:,2]= _eval_force(_evaluatezforces,self._pot,t,
+                                      R,q[:,2],phi=phi)
+        elif self._ndim == 5:
+            acc= nu.empty((len(y),nq))
+            acc[:,0]= _eval_force(_evaluateRforces,self._pot,t,y[:,0],y[:,3])\
+                +y[:,2]**2./y[:,0]
+            acc[:,1]= _eval_force(_evaluatezforces,self._pot,t,y[:,0],y[:,3])
+        elif self._ndim == 3:
+            acc= (_eval_force(_evaluateplanarRforces,self._pot,t,y[:,0])
+                  +y[:,2]**2./y[:,0])[:,nu.newaxis]
+        else:
+            acc= _eval_force(_evaluatelinearForces,self._pot,t,
+                             y[:,0])[:,nu.newaxis]
+        self._acc[:,indx]= acc.reshape((self._orbit.shape[0],len(indx),nq))
+        self._acc_set[indx]= True
+        return None
+
+def _drdt(t,vxvv):
+    """Event function for peri- and apocenters: r dr/dt"""
+    if vxvv.shape[-1] > 4:
+        return vxvv[...,0]*vxvv[...,1]+vxvv[...,3]*vxvv[...,4]
+    else:
+        return vxvv[...,0]*vxvv[...,1]
+
+def _vz(t,vxvv):
+    """Event function for maximum |z|"""
+    return vxvv[...,4]
+
+def _z(t,vxvv):
+    """Event function for disk crossings"""
+    return vxvv[...,3]
+
+# Named events: (event function, direction of the zero crossing)
+_EVENTS= {'rperi':(_drdt,1),
+          'rap':(_drdt,-1),
+          'zmax':(_vz,0),
+          'zcross':(_z,0)}
+
+def _eval_force(func,pot,t,*args,**kwargs):
+    """Evaluate func(pot,*args,t=t,**kwargs) for arrays args, kwargs, and t, for all points at once for the potentials that can be evaluated for arrays and one point at a time for the others"""
+    if not isinstance(pot,list): pot= [pot]
+    out= 0.
+    for p in pot:
+        try:
+            pout= func(p,*args,t=t,**kwargs)
+            array_ok= nu.shape(pout) == nu.shape(args[0]) \
+                or nu.shape(pout) == ()
+        except (ValueError,TypeError):
+            array_ok= False
+        if not array_ok:
+            pout= nu.array([func(p,*[a[ii] for a in args],t=t[ii],
+                                 **dict((k,v[ii]) for k,v in kwargs.items()))
+                            for ii in range(len(args[0]))])
+        out= out+pout
+    return out
@@ -8,6 +8,7 @@ from numpy.ctypeslib import ndpointer
 import os
 from galpy import potential
 from galpy.util import galpyWarning
+from galpy.potential_src.Potential import _parameter_state
 from galpy.orbit_src.integratePlanarOrbit import _parse_integrator, _parse_tol
 #Find and load the library
 _lib= None
@@ -42,153 +43,190 @@ def _parse_pot(pot,potforactions=False,potfortorus=False):
     #Figure out what's in pot
     if not isinstance(pot,list):
         pot= [pot]
-    #Initialize everything
+    #Parse each potential, re-using the arguments cached on the potential
+    parsed= [_cached_parse_pot(p,('full',potforactions,potfortorus),
+                               _parse_single_pot,
+                               potforactions=potforactions,
+                               potfortorus=potfortorus)
+             for p in pot]
+    npot= int(nu.sum([pp[0] for pp in parsed]))
+    pot_type= nu.concatenate([pp[1] for pp in parsed])
+    pot_args= nu.concatenate([pp[2] for pp in parsed])
+    return (npot,pot_type,pot_args)
+
+def _cached_parse_pot(p,key,parser,**kwargs):
+    """Return parser(p,**kwargs), cached on p under key; the cached value is 
+    re-computed whenever a parameter of p or of a potential that it 
+    contains changes (e.g., its amplitude)"""
+    state= _parameter_state(p)
+    try:
+        cache= p._c_args_cache
+    except AttributeError:
+        cache= {}
+        try:
+            p._c_args_cache= cache
+        except AttributeError: #pragma: no cover
+            pass
+    if not key in cache or cache[key][0] != state:
+        cache[key]= (state,parser(p,**kwargs))
+    return cache[key][1]
+
+def _parse_single_pot(p,potforactions=False,potfortorus=False):
+    """Parse a single potential so it can be fed to C, returns 
+    (npot,pot_type,pot_args), with npot > 1 for potentials that are 
+    represented as a sum of potentials in C"""
     pot_type= []
     pot_args= []
-    npot= len(pot)
-    for p in pot:
-        if isinstance(p,potential.LogarithmicHaloPotential):
-            pot_type.append(0)
-            pot_args.extend([p._amp,p._q,p._core2])
-        elif isinstance(p,potential.MiyamotoNagaiPotential):
-            pot_type.append(5)
-            pot_args.extend([p._amp,p._a,p._b])
-        elif isinstance(p,potential.PowerSphericalPotential):
-            pot_type.append(7)
-            pot_args.extend([p._amp,p.alpha])
-        elif isinstance(p,potential.HernquistPotential):
-            pot_type.append(8)
-            pot_args.extend([p._amp,p.a])
-        elif isinstance(p,potential.NFWPotential):
-            pot_type.append(9)
-            pot_args.extend([p._amp,p.a])
-        elif isinstance(p,potential.JaffePotential):
-            pot_type.append(10)
-            pot_args.extend([p._amp,p.a])
-        elif isinstance(p,potential.DoubleExponentialDiskPotential):
-            pot_type.append(11)
-            pot_args.extend([p._amp,p._alpha,p._beta,p._kmaxFac,
-                             p._nzeros,p._glorder])
-            pot_args.extend([p._glx[ii] for ii in range(p._glorder)])
-            pot_args.extend([p._glw[ii] for ii in range(p._glorder)])
-            pot_args.extend([p._j0zeros[ii] for ii in range(p._nzeros+1)])
-            pot_args.extend([p._dj0zeros[ii] for ii in range(p._nzeros+1)])
-            pot_args.extend([p._j1zeros[ii] for ii in range(p._nzeros+1)])
-            pot_args.extend([p._dj1zeros[ii] for ii in range(p._nzeros+1)])
-            pot_args.extend([p._kp._amp,p._kp.alpha])
-        elif isinstance(p,potential.FlattenedPowerPotential):
-            pot_type.append(12)
-            pot_args.extend([p._amp,p.alpha,p.q2,p.core2])
-        elif isinstance(p,potential.interpRZPotential):
-            pot_type.append(13)
-            pot_args.extend([len(p._rgrid),len(p._zgrid)])
-            if p._logR:
-                pot_args.extend([p._logrgrid[ii] for ii in range(len(p._rgrid))])
-            else:
-                pot_args.extend([p._rgrid[ii] for ii in range(len(p._rgrid))])
-            pot_args.extend([p._zgrid[ii] for ii in range(len(p._zgrid))])
-            if potforactions or potfortorus:
-                pot_args.extend([x for x in p._potGrid_splinecoeffs.flatten(order='C')])
-            if not potforactions:
-                pot_args.extend([x for x in p._rforceGrid_splinecoeffs.flatten(order='C')])
-                pot_args.extend([x for x in p._zforceGrid_splinecoeffs.flatten(order='C')])
-            pot_args.extend([p._amp,int(p._logR)])
-        elif isinstance(p,potential.IsochronePotential):
-            pot_type.append(14)
-            pot_args.extend([p._amp,p.b])
-        elif isinstance(p,potential.PowerSphericalPotentialwCutoff):
-            pot_type.append(15)
-            pot_args.extend([p._amp,p.alpha,p.rc])
-        elif isinstance(p,potential.MN3ExponentialDiskPotential):
-            # Three Miyamoto-Nagai disks
-            npot+= 2
-            pot_type.extend([5,5,5])
-            pot_args.extend([p._amp*p._mn3[0]._amp,
-                             p._mn3[0]._a,p._mn3[0]._b,
-                             p._amp*p._mn3[1]._amp,
-                             p._mn3[1]._a,p._mn3[1]._b,
-                             p._amp*p._mn3[2]._amp,
-                             p._mn3[2]._a,p._mn3[2]._b])
-        elif isinstance(p,potential.KuzminKutuzovStaeckelPotential):
-            pot_type.append(16)
-            pot_args.extend([p._amp,p._ac,p._Delta])
-        elif isinstance(p,potential.PlummerPotential):
-            pot_type.append(17)
-            pot_args.extend([p._amp,p._b])
-        elif isinstance(p,potential.PseudoIsothermalPotential):
-            pot_type.append(18)
-            pot_args.extend([p._amp,p._a])
-        elif isinstance(p,potential.KuzminDiskPotential):
-            pot_type.append(19)
-            pot_args.extend([p._amp,p._a])
-        elif isinstance(p,potential.BurkertPotential):
-            pot_type.append(20)
-            pot_args.extend([p._amp,p.a])
-        elif isinstance(p,potential.TwoPowerTriaxialPotential):
-            if isinstance(p,potential.TriaxialHernquistPotential):
-                pot_type.append(21)
-            elif isinstance(p,potential.TriaxialNFWPotential):
-                pot_type.append(22)
-            elif isinstance(p,potential.TriaxialJaffePotential):
-                pot_type.append(23)
-            pot_args.extend([p._amp,p.a,p._b2,p._c2,int(p._aligned)])
-            if not p._aligned:
-                pot_args.extend(list(p._rot.flatten()))
-            else:
-                pot_args.extend(list(nu.eye(3).flatten())) # not actually used
-            pot_args.append(p._glorder)
-            pot_args.extend([p._glx[ii] for ii in range(p._glorder)])
-            # this adds some common factors to the integration weights
-            pot_args.extend([-p._glw[ii]*p._b*p._c/p.a**3.\
-                                  /nu.sqrt(( 1.+(p._b2-1.)*p._glx[ii]**2.)
-                                           *(1.+(p._c2-1.)*p._glx[ii]**2.))
-                             for ii in range(p._glorder)])
-            pot_args.extend([0.,0.,0.,0.,0.,0.]) # for caching
-        elif isinstance(p,potential.SCFPotential):
-            # Type 24, see stand-alone parser below
-            pt,pa= _parse_scf_pot(p)
-            pot_type.append(pt)
-            pot_args.extend(pa)
-        elif isinstance(p,potential.SoftenedNeedleBarPotential):
-            pot_type.append(25)
-            pot_args.extend([p._amp,p._a,p._b,p._c2,p._pa,p._omegab])
-            pot_args.extend([0.,0.,0.,0.,0.,0.,0.]) # for caching
-        elif isinstance(p,potential.DiskSCFPotential):
-            # Need to pull this apart into: (a) SCF part, (b) constituent
-            # [Sigma_i,h_i] parts
-            # (a) SCF, multiply in any add'l amp
-            pt,pa= _parse_scf_pot(p._scf,extra_amp=p._amp)
-            pot_type.append(pt)
-            pot_args.extend(pa)
-            # (b) constituent [Sigma_i,h_i] parts
-            for Sigma,hz in zip(p._Sigma_dict,p._hz_dict):
-                npot+= 1
-                pot_type.append(26)
-                stype= Sigma.get('type','exp')
-                if stype == 'exp' \
-                        or (stype == 'exp' and 'Rhole' in Sigma):
-                    pot_args.extend([3,0,
-                                     4.*nu.pi*Sigma.get('amp',1.)*p._amp,
-                                     Sigma.get('h',1./3.)])
-                elif stype == 'expwhole' \
-                        or (stype == 'exp' and 'Rhole' in Sigma):
-                    pot_args.extend([4,1,
-                                     4.*nu.pi*Sigma.get('amp',1.)*p._amp,
-                                     Sigma.get('h',1./3.),
-                                     Sigma.get('Rhole',0.5)])
-                hztype= hz.get('type','exp')
-                if hztype == 'exp':
-                    pot_args.extend([0,hz.get('h',0.0375)])
-                elif hztype == 'sech2':
-                    pot_args.extend([1,hz.get('h',0.0375)])
+    npot= 1
+    if isinstance(p,potential.LogarithmicHaloPotential):
+        pot_type.append(0)
+        pot_args.extend([p._amp,p._q,p._core2])
+    elif isinstance(p,potential.MiyamotoNagaiPotential):
+        pot_type.append(5)
+        pot_args.extend([p._amp,p._a,p._b])
+    elif isinstance(p,potential.PowerSphericalPotential):
+        pot_type.append(7)
+        pot_args.extend([p._amp,p.alpha])
+    elif isinstance(p,potential.HernquistPotential):
+        pot_type.append(8)
+        pot_args.extend([p._amp,p.a])
+    elif isinstance(p,potential.NFWPotential):
+        pot_type.append(9)
+        pot_args.extend([p._amp,p.a])
+    elif isinstance(p,potential.JaffePotential):
+        pot_type.append(10)
+        pot_args.extend([p._amp,p.a])
+    elif isinstance(p,potential.DoubleExponentialDiskPotential):
+        pot_type.append(11)
+        pot_args.extend([p._amp,p._alpha,p._beta,p._kmaxFac,
+                         p._nzeros,p._glorder])
+        pot_args.extend([p._glx[ii] for ii in range(p._glorder)])
+        pot_args.extend([p._glw[ii] for ii in range(p._glorder)])
+        pot_args.extend([p._j0zeros[ii] for ii in range(p._nzeros+1)])
+        pot_args.extend([p._dj0zeros[ii] for ii in range(p._nzeros+1)])
+        pot_args.extend([p._j1zeros[ii] for ii in range(p._nzeros+1)])
+        pot_args.extend([p._dj1zeros[ii] for ii in range(p._nzeros+1)])
+        pot_args.extend([p._kp._amp,p._kp.alpha])
+    elif isinstance(p,potential.FlattenedPowerPotential):
+        pot_type.append(12)
+        pot_args.extend([p._amp,p.alpha,p.q2,p.core2])
+    elif isinstance(p,potential.interpRZPotential):
+        pot_type.append(13)
+        pot_args.extend([len(p._rgrid),len(p._zgrid)])
+        if p._logR:
+            pot_args.extend([p._logrgrid[ii] for ii in range(len(p._rgrid))])
+        else:
+            pot_args.extend([p._rgrid[ii] for ii in range(len(p._rgrid))])
+        pot_args.extend([p._zgrid[ii] for ii in range(len(p._zgrid))])
+        if potforactions or potfortorus:
+            pot_args.extend([x for x in p._potGrid_splinecoeffs.flatten(order='C')])
+        if not potforactions:
+            pot_args.extend([x for x in p._rforceGrid_splinecoeffs.flatten(order='C')])
+            pot_args.extend([x for x in p._zforceGrid_splinecoeffs.flatten(order='C')])
+        pot_args.extend([p._amp,int(p._logR),int(p._adaptive)])
+    elif isinstance(p,potential.IsochronePotential):
+        pot_type.append(14)
+        pot_args.extend([p._amp,p.b])
+    elif isinstance(p,potential.PowerSphericalPotentialwCutoff):
+        pot_type.append(15)
+        pot_args.extend([p._amp,p.alpha,p.rc])
+    elif isinstance(p,potential.MN3ExponentialDiskPotential):
+        # Three Miyamoto-Nagai disks
+        npot+= 2
+        pot_type.extend([5,5,5])
+        pot_args.extend([p._amp*p._mn3[0]._amp,
+                         p._mn3[0]._a,p._mn3[0]._b,
+                         p._amp*p._mn3[1]._amp,
+                         p._mn3[1]._a,p._mn3[1]._b,
+                         p._amp*p._mn3[2]._amp,
+                         p._mn3[2]._a,p._mn3[2]._b])
+    elif isinstance(p,potential.KuzminKutuzovStaeckelPotential):
+        pot_type.append(16)
+        pot_args.extend([p._amp,p._ac,p._Delta])
+    elif isinstance(p,potential.PlummerPotential):
+        pot_type.append(17)
+        pot_args.extend([p._amp,p._b])
+    elif isinstance(p,potential.PseudoIsothermalPotential):
+        pot_type.append(18)
+        pot_args.extend([p._amp,p._a])
+    elif isinstance(p,potential.KuzminDiskPotential):
+        pot_type.append(19)
+        pot_args.extend([p._amp,p._a])
+    elif isinstance(p,potential.BurkertPotential):
+        pot_type.append(20)
+        pot_args.extend([p._amp,p.a])
+    elif isinstance(p,potential.TwoPowerTriaxialPotential):
+        # Types 21-23 and 28, see stand-alone parser below
+        pt,pa= _parse_twopowertriaxial_pot(p)
+        pot_type.append(pt)
+        pot_args.extend(pa)
+    elif isinstance(p,potential.SCFPotential):
+        # Type 24, see stand-alone parser below
+        pt,pa= _parse_scf_pot(p)
+        pot_type.append(pt)
+        pot_args.extend(pa)
+    elif isinstance(p,potential.SoftenedNeedleBarPotential):
+        pot_type.append(25)
+        pot_args.extend([p._amp,p._a,p._b,p._c2,p._pa,p._omegab])
+        pot_args.extend([0.,0.,0.,0.,0.,0.,0.]) # for caching
+    elif isinstance(p,potential.FerrersPotential):
+        # Type 29, see stand-alone parser below
+        pt,pa= _parse_ferrers_pot(p)
+        pot_type.append(pt)
+        pot_args.extend(pa)
+    elif isinstance(p,potential.interp3DPotential):
+        # Type 30, see stand-alone parser below
+        pt,pa= _parse_interp3d_pot(p)
+        pot_type.append(pt)
+        pot_args.extend(pa)
+    elif isinstance(p,potential.DiskSCFPotential):
+        # Need to pull this apart into: (a) SCF part, (b) constituent
+        # [Sigma_i,h_i] parts
+        # (a) SCF, multiply in any add'l amp
+        pt,pa= _parse_scf_pot(p._scf,extra_amp=p._amp)
+        pot_type.append(pt)
+        pot_args.extend(pa)
+        # (b) constituent [Sigma_i,h_i] parts
+        for Sigma,hz in zip(p._Sigma_dict,p._hz_dict):
+            npot+= 1
+            pot_type.append(26)
+            stype= Sigma.get('type','exp')
+            if stype == 'exp' \
+                    or (stype == 'exp' and 'Rhole' in Sigma):
+                pot_args.extend([3,0,
+                                 4.*nu.pi*Sigma.get('amp',1.)*p._amp,
+                                 Sigma.get('h',1./3.)])
+            elif stype == 'expwhole' \
+                    or (stype == 'exp' and 'Rhole' in Sigma):
+                pot_args.extend([4,1,
+                                 4.*nu.pi*Sigma.get('amp',1.)*p._amp,
+                                 Sigma.get('h',1./3.),
+                                 Sigma.get('Rhole',0.5)])
+            hztype= hz.get('type','exp')
+            if hztype == 'exp':
+                pot_args.extend([0,hz.get('h',0.0375)])
+            elif hztype == 'sech2':
+                pot_args.extend([1,hz.get('h',0.0375)])
 
-        elif isinstance(p,potential.WilkinsonEvansPotential):
+    elif isinstance(p,potential.WilkinsonEvansPotential):
 	    #print 'we are here - trying to use c potential'
 	    #warnings.warn('We are here 27', galpyWarning)
 	    #print p._Mh,p._ah
-            pot_type.append(27)
-            pot_args.extend([p._Mh,p._ah])
-
+        pot_type.append(27)
+        pot_args.extend([p._Mh,p._ah])
+    elif isinstance(p,potential.DehnenSmoothWrapperPotential):
+        # Type -1 is followed by the types of the wrapped potentials, its
+        # arguments are [nwrapped,wrapped args,amp,tform,tsteady]
+        if potforactions or potfortorus:
+            raise NotImplementedError("DehnenSmoothWrapperPotential is time-dependent and cannot be used in the C implementation of actionAngle or torus methods")
+        pot_type.append(-1)
+        wrap_npot, wrap_pot_type, wrap_pot_args= \
+            _parse_pot(p._pot,potforactions=potforactions,
+                       potfortorus=potfortorus)
+        pot_type.extend(wrap_pot_type)
+        pot_args.append(wrap_npot)
+        pot_args.extend(wrap_pot_args)
+        pot_args.extend([p._amp,p._tform,p._tsteady])
 
     pot_type= nu.array(pot_type,dtype=nu.int32,order='C')
     pot_args= nu.array(pot_args,dtype=nu.float64,order='C')
@@ -205,7 +243,59 @@ def _parse_scf_pot(p,extra_amp=1.):
     pot_args.extend([-1.,0,0,0,0,0,0])    
     return (24,pot_args)
 
-def integrateFullOrbit_c(pot,yo,t,int_method,rtol=None,atol=None,dt=None):
+def _parse_twopowertriaxial_pot(p):
+    # Stand-alone parser for TwoPowerTriaxial, bc re-used
+    if p.alpha == 1 and p.beta == 4:
+        pt= 21 # Hernquist
+    elif p.alpha == 1 and p.beta == 3:
+        pt= 22 # NFW
+    elif p.alpha == 2 and p.beta == 4:
+        pt= 23 # Jaffe
+    else:
+        pt= 28 # general alpha and beta
+    pot_args= [p._amp,p.a,p._b2,p._c2,int(p._aligned)]
+    if not p._aligned:
+        pot_args.extend(list(p._rot.flatten()))
+    else:
+        pot_args.extend(list(nu.eye(3).flatten())) # not actually used
+    pot_args.append(p._glorder)
+    pot_args.extend([p._glx[ii] for ii in range(p._glorder)])
+    # this adds some common factors to the integration weights
+    pot_args.extend([-p._glw[ii]*p._b*p._c/p.a**3.\
+                          /nu.sqrt(( 1.+(p._b2-1.)*p._glx[ii]**2.)
+                                   *(1.+(p._c2-1.)*p._glx[ii]**2.))
+                     for ii in range(p._glorder)])
+    pot_args.extend([0.,0.,0.,0.,0.,0.]) # for caching
+    if pt == 28:
+        pot_args.extend([p.alpha,p.beta])
+    return (pt,pot_args)
+
+def _parse_ferrers_pot(p):
+    # Stand-alone parser for Ferrers, bc re-used
+    pot_args= [p._amp*nu.pi*p._rhoc_M*p.a**3.*p._b*p._c,
+               p._a2,p._b2*p._a2,p._c2*p._a2,p.n,p._pa,p._omegab,
+               p._glorder]
+    pot_args.extend(p._glx)
+    pot_args.extend(p._glw)
+    pot_args.extend([0.,0.,0.,0.,0.,0.,0.]) # for caching
+    return (29,pot_args)
+
+def _parse_interp3d_pot(p):
+    # Stand-alone parser for interp3D, bc re-used
+    if p._logR:
+        x0, dx= p._logrgrid[0], p._logrgrid[1]-p._logrgrid[0]
+    else:
+        x0, dx= p._rgrid[0], p._rgrid[1]-p._rgrid[0]
+    pot_args= [len(p._rgrid),len(p._zgrid),len(p._phigrid),
+               int(p._logR),int(p._zsym),x0,dx,
+               p._zgrid[0],p._zgrid[1]-p._zgrid[0],p._omegab,p._amp]
+    for coeffs in [p._potGrid_splinecoeffs,p._rforceGrid_splinecoeffs,
+                   p._zforceGrid_splinecoeffs,p._phiforceGrid_splinecoeffs]:
+        pot_args.extend(coeffs.flatten(order='C'))
+    return (30,pot_args)
+
+def integrateFullOrbit_c(pot,yo,t,int_method,rtol=None,atol=None,dt=None,
+                         nthreads=None,OmegaP=None):
     """
     NAME:
        integrateFullOrbit_c
@@ -213,34 +303,45 @@ def integrateFullOrbit_c(pot,yo,t,int_method,rtol=None,atol=None,dt=None):
        C integrate an ode for a FullOrbit
     INPUT:
        pot - Potential or list of such instances
-       yo - initial condition [q,p]
+       yo - initial condition [q,p], shape [6] or [N,6] to integrate N orbits at once (in parallel using OpenMP)
        t - set of times at which one wants the result
        int_method= 'leapfrog_c', 'rk4_c', 'rk6_c', 'symplec4_c'
        rtol, atol
        dt= (None) force integrator to use this stepsize (default is to automatically determine one))
+       nthreads= (None) number of OpenMP threads to integrate multiple orbits with (default: OpenMP's default); use 1 when calling this function from multiple Python threads
+       OmegaP= (None) if set, integrate in the frame rotating with this pattern speed, which coincides with the inertial frame at t=0 (yo and y are then in the rotating frame; only for the Runge-Kutta integrators)
     OUTPUT:
        (y,err)
-       y : array, shape (len(y0), len(t))
+       y : array, shape (len(t),6) or (N,len(t),6)
        Array containing the value of y for each desired time in t, \
        with the initial value y0 in the first row.
-       err: error message, if not zero: 1 means maximum step reduction happened for adaptive integrators
+       err: error message (array of shape N for N orbits), if not zero: 1 means maximum step reduction happened for adaptive integrators
     HISTORY:
        2011-11-13 - Written - Bovy (IAS)
+       2026-10-16 - Integrate multiple orbits in a single call, using nthreads OpenMP threads
+       2026-10-16 - Added OmegaP
     """
     rtol, atol= _parse_tol(rtol,atol)
     npot, pot_type, pot_args= _parse_pot(pot)
     int_method_c= _parse_integrator(int_method)
+    if not OmegaP is None and not int_method_c in [1,2,5]:
+        raise ValueError("Integration in a rotating frame (OmegaP=) requires one of the Runge-Kutta integrators rk4_c, rk6_c, or dopr54_c")
     if dt is None: 
         dt= -9999.99
+    # Multiple orbits?
+    single_obj= len(nu.shape(yo)) == 1
+    yo= nu.atleast_2d(yo)
+    nobj= len(yo)
 
     #Set up result array
-    result= nu.empty((len(t),6))
-    err= ctypes.c_int(0)
+    result= nu.empty((nobj,len(t),6))
+    err= nu.zeros(nobj,dtype=nu.int32)
 
     #Set up the C code
     ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
     integrationFunc= _lib.integrateFullOrbit
-    integrationFunc.argtypes= [ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+    integrationFunc.argtypes= [ctypes.c_int,
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
                                ctypes.c_int,                             
                                ndpointer(dtype=nu.float64,flags=ndarrayFlags),
                                ctypes.c_int,
@@ -250,7 +351,9 @@ def integrateFullOrbit_c(pot,yo,t,int_method,rtol=None,atol=None,dt=None):
                                ctypes.c_double,
                                ctypes.c_double,
                                ndpointer(dtype=nu.float64,flags=ndarrayFlags),
-                               ctypes.POINTER(ctypes.c_int),
+                               ndpointer(dtype=nu.int32,flags=ndarrayFlags),
+                               ctypes.c_int,
+                               ctypes.c_double,
                                ctypes.c_int]
 
     #Array requirements, first store old order
@@ -259,9 +362,11 @@ def integrateFullOrbit_c(pot,yo,t,int_method,rtol=None,atol=None,dt=None):
     yo= nu.require(yo,dtype=nu.float64,requirements=['C','W'])
     t= nu.require(t,dtype=nu.float64,requirements=['C','W'])
     result= nu.require(result,dtype=nu.float64,requirements=['C','W'])
+    err= nu.require(err,dtype=nu.int32,requirements=['C','W'])
 
     #Run the C code
-    integrationFunc(yo,
+    integrationFunc(ctypes.c_int(nobj),
+                    yo,
                     ctypes.c_int(len(t)),
                     t,
                     ctypes.c_int(npot),
@@ -270,53 +375,70 @@ def integrateFullOrbit_c(pot,yo,t,int_method,rtol=None,atol=None,dt=None):
                     ctypes.c_double(dt),
                     ctypes.c_double(rtol),ctypes.c_double(atol),
                     result,
-                    ctypes.byref(err),
-                    ctypes.c_int(int_method_c))
+                    err,
+                    ctypes.c_int(int_method_c),
+                    ctypes.c_double(0. if OmegaP is None else OmegaP),
+                    ctypes.c_int(0 if nthreads is None else nthreads))
     
-    if int(err.value) == -10: #pragma: no cover
+    if nu.any(err == -10): #pragma: no cover
         raise KeyboardInterrupt("Orbit integration interrupted by CTRL-C (SIGINT)")
 
     #Reset input arrays
     if f_cont[0]: yo= nu.asfortranarray(yo)
     if f_cont[1]: t= nu.asfortranarray(t)
 
-    return (result,err.value)
+    if single_obj:
+        return (result[0],err[0])
+    else:
+        return (result,err)
 
-def integrateFullOrbit_dxdv_c(pot,yo,dyo,t,int_method,rtol=None,atol=None): #pragma: no cover because not included in v1, uncover when included
+def integrateFullOrbit_dxdv_c(pot,yo,dyo,t,int_method,rtol=None,atol=None,
+                              dt=None,nthreads=None):
     """
     NAME:
        integrateFullOrbit_dxdv_c
     PURPOSE:
-       C integrate an ode for a planarOrbit+phase space volume dxdv
+       C integrate an ode for a FullOrbit+phase space volume dxdv
     INPUT:
        pot - Potential or list of such instances
-       yo - initial condition [q,p]
-       dyo - initial condition [dq,dp]
+       yo - initial condition [q,p], shape [6] or [N,6] to integrate N orbits at once (in parallel using OpenMP)
+       dyo - initial condition [dq,dp], same shape as yo
        t - set of times at which one wants the result
-       int_method= 'leapfrog_c', 'rk4_c', 'rk6_c', 'symplec4_c'
+       int_method= 'rk4_c', 'rk6_c', 'dopr54_c'
        rtol, atol
+       dt= (None) force integrator to use this stepsize (default is to automatically determine one))
+       nthreads= (None) number of OpenMP threads to integrate multiple orbits with (default: OpenMP's default)
     OUTPUT:
        (y,err)
-       y : array, shape (len(y0), len(t))
+       y : array, shape (len(t),12) or (N,len(t),12) of [q,p,dq,dp]
        Array containing the value of y for each desired time in t, \
        with the initial value y0 in the first row.
-       err: error message if not zero, 1: maximum step reduction happened for adaptive integrators
+       err: error message (array of shape N for N orbits), if not zero: 1 means maximum step reduction happened for adaptive integrators
     HISTORY:
        2011-11-13 - Written - Bovy (IAS)
+       2026-10-16 - Integrate multiple orbits in a single call
     """
     rtol, atol= _parse_tol(rtol,atol)
     npot, pot_type, pot_args= _parse_pot(pot)
     int_method_c= _parse_integrator(int_method)
-    yo= nu.concatenate((yo,dyo))
+    if not int_method_c in [1,2,5]:
+        raise TypeError('Symplectic integration for phase-space volume is not possible')
+    if dt is None: 
+        dt= -9999.99
+    # Multiple orbits?
+    single_obj= len(nu.shape(yo)) == 1
+    yo= nu.concatenate((nu.atleast_2d(yo),nu.atleast_2d(dyo)),axis=1)
+    nobj= len(yo)
 
     #Set up result array
-    result= nu.empty((len(t),12))
-    err= ctypes.c_int(0)
+    result= nu.empty((nobj,len(t),12))
+    err= nu.zeros(nobj,dtype=nu.int32)
 
     #Set up the C code
     ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
     integrationFunc= _lib.integrateFullOrbit_dxdv
-    integrationFunc.argtypes= [ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+    integrationFunc.argtypes= [ctypes.c_int,
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
                                ctypes.c_int,                             
                                ndpointer(dtype=nu.float64,flags=ndarrayFlags),
                                ctypes.c_int,
@@ -324,34 +446,41 @@ def integrateFullOrbit_dxdv_c(pot,yo,dyo,t,int_method,rtol=None,atol=None): #pra
                                ndpointer(dtype=nu.float64,flags=ndarrayFlags),
                                ctypes.c_double,
                                ctypes.c_double,
+                               ctypes.c_double,
                                ndpointer(dtype=nu.float64,flags=ndarrayFlags),
-                               ctypes.POINTER(ctypes.c_int),
+                               ndpointer(dtype=nu.int32,flags=ndarrayFlags),
+                               ctypes.c_int,
                                ctypes.c_int]
 
     #Array requirements, first store old order
-    f_cont= [yo.flags['F_CONTIGUOUS'],
-             t.flags['F_CONTIGUOUS']]
+    f_cont= [t.flags['F_CONTIGUOUS']]
     yo= nu.require(yo,dtype=nu.float64,requirements=['C','W'])
     t= nu.require(t,dtype=nu.float64,requirements=['C','W'])
     result= nu.require(result,dtype=nu.float64,requirements=['C','W'])
+    err= nu.require(err,dtype=nu.int32,requirements=['C','W'])
 
     #Run the C code
-    integrationFunc(yo,
+    integrationFunc(ctypes.c_int(nobj),
+                    yo,
                     ctypes.c_int(len(t)),
                     t,
                     ctypes.c_int(npot),
                     pot_type,
                     pot_args,
+                    ctypes.c_double(dt),
                     ctypes.c_double(rtol),ctypes.c_double(atol),
                     result,
-                    ctypes.byref(err),
-                    ctypes.c_int(int_method_c))
+                    err,
+                    ctypes.c_int(int_method_c),
+                    ctypes.c_int(0 if nthreads is None else nthreads))
 
-    if int(err.value) == -10: #pragma: no cover
+    if nu.any(err == -10): #pragma: no cover
         raise KeyboardInterrupt("Orbit integration interrupted by CTRL-C (SIGINT)")
 
     #Reset input arrays
-    if f_cont[0]: yo= nu.asfortranarray(yo)
-    if f_cont[1]: t= nu.asfortranarray(t)
+    if f_cont[0]: t= nu.asfortranarray(t)
 
-    return (result,err.value)
+    if single_obj:
+        return (result[0],err[0])
+    else:
+        return (result,err)
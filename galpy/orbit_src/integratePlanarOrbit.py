@@ -38,192 +38,222 @@ else:
 
 def _parse_pot(pot):
     """Parse the potential so it can be fed to C"""
-    from galpy.orbit_src.integrateFullOrbit import _parse_scf_pot
+    from galpy.orbit_src.integrateFullOrbit import _cached_parse_pot
     #Figure out what's in pot
     if not isinstance(pot,list):
         pot= [pot]
-    #Initialize everything
+    #Parse each potential, re-using the arguments cached on the potential;
+    #for planar potentials derived from 3D potentials, the cache is stored 
+    #on the 3D potential, as a new planar wrapper is created for each orbit
+    parsed= []
+    for p in pot:
+        if isinstance(p,(potential_src.planarPotential.planarPotentialFromRZPotential,
+                         potential_src.planarPotential.planarPotentialFromFullPotential)):
+            parsed.append(_cached_parse_pot(p._Pot,('planar',),
+                                            _parse_single_pot_wrapper,
+                                            planarp=p))
+        else:
+            parsed.append(_cached_parse_pot(p,('planar',),_parse_single_pot))
+    npot= int(nu.sum([pp[0] for pp in parsed]))
+    pot_type= nu.concatenate([pp[1] for pp in parsed])
+    pot_args= nu.concatenate([pp[2] for pp in parsed])
+    return (npot,pot_type,pot_args)
+
+def _parse_single_pot_wrapper(p,planarp=None):
+    """Parse a planar wrapper planarp of the 3D potential p"""
+    return _parse_single_pot(planarp)
+
+def _parse_single_pot(p):
+    """Parse a single planar potential so it can be fed to C, returns 
+    (npot,pot_type,pot_args), with npot > 1 for potentials that are 
+    represented as a sum of potentials in C"""
+    from galpy.orbit_src.integrateFullOrbit import _parse_scf_pot, \
+        _parse_twopowertriaxial_pot, _parse_ferrers_pot, \
+        _parse_interp3d_pot
     pot_type= []
     pot_args= []
-    npot= len(pot)
-    for p in pot:
-        if isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._Pot,potential.LogarithmicHaloPotential):
-            pot_type.append(0)
-            pot_args.extend([p._Pot._amp,p._Pot._core2])
-        elif isinstance(p,potential.DehnenBarPotential):
-            pot_type.append(1)
-            pot_args.extend([p._amp,p._tform,p._tsteady,p._rb,p._af,p._omegab,
-                             p._barphi])
-        elif isinstance(p,potential.TransientLogSpiralPotential):
-            pot_type.append(2)
-            pot_args.extend([p._amp,p._A,p._to,p._sigma2,p._alpha,p._m,
+    npot= 1
+    if isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._Pot,potential.LogarithmicHaloPotential):
+        pot_type.append(0)
+        pot_args.extend([p._Pot._amp,p._Pot._core2])
+    elif isinstance(p,potential.DehnenBarPotential):
+        pot_type.append(1)
+        pot_args.extend([p._amp,p._tform,p._tsteady,p._rb,p._af,p._omegab,
+                         p._barphi])
+    elif isinstance(p,potential.TransientLogSpiralPotential):
+        pot_type.append(2)
+        pot_args.extend([p._amp,p._A,p._to,p._sigma2,p._alpha,p._m,
+                         p._omegas,p._gamma])
+    elif isinstance(p,potential.SteadyLogSpiralPotential):
+        pot_type.append(3)
+        if p._tform is None:
+            pot_args.extend([p._amp,float('nan'), float('nan'),
+                             p._A,p._alpha,p._m,
+                             p._omegas,p._gamma])
+        else:
+            pot_args.extend([p._amp,p._tform,p._tsteady,p._A,p._alpha,p._m,
                              p._omegas,p._gamma])
-        elif isinstance(p,potential.SteadyLogSpiralPotential):
-            pot_type.append(3)
-            if p._tform is None:
-                pot_args.extend([p._amp,float('nan'), float('nan'),
-                                 p._A,p._alpha,p._m,
-                                 p._omegas,p._gamma])
-            else:
-                pot_args.extend([p._amp,p._tform,p._tsteady,p._A,p._alpha,p._m,
-                                 p._omegas,p._gamma])
-        elif isinstance(p,potential.EllipticalDiskPotential):
-            pot_type.append(4)
-            if p._tform is None:
-                pot_args.extend([p._amp,float('nan'), float('nan'),
-                                 p._twophio,p._p,p._phib])
-            else:
-                pot_args.extend([p._amp,p._tform,p._tsteady,
-                                 p._twophio,p._p,p._phib])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._Pot,potential.MiyamotoNagaiPotential):
-            pot_type.append(5)
-            pot_args.extend([p._Pot._amp,p._Pot._a,p._Pot._b])
-        elif isinstance(p,potential.LopsidedDiskPotential):
-            pot_type.append(6)
-            if p._tform is None:
-                pot_args.extend([p._amp,float('nan'), float('nan'),
-                                 p._mphio,p._p,p._phib])
-            else:
-                pot_args.extend([p._amp,p._tform,p._tsteady,
-                                 p._mphio,p._p,p._phib])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._Pot,potential.PowerSphericalPotential):
-            pot_type.append(7)
-            pot_args.extend([p._Pot._amp,p._Pot.alpha])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._Pot,potential.HernquistPotential):
-            pot_type.append(8)
-            pot_args.extend([p._Pot._amp,p._Pot.a])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._Pot,potential.NFWPotential):
-            pot_type.append(9)
-            pot_args.extend([p._Pot._amp,p._Pot.a])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._Pot,potential.JaffePotential):
-            pot_type.append(10)
-            pot_args.extend([p._Pot._amp,p._Pot.a])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                and isinstance(p._Pot,potential.DoubleExponentialDiskPotential):
-            pot_type.append(11)
-            pot_args.extend([p._Pot._amp,p._Pot._alpha,
-                             p._Pot._beta,p._Pot._kmaxFac,
-                             p._Pot._nzeros,p._Pot._glorder])
-            pot_args.extend([p._Pot._glx[ii] for ii in range(p._Pot._glorder)])
-            pot_args.extend([p._Pot._glw[ii] for ii in range(p._Pot._glorder)])
-            pot_args.extend([p._Pot._j0zeros[ii] for ii in range(p._Pot._nzeros+1)])
-            pot_args.extend([p._Pot._dj0zeros[ii] for ii in range(p._Pot._nzeros+1)])
-            pot_args.extend([p._Pot._j1zeros[ii] for ii in range(p._Pot._nzeros+1)])
-            pot_args.extend([p._Pot._dj1zeros[ii] for ii in range(p._Pot._nzeros+1)])
-            pot_args.extend([p._Pot._kp._amp,p._Pot._kp.alpha])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                and isinstance(p._Pot,potential.FlattenedPowerPotential):
-            pot_type.append(12)
-            pot_args.extend([p._Pot._amp,p._Pot.alpha,p._Pot.core2])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._Pot,potential.IsochronePotential):
-            pot_type.append(14)
-            pot_args.extend([p._Pot._amp,p._Pot.b])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._Pot,potential.PowerSphericalPotentialwCutoff):
-            pot_type.append(15)
-            pot_args.extend([p._Pot._amp,p._Pot.alpha,p._Pot.rc])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._Pot,potential.MN3ExponentialDiskPotential):
-            # Three Miyamoto-Nagai disks
-            npot+= 2
-            pot_type.extend([5,5,5])
-            pot_args.extend([p._Pot._amp*p._Pot._mn3[0]._amp,
-                             p._Pot._mn3[0]._a,p._Pot._mn3[0]._b,
-                             p._Pot._amp*p._Pot._mn3[1]._amp,
-                             p._Pot._mn3[1]._a,p._Pot._mn3[1]._b,
-                             p._Pot._amp*p._Pot._mn3[2]._amp,
-                             p._Pot._mn3[2]._a,p._Pot._mn3[2]._b])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._Pot,potential.KuzminKutuzovStaeckelPotential):
-            pot_type.append(16)
-            pot_args.extend([p._Pot._amp,p._Pot._ac,p._Pot._Delta])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._Pot,potential.PlummerPotential):
-            pot_type.append(17)
-            pot_args.extend([p._Pot._amp,p._Pot._b])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._Pot,potential.PseudoIsothermalPotential):
-            pot_type.append(18)
-            pot_args.extend([p._Pot._amp,p._Pot._a])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._Pot,potential.KuzminDiskPotential):
-            pot_type.append(19)
-            pot_args.extend([p._Pot._amp,p._Pot._a])
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
-                 and isinstance(p._Pot,potential.BurkertPotential):
-            pot_type.append(20)
-            pot_args.extend([p._Pot._amp,p._Pot.a])
-        elif (isinstance(p,potential_src.planarPotential.planarPotentialFromFullPotential) or isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential)) and isinstance(p._Pot,potential.TwoPowerTriaxialPotential):
-            if isinstance(p._Pot,potential.TriaxialHernquistPotential):
-                pot_type.append(21)
-            elif isinstance(p._Pot,potential.TriaxialNFWPotential):
-                pot_type.append(22)
-            elif isinstance(p._Pot,potential.TriaxialJaffePotential):
-                pot_type.append(23)
-            pot_args.extend([p._Pot._amp,p._Pot.a,p._Pot._b2,
-                             p._Pot._c2,int(p._Pot._aligned)])
-            if not p._Pot._aligned:
-                pot_args.extend(list(p._Pot._rot.flatten()))
-            else:
-                pot_args.extend(list(nu.eye(3).flatten())) # not actually used
-            pot_args.append(p._Pot._glorder)
-            pot_args.extend([p._Pot._glx[ii] for ii in range(p._Pot._glorder)])
-            # this adds some common factors to the integration weights
-            pot_args.extend([-p._Pot._glw[ii]*p._Pot._b*p._Pot._c/p._Pot.a**3.\
-                                 /nu.sqrt(( 1.+(p._Pot._b2-1.)
-                                            *p._Pot._glx[ii]**2.)
-                                          *(1.+(p._Pot._c2-1.)
-                                            *p._Pot._glx[ii]**2.))
-                             for ii in range(p._Pot._glorder)])
-            pot_args.extend([p._Pot._glw[ii] for ii in range(p._Pot._glorder)])
-            pot_args.extend([0.,0.,0.,0.,0.,0.]) 
-        elif (isinstance(p,potential_src.planarPotential.planarPotentialFromFullPotential) or isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential)) \
-                 and isinstance(p._Pot,potential.SCFPotential):
-            pt,pa= _parse_scf_pot(p._Pot)
-            pot_type.append(pt)
-            pot_args.extend(pa)
-        elif isinstance(p,potential_src.planarPotential.planarPotentialFromFullPotential) \
-                 and isinstance(p._Pot,potential.SoftenedNeedleBarPotential):
-            pot_type.append(25)
-            pot_args.extend([p._Pot._amp,p._Pot._a,p._Pot._b,p._Pot._c2,
-                             p._Pot._pa,p._Pot._omegab])
-            pot_args.extend([0.,0.,0.,0.,0.,0.,0.]) # for caching
-        elif (isinstance(p,potential_src.planarPotential.planarPotentialFromFullPotential) or isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential)) \
-                and isinstance(p._Pot,potential.DiskSCFPotential):
-            # Need to pull this apart into: (a) SCF part, (b) constituent
-            # [Sigma_i,h_i] parts
-            # (a) SCF, multiply in any add'l amp
-            pt,pa= _parse_scf_pot(p._Pot._scf,extra_amp=p._Pot._amp)
-            pot_type.append(pt)
-            pot_args.extend(pa)
-            # (b) constituent [Sigma_i,h_i] parts
-            for Sigma,hz in zip(p._Pot._Sigma_dict,p._Pot._hz_dict):
-                npot+= 1
-                pot_type.append(26)
-                stype= Sigma.get('type','exp')
-                if stype == 'exp' \
-                        or (stype == 'exp' and 'Rhole' in Sigma):
-                    pot_args.extend([3,0,
-                                     4.*nu.pi*Sigma.get('amp',1.)*p._Pot._amp,
-                                     Sigma.get('h',1./3.)])
-                elif stype == 'expwhole' \
-                        or (stype == 'exp' and 'Rhole' in Sigma):
-                    pot_args.extend([4,1,
-                                     4.*nu.pi*Sigma.get('amp',1.)*p._Pot._amp,
-                                     Sigma.get('h',1./3.),
-                                     Sigma.get('Rhole',0.5)])
-                hztype= hz.get('type','exp')
-                if hztype == 'exp':
-                    pot_args.extend([0,hz.get('h',0.0375)])
-                elif hztype == 'sech2':
-                    pot_args.extend([1,hz.get('h',0.0375)])
+    elif isinstance(p,potential.EllipticalDiskPotential):
+        pot_type.append(4)
+        if p._tform is None:
+            pot_args.extend([p._amp,float('nan'), float('nan'),
+                             p._twophio,p._p,p._phib])
+        else:
+            pot_args.extend([p._amp,p._tform,p._tsteady,
+                             p._twophio,p._p,p._phib])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._Pot,potential.MiyamotoNagaiPotential):
+        pot_type.append(5)
+        pot_args.extend([p._Pot._amp,p._Pot._a,p._Pot._b])
+    elif isinstance(p,potential.LopsidedDiskPotential):
+        pot_type.append(6)
+        if p._tform is None:
+            pot_args.extend([p._amp,float('nan'), float('nan'),
+                             p._mphio,p._p,p._phib])
+        else:
+            pot_args.extend([p._amp,p._tform,p._tsteady,
+                             p._mphio,p._p,p._phib])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._Pot,potential.PowerSphericalPotential):
+        pot_type.append(7)
+        pot_args.extend([p._Pot._amp,p._Pot.alpha])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._Pot,potential.HernquistPotential):
+        pot_type.append(8)
+        pot_args.extend([p._Pot._amp,p._Pot.a])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._Pot,potential.NFWPotential):
+        pot_type.append(9)
+        pot_args.extend([p._Pot._amp,p._Pot.a])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._Pot,potential.JaffePotential):
+        pot_type.append(10)
+        pot_args.extend([p._Pot._amp,p._Pot.a])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+            and isinstance(p._Pot,potential.DoubleExponentialDiskPotential):
+        pot_type.append(11)
+        pot_args.extend([p._Pot._amp,p._Pot._alpha,
+                         p._Pot._beta,p._Pot._kmaxFac,
+                         p._Pot._nzeros,p._Pot._glorder])
+        pot_args.extend([p._Pot._glx[ii] for ii in range(p._Pot._glorder)])
+        pot_args.extend([p._Pot._glw[ii] for ii in range(p._Pot._glorder)])
+        pot_args.extend([p._Pot._j0zeros[ii] for ii in range(p._Pot._nzeros+1)])
+        pot_args.extend([p._Pot._dj0zeros[ii] for ii in range(p._Pot._nzeros+1)])
+        pot_args.extend([p._Pot._j1zeros[ii] for ii in range(p._Pot._nzeros+1)])
+        pot_args.extend([p._Pot._dj1zeros[ii] for ii in range(p._Pot._nzeros+1)])
+        pot_args.extend([p._Pot._kp._amp,p._Pot._kp.alpha])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+            and isinstance(p._Pot,potential.FlattenedPowerPotential):
+        pot_type.append(12)
+        pot_args.extend([p._Pot._amp,p._Pot.alpha,p._Pot.core2])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._Pot,potential.IsochronePotential):
+        pot_type.append(14)
+        pot_args.extend([p._Pot._amp,p._Pot.b])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._Pot,potential.PowerSphericalPotentialwCutoff):
+        pot_type.append(15)
+        pot_args.extend([p._Pot._amp,p._Pot.alpha,p._Pot.rc])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._Pot,potential.MN3ExponentialDiskPotential):
+        # Three Miyamoto-Nagai disks
+        npot+= 2
+        pot_type.extend([5,5,5])
+        pot_args.extend([p._Pot._amp*p._Pot._mn3[0]._amp,
+                         p._Pot._mn3[0]._a,p._Pot._mn3[0]._b,
+                         p._Pot._amp*p._Pot._mn3[1]._amp,
+                         p._Pot._mn3[1]._a,p._Pot._mn3[1]._b,
+                         p._Pot._amp*p._Pot._mn3[2]._amp,
+                         p._Pot._mn3[2]._a,p._Pot._mn3[2]._b])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._Pot,potential.KuzminKutuzovStaeckelPotential):
+        pot_type.append(16)
+        pot_args.extend([p._Pot._amp,p._Pot._ac,p._Pot._Delta])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._Pot,potential.PlummerPotential):
+        pot_type.append(17)
+        pot_args.extend([p._Pot._amp,p._Pot._b])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._Pot,potential.PseudoIsothermalPotential):
+        pot_type.append(18)
+        pot_args.extend([p._Pot._amp,p._Pot._a])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._Pot,potential.KuzminDiskPotential):
+        pot_type.append(19)
+        pot_args.extend([p._Pot._amp,p._Pot._a])
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential) \
+             and isinstance(p._Pot,potential.BurkertPotential):
+        pot_type.append(20)
+        pot_args.extend([p._Pot._amp,p._Pot.a])
+    elif (isinstance(p,potential_src.planarPotential.planarPotentialFromFullPotential) or isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential)) and isinstance(p._Pot,potential.TwoPowerTriaxialPotential):
+        pt,pa= _parse_twopowertriaxial_pot(p._Pot)
+        pot_type.append(pt)
+        pot_args.extend(pa)
+    elif (isinstance(p,potential_src.planarPotential.planarPotentialFromFullPotential) or isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential)) \
+             and isinstance(p._Pot,potential.SCFPotential):
+        pt,pa= _parse_scf_pot(p._Pot)
+        pot_type.append(pt)
+        pot_args.extend(pa)
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromFullPotential) \
+             and isinstance(p._Pot,potential.SoftenedNeedleBarPotential):
+        pot_type.append(25)
+        pot_args.extend([p._Pot._amp,p._Pot._a,p._Pot._b,p._Pot._c2,
+                         p._Pot._pa,p._Pot._omegab])
+        pot_args.extend([0.,0.,0.,0.,0.,0.,0.]) # for caching
+    elif (isinstance(p,potential_src.planarPotential.planarPotentialFromFullPotential) or isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential)) \
+             and isinstance(p._Pot,potential.FerrersPotential):
+        pt,pa= _parse_ferrers_pot(p._Pot)
+        pot_type.append(pt)
+        pot_args.extend(pa)
+    elif isinstance(p,potential_src.planarPotential.planarPotentialFromFullPotential) \
+             and isinstance(p._Pot,potential.interp3DPotential):
+        pt,pa= _parse_interp3d_pot(p._Pot)
+        pot_type.append(pt)
+        pot_args.extend(pa)
+    elif (isinstance(p,potential_src.planarPotential.planarPotentialFromFullPotential) or isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential)) \
+            and isinstance(p._Pot,potential.DiskSCFPotential):
+        # Need to pull this apart into: (a) SCF part, (b) constituent
+        # [Sigma_i,h_i] parts
+        # (a) SCF, multiply in any add'l amp
+        pt,pa= _parse_scf_pot(p._Pot._scf,extra_amp=p._Pot._amp)
+        pot_type.append(pt)
+        pot_args.extend(pa)
+        # (b) constituent [Sigma_i,h_i] parts
+        for Sigma,hz in zip(p._Pot._Sigma_dict,p._Pot._hz_dict):
+            npot+= 1
+            pot_type.append(26)
+            stype= Sigma.get('type','exp')
+            if stype == 'exp' \
+                    or (stype == 'exp' and 'Rhole' in Sigma):
+                pot_args.extend([3,0,
+                                 4.*nu.pi*Sigma.get('amp',1.)*p._Pot._amp,
+                                 Sigma.get('h',1./3.)])
+            elif stype == 'expwhole' \
+                    or (stype == 'exp' and 'Rhole' in Sigma):
+                pot_args.extend([4,1,
+                                 4.*nu.pi*Sigma.get('amp',1.)*p._Pot._amp,
+                                 Sigma.get('h',1./3.),
+                                 Sigma.get('Rhole',0.5)])
+            hztype= hz.get('type','exp')
+            if hztype == 'exp':
+                pot_args.extend([0,hz.get('h',0.0375)])
+            elif hztype == 'sech2':
+                pot_args.extend([1,hz.get('h',0.0375)])
+    elif isinstance(p,potential_src.DehnenSmoothWrapperPotential.planarDehnenSmoothWrapperPotential) \
+            or ((isinstance(p,potential_src.planarPotential.planarPotentialFromFullPotential) or isinstance(p,potential_src.planarPotential.planarPotentialFromRZPotential)) \
+                    and isinstance(p._Pot,potential.DehnenSmoothWrapperPotential)):
+        # Type -1 is followed by the types of the wrapped potentials, its
+        # arguments are [nwrapped,wrapped args,amp,tform,tsteady]
+        if not isinstance(p,potential_src.DehnenSmoothWrapperPotential.planarDehnenSmoothWrapperPotential):
+            p= p._Pot
+        pot_type.append(-1)
+        wrap_npot, wrap_pot_type, wrap_pot_args= \
+            _parse_pot(potential.toPlanarPotential(p._pot))
+        pot_type.extend(wrap_pot_type)
+        pot_args.append(wrap_npot)
+        pot_args.extend(wrap_pot_args)
+        pot_args.extend([p._amp,p._tform,p._tsteady])
     pot_type= nu.array(pot_type,dtype=nu.int32,order='C')
     pot_args= nu.array(pot_args,dtype=nu.float64,order='C')
     return (npot,pot_type,pot_args)
@@ -259,7 +289,7 @@ def _parse_tol(rtol,atol):
     return (rtol,atol)
 
 def integratePlanarOrbit_c(pot,yo,t,int_method,rtol=None,atol=None,
-                           dt=None):
+                           dt=None,nthreads=None,OmegaP=None):
     """
     NAME:
        integratePlanarOrbit_c
@@ -267,34 +297,45 @@ def integratePlanarOrbit_c(pot,yo,t,int_method,rtol=None,atol=None,
        C integrate an ode for a planarOrbit
     INPUT:
        pot - Potential or list of such instances
-       yo - initial condition [q,p]
+       yo - initial condition [q,p], shape [4] or [N,4] to integrate N orbits at once (in parallel using OpenMP)
        t - set of times at which one wants the result
        int_method= 'leapfrog_c', 'rk4_c', 'rk6_c', 'symplec4_c'
        rtol, atol
        dt= (None) force integrator to use this stepsize (default is to automatically determine one))
+       nthreads= (None) number of OpenMP threads to integrate multiple orbits with (default: OpenMP's default); use 1 when calling this function from multiple Python threads
+       OmegaP= (None) if set, integrate in the frame rotating with this pattern speed, which coincides with the inertial frame at t=0 (yo and y are then in the rotating frame; only for the Runge-Kutta integrators)
     OUTPUT:
        (y,err)
-       y : array, shape (len(y0), len(t))
+       y : array, shape (len(t),4) or (N,len(t),4)
        Array containing the value of y for each desired time in t, \
        with the initial value y0 in the first row.
-       err: error message, if not zero: 1 means maximum step reduction happened for adaptive integrators
+       err: error message (array of shape N for N orbits), if not zero: 1 means maximum step reduction happened for adaptive integrators
     HISTORY:
        2011-10-03 - Written - Bovy (IAS)
+       2026-10-16 - Integrate multiple orbits in a single call, using nthreads OpenMP threads
+       2026-10-16 - Added OmegaP
     """
     rtol, atol= _parse_tol(rtol,atol)
     npot, pot_type, pot_args= _parse_pot(pot)
     int_method_c= _parse_integrator(int_method)
+    if not OmegaP is None and not int_method_c in [1,2,5]:
+        raise ValueError("Integration in a rotating frame (OmegaP=) requires one of the Runge-Kutta integrators rk4_c, rk6_c, or dopr54_c")
     if dt is None: 
         dt= -9999.99
+    # Multiple orbits?
+    single_obj= len(nu.shape(yo)) == 1
+    yo= nu.atleast_2d(yo)
+    nobj= len(yo)
 
     #Set up result array
-    result= nu.empty((len(t),4))
-    err= ctypes.c_int(0)
+    result= nu.empty((nobj,len(t),4))
+    err= nu.zeros(nobj,dtype=nu.int32)
 
     #Set up the C code
     ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
     integrationFunc= _lib.integratePlanarOrbit
-    integrationFunc.argtypes= [ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+    integrationFunc.argtypes= [ctypes.c_int,
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
                                ctypes.c_int,                             
                                ndpointer(dtype=nu.float64,flags=ndarrayFlags),
                                ctypes.c_int,
@@ -304,7 +345,9 @@ def integratePlanarOrbit_c(pot,yo,t,int_method,rtol=None,atol=None,
                                ctypes.c_double,
                                ctypes.c_double,
                                ndpointer(dtype=nu.float64,flags=ndarrayFlags),
-                               ctypes.POINTER(ctypes.c_int),
+                               ndpointer(dtype=nu.int32,flags=ndarrayFlags),
+                               ctypes.c_int,
+                               ctypes.c_double,
                                ctypes.c_int]
 
     #Array requirements, first store old order
@@ -313,9 +356,11 @@ def integratePlanarOrbit_c(pot,yo,t,int_method,rtol=None,atol=None,
     yo= nu.require(yo,dtype=nu.float64,requirements=['C','W'])
     t= nu.require(t,dtype=nu.float64,requirements=['C','W'])
     result= nu.require(result,dtype=nu.float64,requirements=['C','W'])
+    err= nu.require(err,dtype=nu.int32,requirements=['C','W'])
 
     #Run the C code
-    integrationFunc(yo,
+    integrationFunc(ctypes.c_int(nobj),
+                    yo,
                     ctypes.c_int(len(t)),
                     t,
                     ctypes.c_int(npot),
@@ -324,17 +369,22 @@ def integratePlanarOrbit_c(pot,yo,t,int_method,rtol=None,atol=None,
                     ctypes.c_double(dt),                    
                     ctypes.c_double(rtol),ctypes.c_double(atol),
                     result,
-                    ctypes.byref(err),
-                    ctypes.c_int(int_method_c))
+                    err,
+                    ctypes.c_int(int_method_c),
+                    ctypes.c_double(0. if OmegaP is None else OmegaP),
+                    ctypes.c_int(0 if nthreads is None else nthreads))
 
-    if err.value == -10: #pragma: no cover
+    if nu.any(err == -10): #pragma: no cover
         raise KeyboardInterrupt("Orbit integration interrupted by CTRL-C (SIGINT)")
 
     #Reset input arrays
     if f_cont[0]: yo= nu.asfortranarray(yo)
     if f_cont[1]: t= nu.asfortranarray(t)
 
-    return (result,err.value)
+    if single_obj:
+        return (result[0],err[0])
+    else:
+        return (result,err)
 
 
 def integratePlanarOrbit_dxdv_c(pot,yo,dyo,t,int_method,rtol=None,atol=None,
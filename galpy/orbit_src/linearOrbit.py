@@ -3,7 +3,8 @@ from scipy import integrate
 from galpy.orbit_src.OrbitTop import OrbitTop
 from galpy.potential_src.linearPotential import _evaluatelinearForces,\
     evaluatelinearPotentials
-import galpy.util.bovy_plot as plot
+from galpy.util import LazyModule
+plot= LazyModule('galpy.util.bovy_plot')
 import galpy.util.bovy_symplecticode as symplecticode
 from galpy.util.bovy_conversion import physical_conversion
 class linearOrbit(OrbitTop):
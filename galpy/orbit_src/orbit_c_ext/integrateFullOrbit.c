@@ -5,6 +5,9 @@
 #include <stdlib.h>
 #include <stdbool.h>
 #include <math.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
 #include <bovy_symplecticode.h>
 #include <bovy_rk.h>
 //Potentials
@@ -12,6 +15,8 @@
 #ifndef M_PI
 #define M_PI 3.14159265358979323846
 #endif
+#define CHUNKSIZE 1
+#define DXDV_FD_EPS 1e-5
 /*
   Function Declarations
 */
@@ -21,6 +26,10 @@ void evalRectDeriv(double, double *, double *,
 			 int, struct potentialArg *);
 void evalRectDeriv_dxdv(double,double *, double *,
 			      int, struct potentialArg *);
+void evalRectDeriv_rotating(double, double *, double *,
+			    int, struct potentialArg *);
+static void parse_leapFuncArgs_Full_ptr(int,struct potentialArg *,
+					int **,double **);
 /*
   Actual functions
 */
@@ -28,73 +37,109 @@ void parse_leapFuncArgs_Full(int npot,
 			     struct potentialArg * potentialArgs,
 			     int * pot_type,
 			     double * pot_args){
+  parse_leapFuncArgs_Full_ptr(npot,potentialArgs,&pot_type,&pot_args);
+}
+static void parse_leapFuncArgs_Full_ptr(int npot,
+					struct potentialArg * potentialArgs,
+					int ** pot_type_ptr,
+					double ** pot_args_ptr){
+  // Pointers to the pointers, such that wrapper potentials can parse the
+  // potentials that they wrap and continue after them
+  int * pot_type= *pot_type_ptr;
+  double * pot_args= *pot_args_ptr;
   int ii,jj,kk;
   int nR, nz;
   double * Rgrid, * zgrid, * potGrid_splinecoeffs;
   for (ii=0; ii < npot; ii++){
+    potentialArgs->nwrapped= 0;
+    potentialArgs->wrappedPotentialArg= NULL;
     potentialArgs->i2drforce= NULL;
     potentialArgs->accxrforce= NULL;
     potentialArgs->accyrforce= NULL;
     potentialArgs->i2dzforce= NULL;
     potentialArgs->accxzforce= NULL;
     potentialArgs->accyzforce= NULL;
+    potentialArgs->dens= NULL;
+    // Second derivatives are NULL if not implemented (evaluated as finite
+    // differences of the forces when needed)
+    potentialArgs->R2deriv= NULL;
+    potentialArgs->z2deriv= NULL;
+    potentialArgs->Rzderiv= NULL;
+    potentialArgs->phi2deriv= NULL;
+    potentialArgs->Rphideriv= NULL;
+    potentialArgs->zphideriv= NULL;
 
     switch ( *pot_type++ ) {
     case 0: //LogarithmicHaloPotential, 2 arguments
+      potentialArgs->potentialEval= &LogarithmicHaloPotentialEval;
       potentialArgs->Rforce= &LogarithmicHaloPotentialRforce;
       potentialArgs->zforce= &LogarithmicHaloPotentialzforce;
       potentialArgs->phiforce= &ZeroForce;
-      //potentialArgs->R2deriv= &LogarithmicHaloPotentialR2deriv;
-      //potentialArgs->planarphi2deriv= &ZeroForce;
-      //potentialArgs->planarRphideriv= &ZeroForce;
+      potentialArgs->R2deriv= &LogarithmicHaloPotentialR2deriv;
+      potentialArgs->z2deriv= &LogarithmicHaloPotentialz2deriv;
+      potentialArgs->Rzderiv= &LogarithmicHaloPotentialRzderiv;
       potentialArgs->nargs= 3;
       break;
     case 5: //MiyamotoNagaiPotential, 3 arguments
+      potentialArgs->potentialEval= &MiyamotoNagaiPotentialEval;
       potentialArgs->Rforce= &MiyamotoNagaiPotentialRforce;
       potentialArgs->zforce= &MiyamotoNagaiPotentialzforce;
       potentialArgs->phiforce= &ZeroForce;
-      //potentialArgs->R2deriv= &MiyamotoNagaiPotentialR2deriv;
-      //potentialArgs->planarphi2deriv= &ZeroForce;
-      //potentialArgs->planarRphideriv= &ZeroForce;
+      potentialArgs->R2deriv= &MiyamotoNagaiPotentialR2deriv;
+      potentialArgs->z2deriv= &MiyamotoNagaiPotentialz2deriv;
+      potentialArgs->Rzderiv= &MiyamotoNagaiPotentialRzderiv;
       potentialArgs->nargs= 3;
       break;
     case 7: //PowerSphericalPotential, 2 arguments
+      potentialArgs->potentialEval= &PowerSphericalPotentialEval;
       potentialArgs->Rforce= &PowerSphericalPotentialRforce;
       potentialArgs->zforce= &PowerSphericalPotentialzforce;
       potentialArgs->phiforce= &ZeroForce;
-      //potentialArgs->R2deriv= &PowerSphericalPotentialR2deriv;
-      //potentialArgs->planarphi2deriv= &ZeroForce;
-      //potentialArgs->planarRphideriv= &ZeroForce;
+      potentialArgs->planarRforce= &PowerSphericalPotentialPlanarRforce;
+      potentialArgs->planarR2deriv= &PowerSphericalPotentialPlanarR2deriv;
+      potentialArgs->R2deriv= &SphericalPotentialR2deriv;
+      potentialArgs->z2deriv= &SphericalPotentialz2deriv;
+      potentialArgs->Rzderiv= &SphericalPotentialRzderiv;
       potentialArgs->nargs= 2;
       break;
     case 8: //HernquistPotential, 2 arguments
+      potentialArgs->potentialEval= &HernquistPotentialEval;
       potentialArgs->Rforce= &HernquistPotentialRforce;
       potentialArgs->zforce= &HernquistPotentialzforce;
       potentialArgs->phiforce= &ZeroForce;
-      //potentialArgs->R2deriv= &HernquistPotentialR2deriv;
-      //potentialArgs->planarphi2deriv= &ZeroForce;
-      //potentialArgs->planarRphideriv= &ZeroForce;
+      potentialArgs->planarRforce= &HernquistPotentialPlanarRforce;
+      potentialArgs->planarR2deriv= &HernquistPotentialPlanarR2deriv;
+      potentialArgs->R2deriv= &SphericalPotentialR2deriv;
+      potentialArgs->z2deriv= &SphericalPotentialz2deriv;
+      potentialArgs->Rzderiv= &SphericalPotentialRzderiv;
       potentialArgs->nargs= 2;
       break;
     case 9: //NFWPotential, 2 arguments
+      potentialArgs->potentialEval= &NFWPotentialEval;
       potentialArgs->Rforce= &NFWPotentialRforce;
       potentialArgs->zforce= &NFWPotentialzforce;
       potentialArgs->phiforce= &ZeroForce;
-      //potentialArgs->R2deriv= &NFWPotentialR2deriv;
-      //potentialArgs->planarphi2deriv= &ZeroForce;
-      //potentialArgs->planarRphideriv= &ZeroForce;
+      potentialArgs->planarRforce= &NFWPotentialPlanarRforce;
+      potentialArgs->planarR2deriv= &NFWPotentialPlanarR2deriv;
+      potentialArgs->R2deriv= &SphericalPotentialR2deriv;
+      potentialArgs->z2deriv= &SphericalPotentialz2deriv;
+      potentialArgs->Rzderiv= &SphericalPotentialRzderiv;
       potentialArgs->nargs= 2;
       break;
     case 10: //JaffePotential, 2 arguments
+      potentialArgs->potentialEval= &JaffePotentialEval;
       potentialArgs->Rforce= &JaffePotentialRforce;
       potentialArgs->zforce= &JaffePotentialzforce;
       potentialArgs->phiforce= &ZeroForce;
-      //potentialArgs->R2deriv= &JaffePotentialR2deriv;
-      //potentialArgs->planarphi2deriv= &ZeroForce;
-      //potentialArgs->planarRphideriv= &ZeroForce;
+      potentialArgs->planarRforce= &JaffePotentialPlanarRforce;
+      potentialArgs->planarR2deriv= &JaffePotentialPlanarR2deriv;
+      potentialArgs->R2deriv= &SphericalPotentialR2deriv;
+      potentialArgs->z2deriv= &SphericalPotentialz2deriv;
+      potentialArgs->Rzderiv= &SphericalPotentialRzderiv;
       potentialArgs->nargs= 2;
       break;
     case 11: //DoubleExponentialDiskPotential, XX arguments
+      potentialArgs->potentialEval= &DoubleExponentialDiskPotentialEval;
       potentialArgs->Rforce= &DoubleExponentialDiskPotentialRforce;
       potentialArgs->zforce= &DoubleExponentialDiskPotentialzforce;
       potentialArgs->phiforce= &ZeroForce;
@@ -102,9 +147,13 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->nargs= (int) (8 + 2 * *(pot_args+5) + 4 * ( *(pot_args+4) + 1 ));
       break;
     case 12: //FlattenedPowerPotential, 4 arguments
+      potentialArgs->potentialEval= &FlattenedPowerPotentialEval;
       potentialArgs->Rforce= &FlattenedPowerPotentialRforce;
       potentialArgs->zforce= &FlattenedPowerPotentialzforce;
       potentialArgs->phiforce= &ZeroForce;
+      potentialArgs->R2deriv= &FlattenedPowerPotentialR2deriv;
+      potentialArgs->z2deriv= &FlattenedPowerPotentialz2deriv;
+      potentialArgs->Rzderiv= &FlattenedPowerPotentialRzderiv;
       potentialArgs->nargs= 4;
       break;
     case 13: //interpRZPotential, XX arguments
@@ -134,31 +183,42 @@ void parse_leapFuncArgs_Full(int npot,
 		     INTERP_2D_LINEAR); //latter bc we already calculated the coeffs
       potentialArgs->accxzforce= gsl_interp_accel_alloc ();
       potentialArgs->accyzforce= gsl_interp_accel_alloc ();
+      potentialArgs->potentialEval= NULL; // potential grid not parsed
       potentialArgs->Rforce= &interpRZPotentialRforce;
       potentialArgs->zforce= &interpRZPotentialzforce;
       potentialArgs->phiforce= &ZeroForce;
-      potentialArgs->nargs= 2;
+      potentialArgs->nargs= 3;
       //clean up
       free(Rgrid);
       free(zgrid);
       free(potGrid_splinecoeffs);
       break;
     case 14: //IsochronePotential, 2 arguments
+      potentialArgs->potentialEval= &IsochronePotentialEval;
       potentialArgs->Rforce= &IsochronePotentialRforce;
       potentialArgs->zforce= &IsochronePotentialzforce;
       potentialArgs->phiforce= &ZeroForce;
+      potentialArgs->planarRforce= &IsochronePotentialPlanarRforce;
+      potentialArgs->planarR2deriv= &IsochronePotentialPlanarR2deriv;
+      potentialArgs->R2deriv= &SphericalPotentialR2deriv;
+      potentialArgs->z2deriv= &SphericalPotentialz2deriv;
+      potentialArgs->Rzderiv= &SphericalPotentialRzderiv;
       potentialArgs->nargs= 2;
       break;
     case 15: //PowerSphericalwCutoffPotential, 3 arguments
+      potentialArgs->potentialEval= &PowerSphericalPotentialwCutoffEval;
       potentialArgs->Rforce= &PowerSphericalPotentialwCutoffRforce;
       potentialArgs->zforce= &PowerSphericalPotentialwCutoffzforce;
       potentialArgs->phiforce= &ZeroForce;
-      //potentialArgs->R2deriv= &PowerSphericalPotentialR2deriv;
-      //potentialArgs->planarphi2deriv= &ZeroForce;
-      //potentialArgs->planarRphideriv= &ZeroForce;
+      potentialArgs->planarRforce= &PowerSphericalPotentialwCutoffPlanarRforce;
+      potentialArgs->planarR2deriv= &PowerSphericalPotentialwCutoffPlanarR2deriv;
+      potentialArgs->R2deriv= &SphericalPotentialR2deriv;
+      potentialArgs->z2deriv= &SphericalPotentialz2deriv;
+      potentialArgs->Rzderiv= &SphericalPotentialRzderiv;
       potentialArgs->nargs= 3;
       break;
     case 16: //KuzminKutuzovStaeckelPotential, 3 arguments
+      potentialArgs->potentialEval= &KuzminKutuzovStaeckelPotentialEval;
       potentialArgs->Rforce= &KuzminKutuzovStaeckelPotentialRforce;
       potentialArgs->zforce= &KuzminKutuzovStaeckelPotentialzforce;
       potentialArgs->phiforce= &ZeroForce;
@@ -166,62 +226,89 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->nargs= 3;
       break;
     case 17: //PlummerPotential, 2 arguments
+      potentialArgs->potentialEval= &PlummerPotentialEval;
       potentialArgs->Rforce= &PlummerPotentialRforce;
       potentialArgs->zforce= &PlummerPotentialzforce;
       potentialArgs->phiforce= &ZeroForce;
-      //potentialArgs->R2deriv= &PlummerPotentialR2deriv;
+      potentialArgs->planarRforce= &PlummerPotentialPlanarRforce;
+      potentialArgs->planarR2deriv= &PlummerPotentialPlanarR2deriv;
+      potentialArgs->R2deriv= &SphericalPotentialR2deriv;
+      potentialArgs->z2deriv= &SphericalPotentialz2deriv;
+      potentialArgs->Rzderiv= &SphericalPotentialRzderiv;
       potentialArgs->nargs= 2;
       break;
     case 18: //PseudoIsothermalPotential, 2 arguments
+      potentialArgs->potentialEval= &PseudoIsothermalPotentialEval;
       potentialArgs->Rforce= &PseudoIsothermalPotentialRforce;
       potentialArgs->zforce= &PseudoIsothermalPotentialzforce;
       potentialArgs->phiforce= &ZeroForce;
-      //potentialArgs->R2deriv= &PseudoIsothermalPotentialR2deriv;
+      potentialArgs->planarRforce= &PseudoIsothermalPotentialPlanarRforce;
+      potentialArgs->planarR2deriv= &PseudoIsothermalPotentialPlanarR2deriv;
+      potentialArgs->R2deriv= &SphericalPotentialR2deriv;
+      potentialArgs->z2deriv= &SphericalPotentialz2deriv;
+      potentialArgs->Rzderiv= &SphericalPotentialRzderiv;
       potentialArgs->nargs= 2;
       break;
     case 19: //KuzminDiskPotential, 2 arguments
+      potentialArgs->potentialEval= &KuzminDiskPotentialEval;
       potentialArgs->Rforce= &KuzminDiskPotentialRforce;
       potentialArgs->zforce= &KuzminDiskPotentialzforce;
       potentialArgs->phiforce= &ZeroForce;
+      potentialArgs->R2deriv= &KuzminDiskPotentialR2deriv;
+      potentialArgs->z2deriv= &KuzminDiskPotentialz2deriv;
+      potentialArgs->Rzderiv= &KuzminDiskPotentialRzderiv;
       potentialArgs->nargs= 2;
       break;
     case 20: //BurkertPotential, 2 arguments
+      potentialArgs->potentialEval= &BurkertPotentialEval;
       potentialArgs->Rforce= &BurkertPotentialRforce;
       potentialArgs->zforce= &BurkertPotentialzforce;
       potentialArgs->phiforce= &ZeroForce;
+      potentialArgs->planarRforce= &BurkertPotentialPlanarRforce;
+      potentialArgs->planarR2deriv= &BurkertPotentialPlanarR2deriv;
+      potentialArgs->R2deriv= &SphericalPotentialR2deriv;
+      potentialArgs->z2deriv= &SphericalPotentialz2deriv;
+      potentialArgs->Rzderiv= &SphericalPotentialRzderiv;
       potentialArgs->nargs= 2;
       break;
     case 21: //TriaxialHernquistPotential, lots of arguments
+      potentialArgs->potentialEval= &TriaxialHernquistPotentialEval;
       potentialArgs->Rforce= &TriaxialHernquistPotentialRforce;
       potentialArgs->zforce= &TriaxialHernquistPotentialzforce;
       potentialArgs->phiforce= &TriaxialHernquistPotentialphiforce;
       potentialArgs->nargs= (int) (21 + 2 * *(pot_args+14));
       break;
     case 22: //TriaxialNFWPotential, lots of arguments
+      potentialArgs->potentialEval= &TriaxialNFWPotentialEval;
       potentialArgs->Rforce= &TriaxialNFWPotentialRforce;
       potentialArgs->zforce= &TriaxialNFWPotentialzforce;
       potentialArgs->phiforce= &TriaxialNFWPotentialphiforce;
       potentialArgs->nargs= (int) (21 + 2 * *(pot_args+14));
       break;
     case 23: //TriaxialJaffePotential, lots of arguments
+      potentialArgs->potentialEval= &TriaxialJaffePotentialEval;
       potentialArgs->Rforce= &TriaxialJaffePotentialRforce;
       potentialArgs->zforce= &TriaxialJaffePotentialzforce;
       potentialArgs->phiforce= &TriaxialJaffePotentialphiforce;
       potentialArgs->nargs= (int) (21 + 2 * *(pot_args+14));
       break;      
     case 24: //SCFPotential, many arguments
+      potentialArgs->potentialEval= &SCFPotentialEval;
       potentialArgs->Rforce= &SCFPotentialRforce;
       potentialArgs->zforce= &SCFPotentialzforce;
       potentialArgs->phiforce= &SCFPotentialphiforce;
+      potentialArgs->dens= &SCFPotentialDens;
       potentialArgs->nargs= (int) (5 + (1 + *(pot_args + 1)) * *(pot_args+2) * *(pot_args+3)* *(pot_args+4) + 7);
       break;
     case 25: //SoftenedNeedleBarPotential, 13 arguments
+      potentialArgs->potentialEval= &SoftenedNeedleBarPotentialEval;
       potentialArgs->Rforce= &SoftenedNeedleBarPotentialRforce;
       potentialArgs->zforce= &SoftenedNeedleBarPotentialzforce;
       potentialArgs->phiforce= &SoftenedNeedleBarPotentialphiforce;
       potentialArgs->nargs= (int) 13;
       break;      
     case 26: //DiskSCFPotential, nsigma+3 arguments
+      potentialArgs->potentialEval= &DiskSCFPotentialEval;
       potentialArgs->Rforce= &DiskSCFPotentialRforce;
       potentialArgs->zforce= &DiskSCFPotentialzforce;
       potentialArgs->phiforce= &ZeroForce;
@@ -231,12 +318,47 @@ void parse_leapFuncArgs_Full(int npot,
 //      printf("TEST");	
 //      potentialArgs->Rforce= &ZeroForce;
 //      potentialArgs->zforce= &ZeroForce;
+      potentialArgs->potentialEval= &WilkinsonEvansPotentialEval;
       potentialArgs->Rforce= &WilkinsonEvansPotentialRforce;
       potentialArgs->zforce= &WilkinsonEvansPotentialzforce;
       potentialArgs->phiforce= &ZeroForce;
 //      printf("tst", &WilkinsonEvansPotentialRforce, &WilkinsonEvansPotentialzforce);
       potentialArgs->nargs= 2;
       break;
+    case 28: //TwoPowerTriaxialPotential, lots of arguments
+      potentialArgs->potentialEval= &TwoPowerTriaxialPotentialEval;
+      potentialArgs->Rforce= &TwoPowerTriaxialPotentialRforce;
+      potentialArgs->zforce= &TwoPowerTriaxialPotentialzforce;
+      potentialArgs->phiforce= &TwoPowerTriaxialPotentialphiforce;
+      potentialArgs->nargs= (int) (23 + 2 * *(pot_args+14));
+      break;
+    case 29: //FerrersPotential, 15 + 2 x glorder arguments
+      potentialArgs->potentialEval= &FerrersPotentialEval;
+      potentialArgs->Rforce= &FerrersPotentialRforce;
+      potentialArgs->zforce= &FerrersPotentialzforce;
+      potentialArgs->phiforce= &FerrersPotentialphiforce;
+      potentialArgs->nargs= (int) (15 + 2 * *(pot_args+7));
+      break;
+    case 30: //interp3DPotential, 11 + 4 x nR x nz x nphi arguments
+      potentialArgs->potentialEval= &interp3DPotentialEval;
+      potentialArgs->Rforce= &interp3DPotentialRforce;
+      potentialArgs->zforce= &interp3DPotentialzforce;
+      potentialArgs->phiforce= &interp3DPotentialphiforce;
+      potentialArgs->nargs= (int) (11 + 4 * *pot_args * *(pot_args+1)
+				   * *(pot_args+2));
+      break;
+    case -1: //DehnenSmoothWrapperPotential, wrapped potentials + 3 arguments
+      potentialArgs->potentialEval= &DehnenSmoothWrapperPotentialEval;
+      potentialArgs->Rforce= &DehnenSmoothWrapperPotentialRforce;
+      potentialArgs->zforce= &DehnenSmoothWrapperPotentialzforce;
+      potentialArgs->phiforce= &DehnenSmoothWrapperPotentialphiforce;
+      potentialArgs->nwrapped= (int) *pot_args++;
+      potentialArgs->wrappedPotentialArg= (struct potentialArg *) malloc ( potentialArgs->nwrapped * sizeof (struct potentialArg) );
+      parse_leapFuncArgs_Full_ptr(potentialArgs->nwrapped,
+				  potentialArgs->wrappedPotentialArg,
+				  &pot_type,&pot_args);
+      potentialArgs->nargs= 3;
+      break;
     }
     potentialArgs->args= (double *) malloc( potentialArgs->nargs * sizeof(double));
     for (jj=0; jj < potentialArgs->nargs; jj++){
@@ -247,8 +369,11 @@ void parse_leapFuncArgs_Full(int npot,
     potentialArgs++;
   }
   potentialArgs-= npot;
+  *pot_type_ptr= pot_type;
+  *pot_args_ptr= pot_args;
 }
-void integrateFullOrbit(double *yo,
+void integrateFullOrbit(int nobj,
+			double *yo,
 			int nt, 
 			double *t,
 			int npot,
@@ -259,12 +384,27 @@ void integrateFullOrbit(double *yo,
 			double atol,
 			double *result,
 			int * err,
-			int odeint_type){
+			int odeint_type,
+			double omegap,
+			int nthreads){
   //Set up the forces, first count
-  int ii;
+  int ii,jj;
   int dim;
-  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
-  parse_leapFuncArgs_Full(npot,potentialArgs,pot_type,pot_args);
+  int max_threads;
+  int tid;
+#ifdef _OPENMP
+  // nthreads > 0 sets the number of threads (e.g., 1 when called from a
+  // pool of Python threads), otherwise use OpenMP's default
+  max_threads= ( nthreads > 0 ) ? nthreads : omp_get_max_threads();
+  max_threads= ( nobj < max_threads ) ? nobj : max_threads;
+#else
+  max_threads= 1;
+#endif
+  // Each thread gets its own copy of the potential arguments, because some
+  // potentials cache intermediate results in their arguments
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( max_threads * npot * sizeof (struct potentialArg) );
+  for (jj=0; jj < max_threads; jj++)
+    parse_leapFuncArgs_Full(npot,potentialArgs+jj*npot,pot_type,pot_args);
   //Integrate
   void (*odeint_func)(void (*func)(double, double *, double *,
 			   int, struct potentialArg *),
@@ -308,34 +448,85 @@ void integrateFullOrbit(double *yo,
     dim= 6;
     break;
   }
-  odeint_func(odeint_deriv_func,dim,yo,nt,dt,t,npot,potentialArgs,rtol,atol,
-	      result,err);
+  // In a frame rotating with pattern speed omegap (only for the Runge-Kutta
+  // integrators, because of the Coriolis force), each thread's potentials
+  // are wrapped in a single argument that holds the pattern speed
+  int frame_npot= npot;
+  struct potentialArg * frameArgs= potentialArgs;
+  if ( omegap != 0. ) {
+    frame_npot= 1;
+    frameArgs= (struct potentialArg *) malloc ( max_threads * sizeof (struct potentialArg) );
+    for (jj=0; jj < max_threads; jj++) {
+      (frameArgs+jj)->nwrapped= npot;
+      (frameArgs+jj)->wrappedPotentialArg= potentialArgs+jj*npot;
+      (frameArgs+jj)->nargs= 1;
+      (frameArgs+jj)->args= (double *) malloc ( sizeof (double) );
+      *((frameArgs+jj)->args)= omegap;
+    }
+    odeint_deriv_func= &evalRectDeriv_rotating;
+  }
+  // Orbits can take very different amounts of time to integrate
+  // (especially with the adaptive integrators), so schedule dynamically
+  UNUSED int chunk= CHUNKSIZE;
+  // Handle KeyboardInterrupt gracefully, once for all orbits
+  struct sigaction old_action;
+  install_sigint_handler(&old_action);
+#pragma omp parallel for schedule(dynamic,chunk) private(ii,tid)	\
+  num_threads(max_threads)
+  for (ii=0; ii < nobj; ii++) {
+#ifdef _OPENMP
+    tid= omp_get_thread_num();
+#else
+    tid = 0;
+#endif
+    if ( interrupted ) { // skip the remaining orbits
+      *(err+ii)= -10;
+      continue;
+    }
+    odeint_func(odeint_deriv_func,dim,yo+6*ii,nt,dt,t,frame_npot,
+		frameArgs+tid*frame_npot,rtol,atol,
+		result+6*nt*ii,err+ii);
+  }
+  restore_sigint_handler(&old_action);
   //Free allocated memory
-  for (ii=0; ii < npot; ii++) {
-    free(potentialArgs->args);
-    potentialArgs++;
+  if ( omegap != 0. ) {
+    for (jj=0; jj < max_threads; jj++)
+      free((frameArgs+jj)->args);
+    free(frameArgs);
   }
-  potentialArgs-= npot;
+  for (jj=0; jj < max_threads; jj++)
+    free_potentialArgs(npot,potentialArgs+jj*npot);
   free(potentialArgs);
   //Done!
 }
-// LCOV_EXCL_START
-void integrateOrbit_dxdv(double *yo,
-			 int nt, 
-			 double *t,
-			 int npot,
-			 int * pot_type,
-			 double * pot_args,
-			 double rtol,
-			 double atol,
-			 double *result,
-			 int * err,
-			 int odeint_type){
+void integrateFullOrbit_dxdv(int nobj,
+			     double *yo,
+			     int nt, 
+			     double *t,
+			     int npot,
+			     int * pot_type,
+			     double * pot_args,
+			     double dt,
+			     double rtol,
+			     double atol,
+			     double *result,
+			     int * err,
+			     int odeint_type,
+			     int nthreads){
   //Set up the forces, first count
-  int ii;
+  int ii,jj;
   int dim;
-  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
-  parse_leapFuncArgs_Full(npot,potentialArgs,pot_type,pot_args);
+  int max_threads;
+  int tid;
+#ifdef _OPENMP
+  max_threads= ( nthreads > 0 ) ? nthreads : omp_get_max_threads();
+  max_threads= ( nobj < max_threads ) ? nobj : max_threads;
+#else
+  max_threads= 1;
+#endif
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( max_threads * npot * sizeof (struct potentialArg) );
+  for (jj=0; jj < max_threads; jj++)
+    parse_leapFuncArgs_Full(npot,potentialArgs+jj*npot,pot_type,pot_args);
   //Integrate
   void (*odeint_func)(void (*func)(double, double *, double *,
 			   int, struct potentialArg *),
@@ -348,11 +539,6 @@ void integrateOrbit_dxdv(double *yo,
   void (*odeint_deriv_func)(double, double *, double *,
 			    int,struct potentialArg *);
   switch ( odeint_type ) {
-  case 0: //leapfrog
-    odeint_func= &leapfrog;
-    odeint_deriv_func= &evalRectForce;
-    dim= 6;
-    break;
   case 1: //RK4
     odeint_func= &bovy_rk4;
     odeint_deriv_func= &evalRectDeriv_dxdv;
@@ -363,34 +549,39 @@ void integrateOrbit_dxdv(double *yo,
     odeint_deriv_func= &evalRectDeriv_dxdv;
     dim= 12;
     break;
-  case 3: //symplec4
-    odeint_func= &symplec4;
-    odeint_deriv_func= &evalRectForce;
-    dim= 6;
-    break;
-  case 4: //symplec6
-    odeint_func= &symplec6;
-    odeint_deriv_func= &evalRectForce;
-    dim= 6;
-    break;
   case 5: //DOPR54
     odeint_func= &bovy_dopr54;
     odeint_deriv_func= &evalRectDeriv_dxdv;
     dim= 12;
     break;
   }
-  odeint_func(odeint_deriv_func,dim,yo,nt,-9999.99,t,npot,potentialArgs,
-	      rtol,atol,result,err);
-  //Free allocated memory
-  for (ii=0; ii < npot; ii++) {
-    free(potentialArgs->args);
-    potentialArgs++;
+  UNUSED int chunk= CHUNKSIZE;
+  // Handle KeyboardInterrupt gracefully, once for all orbits
+  struct sigaction old_action;
+  install_sigint_handler(&old_action);
+#pragma omp parallel for schedule(dynamic,chunk) private(ii,tid)	\
+  num_threads(max_threads)
+  for (ii=0; ii < nobj; ii++) {
+#ifdef _OPENMP
+    tid= omp_get_thread_num();
+#else
+    tid = 0;
+#endif
+    if ( interrupted ) { // skip the remaining orbits
+      *(err+ii)= -10;
+      continue;
+    }
+    odeint_func(odeint_deriv_func,dim,yo+12*ii,nt,dt,t,npot,
+		potentialArgs+tid*npot,rtol,atol,
+		result+12*nt*ii,err+ii);
   }
-  potentialArgs-= npot;
+  restore_sigint_handler(&old_action);
+  //Free allocated memory
+  for (jj=0; jj < max_threads; jj++)
+    free_potentialArgs(npot,potentialArgs+jj*npot);
   free(potentialArgs);
   //Done!
 }
-// LCOV_EXCL_STOP
 void evalRectForce(double t, double *q, double *a,
 		   int nargs, struct potentialArg * potentialArgs){
   double sinphi, cosphi, x, y, phi,R,Rforce,phiforce, z, zforce;
@@ -437,64 +628,65 @@ void evalRectDeriv(double t, double *q, double *a,
   *a= zforce;
 }
 
-// LCOV_EXCL_START
 void evalRectDeriv_dxdv(double t, double *q, double *a,
 			int nargs, struct potentialArg * potentialArgs){
-  double sinphi, cosphi, x, y, phi,R,Rforce,phiforce,z,zforce;
-  double R2deriv, phi2deriv, Rphideriv, dFxdx, dFxdy, dFydx, dFydy;
+  int ii;
+  double r, dxnorm, h;
+  double qp[3], qm[3], ap[3], am[3];
   //first three derivatives are just the velocities
   *a++= *(q+3);
   *a++= *(q+4);
   *a++= *(q+5);
   //Rest is force
-  //q is rectangular so calculate R and phi
-  x= *q;
-  y= *(q+1);
-  z= *(q+2);
-  R= sqrt(x*x+y*y);
-  phi= acos(x/R);
-  sinphi= y/R;
-  cosphi= x/R;
-  if ( y < 0. ) phi= 2.*M_PI-phi;
-  //Calculate the forces
-  Rforce= calcRforce(R,z,phi,t,nargs,potentialArgs);
-  zforce= calczforce(R,z,phi,t,nargs,potentialArgs);
-  phiforce= calcPhiforce(R,z,phi,t,nargs,potentialArgs);
-  *a++= cosphi*Rforce-1./R*sinphi*phiforce;
-  *a++= sinphi*Rforce+1./R*cosphi*phiforce;
-  *a++= zforce;
+  evalRectForce(t,q,a,nargs,potentialArgs);
+  a+= 3;
   //dx derivatives are just dv
   *a++= *(q+9);
   *a++= *(q+10);
   *a++= *(q+11);
-  //for the dv derivatives we need also R2deriv, phi2deriv, and Rphideriv
-  R2deriv= calcR2deriv(R,z,phi,t,nargs,potentialArgs);
-  phi2deriv= calcphi2deriv(R,z,phi,t,nargs,potentialArgs);
-  Rphideriv= calcRphideriv(R,z,phi,t,nargs,potentialArgs);
-  //..and dFxdx, dFxdy, dFydx, dFydy
-  dFxdx= -cosphi*cosphi*R2deriv
-    +2.*cosphi*sinphi/R/R*phiforce
-    +sinphi*sinphi/R*Rforce
-    +2.*sinphi*cosphi/R*Rphideriv
-    -sinphi*sinphi/R/R*phi2deriv;
-  dFxdy= -sinphi*cosphi*R2deriv
-    +(sinphi*sinphi-cosphi*cosphi)/R/R*phiforce
-    -cosphi*sinphi/R*Rforce
-    -(cosphi*cosphi-sinphi*sinphi)/R*Rphideriv
-    +cosphi*sinphi/R/R*phi2deriv;
-  dFydx= -cosphi*sinphi*R2deriv
-    +(sinphi*sinphi-cosphi*cosphi)/R/R*phiforce
-    +(sinphi*sinphi-cosphi*cosphi)/R*Rphideriv
-    -sinphi*cosphi/R*Rforce
-    +sinphi*cosphi/R/R*phi2deriv;
-  dFydy= -sinphi*sinphi*R2deriv
-    -2.*sinphi*cosphi/R/R*phiforce
-    -2.*sinphi*cosphi/R*Rphideriv
-    +cosphi*cosphi/R*Rforce
-    -cosphi*cosphi/R/R*phi2deriv;
-  *a++= dFxdx * *(q+4) + dFxdy * *(q+5);
-  *a++= dFydx * *(q+4) + dFydy * *(q+5);
-  *a= 0; //BOVY: PUT IN Z2DERIVS
+  //dv derivatives are the Jacobian of the force times dx, which is the
+  //derivative of the force in the direction of dx: compute it as a central
+  //finite difference with a step of DXDV_FD_EPS times the radius
+  r= sqrt(*q * *q + *(q+1) * *(q+1) + *(q+2) * *(q+2));
+  dxnorm= sqrt(*(q+6) * *(q+6) + *(q+7) * *(q+7) + *(q+8) * *(q+8));
+  if ( dxnorm == 0. ) {
+    *a++= 0.;
+    *a++= 0.;
+    *a= 0.;
+    return;
+  }
+  h= DXDV_FD_EPS * ( r > 0. ? r : 1. ) / dxnorm;
+  for (ii=0; ii < 3; ii++) {
+    qp[ii]= *(q+ii) + h * *(q+6+ii);
+    qm[ii]= *(q+ii) - h * *(q+6+ii);
+  }
+  evalRectForce(t,qp,ap,nargs,potentialArgs);
+  evalRectForce(t,qm,am,nargs,potentialArgs);
+  for (ii=0; ii < 3; ii++)
+    *a++= 0.5 * ( ap[ii] - am[ii] ) / h;
+}
+void evalRectDeriv_rotating(double t, double *q, double *a,
+			    int nargs, struct potentialArg * potentialArgs){
+  // q is in the frame rotating with the pattern speed in the arguments,
+  // which coincides with the inertial frame at t=0; nargs is always 1
+  double omegap= *potentialArgs->args;
+  double cosot= cos(omegap*t);
+  double sinot= sin(omegap*t);
+  double qin[3], ain[3];
+  //first three derivatives are just the velocities
+  *a++= *(q+3);
+  *a++= *(q+4);
+  *a++= *(q+5);
+  //Inertial force at the inertial position
+  qin[0]= cosot * *q - sinot * *(q+1);
+  qin[1]= sinot * *q + cosot * *(q+1);
+  qin[2]= *(q+2);
+  evalRectForce(t,qin,ain,potentialArgs->nwrapped,
+		potentialArgs->wrappedPotentialArg);
+  //Rotate back and add the centrifugal and Coriolis forces
+  *a++= cosot * ain[0] + sinot * ain[1]
+    + omegap * omegap * *q + 2. * omegap * *(q+4);
+  *a++= -sinot * ain[0] + cosot * ain[1]
+    + omegap * omegap * *(q+1) - 2. * omegap * *(q+3);
+  *a= ain[2];
 }
-
-// LCOV_EXCL_STOP
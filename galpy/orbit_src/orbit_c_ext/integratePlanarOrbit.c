@@ -5,6 +5,9 @@
 #include <stdlib.h>
 #include <stdbool.h>
 #include <math.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
 #include <bovy_symplecticode.h>
 #include <bovy_rk.h>
 //Potentials
@@ -12,6 +15,7 @@
 #ifndef M_PI
 #define M_PI 3.14159265358979323846
 #endif
+#define CHUNKSIZE 1
 /*
   Function Declarations
 */
@@ -21,14 +25,36 @@ void evalPlanarRectDeriv(double, double *, double *,
 			 int, struct potentialArg *);
 void evalPlanarRectDeriv_dxdv(double, double *, double *,
 			      int, struct potentialArg *);
+void evalPlanarRectDeriv_rotating(double, double *, double *,
+				  int, struct potentialArg *);
+static void parse_leapFuncArgs_ptr(int,struct potentialArg *,
+				   int **,double **);
 /*
   Actual functions
 */
 void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
 			int * pot_type,
 			double * pot_args){
+  parse_leapFuncArgs_ptr(npot,potentialArgs,&pot_type,&pot_args);
+}
+static void parse_leapFuncArgs_ptr(int npot,
+				   struct potentialArg * potentialArgs,
+				   int ** pot_type_ptr,
+				   double ** pot_args_ptr){
+  // Pointers to the pointers, such that wrapper potentials can parse the
+  // potentials that they wrap and continue after them
+  int * pot_type= *pot_type_ptr;
+  double * pot_args= *pot_args_ptr;
   int ii,jj;
   for (ii=0; ii < npot; ii++){
+    potentialArgs->nwrapped= 0;
+    potentialArgs->wrappedPotentialArg= NULL;
+    potentialArgs->i2drforce= NULL;
+    potentialArgs->accxrforce= NULL;
+    potentialArgs->accyrforce= NULL;
+    potentialArgs->i2dzforce= NULL;
+    potentialArgs->accxzforce= NULL;
+    potentialArgs->accyzforce= NULL;
     switch ( *pot_type++ ) {
     case 0: //LogarithmicHaloPotential, 2 arguments
       potentialArgs->planarRforce= &LogarithmicHaloPotentialPlanarRforce;
@@ -213,11 +239,37 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->planarphiforce= &SoftenedNeedleBarPotentialPlanarphiforce;
       potentialArgs->nargs= (int) 13;
       break;    
+    case 28: //TwoPowerTriaxialPotential, lots of arguments
+      potentialArgs->planarRforce= &TwoPowerTriaxialPotentialPlanarRforce;
+      potentialArgs->planarphiforce= &TwoPowerTriaxialPotentialPlanarphiforce;
+      potentialArgs->nargs= (int) (23 + 2 * *(pot_args+14));
+      break;
+    case 29: //FerrersPotential, 15 + 2 x glorder arguments
+      potentialArgs->planarRforce= &FerrersPotentialPlanarRforce;
+      potentialArgs->planarphiforce= &FerrersPotentialPlanarphiforce;
+      potentialArgs->nargs= (int) (15 + 2 * *(pot_args+7));
+      break;
+    case 30: //interp3DPotential, 11 + 4 x nR x nz x nphi arguments
+      potentialArgs->planarRforce= &interp3DPotentialPlanarRforce;
+      potentialArgs->planarphiforce= &interp3DPotentialPlanarphiforce;
+      potentialArgs->nargs= (int) (11 + 4 * *pot_args * *(pot_args+1)
+				   * *(pot_args+2));
+      break;
     case 26: //DiskSCFPotential, nsigma+3 arguments
       potentialArgs->planarRforce= &DiskSCFPotentialPlanarRforce;
       potentialArgs->planarphiforce= &ZeroForce;
       potentialArgs->nargs= (int) *(pot_args) + 3;
       break;      
+    case -1: //DehnenSmoothWrapperPotential, wrapped potentials + 3 arguments
+      potentialArgs->planarRforce= &DehnenSmoothWrapperPotentialPlanarRforce;
+      potentialArgs->planarphiforce= &DehnenSmoothWrapperPotentialPlanarphiforce;
+      potentialArgs->nwrapped= (int) *pot_args++;
+      potentialArgs->wrappedPotentialArg= (struct potentialArg *) malloc ( potentialArgs->nwrapped * sizeof (struct potentialArg) );
+      parse_leapFuncArgs_ptr(potentialArgs->nwrapped,
+			     potentialArgs->wrappedPotentialArg,
+			     &pot_type,&pot_args);
+      potentialArgs->nargs= 3;
+      break;
     }
     potentialArgs->args= (double *) malloc( potentialArgs->nargs * sizeof(double));
     for (jj=0; jj < potentialArgs->nargs; jj++){
@@ -228,8 +280,11 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
     potentialArgs++;
   }
   potentialArgs-= npot;
+  *pot_type_ptr= pot_type;
+  *pot_args_ptr= pot_args;
 }
-void integratePlanarOrbit(double *yo,
+void integratePlanarOrbit(int nobj,
+			  double *yo,
 			  int nt, 
 			  double *t,
 			  int npot,
@@ -240,12 +295,27 @@ void integratePlanarOrbit(double *yo,
 			  double atol,
 			  double *result,
 			  int * err,
-			  int odeint_type){
+			  int odeint_type,
+			  double omegap,
+			  int nthreads){
   //Set up the forces, first count
-  int ii;
+  int ii,jj;
   int dim;
-  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
-  parse_leapFuncArgs(npot,potentialArgs,pot_type,pot_args);
+  int max_threads;
+  int tid;
+#ifdef _OPENMP
+  // nthreads > 0 sets the number of threads (e.g., 1 when called from a
+  // pool of Python threads), otherwise use OpenMP's default
+  max_threads= ( nthreads > 0 ) ? nthreads : omp_get_max_threads();
+  max_threads= ( nobj < max_threads ) ? nobj : max_threads;
+#else
+  max_threads= 1;
+#endif
+  // Each thread gets its own copy of the potential arguments, because some
+  // potentials cache intermediate results in their arguments
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( max_threads * npot * sizeof (struct potentialArg) );
+  for (jj=0; jj < max_threads; jj++)
+    parse_leapFuncArgs(npot,potentialArgs+jj*npot,pot_type,pot_args);
   //Integrate
   void (*odeint_func)(void (*func)(double, double *, double *,
 			   int, struct potentialArg *),
@@ -289,14 +359,52 @@ void integratePlanarOrbit(double *yo,
     dim= 4;
     break;
   }
-  odeint_func(odeint_deriv_func,dim,yo,nt,dt,t,npot,potentialArgs,rtol,atol,
-	      result,err);
+  // In a frame rotating with pattern speed omegap (only for the Runge-Kutta
+  // integrators, because of the Coriolis force), each thread's potentials
+  // are wrapped in a single argument that holds the pattern speed
+  int frame_npot= npot;
+  struct potentialArg * frameArgs= potentialArgs;
+  if ( omegap != 0. ) {
+    frame_npot= 1;
+    frameArgs= (struct potentialArg *) malloc ( max_threads * sizeof (struct potentialArg) );
+    for (jj=0; jj < max_threads; jj++) {
+      (frameArgs+jj)->nwrapped= npot;
+      (frameArgs+jj)->wrappedPotentialArg= potentialArgs+jj*npot;
+      (frameArgs+jj)->nargs= 1;
+      (frameArgs+jj)->args= (double *) malloc ( sizeof (double) );
+      *((frameArgs+jj)->args)= omegap;
+    }
+    odeint_deriv_func= &evalPlanarRectDeriv_rotating;
+  }
+  UNUSED int chunk= CHUNKSIZE;
+  // Handle KeyboardInterrupt gracefully, once for all orbits
+  struct sigaction old_action;
+  install_sigint_handler(&old_action);
+#pragma omp parallel for schedule(dynamic,chunk) private(ii,tid)	\
+  num_threads(max_threads)
+  for (ii=0; ii < nobj; ii++) {
+#ifdef _OPENMP
+    tid= omp_get_thread_num();
+#else
+    tid = 0;
+#endif
+    if ( interrupted ) { // skip the remaining orbits
+      *(err+ii)= -10;
+      continue;
+    }
+    odeint_func(odeint_deriv_func,dim,yo+4*ii,nt,dt,t,frame_npot,
+		frameArgs+tid*frame_npot,rtol,atol,
+		result+4*nt*ii,err+ii);
+  }
+  restore_sigint_handler(&old_action);
   //Free allocated memory
-  for (ii=0; ii < npot; ii++) {
-    free(potentialArgs->args);
-    potentialArgs++;
+  if ( omegap != 0. ) {
+    for (jj=0; jj < max_threads; jj++)
+      free((frameArgs+jj)->args);
+    free(frameArgs);
   }
-  potentialArgs-= npot;
+  for (jj=0; jj < max_threads; jj++)
+    free_potentialArgs(npot,potentialArgs+jj*npot);
   free(potentialArgs);
   //Done!
 }
@@ -346,8 +454,12 @@ void integratePlanarOrbit_dxdv(double *yo,
     dim= 8;
     break;
   }
+  // Handle KeyboardInterrupt gracefully
+  struct sigaction old_action;
+  install_sigint_handler(&old_action);
   odeint_func(odeint_deriv_func,dim,yo,nt,dt,t,npot,potentialArgs,rtol,atol,
 	      result,err);
+  restore_sigint_handler(&old_action);
   //Free allocated memory
   for (ii=0; ii < npot; ii++) {
     free(potentialArgs->args);
@@ -396,6 +508,28 @@ void evalPlanarRectDeriv(double t, double *q, double *a,
   *a++= cosphi*Rforce-1./R*sinphi*phiforce;
   *a= sinphi*Rforce+1./R*cosphi*phiforce;
 }
+void evalPlanarRectDeriv_rotating(double t, double *q, double *a,
+				  int nargs, struct potentialArg * potentialArgs){
+  // q is in the frame rotating with the pattern speed in the arguments,
+  // which coincides with the inertial frame at t=0; nargs is always 1
+  double omegap= *potentialArgs->args;
+  double cosot= cos(omegap*t);
+  double sinot= sin(omegap*t);
+  double qin[2], ain[2];
+  //first two derivatives are just the velocities
+  *a++= *(q+2);
+  *a++= *(q+3);
+  //Inertial force at the inertial position
+  qin[0]= cosot * *q - sinot * *(q+1);
+  qin[1]= sinot * *q + cosot * *(q+1);
+  evalPlanarRectForce(t,qin,ain,potentialArgs->nwrapped,
+		      potentialArgs->wrappedPotentialArg);
+  //Rotate back and add the centrifugal and Coriolis forces
+  *a++= cosot * ain[0] + sinot * ain[1]
+    + omegap * omegap * *q + 2. * omegap * *(q+3);
+  *a= -sinot * ain[0] + cosot * ain[1]
+    + omegap * omegap * *(q+1) - 2. * omegap * *(q+2);
+}
 
 void evalPlanarRectDeriv_dxdv(double t, double *q, double *a,
 			      int nargs, struct potentialArg * potentialArgs){
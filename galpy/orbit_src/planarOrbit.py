@@ -2,9 +2,12 @@ import math as m
 import warnings
 import numpy as nu
 from scipy import integrate
-import galpy.util.bovy_symplecticode as symplecticode
 from galpy.util.bovy_conversion import physical_conversion
 from galpy.orbit_src.OrbitTop import OrbitTop
+from galpy.orbit_src.FullOrbit import _PYTHON_METHODS, \
+    _python_fallback_method, _python_integrate, _parse_python_warnmessage, \
+    _split_array_pots, _split_eval, _check_rotating_method, _rotating_frame, \
+    _rotatingEOM
 from galpy.potential_src.planarPotential import _evaluateplanarRforces,\
     RZToplanarPotential, toPlanarPotential, _evaluateplanarphiforces,\
     _evaluateplanarPotentials
@@ -74,7 +77,7 @@ class planarOrbitTop(OrbitTop):
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
-            self.rs= self.orbit[:,0]
+            self.rs= self._add_event_rs(self.orbit[:,0])
         return (nu.amax(self.rs)-nu.amin(self.rs))/(nu.amax(self.rs)+nu.amin(self.rs))
 
     @physical_conversion('energy')
@@ -145,7 +148,7 @@ class planarOrbitTop(OrbitTop):
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
-            self.rs= self.orbit[:,0]
+            self.rs= self._add_event_rs(self.orbit[:,0])
         return nu.amax(self.rs)
 
     @physical_conversion('position')
@@ -170,7 +173,7 @@ class planarOrbitTop(OrbitTop):
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
-            self.rs= self.orbit[:,0]
+            self.rs= self._add_event_rs(self.orbit[:,0])
         return nu.amin(self.rs)
 
     @physical_conversion('position')
@@ -228,6 +231,10 @@ class planarROrbit(planarOrbitTop):
            pot - potential instance or list of instances
            method= 'odeint' for scipy's odeint
                    'leapfrog' for a simple leapfrog implementation
+                   'symplec4' for a 4th order symplectic integrator
+                   'rk4' for a 4th-order Runge-Kutta integrator
+                   'dopr54' for a Dormand-Prince integrator
+                   'dop853' for an 8th order Dormand-Prince integrator
                    'leapfrog_c' for a simple leapfrog implementation in C
                    'rk4_c' for a 4th-order Runge-Kutta integrator in C
                    'rk6_c' for a 6-th order Runge-Kutta integrator in C
@@ -338,7 +345,7 @@ class planarOrbit(planarOrbitTop):
                           ro=ro,zo=zo,vo=vo,solarmotion=solarmotion)
         return None
 
-    def integrate(self,t,pot,method='symplec4_c',dt=None):
+    def integrate(self,t,pot,method='symplec4_c',dt=None,OmegaP=None):
         """
         NAME:
            integrate
@@ -349,22 +356,29 @@ class planarOrbit(planarOrbitTop):
            pot - potential instance or list of instances
            method= 'odeint' for scipy's odeint
                    'leapfrog' for a simple leapfrog implementation
+                   'symplec4' for a 4th order symplectic integrator
+                   'rk4' for a 4th-order Runge-Kutta integrator
+                   'dopr54' for a Dormand-Prince integrator
+                   'dop853' for an 8th order Dormand-Prince integrator
                    'leapfrog_c' for a simple leapfrog implementation in C
                    'rk4_c' for a 4th-order Runge-Kutta integrator in C
                    'rk6_c' for a 6-th order Runge-Kutta integrator in C
                    'dopr54_c' for a Dormand-Prince integrator in C (generally the fastest)
            dt= (None) if set, force the integrator to use this basic stepsize; must be an integer divisor of output stepsize
+           OmegaP= (None) if set, integrate in the frame rotating with this pattern speed (the orbit is returned in the inertial frame); only for the Runge-Kutta integrators
         OUTPUT:
            (none) (get the actual orbit using getOrbit()
         HISTORY:
            2010-07-20
+           2026-10-16 - Added OmegaP
         """
         if hasattr(self,'_orbInterp'): delattr(self,'_orbInterp')
         if hasattr(self,'rs'): delattr(self,'rs')
         thispot= toPlanarPotential(pot)
         self.t= nu.array(t)
         self._pot= thispot
-        self.orbit, msg= _integrateOrbit(self.vxvv,thispot,t,method,dt)
+        self.orbit, msg= _integrateOrbit(self.vxvv,thispot,t,method,dt,
+                                           OmegaP=OmegaP)
         return msg
 
     def integrate_dxdv(self,dxdv,t,pot,method='dopr54_c',
@@ -474,7 +488,7 @@ class planarOrbit(planarOrbitTop):
         if not hasattr(self,'orbit'):
             raise AttributeError("Integrate the orbit first")
         if not hasattr(self,'rs'):
-            self.rs= self.orbit[:,0]
+            self.rs= self._add_event_rs(self.orbit[:,0])
         return (nu.amax(self.rs)-nu.amin(self.rs))/(nu.amax(self.rs)+nu.amin(self.rs))
 
 def _integrateROrbit(vxvv,pot,t,method,dt):
@@ -488,12 +502,13 @@ def _integrateROrbit(vxvv,pot,t,method,dt):
               [R,vR,vT]; vR outward!
        pot - Potential instance
        t - list of times at which to output (0 has to be in this!)
-       method - 'odeint' or 'leapfrog'
+       method - 'odeint', 'leapfrog', 'symplec4', 'rk4', 'dopr54', 'dop853', or one of the C integrators
        dt - if set, force the integrator to use this basic stepsize; must be an integer divisor of output stepsize
     OUTPUT:
        [:,3] array of [R,vR,vT] at each t
     HISTORY:
        2010-07-20 - Written - Bovy (NYU)
+       2026-10-16 - Added vectorized python integrators
     """
     #First check that the potential has C
     if '_c' in method:
@@ -507,7 +522,7 @@ def _integrateROrbit(vxvv,pot,t,method,dt):
             else:
                 method= 'odeint'
             warnings.warn("Cannot use C integration because some of the potentials are not implemented in C (using %s instead)" % (method), galpyWarning)
-    if method.lower() == 'leapfrog':
+    if method.lower() in _PYTHON_METHODS:
         #We hack this by putting in a dummy phi
         this_vxvv= nu.zeros(len(vxvv)+1)
         this_vxvv[0:len(vxvv)]= vxvv
@@ -560,7 +575,7 @@ def _REOM(y,t,pot,l2):
     return [y[1],
             l2/y[0]**3.+_evaluateplanarRforces(pot,y[0],t=t)]
 
-def _integrateOrbit(vxvv,pot,t,method,dt):
+def _integrateOrbit(vxvv,pot,t,method,dt,nthreads=None,OmegaP=None):
     """
     NAME:
        _integrateOrbit
@@ -568,72 +583,77 @@ def _integrateOrbit(vxvv,pot,t,method,dt):
        integrate an orbit in a Phi(R) potential in the (R,phi)-plane
     INPUT:
        vxvv - array with the initial conditions stacked like
-              [R,vR,vT,phi]; vR outward!
+              [R,vR,vT,phi]; vR outward!; shape [4] or [N,4] for N orbits
        pot - Potential instance
        t - list of times at which to output (0 has to be in this!)
-       method - 'odeint' or 'leapfrog'
+       method - 'odeint', 'leapfrog', 'symplec4', 'rk4', 'dopr54', 'dop853', or one of the C integrators
        dt- if set, force the integrator to use this basic stepsize; must be an integer divisor of output stepsize
+       nthreads= (None) number of OpenMP threads for the C integrators (default: OpenMP's default)
+       OmegaP= (None) if set, integrate in the frame rotating with this pattern speed (only for the Runge-Kutta integrators); the output is in the inertial frame
     OUTPUT:
-       [:,4] array of [R,vR,vT,phi] at each t
+       [:,4] array of [R,vR,vT,phi] at each t ([N,:,4] for N orbits)
     HISTORY:
        2010-07-20 - Written - Bovy (NYU)
+       2026-10-16 - Allow multiple orbits, integrated in a single C call
+       2026-10-16 - Added vectorized python integrators
+       2026-10-16 - Added integration in a rotating frame
     """
+    vxvv= nu.array(vxvv)
+    if not OmegaP is None:
+        _check_rotating_method(method)
     #First check that the potential has C
     if '_c' in method:
         if isinstance(pot,list):
             allHasC= nu.prod([p.hasC for p in pot])
         else:
             allHasC= pot.hasC
-        if not allHasC:
-            if ('leapfrog' in method or 'symplec' in method):
-                method= 'leapfrog'
-            else:
-                method= 'odeint'
-            warnings.warn("Cannot use C integration because some of the potentials are not implemented in C (using %s instead)" % (method), galpyWarning)
-    if method.lower() == 'leapfrog':
+        if not allHasC or not ext_loaded:
+            method= _python_fallback_method(method,len(vxvv.shape) > 1
+                                            or not OmegaP is None)
+            if not allHasC:
+                warnings.warn("Cannot use C integration because some of the potentials are not implemented in C (using %s instead)" % (method), galpyWarning)
+    if len(vxvv.shape) > 1 and method.lower() == 'odeint':
+        # odeint does one orbit at a time
+        outs= [_integrateOrbit(vxvv[ii],pot,t,method,dt)
+               for ii in range(len(vxvv))]
+        return (nu.array([o[0] for o in outs]),
+                nu.array([o[1] for o in outs]))
+    if method.lower() in _PYTHON_METHODS:
         #go to the rectangular frame
-        this_vxvv= nu.array([vxvv[0]*nu.cos(vxvv[3]),
-                             vxvv[0]*nu.sin(vxvv[3]),
-                             vxvv[1]*nu.cos(vxvv[3])-vxvv[2]*nu.sin(vxvv[3]),
-                             vxvv[2]*nu.cos(vxvv[3])+vxvv[1]*nu.sin(vxvv[3])])
-        #integrate
-        tmp_out= symplecticode.leapfrog(_rectForce,this_vxvv,
-                                        t,args=(pot,),rtol=10.**-8)
-        #go back to the cylindrical frame
-        R= nu.sqrt(tmp_out[:,0]**2.+tmp_out[:,1]**2.)
-        phi= nu.arccos(tmp_out[:,0]/R)
-        phi[(tmp_out[:,1] < 0.)]= 2.*nu.pi-phi[(tmp_out[:,1] < 0.)]
-        vR= tmp_out[:,2]*nu.cos(phi)+tmp_out[:,3]*nu.sin(phi)
-        vT= tmp_out[:,3]*nu.cos(phi)-tmp_out[:,2]*nu.sin(phi)
-        out= nu.zeros((len(t),4))
-        out[:,0]= R
-        out[:,1]= vR
-        out[:,2]= vT
-        out[:,3]= phi
-        msg= 0
+        this_vxvv= _rotating_frame(_cyl_to_rect_vxvv(vxvv),OmegaP,t[0])
+        #Decide once which potentials can be evaluated for all orbits at once
+        if len(vxvv.shape) > 1:
+            pot_args= _split_array_pots(pot,[_evaluateplanarRforces,
+                                             _evaluateplanarphiforces],
+                                        t[0],vxvv[:,0],vxvv[:,3])
+        else:
+            pot_args= (pot,[])
+        #integrate, all orbits at once
+        if OmegaP is None:
+            eom= _rectEOM
+        else:
+            eom= _rotatingEOM(_rectForce,OmegaP)
+        tmp_out, msg= _python_integrate(method,_rectForce,eom,
+                                        this_vxvv,t,pot_args)
+        _parse_python_warnmessage(msg)
+        #go back to the inertial, cylindrical frame
+        out= _rect_to_cyl_orbit(_rotating_frame(tmp_out,OmegaP,t,
+                                                inverse=True))
     elif method.lower() == 'leapfrog_c' or method.lower() == 'rk4_c' \
             or method.lower() == 'rk6_c' or method.lower() == 'symplec4_c' \
             or method.lower() == 'symplec6_c' or method.lower() == 'dopr54_c':
         warnings.warn("Using C implementation to integrate orbits",galpyWarning)
         #go to the rectangular frame
-        this_vxvv= nu.array([vxvv[0]*nu.cos(vxvv[3]),
-                             vxvv[0]*nu.sin(vxvv[3]),
-                             vxvv[1]*nu.cos(vxvv[3])-vxvv[2]*nu.sin(vxvv[3]),
-                             vxvv[2]*nu.cos(vxvv[3])+vxvv[1]*nu.sin(vxvv[3])])
-        #integrate
+        this_vxvv= _rotating_frame(_cyl_to_rect_vxvv(vxvv),OmegaP,t[0])
+        #integrate, all orbits at once
         tmp_out, msg= integratePlanarOrbit_c(pot,this_vxvv,
-                                             t,method,dt=dt)
-        #go back to the cylindrical frame
-        R= nu.sqrt(tmp_out[:,0]**2.+tmp_out[:,1]**2.)
-        phi= nu.arccos(tmp_out[:,0]/R)
-        phi[(tmp_out[:,1] < 0.)]= 2.*nu.pi-phi[(tmp_out[:,1] < 0.)]
-        vR= tmp_out[:,2]*nu.cos(phi)+tmp_out[:,3]*nu.sin(phi)
-        vT= tmp_out[:,3]*nu.cos(phi)-tmp_out[:,2]*nu.sin(phi)
-        out= nu.zeros((len(t),4))
-        out[:,0]= R
-        out[:,1]= vR
-        out[:,2]= vT
-        out[:,3]= phi
+                                             t,method,dt=dt,
+                                             nthreads=nthreads,
+                                             OmegaP=OmegaP)
+        #go back to the inertial, cylindrical frame
+        out= _rect_to_cyl_orbit(_rotating_frame(tmp_out,OmegaP,t,
+                                                inverse=True))
+        _parse_warnmessage(msg)
     elif method.lower() == 'odeint':
         vphi= vxvv[2]/vxvv[0]
         init= [vxvv[0],vxvv[1],vxvv[3],vphi]
@@ -648,12 +668,32 @@ def _integrateOrbit(vxvv,pot,t,method,dt):
     else:
         raise NotImplementedError("requested integration method does not exist")
     #post-process to remove negative radii
-    neg_radii= (out[:,0] < 0.)
+    neg_radii= (out[...,0] < 0.)
     out[neg_radii,0]= -out[neg_radii,0]
     out[neg_radii,3]+= m.pi
-    _parse_warnmessage(msg)
     return (out,msg)
 
+def _cyl_to_rect_vxvv(vxvv):
+    """Convert [...,4] initial conditions [R,vR,vT,phi] to [x,y,vx,vy]"""
+    return nu.array([vxvv[...,0]*nu.cos(vxvv[...,3]),
+                     vxvv[...,0]*nu.sin(vxvv[...,3]),
+                     vxvv[...,1]*nu.cos(vxvv[...,3])
+                     -vxvv[...,2]*nu.sin(vxvv[...,3]),
+                     vxvv[...,2]*nu.cos(vxvv[...,3])
+                     +vxvv[...,1]*nu.sin(vxvv[...,3])]).T
+
+def _rect_to_cyl_orbit(rect_out):
+    """Convert a [...,nt,4] integrated orbit [x,y,vx,vy] to [R,vR,vT,phi]"""
+    R= nu.sqrt(rect_out[...,0]**2.+rect_out[...,1]**2.)
+    phi= nu.arccos(rect_out[...,0]/R)
+    phi[(rect_out[...,1] < 0.)]= 2.*nu.pi-phi[(rect_out[...,1] < 0.)]
+    out= nu.empty_like(rect_out)
+    out[...,0]= R
+    out[...,1]= rect_out[...,2]*nu.cos(phi)+rect_out[...,3]*nu.sin(phi)
+    out[...,2]= rect_out[...,3]*nu.cos(phi)-rect_out[...,2]*nu.sin(phi)
+    out[...,3]= phi
+    return out
+
 def _integrateOrbit_dxdv(vxvv,dxdv,pot,t,method,rectIn,rectOut):
     """
     NAME:
@@ -682,9 +722,11 @@ def _integrateOrbit_dxdv(vxvv,dxdv,pot,t,method,rectIn,rectOut):
             allHasC= nu.prod([p.hasC and p.hasC_dxdv for p in pot])
         else:
             allHasC= pot.hasC and pot.hasC_dxdv
-        if not allHasC and not 'leapfrog' in method and not 'symplec' in method:
+        if (not allHasC or not ext_loaded) \
+                and not 'leapfrog' in method and not 'symplec' in method:
             method= 'odeint'
-            warnings.warn("Using odeint because not all used potential have adequate C implementations to integrate phase-space volumes",galpyWarning)
+            if not allHasC:
+                warnings.warn("Using odeint because not all used potential have adequate C implementations to integrate phase-space volumes",galpyWarning)
     #go to the rectangular frame
     this_vxvv= nu.array([vxvv[0]*nu.cos(vxvv[3]),
                          vxvv[0]*nu.sin(vxvv[3]),
@@ -827,34 +869,44 @@ def _EOM(y,t,pot):
             1./y[0]**2.*(_evaluateplanarphiforces(pot,y[0],phi=y[2],t=t)-
                          2.*y[0]*y[1]*y[3])]
 
-def _rectForce(x,pot,t=0.):
+def _rectForce(x,pot,spot=[],t=0.):
     """
     NAME:
        _rectForce
     PURPOSE:
        returns the force in the rectangular frame
     INPUT:
-       x - current position
+       x - current position; shape [2] or [N,2]
        t - current time
        pot - (list of) Potential instance(s)
+       spot= ([]) list of Potential instances that need to be evaluated one orbit at a time (for [N,2] x)
     OUTPUT:
        force
     HISTORY:
        2011-02-02 - Written - Bovy (NYU)
+       2026-10-16 - Allow multiple orbits
     """
     #x is rectangular so calculate R and phi
-    R= nu.sqrt(x[0]**2.+x[1]**2.)
-    phi= nu.arccos(x[0]/R)
-    sinphi= x[1]/R
-    cosphi= x[0]/R
-    if x[1] < 0.: phi= 2.*nu.pi-phi
+    R= nu.sqrt(x[...,0]**2.+x[...,1]**2.)
+    phi= nu.arccos(x[...,0]/R)
+    sinphi= x[...,1]/R
+    cosphi= x[...,0]/R
+    # [()] turns the 0-d arrays for a single orbit into scalars
+    phi= nu.where(x[...,1] < 0.,2.*nu.pi-phi,phi)[()]
     #calculate forces
-    Rforce= _evaluateplanarRforces(pot,R,phi=phi,t=t)
-    phiforce= _evaluateplanarphiforces(pot,R,phi=phi,t=t)
-    return nu.array([cosphi*Rforce-1./R*sinphi*phiforce,
-                     sinphi*Rforce+1./R*cosphi*phiforce])
+    Rforce= _split_eval(_evaluateplanarRforces,pot,spot,R,phi=phi,t=t)
+    phiforce= _split_eval(_evaluateplanarphiforces,pot,spot,R,phi=phi,t=t)
+    out= nu.empty(x.shape)
+    out[...,0]= cosphi*Rforce-1./R*sinphi*phiforce
+    out[...,1]= sinphi*Rforce+1./R*cosphi*phiforce
+    return out
+
+def _rectEOM(y,t,pot,spot=[]):
+    """Equations of motion in the rectangular frame, y= [...,4] [x,y,vx,vy]"""
+    return nu.concatenate((y[...,2:],_rectForce(y[...,:2],pot,spot,t=t)),
+                          axis=-1)
 
 def _parse_warnmessage(msg):
-    if msg == 1: #pragma: no cover
+    if nu.any(nu.array(msg) == 1): #pragma: no cover
         warnings.warn("During numerical integration, steps smaller than the smallest step were requested; integration might not be accurate",galpyWarning)
         
@@ -16,6 +16,7 @@ from galpy.potential_src import plotRotcurve
 from galpy.potential_src import plotEscapecurve
 from galpy.potential_src import KGPotential
 from galpy.potential_src import interpRZPotential
+from galpy.potential_src import interp3DPotential
 from galpy.potential_src import DehnenBarPotential
 from galpy.potential_src import SteadyLogSpiralPotential
 from galpy.potential_src import TransientLogSpiralPotential
@@ -38,6 +39,8 @@ from galpy.potential_src import SCFPotential
 from galpy.potential_src import SoftenedNeedleBarPotential
 from galpy.potential_src import DiskSCFPotential
 from galpy.potential_src import WilkinsonEvansPotential
+from galpy.potential_src import DehnenSmoothWrapperPotential
+from galpy.potential_src import CompositePotential
 #
 # Functions
 #
@@ -50,6 +53,8 @@ evaluaterforces= Potential.evaluaterforces
 evaluateR2derivs= Potential.evaluateR2derivs
 evaluatez2derivs= Potential.evaluatez2derivs
 evaluateRzderivs= Potential.evaluateRzderivs
+evaluateHessians= Potential.evaluateHessians
+evaluate_c= Potential.evaluate_c
 RZToplanarPotential= planarPotential.RZToplanarPotential
 toPlanarPotential= planarPotential.toPlanarPotential
 RZToverticalPotential= verticalPotential.RZToverticalPotential
@@ -108,6 +113,7 @@ HernquistPotential= TwoPowerSphericalPotential.HernquistPotential
 TwoPowerSphericalPotential= TwoPowerSphericalPotential.TwoPowerSphericalPotential
 KGPotential= KGPotential.KGPotential
 interpRZPotential= interpRZPotential.interpRZPotential
+interp3DPotential= interp3DPotential.interp3DPotential
 DehnenBarPotential= DehnenBarPotential.DehnenBarPotential
 SteadyLogSpiralPotential= SteadyLogSpiralPotential.SteadyLogSpiralPotential
 TransientLogSpiralPotential= TransientLogSpiralPotential.TransientLogSpiralPotential
@@ -134,6 +140,8 @@ SCFPotential = SCFPotential.SCFPotential
 SoftenedNeedleBarPotential= SoftenedNeedleBarPotential.SoftenedNeedleBarPotential
 DiskSCFPotential = DiskSCFPotential.DiskSCFPotential
 WilkinsonEvansPotential = WilkinsonEvansPotential.WilkinsonEvansPotential
+DehnenSmoothWrapperPotential= DehnenSmoothWrapperPotential.DehnenSmoothWrapperPotential
+CompositePotential= CompositePotential.CompositePotential
 #Softenings
 PlummerSoftening= ForceSoftening.PlummerSoftening
 
@@ -155,6 +155,30 @@ class BurkertPotential(Potential):
         """
         return self._R2deriv(z,R) #Spherical potential
 
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t- time
+        OUTPUT:
+           d2phi/dR/dz
+        HISTORY:
+           2026-10-17 - Written
+        """
+        r= numpy.sqrt(R**2.+z**2.)
+        x= r/self.a
+        Fx= numpy.pi-2.*numpy.arctan(1./x)-2.*numpy.log(1.+x)-numpy.log(1.+x**2.)
+        dPhidr= -self.a*numpy.pi/x**2.*Fx
+        d2Phidr2= numpy.pi*self.a**3.*(4./(self.a**2.+r**2.)/(self.a+r)
+                                       +2.*Fx/r**3.)
+        return (d2Phidr2-dPhidr/r)*R*z/r**2.
+
     def _dens(self,R,z,phi=0.,t=0.):
         """
         NAME:
@@ -0,0 +1,131 @@
+###############################################################################
+#   CompositePotential.py: class that represents a fixed combination of
+#                          potentials
+#
+#   A CompositePotential is a list of potentials that cannot be changed
+#   after it is created, such that properties that functions otherwise
+#   determine from the list on every call (whether it is non-axisymmetric,
+#   its dimension, whether all potentials have a C implementation) can be
+#   computed once
+###############################################################################
+import numpy as nu
+from galpy.potential_src.Potential import Potential, PotentialError, \
+    _check_evaluate_c_quantities, _evaluate_c_arrays
+from galpy.potential_src.planarPotential import planarPotential
+from galpy.potential_src.linearPotential import linearPotential
+class CompositePotential(list):
+    """Class that represents a fixed combination of potentials, which can be used wherever a list of potentials can be used"""
+    def __init__(self,pots):
+        """
+        NAME:
+
+           __init__
+
+        PURPOSE:
+
+           initialize a CompositePotential
+
+        INPUT:
+
+           pots - list of Potential, planarPotential, or linearPotential instances (all of the same dimension); lists and CompositePotentials in this list are flattened
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-17 - Written
+
+        """
+        list.__init__(self,_flatten(pots))
+        if len(self) == 0:
+            raise PotentialError("A CompositePotential needs at least one potential")
+        for kind in [Potential,planarPotential,linearPotential]:
+            if nu.all([isinstance(p,kind) for p in self]): break
+        else:
+            raise PotentialError("The potentials in a CompositePotential must all be Potential, all planarPotential, or all linearPotential instances")
+        self.dim= self[0].dim
+        self.isNonAxi= bool(nu.any([p.isNonAxi for p in self])) \
+            if self.dim > 1 else False
+        self.hasC= bool(nu.all([p.hasC for p in self]))
+        self.hasC_dxdv= bool(nu.all([getattr(p,'hasC_dxdv',False)
+                                      for p in self]))
+        self.hasC_dens= bool(nu.all([getattr(p,'hasC_dens',False)
+                                      for p in self]))
+        if self.dim == 3:
+            from galpy.potential_src.interpRZPotential import \
+                interpRZPotential
+            from galpy.potential_src.interpRZPotential import ext_loaded \
+                as interp_ext_loaded
+            self._c_ok= interp_ext_loaded and self.hasC
+            # The C implementation of interpRZPotential only has the forces
+            self._c_potential= not nu.any([isinstance(p,interpRZPotential)
+                                           for p in self])
+        return None
+
+    def evaluate(self,R,z,phi=None,t=0.,quantities='potential',
+                 nthreads=None):
+        """
+        NAME:
+
+           evaluate
+
+        PURPOSE:
+
+           evaluate the potential, forces, second derivatives, or density of all potentials at once for (arrays of) (R,z,phi,t), in a single, OpenMP-parallel call of the C implementation when possible; this is a fast path that does not handle physical units
+
+        INPUT:
+
+           R - cylindrical Galactocentric distance (array; natural units)
+
+           z - distance above the plane (array; natural units)
+
+           phi - azimuth (optional; array)
+
+           t - time (optional; array; natural units)
+
+           quantities= ('potential') quantity or list of quantities to evaluate (see evaluate_c for the options)
+
+           nthreads= (None) number of OpenMP threads to use (default: OpenMP's default)
+
+        OUTPUT:
+
+           array with the broadcast shape of (R,z,phi,t) or a tuple of such arrays if quantities is a list (natural units); identical to evaluate_c for the list of potentials
+
+        HISTORY:
+
+           2026-10-17 - Written
+
+        """
+        if self.dim != 3:
+            raise PotentialError("CompositePotential.evaluate only works for 3D potentials")
+        single= not isinstance(quantities,(list,tuple))
+        if single: quantities= [quantities]
+        _check_evaluate_c_quantities(quantities)
+        if self.isNonAxi and phi is None:
+            raise PotentialError("The CompositePotential is non-axisymmetric, but you did not provide phi")
+        use_c= self._c_ok \
+            and (self._c_potential or not 'potential' in quantities) \
+            and (self.hasC_dens or not 'dens' in quantities)
+        return _evaluate_c_arrays(self,R,z,phi,t,quantities,single,use_c,
+                                  nthreads)
+
+    def __reduce__(self):
+        # The default pickling protocol for lists uses append/extend
+        return (self.__class__,(list(self),))
+
+    def _frozen(self,*args,**kwargs):
+        raise TypeError("A CompositePotential cannot be changed after it is created; create a new CompositePotential instead")
+    append= extend= insert= remove= pop= clear= sort= reverse= _frozen
+    __setitem__= __delitem__= __iadd__= __imul__= _frozen
+    __setslice__= __delslice__= _frozen # python 2
+
+def _flatten(pots):
+    """Flatten nested lists of potentials"""
+    if not isinstance(pots,list):
+        return [pots]
+    out= []
+    for p in pots:
+        out.extend(_flatten(p))
+    return out
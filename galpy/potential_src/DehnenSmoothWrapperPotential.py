@@ -0,0 +1,456 @@
+###############################################################################
+#   DehnenSmoothWrapperPotential.py: Wrapper to smoothly grow a potential
+###############################################################################
+import numpy
+from galpy.util import bovy_conversion
+from galpy.potential_src.Potential import Potential, _APY_LOADED, _dim
+from galpy.potential_src.planarPotential import planarPotential
+if _APY_LOADED:
+    from astropy import units
+def _dehnenSmooth(t,tform,tsteady):
+    """Dehnen (2000)'s smooth growth function, 0 before tform and 1 after
+    tsteady (t can be an array)"""
+    xi= 2.*(t-tform)/(tsteady-tform)-1.
+    return numpy.where(t < tform,0.,
+                       numpy.where(t < tsteady,
+                                   3./16.*xi**5.-5./8.*xi**3.+15./16.*xi+.5,
+                                   1.))
+
+def _parse_smooth_input(self,pot,tform,tsteady):
+    # Common setup of the 3D and planar wrappers
+    if not isinstance(pot,list):
+        pot= [pot]
+    if _APY_LOADED and isinstance(tform,units.Quantity):
+        tform= tform.to(units.Gyr).value\
+            /bovy_conversion.time_in_Gyr(self._vo,self._ro)
+    if _APY_LOADED and isinstance(tsteady,units.Quantity):
+        tsteady= tsteady.to(units.Gyr).value\
+            /bovy_conversion.time_in_Gyr(self._vo,self._ro)
+    self._pot= pot
+    self._tform= tform
+    if tsteady is None:
+        self._tsteady= self._tform/2.
+    else:
+        self._tsteady= self._tform+tsteady
+    self.isNonAxi= True in [p.isNonAxi for p in pot]
+    self.hasC= not False in [p.hasC for p in pot]
+    self.hasC_dxdv= False
+    return None
+
+class DehnenSmoothWrapperPotential(Potential):
+    """Potential wrapper class that implements the growth of a gravitational potential following `Dehnen (2000) <http://adsabs.harvard.edu/abs/2000AJ....119..800D>`__. The amplitude A applied to a potential wrapped by an instance of this class is changed as
+
+    .. math::
+
+        A(t) = \\mathrm{amp}\\,\\left(\\frac{3}{16}\\xi^5-\\frac{5}{8}\\xi^3+\\frac{15}{16}\\xi+\\frac{1}{2}\\right)
+
+    where
+
+    .. math::
+
+        \\xi = \\begin{cases}
+        -1 & t < t_\\mathrm{form}\\\\
+        2\\left(\\frac{t-t_\\mathrm{form}}{t_\\mathrm{steady}}\\right)-1\\,, &  t_\\mathrm{form} \\leq t \\leq t_\\mathrm{form}+t_\\mathrm{steady}\\\\
+        1 & t > t_\\mathrm{form}+t_\\mathrm{steady}
+        \\end{cases}
+
+    The wrapper is implemented in C, such that orbits in wrapped potentials that have a C implementation (e.g., a growing SoftenedNeedleBarPotential) are integrated in C. Wrapping a planarPotential (e.g., a SteadyLogSpiralPotential) returns a planar wrapper.
+
+    """
+    def __new__(cls,*args,**kwargs):
+        pot= kwargs.get('pot',args[1] if len(args) > 1 else None)
+        if cls is DehnenSmoothWrapperPotential and not pot is None \
+                and _dim(pot) == 2:
+            return planarDehnenSmoothWrapperPotential(*args,**kwargs)
+        return Potential.__new__(cls)
+
+    def __init__(self,amp=1.,pot=None,tform=-4.,tsteady=None,
+                 ro=None,vo=None):
+        """
+        NAME:
+
+           __init__
+
+        PURPOSE:
+
+           initialize a DehnenSmoothWrapper Potential
+
+        INPUT:
+
+           amp - amplitude to be applied to the potential (default: 1.)
+
+           pot - Potential instance or list thereof; the amplitude of this will be grown by this wrapper
+
+           tform - start of growth (can be a Quantity)
+
+           tsteady - time from tform at which the potential is fully grown (default: -tform/2, st the perturbation is fully grown at tform/2; can be a Quantity)
+
+           ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-16 - Started
+
+        """
+        Potential.__init__(self,amp=amp,ro=ro,vo=vo)
+        _parse_smooth_input(self,pot,tform,tsteady)
+        return None
+
+    def _smooth(self,t):
+        return _dehnenSmooth(t,self._tform,self._tsteady)
+
+    def _wrap(self,attribute,R,z,phi=0.,t=0.):
+        return self._smooth(t)\
+            *sum([getattr(p,attribute)(R,z,phi=phi,t=t,use_physical=False)
+                  for p in self._pot])
+
+    def _evaluate(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _evaluate
+        PURPOSE:
+           evaluate the potential at R,z
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           Phi(R,z)
+        HISTORY:
+           2026-10-16 - Started
+        """
+        return self._wrap('__call__',R,z,phi=phi,t=t)
+
+    def _Rforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rforce
+        PURPOSE:
+           evaluate the radial force for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the radial force
+        HISTORY:
+           2026-10-16 - Written
+        """
+        return self._wrap('Rforce',R,z,phi=phi,t=t)
+
+    def _zforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _zforce
+        PURPOSE:
+           evaluate the vertical force for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the vertical force
+        HISTORY:
+           2026-10-16 - Written
+        """
+        return self._wrap('zforce',R,z,phi=phi,t=t)
+
+    def _phiforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _phiforce
+        PURPOSE:
+           evaluate the azimuthal force for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the azimuthal force
+        HISTORY:
+           2026-10-16 - Written
+        """
+        return self._wrap('phiforce',R,z,phi=phi,t=t)
+
+    def _dens(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _dens
+        PURPOSE:
+           evaluate the density for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the density
+        HISTORY:
+           2026-10-16 - Written
+        """
+        return self._wrap('dens',R,z,phi=phi,t=t)
+
+    def _R2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _R2deriv
+        PURPOSE:
+           evaluate the second radial derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second radial derivative
+        HISTORY:
+           2026-10-16 - Written
+        """
+        return self._wrap('R2deriv',R,z,phi=phi,t=t)
+
+    def _z2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _z2deriv
+        PURPOSE:
+           evaluate the second vertical derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second vertical derivative
+        HISTORY:
+           2026-10-16 - Written
+        """
+        return self._wrap('z2deriv',R,z,phi=phi,t=t)
+
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           d2phi/dR/dz
+        HISTORY:
+           2026-10-16 - Written
+        """
+        return self._wrap('Rzderiv',R,z,phi=phi,t=t)
+
+    def _phi2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _phi2deriv
+        PURPOSE:
+           evaluate the second azimuthal derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second azimuthal derivative
+        HISTORY:
+           2026-10-16 - Written
+        """
+        return self._wrap('phi2deriv',R,z,phi=phi,t=t)
+
+    def _Rphideriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rphideriv
+        PURPOSE:
+           evaluate the mixed radial, azimuthal derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed radial, azimuthal derivative
+        HISTORY:
+           2026-10-16 - Written
+        """
+        return self._wrap('Rphideriv',R,z,phi=phi,t=t)
+
+    def _zphideriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _zphideriv
+        PURPOSE:
+           evaluate the mixed vertical, azimuthal derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed vertical, azimuthal derivative
+        HISTORY:
+           2026-10-17 - Written
+        """
+        return self._wrap('zphideriv',R,z,phi=phi,t=t)
+
+class planarDehnenSmoothWrapperPotential(planarPotential):
+    """Planar version of DehnenSmoothWrapperPotential, for growing planarPotentials such as DehnenBarPotential and the spiral potentials; returned by DehnenSmoothWrapperPotential when it wraps planarPotentials"""
+    def __init__(self,amp=1.,pot=None,tform=-4.,tsteady=None,
+                 ro=None,vo=None):
+        """
+        NAME:
+
+           __init__
+
+        PURPOSE:
+
+           initialize a planar DehnenSmoothWrapper Potential
+
+        INPUT:
+
+           amp - amplitude to be applied to the potential (default: 1.)
+
+           pot - planarPotential instance or list thereof; the amplitude of this will be grown by this wrapper
+
+           tform - start of growth (can be a Quantity)
+
+           tsteady - time from tform at which the potential is fully grown (default: -tform/2, st the perturbation is fully grown at tform/2; can be a Quantity)
+
+           ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-16 - Started
+
+        """
+        planarPotential.__init__(self,amp=amp,ro=ro,vo=vo)
+        self._amp= amp
+        _parse_smooth_input(self,pot,tform,tsteady)
+        return None
+
+    def _smooth(self,t):
+        return _dehnenSmooth(t,self._tform,self._tsteady)
+
+    def _wrap(self,attribute,R,phi=0.,t=0.):
+        return self._smooth(t)\
+            *sum([getattr(p,attribute)(R,phi=phi,t=t,use_physical=False)
+                  for p in self._pot])
+
+    def _evaluate(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           _evaluate
+        PURPOSE:
+           evaluate the potential at R,phi,t
+        INPUT:
+           R - Galactocentric cylindrical radius
+           phi - azimuth
+           t - time
+        OUTPUT:
+           Phi(R,phi,t)
+        HISTORY:
+           2026-10-16 - Started
+        """
+        return self._wrap('__call__',R,phi=phi,t=t)
+
+    def _Rforce(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           _Rforce
+        PURPOSE:
+           evaluate the radial force
+        INPUT:
+           R - Galactocentric cylindrical radius
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the radial force
+        HISTORY:
+           2026-10-16 - Written
+        """
+        return self._wrap('Rforce',R,phi=phi,t=t)
+
+    def _phiforce(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           _phiforce
+        PURPOSE:
+           evaluate the azimuthal force
+        INPUT:
+           R - Galactocentric cylindrical radius
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the azimuthal force
+        HISTORY:
+           2026-10-16 - Written
+        """
+        return self._wrap('phiforce',R,phi=phi,t=t)
+
+    def _R2deriv(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           _R2deriv
+        PURPOSE:
+           evaluate the second radial derivative
+        INPUT:
+           R - Galactocentric cylindrical radius
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second radial derivative
+        HISTORY:
+           2026-10-16 - Written
+        """
+        return self._wrap('R2deriv',R,phi=phi,t=t)
+
+    def _phi2deriv(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           _phi2deriv
+        PURPOSE:
+           evaluate the second azimuthal derivative
+        INPUT:
+           R - Galactocentric cylindrical radius
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second azimuthal derivative
+        HISTORY:
+           2026-10-16 - Written
+        """
+        return self._wrap('phi2deriv',R,phi=phi,t=t)
+
+    def _Rphideriv(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           _Rphideriv
+        PURPOSE:
+           evaluate the mixed radial, azimuthal derivative
+        INPUT:
+           R - Galactocentric cylindrical radius
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed radial, azimuthal derivative
+        HISTORY:
+           2026-10-16 - Written
+        """
+        return self._wrap('Rphideriv',R,phi=phi,t=t)
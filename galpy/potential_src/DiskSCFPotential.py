@@ -3,7 +3,11 @@
 ###############################################################################
 import copy
 import numpy
-from scipy.misc import logsumexp
+try:
+    from scipy.special import logsumexp
+except ImportError: #pragma: no cover
+    # scipy < 0.19 (scipy.misc is slow to import)
+    from scipy.misc import logsumexp
 from galpy.potential_src.Potential import Potential, _APY_LOADED
 from galpy.potential_src.SCFPotential import SCFPotential, \
     scf_compute_coeffs_axi, scf_compute_coeffs
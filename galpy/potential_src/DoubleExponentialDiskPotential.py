@@ -14,6 +14,12 @@ if _APY_LOADED:
     from astropy import units
 _TOL= 1.4899999999999999e-15
 _MAXITER= 20
+# Maximum number of (point,node) pairs evaluated at once by _hankel
+_HANKEL_CHUNK_ELEMENTS= 2**20
+# Caches of the zeros of the Bessel functions and of the Gauss-Legendre
+# (k,weight) node tables between them, shared by all instances
+_BESSEL_ZEROS= {}
+_HANKEL_NODES= {}
 class DoubleExponentialDiskPotential(Potential):
     """Class that implements the double exponential disk potential
 
@@ -83,20 +89,11 @@ class DoubleExponentialDiskPotential(Potential):
         self._glx, self._glw= nu.polynomial.legendre.leggauss(self._glorder)
         self._nzeros=100
         #j0 for potential and z
-        self._j0zeros= nu.zeros(self._nzeros+1)
-        self._j0zeros[1:self._nzeros+1]= special.jn_zeros(0,self._nzeros)
-        self._dj0zeros= self._j0zeros-nu.roll(self._j0zeros,1)
-        self._dj0zeros[0]= self._j0zeros[0]
+        self._j0zeros, self._dj0zeros= _besselZeros(0,self._nzeros)
         #j1 for R
-        self._j1zeros= nu.zeros(self._nzeros+1)
-        self._j1zeros[1:self._nzeros+1]= special.jn_zeros(1,self._nzeros)
-        self._dj1zeros= self._j1zeros-nu.roll(self._j1zeros,1)
-        self._dj1zeros[0]= self._j1zeros[0]
+        self._j1zeros, self._dj1zeros= _besselZeros(1,self._nzeros)
         #j2 for R2deriv
-        self._j2zeros= nu.zeros(self._nzeros+1)
-        self._j2zeros[1:self._nzeros+1]= special.jn_zeros(2,self._nzeros)
-        self._dj2zeros= self._j2zeros-nu.roll(self._j2zeros,1)
-        self._dj2zeros[0]= self._j2zeros[0]
+        self._j2zeros, self._dj2zeros= _besselZeros(2,self._nzeros)
         if normalize or \
                 (isinstance(normalize,(int,float)) \
                      and not isinstance(normalize,bool)): #pragma: no cover
@@ -120,34 +117,21 @@ class DoubleExponentialDiskPotential(Potential):
         HISTORY:
            2010-04-16 - Written - Bovy (NYU)
            2012-12-26 - New method using Gaussian quadrature between zeros - Bovy (IAS)
+           2026-10-17 - Evaluate all points at once
         DOCTEST:
            >>> doubleExpPot= DoubleExponentialDiskPotential()
            >>> r= doubleExpPot(1.,0) #doctest: +ELLIPSIS
            ...
            >>> assert( r+1.89595350484)**2.< 10.**-6.
         """
-        if True:
-            if isinstance(R,float):
-                floatIn= True
-                R= nu.array([R])
-                z= nu.array([z])
-            else:
-                floatIn= False
-            out= nu.empty(len(R))
-            indx= (R <= 6.)
-            out[True-indx]= self._kp(R[True-indx],z[True-indx])
-            R4max= nu.copy(R)
-            R4max[(R < 1.)]= 1.
-            kmax= self._kmaxFac*self._beta
-            for jj in range(len(R)):
-                if not indx[jj]: continue
-                maxj0zeroIndx= nu.argmin((self._j0zeros-kmax*R4max[jj])**2.) #close enough
-                ks= nu.array([0.5*(self._glx+1.)*self._dj0zeros[ii+1] + self._j0zeros[ii] for ii in range(maxj0zeroIndx)]).flatten()
-                weights= nu.array([self._glw*self._dj0zeros[ii+1] for ii in range(maxj0zeroIndx)]).flatten()
-                evalInt= special.jn(0,ks*R[jj])*(self._alpha**2.+ks**2.)**-1.5*(self._beta*nu.exp(-ks*nu.fabs(z[jj]))-ks*nu.exp(-self._beta*nu.fabs(z[jj])))/(self._beta**2.-ks**2.)
-                out[jj]= -2.*nu.pi*self._alpha*nu.sum(weights*evalInt)
-            if floatIn: return out[0]
-            else: return out
+        R, z, shape= _flattenRz(R,z)
+        out= nu.empty(len(R))
+        indx= (R <= 6.)
+        out[~indx]= self._kp(R[~indx],z[~indx])
+        out[indx]= -2.*nu.pi*self._alpha\
+            *self._hankel(R[indx],z[indx],0,self._kmaxFac*self._beta,
+                          lambda ks,R,z: special.j0(ks*R)*(self._alpha**2.+ks**2.)**-1.5*(self._beta*nu.exp(-ks*nu.fabs(z))-ks*nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.))
+        return _reshapeOut(out,shape)
     
     def _Rforce(self,R,z,phi=0.,t=0.):
         """
@@ -164,23 +148,18 @@ class DoubleExponentialDiskPotential(Potential):
            K_R (R,z)
         HISTORY:
            2010-04-16 - Written - Bovy (NYU)
+           2026-10-17 - Evaluate all points at once
         DOCTEST:
         """
-        if True:
-            if isinstance(R,nu.ndarray):
-                if not isinstance(z,nu.ndarray): z= nu.ones_like(R)*z
-                out= nu.array([self._Rforce(rr,zz) for rr,zz in zip(R,z)])
-                return out
-            if (R > 16.*self._hr or R > 6.) and hasattr(self,'_kp'): return self._kp.Rforce(R,z)
-            if R < 1.: R4max= 1.
-            else: R4max= R
-            kmax= self._kmaxFac*self._beta
-            kmax= 2.*self._kmaxFac*self._beta
-            maxj1zeroIndx= nu.argmin((self._j1zeros-kmax*R4max)**2.) #close enough
-            ks= nu.array([0.5*(self._glx+1.)*self._dj1zeros[ii+1] + self._j1zeros[ii] for ii in range(maxj1zeroIndx)]).flatten()
-            weights= nu.array([self._glw*self._dj1zeros[ii+1] for ii in range(maxj1zeroIndx)]).flatten()
-            evalInt= ks*special.jn(1,ks*R)*(self._alpha**2.+ks**2.)**-1.5*(self._beta*nu.exp(-ks*nu.fabs(z))-ks*nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.)
-            return -2.*nu.pi*self._alpha*nu.sum(weights*evalInt)
+        R, z, shape= _flattenRz(R,z)
+        out= nu.empty(len(R))
+        indx= ((R > 16.*self._hr)+(R > 6.))*hasattr(self,'_kp')
+        if nu.any(indx): out[indx]= self._kp.Rforce(R[indx],z[indx])
+        indx= ~indx
+        out[indx]= -2.*nu.pi*self._alpha\
+            *self._hankel(R[indx],z[indx],1,2.*self._kmaxFac*self._beta,
+                          lambda ks,R,z: ks*special.j1(ks*R)*(self._alpha**2.+ks**2.)**-1.5*(self._beta*nu.exp(-ks*nu.fabs(z))-ks*nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.))
+        return _reshapeOut(out,shape)
     
     def _zforce(self,R,z,phi=0.,t=0.):
         """
@@ -197,25 +176,19 @@ class DoubleExponentialDiskPotential(Potential):
            K_z (R,z)
         HISTORY:
            2010-04-16 - Written - Bovy (NYU)
+           2026-10-17 - Evaluate all points at once
         DOCTEST:
         """
-        if True:
-            if isinstance(R,nu.ndarray):
-                if not isinstance(z,nu.ndarray): z= nu.ones_like(R)*z
-                out= nu.array([self._zforce(rr,zz) for rr,zz in zip(R,z)])
-                return out
-            if R > 16.*self._hr or R > 6.: return self._kp.zforce(R,z)
-            if R < 1.: R4max= 1.
-            else: R4max= R
-            kmax= self._kmaxFac*self._beta
-            maxj0zeroIndx= nu.argmin((self._j0zeros-kmax*R4max)**2.) #close enough
-            ks= nu.array([0.5*(self._glx+1.)*self._dj0zeros[ii+1] + self._j0zeros[ii] for ii in range(maxj0zeroIndx)]).flatten()
-            weights= nu.array([self._glw*self._dj0zeros[ii+1] for ii in range(maxj0zeroIndx)]).flatten()
-            evalInt= ks*special.jn(0,ks*R)*(self._alpha**2.+ks**2.)**-1.5*(nu.exp(-ks*nu.fabs(z))-nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.)
-            if z > 0.:
-                return -2.*nu.pi*self._alpha*self._beta*nu.sum(weights*evalInt)
-            else:
-                return 2.*nu.pi*self._alpha*self._beta*nu.sum(weights*evalInt)
+        R, z, shape= _flattenRz(R,z)
+        out= nu.empty(len(R))
+        indx= (R > 16.*self._hr)+(R > 6.)
+        out[indx]= self._kp.zforce(R[indx],z[indx])
+        indx= ~indx
+        out[indx]= 2.*nu.pi*self._alpha*self._beta\
+            *(1.-2.*(z[indx] > 0.))\
+            *self._hankel(R[indx],z[indx],0,self._kmaxFac*self._beta,
+                          lambda ks,R,z: ks*special.j0(ks*R)*(self._alpha**2.+ks**2.)**-1.5*(nu.exp(-ks*nu.fabs(z))-nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.))
+        return _reshapeOut(out,shape)
 
     def _R2deriv(self,R,z,phi=0.,t=0.):
         """
@@ -232,26 +205,20 @@ class DoubleExponentialDiskPotential(Potential):
            -d K_R (R,z) d R
         HISTORY:
            2012-12-27 - Written - Bovy (IAS)
+           2026-10-17 - Evaluate all points at once
         """
-        if True:
-            if isinstance(R,nu.ndarray):
-                if not isinstance(z,nu.ndarray): z= nu.ones_like(R)*z
-                out= nu.array([self._R2deriv(rr,zz) for rr,zz in zip(R,z)])
-                return out
-            if R > 16.*self._hr or R > 6.: return self._kp.R2deriv(R,z)
-            if R < 1.: R4max= 1.
-            else: R4max= R
-            kmax= 2.*self._kmaxFac*self._beta
-            maxj0zeroIndx= nu.argmin((self._j0zeros-kmax*R4max)**2.) #close enough
-            maxj2zeroIndx= nu.argmin((self._j2zeros-kmax*R4max)**2.) #close enough
-            ks0= nu.array([0.5*(self._glx+1.)*self._dj0zeros[ii+1] + self._j0zeros[ii] for ii in range(maxj0zeroIndx)]).flatten()
-            weights0= nu.array([self._glw*self._dj0zeros[ii+1] for ii in range(maxj0zeroIndx)]).flatten()
-            ks2= nu.array([0.5*(self._glx+1.)*self._dj2zeros[ii+1] + self._j2zeros[ii] for ii in range(maxj2zeroIndx)]).flatten()
-            weights2= nu.array([self._glw*self._dj2zeros[ii+1] for ii in range(maxj2zeroIndx)]).flatten()
-            evalInt0= ks0**2.*special.jn(0,ks0*R)*(self._alpha**2.+ks0**2.)**-1.5*(self._beta*nu.exp(-ks0*nu.fabs(z))-ks0*nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks0**2.)
-            evalInt2= ks2**2.*special.jn(2,ks2*R)*(self._alpha**2.+ks2**2.)**-1.5*(self._beta*nu.exp(-ks2*nu.fabs(z))-ks2*nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks2**2.)
-            return nu.pi*self._alpha*(nu.sum(weights0*evalInt0)
-                                      -nu.sum(weights2*evalInt2))
+        R, z, shape= _flattenRz(R,z)
+        out= nu.empty(len(R))
+        indx= (R > 16.*self._hr)+(R > 6.)
+        out[indx]= self._kp.R2deriv(R[indx],z[indx])
+        indx= ~indx
+        kmax= 2.*self._kmaxFac*self._beta
+        out[indx]= nu.pi*self._alpha\
+            *(self._hankel(R[indx],z[indx],0,kmax,
+                           lambda ks,R,z: ks**2.*special.j0(ks*R)*(self._alpha**2.+ks**2.)**-1.5*(self._beta*nu.exp(-ks*nu.fabs(z))-ks*nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.))
+              -self._hankel(R[indx],z[indx],2,kmax,
+                            lambda ks,R,z: ks**2.*_j2(ks*R)*(self._alpha**2.+ks**2.)**-1.5*(self._beta*nu.exp(-ks*nu.fabs(z))-ks*nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.)))
+        return _reshapeOut(out,shape)
     
     def _z2deriv(self,R,z,phi=0.,t=0.):
         """
@@ -268,21 +235,17 @@ class DoubleExponentialDiskPotential(Potential):
            -d K_Z (R,z) d Z
         HISTORY:
            2012-12-26 - Written - Bovy (IAS)
+           2026-10-17 - Evaluate all points at once
         """
-        if True:
-            if isinstance(R,nu.ndarray):
-                if not isinstance(z,nu.ndarray): z= nu.ones_like(R)*z
-                out= nu.array([self._z2deriv(rr,zz) for rr,zz in zip(R,z)])
-                return out
-            if R > 16.*self._hr or R > 6.: return self._kp.z2deriv(R,z)
-            if R < 1.: R4max= 1.
-            else: R4max= R
-            kmax= self._kmaxFac*self._beta
-            maxj0zeroIndx= nu.argmin((self._j0zeros-kmax*R4max)**2.) #close enough
-            ks= nu.array([0.5*(self._glx+1.)*self._dj0zeros[ii+1] + self._j0zeros[ii] for ii in range(maxj0zeroIndx)]).flatten()
-            weights= nu.array([self._glw*self._dj0zeros[ii+1] for ii in range(maxj0zeroIndx)]).flatten()
-            evalInt= ks*special.jn(0,ks*R)*(self._alpha**2.+ks**2.)**-1.5*(ks*nu.exp(-ks*nu.fabs(z))-self._beta*nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.)
-            return -2.*nu.pi*self._alpha*self._beta*nu.sum(weights*evalInt)
+        R, z, shape= _flattenRz(R,z)
+        out= nu.empty(len(R))
+        indx= (R > 16.*self._hr)+(R > 6.)
+        out[indx]= self._kp.z2deriv(R[indx],z[indx])
+        indx= ~indx
+        out[indx]= -2.*nu.pi*self._alpha*self._beta\
+            *self._hankel(R[indx],z[indx],0,self._kmaxFac*self._beta,
+                          lambda ks,R,z: ks*special.j0(ks*R)*(self._alpha**2.+ks**2.)**-1.5*(ks*nu.exp(-ks*nu.fabs(z))-self._beta*nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.))
+        return _reshapeOut(out,shape)
 
     def _Rzderiv(self,R,z,phi=0.,t=0.):
         """
@@ -299,24 +262,55 @@ class DoubleExponentialDiskPotential(Potential):
            d2phi/dR/dz
         HISTORY:
            2013-08-28 - Written - Bovy (IAS)
+           2026-10-17 - Evaluate all points at once
         """
-        if True:
-            if isinstance(R,nu.ndarray):
-                if not isinstance(z,nu.ndarray): z= nu.ones_like(R)*z
-                out= nu.array([self._Rzderiv(rr,zz) for rr,zz in zip(R,z)])
-                return out
-            if R > 6.: return self._kp.Rzderiv(R,z)
-            if R < 1.: R4max= 1.
-            else: R4max= R
-            kmax= 2.*self._kmaxFac*self._beta
-            maxj1zeroIndx= nu.argmin((self._j1zeros-kmax*R4max)**2.) #close enough
-            ks= nu.array([0.5*(self._glx+1.)*self._dj1zeros[ii+1] + self._j1zeros[ii] for ii in range(maxj1zeroIndx)]).flatten()
-            weights= nu.array([self._glw*self._dj1zeros[ii+1] for ii in range(maxj1zeroIndx)]).flatten()
-            evalInt= ks**2.*special.jn(1,ks*R)*(self._alpha**2.+ks**2.)**-1.5*(nu.exp(-ks*nu.fabs(z))-nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.)
-            if z >= 0.:
-                return -2.*nu.pi*self._alpha*self._beta*nu.sum(weights*evalInt)
-            else:
-                return 2.*nu.pi*self._alpha*self._beta*nu.sum(weights*evalInt)
+        R, z, shape= _flattenRz(R,z)
+        out= nu.empty(len(R))
+        indx= (R > 6.)
+        out[indx]= self._kp.Rzderiv(R[indx],z[indx])
+        indx= ~indx
+        out[indx]= 2.*nu.pi*self._alpha*self._beta\
+            *(1.-2.*(z[indx] >= 0.))\
+            *self._hankel(R[indx],z[indx],1,2.*self._kmaxFac*self._beta,
+                          lambda ks,R,z: ks**2.*special.j1(ks*R)*(self._alpha**2.+ks**2.)**-1.5*(nu.exp(-ks*nu.fabs(z))-nu.exp(-self._beta*nu.fabs(z)))/(self._beta**2.-ks**2.))
+        return _reshapeOut(out,shape)
+
+    def _hankel(self,R,z,order,kmax,integrand):
+        """
+        NAME:
+           _hankel
+        PURPOSE:
+           compute the Hankel-transform integral of integrand for arrays of (R,z), using Gauss-Legendre quadrature between the zeros of J_order up to kmax x max(R,1); points that need the same number of zeros are evaluated together against a shared, cached (k,weight) node table
+        INPUT:
+           R - Cylindrical Galactocentric radius (1D array)
+           z - vertical height (1D array)
+           order - order of the Bessel function whose zeros delimit the quadrature intervals
+           kmax - maximum k at R=1
+           integrand - function integrand(ks,R,z) of the (npoints,nnodes) arrays ks, R, and z
+        OUTPUT:
+           sum_k weight(k) x integrand(k,R,z) for each point
+        HISTORY:
+           2026-10-17 - Written
+        """
+        out= nu.zeros(len(R))
+        if len(R) == 0: return out
+        zeros= getattr(self,'_j%izeros' % order)
+        R4max= nu.copy(R)
+        R4max[(R < 1.)]= 1.
+        maxzeroIndx= nu.argmin((zeros[:,nu.newaxis]-kmax*R4max)**2.,axis=0) #close enough
+        for nzeros in nu.unique(maxzeroIndx):
+            if nzeros == 0: continue
+            ks, weights= _hankelNodes(order,self._glorder,nzeros,
+                                      self._nzeros)
+            pindx= nu.arange(len(R))[maxzeroIndx == nzeros]
+            chunk= max(1,_HANKEL_CHUNK_ELEMENTS//len(ks))
+            for ii in range(0,len(pindx),chunk):
+                tindx= pindx[ii:ii+chunk]
+                out[tindx]= nu.sum(weights\
+                                       *integrand(ks,R[tindx,nu.newaxis],
+                                                  z[tindx,nu.newaxis]),
+                                   axis=1)
+        return out
 
     def _dens(self,R,z,phi=0.,t=0.):
         """
@@ -335,3 +329,46 @@ class DoubleExponentialDiskPotential(Potential):
            2010-08-08 - Written - Bovy (NYU)
         """
         return nu.exp(-self._alpha*R-self._beta*nu.fabs(z))
+
+def _besselZeros(order,nzeros):
+    """Zeros of J_order, preceded by zero, and the differences between consecutive zeros, cached"""
+    if not (order,nzeros) in _BESSEL_ZEROS:
+        zeros= nu.zeros(nzeros+1)
+        zeros[1:nzeros+1]= special.jn_zeros(order,nzeros)
+        dzeros= zeros-nu.roll(zeros,1)
+        dzeros[0]= zeros[0]
+        _BESSEL_ZEROS[(order,nzeros)]= (zeros,dzeros)
+    return _BESSEL_ZEROS[(order,nzeros)]
+
+def _hankelNodes(order,glorder,nintervals,nzeros):
+    """Gauss-Legendre nodes and weights in the first nintervals intervals between the zeros of J_order, cached"""
+    if not (order,glorder,nintervals,nzeros) in _HANKEL_NODES:
+        zeros, dzeros= _besselZeros(order,nzeros)
+        glx, glw= nu.polynomial.legendre.leggauss(glorder)
+        ks= (0.5*(glx+1.)*dzeros[1:nintervals+1,nu.newaxis]
+             +zeros[:nintervals,nu.newaxis]).flatten()
+        weights= (glw*dzeros[1:nintervals+1,nu.newaxis]).flatten()
+        _HANKEL_NODES[(order,glorder,nintervals,nzeros)]= (ks,weights)
+    return _HANKEL_NODES[(order,glorder,nintervals,nzeros)]
+
+def _j2(x):
+    """J_2(x) from J_0 and J_1, which is much faster than special.jn, except at small x where this loses precision"""
+    x= nu.asarray(x)
+    with nu.errstate(divide='ignore',invalid='ignore'):
+        out= 2.*special.j1(x)/x-special.j0(x)
+    small= x < 1.
+    out[small]= special.jn(2,x[small])
+    return out
+
+def _flattenRz(R,z):
+    """Broadcast R and z against each other and flatten them; also return the shape of the output (None for scalar input)"""
+    scalarIn= nu.isscalar(R) and nu.isscalar(z)
+    R, z= nu.broadcast_arrays(nu.asarray(R,dtype='float'),
+                              nu.asarray(z,dtype='float'))
+    shape= None if scalarIn else R.shape
+    return (R.flatten(),z.flatten(),shape)
+
+def _reshapeOut(out,shape):
+    """Reshape the output of _flattenRz-ed input"""
+    if shape is None: return out[0]
+    return out.reshape(shape)
@@ -32,11 +32,11 @@ class FerrersPotential(Potential):
     and :math:`(x',y',z')` is a rotated frame wrt :math:`(x,y,z)`
     so that the major axis is aligned with :math:`x'`.
 
-    Note that this potential has not yet been optimized for speed and has no C implementation, so orbit integration is currently slow.
+    The second derivatives of this potential are computed with general-purpose numerical integration and are therefore slow.
     """
 
     def __init__(self,amp=1.,a=1.,n=2,b=0.35,c=0.2375,omegab=0.,
-                 pa=0.,normalize=False,ro=None,vo=None):
+                 pa=0.,glorder=50,normalize=False,ro=None,vo=None):
         """
         NAME:
 
@@ -62,6 +62,8 @@ class FerrersPotential(Potential):
 
            pa= (None) If set, the position angle of the x axis (rad or Quantity)
 
+           glorder= (50) if set, compute the relevant force and potential integrals with Gaussian quadrature of this order (required for the C implementation)
+
            normalize - if True, normalize such that vc(1.,0.)=1., or, if given as a number, such that the force is this fraction of the force necessary to make vc(1.,0.)=1.
 
            ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
@@ -93,10 +95,21 @@ class FerrersPotential(Potential):
         self._force_hash= None
         self._pa = pa
         self._rhoc_M = gamma(n+2.5)/gamma(n+1) / np.pi**1.5/a**3/b/c
+        self._glorder= glorder
+        if self._glorder is None:
+            self._glx, self._glw= None, None
+        else:
+            self._glx, self._glw=\
+                np.polynomial.legendre.leggauss(self._glorder)
+            # Interval change
+            self._glx= 0.5*self._glx+0.5
+            self._glw*= 0.5
         if normalize or \
                 (isinstance(normalize,(int,float)) \
                      and not isinstance(normalize,bool)): #pragma: no cover
             self.normalize(normalize)
+        self.hasC= not self._glorder is None
+        self.hasC_dxdv= False
         if np.fabs(self._b-1.) > 10.**-10.:
             self.isNonAxi= True
         return None
@@ -126,7 +139,8 @@ class FerrersPotential(Potential):
         """Evaluation of the potential as a function of (x,y,z) in the 
         aligned coordinate frame"""
         return -np.pi * self._rhoc_M /(self.n+1.)*self.a**3*self._b*self._c * \
-            _potInt(x, y, z, self._a2, self._b2*self._a2, self._c2*self._a2, self.n)
+            _potInt(x, y, z, self._a2, self._b2*self._a2, self._c2*self._a2,
+                    self.n, glx=self._glx, glw=self._glw)
 
     def _Rforce(self,R,z,phi=0.,t=0.):
         """
@@ -212,19 +226,22 @@ class FerrersPotential(Potential):
         """Evaluation of the x force as a function of (x,y,z) in the aligned
         coordinate frame"""
         return -2.*np.pi*self._rhoc_M * self.a**3*self._b*self._c * \
-            _forceInt(x, y, z, self._a2, self._b2*self._a2, self._c2*self._a2, self.n, 0)
+            _forceInt(x, y, z, self._a2, self._b2*self._a2, self._c2*self._a2,
+                      self.n, 0, glx=self._glx, glw=self._glw)
 
     def _yforce_xyz(self,x,y,z):
         """Evaluation of the y force as a function of (x,y,z) in the aligned
         coordinate frame"""
         return -2.*np.pi*self._rhoc_M * self.a**3*self._b*self._c * \
-            _forceInt(x, y, z, self._a2, self._b2*self._a2, self._c2*self._a2, self.n, 1)
+            _forceInt(x, y, z, self._a2, self._b2*self._a2, self._c2*self._a2,
+                      self.n, 1, glx=self._glx, glw=self._glw)
 
     def _zforce_xyz(self,x,y,z):
         """Evaluation of the z force as a function of (x,y,z) in the aligned
         coordinate frame"""
         return -2.*np.pi*self._rhoc_M * self.a**3*self._b*self._c * \
-            _forceInt(x, y, z, self._a2, self._b2*self._a2, self._c2*self._a2, self.n, 2)
+            _forceInt(x, y, z, self._a2, self._b2*self._a2, self._c2*self._a2,
+                      self.n, 2, glx=self._glx, glw=self._glw)
 
     def _R2deriv(self,R,z,phi=0.,t=0.):
         """
@@ -248,9 +265,9 @@ class FerrersPotential(Potential):
         phiyya= self._2ndderiv_xyz(x,y,z,1,1)
         ang = self._omegab*t + self._pa
         c, s = np.cos(ang), np.sin(ang)
-        phixx = c**2*phixxa + 2.*c*s*phixya + s**2*phiyya
-        phixy = (c**2-s**2)*phixya + c*s*(phiyya - phixxa)
-        phiyy = s**2*phixxa - 2.*c*s*phixya + c**2*phiyya
+        phixx = c**2*phixxa - 2.*c*s*phixya + s**2*phiyya
+        phixy = (c**2-s**2)*phixya + c*s*(phixxa - phiyya)
+        phiyy = s**2*phixxa + 2.*c*s*phixya + c**2*phiyya
         return np.cos(phi)**2.*phixx + np.sin(phi)**2.*phiyy + \
             2.*np.cos(phi)*np.sin(phi)*phixy
 
@@ -275,8 +292,8 @@ class FerrersPotential(Potential):
         phiyza= self._2ndderiv_xyz(x,y,z,1,2)
         ang = self._omegab*t + self._pa
         c, s = np.cos(ang), np.sin(ang)
-        phixz = c*phixza + s*phiyza
-        phiyz = c*phixza - s*phiyza
+        phixz = c*phixza - s*phiyza
+        phiyz = s*phixza + c*phiyza
         return np.cos(phi)*phixz + np.sin(phi)*phiyz
 
     def _z2deriv(self,R,z,phi=0.,t=0.):
@@ -324,9 +341,9 @@ class FerrersPotential(Potential):
         phiyya= self._2ndderiv_xyz(x,y,z,1,1)
         ang = self._omegab*t + self._pa
         c, s = np.cos(ang), np.sin(ang)
-        phixx = c**2*phixxa + 2.*c*s*phixya + s**2*phiyya
-        phixy = (c**2-s**2)*phixya + c*s*(phiyya - phixxa)
-        phiyy = s**2*phixxa - 2.*c*s*phixya + c**2*phiyya
+        phixx = c**2*phixxa - 2.*c*s*phixya + s**2*phiyya
+        phixy = (c**2-s**2)*phixya + c*s*(phixxa - phiyya)
+        phiyy = s**2*phixxa + 2.*c*s*phixya + c**2*phiyya
         return R**2.*(np.sin(phi)**2.*phixx+np.cos(phi)**2.*phiyy\
                           -2.*np.cos(phi)*np.sin(phi)*phixy)\
                           +R*(np.cos(phi)*Fx+np.sin(phi)*Fy)
@@ -357,13 +374,38 @@ class FerrersPotential(Potential):
         phiyya= self._2ndderiv_xyz(x,y,z,1,1)
         ang = self._omegab*t + self._pa
         c, s = np.cos(ang), np.sin(ang)
-        phixx = c**2*phixxa + 2.*c*s*phixya + s**2*phiyya
-        phixy = (c**2-s**2)*phixya + c*s*(phiyya - phixxa)
-        phiyy = s**2*phixxa - 2.*c*s*phixya + c**2*phiyya
+        phixx = c**2*phixxa - 2.*c*s*phixya + s**2*phiyya
+        phixy = (c**2-s**2)*phixya + c*s*(phixxa - phiyya)
+        phiyy = s**2*phixxa + 2.*c*s*phixya + c**2*phiyya
         return R*np.cos(phi)*np.sin(phi)*\
             (phiyy-phixx)+R*np.cos(2.*(phi))*phixy\
             +np.sin(phi)*Fx-np.cos(phi)*Fy
 
+    def _zphideriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _zphideriv
+        PURPOSE:
+           evaluate the mixed vertical, azimuthal derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed vertical, azimuthal derivative
+        """
+        if not self.isNonAxi:
+            phi= 0.
+        x,y,z= self._compute_xyz(R,phi,z,t)
+        phixza= self._2ndderiv_xyz(x,y,z,0,2)
+        phiyza= self._2ndderiv_xyz(x,y,z,1,2)
+        ang = self._omegab*t + self._pa
+        c, s = np.cos(ang), np.sin(ang)
+        phixz = c*phixza - s*phiyza
+        phiyz = s*phixza + c*phiyza
+        return R*(np.cos(phi)*phiyz-np.sin(phi)*phixz)
+
     def _2ndderiv_xyz(self,x,y,z,i,j):
         """General 2nd derivative of the potential as a function of (x,y,z)
         in the aligned coordinate frame, d^2\Phi/dx_i/dx_j"""
@@ -416,28 +458,45 @@ class FerrersPotential(Potential):
         else:
             return rotmat
 
-def _potInt(x,y,z,a2,b2,c2,n):
+def _potInt(x,y,z,a2,b2,c2,n,glx=None,glw=None):
     """Integral involed in the potential at (x,y,z)
     integrates 1/A B^(n+1) where
     A = sqrt((tau+a)(tau+b)(tau+c)) and B = (1-x^2/(tau+a)-y^2/(tau+b)-z^2/(tau+c))
     from lambda to infty with respect to tau.
     The lower limit lambda is given by lowerlim function.
+    If glx and glw are set, use Gauss-Legendre quadrature in s, with
+    tau = (lambda+a)/s^2-a.
     """
     def integrand(tau):
         return _FracInt(x, y, z, a2, b2, c2, tau, n+1)
-    return integrate.quad(integrand, lowerlim(x**2,y**2,z**2,a2,b2,c2), np.inf)[0]
+    ll= lowerlim(x**2,y**2,z**2,a2,b2,c2)
+    if glx is None:
+        return integrate.quad(integrand, ll, np.inf)[0]
+    else:
+        return _glInt(integrand, ll, a2, glx, glw)
 
-def _forceInt(x,y,z,a2,b2,c2,n,i):
+def _forceInt(x,y,z,a2,b2,c2,n,i,glx=None,glw=None):
     """Integral involved in the force at (x,y,z)
     integrates 1/A B^n (x_i/(tau+a_i)) where
     A = sqrt((tau+a)(tau+b)(tau+c)) and B = (1-x^2/(tau+a)-y^2/(tau+b)-z^2/(tau+c))
     from lambda to infty with respect to tau.
     The lower limit lambda is given by lowerlim function.
+    If glx and glw are set, use Gauss-Legendre quadrature in s, with
+    tau = (lambda+a)/s^2-a.
     """
     def integrand(tau):
         return (x*(i==0) + y*(i==1) + z*(i==2))/(a2*(i==0) + b2*(i==1) + c2*(i==2) + tau) * \
             _FracInt(x, y, z, a2, b2, c2, tau, n)
-    return integrate.quad(integrand, lowerlim(x**2, y**2, z**2, a2, b2, c2), np.inf, epsabs=1e-12)[0]
+    ll= lowerlim(x**2, y**2, z**2, a2, b2, c2)
+    if glx is None:
+        return integrate.quad(integrand, ll, np.inf, epsabs=1e-12)[0]
+    else:
+        return _glInt(integrand, ll, a2, glx, glw)
+
+def _glInt(integrand,ll,a2,glx,glw):
+    """Gauss-Legendre quadrature of integrand from ll to infty, after
+    substituting tau = (ll+a2)/s^2-a2, 0 < s <= 1"""
+    return np.sum(glw*2.*(ll+a2)/glx**3.*integrand((ll+a2)/glx**2.-a2))
 
 def _2ndDerivInt(x,y,z,a2,b2,c2,n,i,j):
     """Integral involved in second derivatives d^\Phi/(dx_i dx_j)
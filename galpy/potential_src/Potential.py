@@ -17,13 +17,14 @@ from __future__  import division, print_function
 
 import os, os.path
 import pickle
+import hashlib
 from functools import wraps
 import math
 import numpy as nu
 from scipy import optimize, integrate
-import galpy.util.bovy_plot as plot
 from galpy.util import bovy_coords
-from galpy.util import config
+from galpy.util import config, LazyModule
+plot= LazyModule('galpy.util.bovy_plot')
 from galpy.util.bovy_conversion import velocity_in_kpcGyr, \
     physical_conversion, potential_physical_input, freq_in_Gyr
 from galpy.util import bovy_conversion
@@ -53,6 +54,7 @@ class Potential(object):
         self.isNonAxi= False
         self.hasC= False
         self.hasC_dxdv= False
+        self.hasC_dens= False
         # Parse ro and vo
         if ro is None:
             self._ro= config.__config__.getfloat('normalization','ro')
@@ -157,6 +159,37 @@ class Potential(object):
                 self._voSet= True
         return None
 
+    def __setattr__(self,name,value):
+        """
+        NAME:
+
+           __setattr__
+
+        PURPOSE:
+
+           set an attribute, bumping the version of the potential's parameters when a parameter is set (such that the arguments for the C code cached on the potential are re-computed when the amplitude or another parameter changes); attributes that cache intermediate results of force evaluations (_cached_*, _force_hash) do not count as parameters
+
+        INPUT:
+
+           name - attribute name
+
+           value - attribute value
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        if _is_parameter_attribute(name):
+            self.__dict__['_c_args_version']= \
+                self.__dict__.get('_c_args_version',0)+1
+        object.__setattr__(self,name,value)
+        return None
+
     def turn_physical_off(self):
         """
         NAME:
@@ -792,6 +825,79 @@ class Potential(object):
                 raise PotentialError("'_phiforce' function not implemented for this non-axisymmetric potential")
             return 0.
 
+    @potential_physical_input
+    @physical_conversion('forcederivative',pop=True)
+    def zphideriv(self,R,Z,phi=0.,t=0.):
+        """
+        NAME:
+
+           zphideriv
+
+        PURPOSE:
+
+           evaluate the mixed vertical, azimuthal derivative
+
+        INPUT:
+
+           R - Galactocentric radius (can be Quantity)
+
+           Z - vertical height (can be Quantity)
+
+           phi - Galactocentric azimuth (can be Quantity)
+
+           t - time (can be Quantity)
+
+        OUTPUT:
+
+           d2Phi/dphidz
+
+        HISTORY:
+
+           2026-10-17 - Written
+
+        """
+        try:
+            return self._amp*self._zphideriv(R,Z,phi=phi,t=t)
+        except AttributeError: #pragma: no cover
+            if self.isNonAxi:
+                raise PotentialError("'_zphideriv' function not implemented for this non-axisymmetric potential")
+            return 0.
+
+    @potential_physical_input
+    @physical_conversion('forcederivative',pop=True)
+    def hessian(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+
+           hessian
+
+        PURPOSE:
+
+           evaluate the Hessian of the potential, the matrix of its second derivatives with respect to the rectangular coordinates (x,y,z), for (arrays of) (R,z,phi,t)
+
+        INPUT:
+
+           R - Galactocentric radius (can be Quantity; R > 0)
+
+           z - vertical height (can be Quantity)
+
+           phi - Galactocentric azimuth (can be Quantity)
+
+           t - time (can be Quantity)
+
+        OUTPUT:
+
+           d2Phi/dx_i/dx_j as an array with shape (N...,3,3), where (N...) is the broadcast shape of (R,z,phi,t); second derivatives that the potential does not implement are central finite differences of its forces
+
+        HISTORY:
+
+           2026-10-17 - Written
+
+        """
+        from galpy.potential_src.interpRZPotential import ext_loaded \
+            as interp_ext_loaded
+        return _hessian([self],R,z,phi,t,interp_ext_loaded and self.hasC)
+
     def toPlanar(self):
         """
         NAME:
@@ -1952,6 +2058,246 @@ def evaluateRzderivs(Pot,R,z,phi=None,t=0.):
     else: #pragma: no cover 
         raise PotentialError("Input to 'evaluateRzderivs' is neither a Potential-instance or a list of such instances")
 
+@potential_physical_input
+@physical_conversion('forcederivative',pop=True)
+def evaluateHessians(Pot,R,z,phi=None,t=0.):
+    """
+    NAME:
+
+       evaluateHessians
+
+    PURPOSE:
+
+       convenience function to evaluate the Hessian of a possible sum of potentials, the matrix of second derivatives with respect to the rectangular coordinates (x,y,z), for (arrays of) (R,z,phi,t) at once (in C if all potentials have a C implementation)
+
+    INPUT:
+
+       Pot - a potential or list of potentials
+
+       R - cylindrical Galactocentric distance (can be Quantity; R > 0)
+
+       z - distance above the plane (can be Quantity)
+
+       phi - azimuth (optional; can be Quantity)
+
+       t - time (optional; can be Quantity)
+
+    OUTPUT:
+
+       d2Phi/dx_i/dx_j as an array with shape (N...,3,3), where (N...) is the broadcast shape of (R,z,phi,t); second derivatives that a potential does not implement are central finite differences of its forces
+
+    HISTORY:
+
+       2026-10-17 - Written
+
+    """
+    from galpy.potential_src.interpRZPotential import ext_loaded \
+        as interp_ext_loaded
+    if _dim(Pot) != 3:
+        raise PotentialError("evaluateHessians only works for 3D potentials")
+    if _isNonAxi(Pot) and phi is None:
+        raise PotentialError("The (list of) Potential instances is non-axisymmetric, but you did not provide phi")
+    if not isinstance(Pot,list): Pot= [Pot]
+    return _hessian(Pot,R,z,phi,t,interp_ext_loaded and _check_c(Pot))
+
+def _hessian(Pot,R,z,phi,t,use_c):
+    """Evaluate the Hessian in rectangular coordinates of the list of 
+    potentials Pot from its cylindrical derivatives"""
+    Rforce, phiforce, R2deriv, z2deriv, Rzderiv, phi2deriv, Rphideriv, \
+        zphideriv= _evaluate_c_arrays(Pot,R,z,phi,t,
+                                      ['Rforce','phiforce','R2deriv',
+                                       'z2deriv','Rzderiv','phi2deriv',
+                                       'Rphideriv','zphideriv'],
+                                      False,use_c,None)
+    if phi is None: phi= 0.
+    R,phi= nu.broadcast_arrays(*[nu.asarray(x,dtype='float')
+                                 for x in [R,phi,z,t]])[:2]
+    cp, sp= nu.cos(phi), nu.sin(phi)
+    # 1/R dPhi/dR + 1/R^2 d2Phi/dphi2 and d/dR (1/R dPhi/dphi)
+    RR= -Rforce/R+phi2deriv/R**2.
+    Rp= Rphideriv/R+phiforce/R**2.
+    out= nu.empty(R.shape+(3,3))
+    out[...,0,0]= cp**2.*R2deriv+sp**2.*RR-2.*cp*sp*Rp
+    out[...,1,1]= sp**2.*R2deriv+cp**2.*RR+2.*cp*sp*Rp
+    out[...,0,1]= cp*sp*(R2deriv-RR)+(cp**2.-sp**2.)*Rp
+    out[...,0,2]= cp*Rzderiv-sp*zphideriv/R
+    out[...,1,2]= sp*Rzderiv+cp*zphideriv/R
+    out[...,2,2]= z2deriv
+    out[...,1,0]= out[...,0,1]
+    out[...,2,0]= out[...,0,2]
+    out[...,2,1]= out[...,1,2]
+    return out
+
+# Quantities that evaluate_c can compute, in the order of the C code, and
+# the relative step of the finite differences for the second derivatives
+_EVALUATE_C_QUANTITIES= ['potential','Rforce','zforce','phiforce',
+                         'R2deriv','z2deriv','Rzderiv','phi2deriv',
+                         'Rphideriv','dens','zphideriv']
+_EVALUATE_C_FD_EPS= 10.**-5.
+# For each second derivative, the force whose finite difference gives it
+# for potentials that do not implement it and the coordinate (R,z,phi) of
+# the finite difference
+_SECOND_DERIVATIVES= {'R2deriv':('Rforce',0),'z2deriv':('zforce',1),
+                      'Rzderiv':('Rforce',1),'phi2deriv':('phiforce',2),
+                      'Rphideriv':('Rforce',2),'zphideriv':('zforce',2)}
+def evaluate_c(Pot,R,z,phi=None,t=0.,quantities='potential',nthreads=None):
+    """
+    NAME:
+
+       evaluate_c
+
+    PURPOSE:
+
+       evaluate the potential, forces, and second derivatives of a potential or list of potentials for arrays of (R,z,phi,t) in a single, OpenMP-parallel call of the C implementation
+
+    INPUT:
+
+       Pot - a potential or list of potentials
+
+       R - cylindrical Galactocentric distance (array; natural units)
+
+       z - distance above the plane (array; natural units)
+
+       phi - azimuth (optional; array)
+
+       t - time (optional; array; natural units)
+
+       quantities= ('potential') quantity or list of quantities to evaluate: 'potential', 'Rforce', 'zforce', 'phiforce', 'R2deriv', 'z2deriv', 'Rzderiv', 'phi2deriv', 'Rphideriv', or 'zphideriv' (second derivatives that a potential does not implement are central finite differences of its forces), or 'dens' (evaluated in C only if all potentials have a C implementation of the density)
+
+       nthreads= (None) number of OpenMP threads to use (default: OpenMP's default)
+
+    OUTPUT:
+
+       array with the broadcast shape of (R,z,phi,t) or a tuple of such arrays if quantities is a list (natural units); if not all potentials have a C implementation, all quantities are evaluated in python in the same way
+
+    HISTORY:
+
+       2026-10-16 - Written
+
+    """
+    from galpy.potential_src.interpRZPotential import interpRZPotential
+    from galpy.potential_src.interpRZPotential import ext_loaded \
+        as interp_ext_loaded
+    single= not isinstance(quantities,(list,tuple))
+    if single: quantities= [quantities]
+    _check_evaluate_c_quantities(quantities)
+    if _dim(Pot) != 3:
+        raise PotentialError("evaluate_c only works for 3D potentials")
+    if _isNonAxi(Pot) and phi is None:
+        raise PotentialError("The (list of) Potential instances is non-axisymmetric, but you did not provide phi")
+    if not isinstance(Pot,list): Pot= [Pot]
+    # The C implementation of interpRZPotential only has the forces
+    use_c= interp_ext_loaded and _check_c(Pot) \
+        and not ('potential' in quantities 
+                 and nu.any([isinstance(p,interpRZPotential) for p in Pot])) \
+        and not ('dens' in quantities
+                 and not nu.all([p.hasC_dens for p in Pot]))
+    return _evaluate_c_arrays(Pot,R,z,phi,t,quantities,single,use_c,nthreads)
+
+def _check_evaluate_c_quantities(quantities):
+    for quantity in quantities:
+        if not quantity in _EVALUATE_C_QUANTITIES:
+            raise PotentialError("Quantity '%s' cannot be evaluated by evaluate_c, use one of %s" % (quantity,', '.join(_EVALUATE_C_QUANTITIES)))
+
+def _evaluate_c_arrays(Pot,R,z,phi,t,quantities,single,use_c,nthreads):
+    """Evaluate quantities for the list of potentials Pot for arrays R,z,phi,t
+    in a single C call if use_c, otherwise in python (after evaluate_c's 
+    checks of the input)"""
+    from galpy.orbit_src.integrateFullOrbit import _parse_pot
+    from galpy.potential_src.interpRZPotential import _evaluate_array_c
+    if phi is None: phi= 0.
+    R,z,phi,t= nu.broadcast_arrays(*[nu.asarray(x,dtype='float')
+                                     for x in [R,z,phi,t]])
+    shape= R.shape
+    R,z,phi,t= [x.flatten() for x in [R,z,phi,t]]
+    if use_c:
+        npot, pot_type, pot_args= _parse_pot(Pot)
+        out= _evaluate_array_c(npot,pot_type,pot_args,R,z,phi,t,
+                               [_EVALUATE_C_QUANTITIES.index(quantity)
+                                for quantity in quantities],
+                               nthreads=nthreads)
+    else:
+        out= nu.array([_evaluate_python(Pot,quantity,R,z,phi,t)
+                       for quantity in quantities])
+    out= [o.reshape(shape) for o in out]
+    if single:
+        return out[0]
+    else:
+        return tuple(out)
+
+def _evaluate_python(Pot,quantity,R,z,phi,t):
+    """Evaluate quantity for arrays R,z,phi,t in python, like the C code 
+    (second derivatives are evaluated by the potentials that implement them
+    and are central finite differences of the forces otherwise)"""
+    if not quantity in _SECOND_DERIVATIVES:
+        return _evaluate_python_single(Pot,quantity,R,z,phi,t)
+    out= nu.zeros(len(R))
+    for pot in Pot:
+        out+= _evaluate_python_2ndderiv(pot,quantity,R,z,phi,t)
+    return out
+
+def _evaluate_python_2ndderiv(pot,quantity,R,z,phi,t):
+    """Evaluate a second derivative of a single potential for arrays 
+    R,z,phi,t"""
+    if quantity in ['phi2deriv','Rphideriv','zphideriv'] and not pot.isNonAxi:
+        return nu.zeros(len(R))
+    if hasattr(pot,'_'+quantity):
+        func= lambda R,z,phi=0.,t=0.: \
+            pot._amp*getattr(pot,'_'+quantity)(R,z,phi=phi,t=t)
+        try:
+            return _evaluate_python_array(func,R,z,phi,t)
+        except (NotImplementedError,PotentialError):
+            # e.g., not implemented for rotated frames or for the wrapped
+            # potential
+            pass
+    force, coord= _SECOND_DERIVATIVES[quantity]
+    if coord == 2:
+        h= _EVALUATE_C_FD_EPS
+    else:
+        h= _EVALUATE_C_FD_EPS*nu.sqrt(R**2.+z**2.)
+        h[h == 0.]= _EVALUATE_C_FD_EPS
+    dx= [0.,0.,0.]
+    dx[coord]= h
+    func= _force_func(pot,force)
+    return -0.5*(_evaluate_python_array(func,R+dx[0],z+dx[1],phi+dx[2],t)
+                 -_evaluate_python_array(func,R-dx[0],z-dx[1],phi-dx[2],t))/h
+
+def _evaluate_python_single(Pot,quantity,R,z,phi,t):
+    """Evaluate the potential, a force, or the density for arrays R,z,phi,t
+    in python"""
+    out= nu.zeros(len(R))
+    for pot in Pot:
+        if quantity == 'dens':
+            func= lambda R,z,phi=0.,t=0.: \
+                pot.dens(R,z,phi=phi,t=t,use_physical=False)
+        else:
+            func= _force_func(pot,quantity)
+        out+= _evaluate_python_array(func,R,z,phi,t)
+    return out
+
+def _force_func(pot,quantity):
+    if quantity == 'potential':
+        return pot._call_nodecorator
+    elif quantity == 'Rforce':
+        return pot._Rforce_nodecorator
+    elif quantity == 'zforce':
+        return pot._zforce_nodecorator
+    elif quantity == 'phiforce':
+        return pot._phiforce_nodecorator
+
+def _evaluate_python_array(func,R,z,phi,t):
+    """Evaluate func for arrays R,z,phi,t, for all points at once for 
+    functions that can be evaluated for arrays, otherwise one point at a 
+    time"""
+    try:
+        out= func(R,z,phi=phi,t=t)
+    except (ValueError,TypeError,IndexError):
+        out= None
+    if nu.shape(out) != nu.shape(R):
+        out= nu.array([func(R[ii],z[ii],phi=phi[ii],t=t[ii])
+                       for ii in range(len(R))])
+    return out
+
 def plotPotentials(Pot,rmin=0.,rmax=1.5,nrs=21,zmin=-0.5,zmax=0.5,nzs=21,
                    phi=None,xy=False,
                    ncontours=21,savefilename=None,aspect=None,
@@ -2646,7 +2992,9 @@ def _check_c(Pot):
        2014-02-17 - Written - Bovy (IAS)
 
     """
-    if isinstance(Pot,list):
+    if isinstance(Pot,list) and hasattr(Pot,'hasC'): # CompositePotential
+        return Pot.hasC
+    elif isinstance(Pot,list):
         return nu.all(nu.array([p.hasC for p in Pot],dtype='bool'))
     elif isinstance(Pot,Potential):
         return Pot.hasC
@@ -2672,7 +3020,9 @@ def _dim(Pot):
        2016-04-19 - Written - Bovy (UofT)
     """
     from galpy.potential import planarPotential, linearPotential
-    if isinstance(Pot,list):
+    if isinstance(Pot,list) and hasattr(Pot,'dim'): # CompositePotential
+        return Pot.dim
+    elif isinstance(Pot,list):
         return nu.amin(nu.array([p.dim for p in Pot],dtype='int'))
     elif isinstance(Pot,(Potential,planarPotential,linearPotential)):
         return Pot.dim
@@ -2700,7 +3050,7 @@ def _isNonAxi(Pot):
        2016-06-16 - Written - Bovy (UofT)
 
     """
-    isList= isinstance(Pot,list)
+    isList= isinstance(Pot,list) and not hasattr(Pot,'isNonAxi')
     if isList:
         isAxis= [not p.isNonAxi for p in Pot]
         nonAxi= not nu.prod(nu.array(isAxis))
@@ -2708,6 +3058,108 @@ def _isNonAxi(Pot):
         nonAxi= Pot.isNonAxi
     return nonAxi
 
+_SCALAR_TYPES= (float,int,bool,str,type(None))
+def _is_parameter_attribute(name):
+    """Return False for the attributes of a potential that are not parameters (the cache for the C code and intermediate results cached by force evaluations)"""
+    return not name.startswith(('_c_args','_cached','_force_hash'))
+
+def _parameter_state(pot):
+    """
+    NAME:
+
+       _parameter_state
+
+    PURPOSE:
+
+       summarize the state of the parameters of a potential and of the potentials that it contains (e.g., the Miyamoto-Nagai disks of MN3ExponentialDiskPotential), such that any change in a parameter (by setting it or by changing an array parameter in place) changes the summary
+
+    INPUT:
+
+       pot - Potential or planarPotential instance
+
+    OUTPUT:
+
+       tuple that can be compared to a previous state
+
+    HISTORY:
+
+       2026-10-16 - Written
+
+    """
+    # Setting any parameter bumps the version, so only arrays (which can be
+    # changed in place) and contained potentials need to be inspected
+    out= [pot.__dict__.get('_c_args_version',0)]
+    for name, value in pot.__dict__.items():
+        if isinstance(value,_SCALAR_TYPES) \
+                or not _is_parameter_attribute(name): continue
+        if isinstance(value,nu.ndarray):
+            out.append(hash(value.tobytes()))
+        elif isinstance(value,list):
+            out.extend([_parameter_state(v) for v in value
+                        if hasattr(v,'_c_args_version')])
+        elif hasattr(value,'_c_args_version'):
+            out.append(_parameter_state(value))
+    return tuple(out)
+
+# Attributes that do not affect the values of a potential in natural units
+_NONVALUE_ATTRIBUTES= ('_ro','_vo','_roSet','_voSet','_num_threads',
+                       '_numcores','_point_hash')
+def _parameter_hash(pot):
+    """
+    NAME:
+
+       _parameter_hash
+
+    PURPOSE:
+
+       compute a hash of the type and parameters of a potential (or list of potentials) and of the potentials that it contains that, unlike _parameter_state, is the same in different sessions (e.g., to key an on-disk cache of quantities computed from the potential)
+
+    INPUT:
+
+       pot - Potential or planarPotential instance or list of such instances
+
+    OUTPUT:
+
+       hexadecimal md5 digest
+
+    HISTORY:
+
+       2026-10-17 - Written
+
+    """
+    md5= hashlib.md5()
+    _update_parameter_hash(md5,pot)
+    return md5.hexdigest()
+
+def _update_parameter_hash(md5,value):
+    if isinstance(value,_SCALAR_TYPES) or isinstance(value,nu.generic):
+        md5.update(repr(value).encode('utf-8'))
+    elif isinstance(value,nu.ndarray):
+        md5.update(repr((value.dtype.str,value.shape)).encode('utf-8'))
+        md5.update(nu.ascontiguousarray(value).tobytes())
+    elif isinstance(value,(list,tuple)):
+        md5.update(('%s%i' % (type(value).__name__,len(value))).encode('utf-8'))
+        for v in value: _update_parameter_hash(md5,v)
+    elif isinstance(value,dict):
+        md5.update(('dict%i' % len(value)).encode('utf-8'))
+        for k in sorted(value.keys(),key=repr):
+            _update_parameter_hash(md5,k)
+            _update_parameter_hash(md5,value[k])
+    elif hasattr(value,'_c_args_version'): # (planar)Potential
+        md5.update(type(value).__name__.encode('utf-8'))
+        for name in sorted(value.__dict__.keys()):
+            if not _is_parameter_attribute(name) \
+                    or name in _NONVALUE_ATTRIBUTES: continue
+            md5.update(name.encode('utf-8'))
+            _update_parameter_hash(md5,value.__dict__[name])
+    elif hasattr(value,'loadable_keys'): # pynbody snapshot
+        md5.update(('snapshot%i' % len(value)).encode('utf-8'))
+        for key in ['pos','mass','eps']:
+            _update_parameter_hash(md5,nu.asarray(value[key]))
+    else:
+        raise PotentialError("Cannot compute a persistent hash of an attribute of type %s" % type(value).__name__)
+    return None
+
 def kms_to_kpcGyrDecorator(func):
     """Decorator to convert velocities from km/s to kpc/Gyr"""
     @wraps(func)
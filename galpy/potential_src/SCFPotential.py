@@ -13,6 +13,9 @@ from scipy.special import gammaln
 
 import hashlib
 
+# Maximum number of elements of the intermediate arrays per chunk of points
+_SCF_CHUNK_ELEMENTS= 2**20
+
 
 class SCFPotential(Potential):
     """Class that implements the `Hernquist & Ostriker (1992) <http://adsabs.harvard.edu/abs/1992ApJ...386..375H>`_ Self-Consistent-Field-type potential. 
@@ -130,6 +133,7 @@ class SCFPotential(Potential):
         self._force_hash= None
         self.hasC= True
         self.hasC_dxdv=True
+        self.hasC_dens=True
         
         if normalize or \
                 (isinstance(normalize,(int,float)) \
@@ -187,19 +191,20 @@ class SCFPotential(Potential):
            N - size of the N dimension
            L - size of the L dimension
         OUTPUT:
-           rho tilde 
+           rho tilde (r.shape+(N,L))
         HISTORY:
            2016-05-17 - Written - Aladdin 
+           2026-10-17 - Vectorized over r
         """
+        r = nu.asarray(r, dtype=float)
         xi = self._calculateXi(r)
         CC = _C(xi,N,L)
         a = self._a
-        rho = nu.zeros((N,L), float)
+        r = r[...,nu.newaxis,nu.newaxis]
         n = nu.arange(0,N, dtype=float)[:, nu.newaxis]
         l = nu.arange(0, L, dtype=float)[nu.newaxis,:]
         K = 0.5 * n * (n + 4*l + 3) + (l + 1.)*(2*l + 1)
-        rho[:,:] = K * ((a*r)**l) / ((r/a)*(a + r)**(2*l + 3.)) * CC[:,:]* (nu.pi)**-0.5
-        return rho   
+        return K * ((a*r)**l) / ((r/a)*(a + r)**(2*l + 3.)) * CC* (nu.pi)**-0.5
 
     def _phiTilde(self, r, N,L):
         """
@@ -212,52 +217,48 @@ class SCFPotential(Potential):
            N - size of the N dimension
            L - size of the L dimension
         OUTPUT:
-           phi tilde 
+           phi tilde (r.shape+(N,L))
         HISTORY:
            2016-05-17 - Written - Aladdin 
+           2026-10-17 - Vectorized over r
         """
+        r = nu.asarray(r, dtype=float)
         xi = self._calculateXi(r)
         CC = _C(xi,N,L)
         a = self._a
-        phi = nu.zeros((N,L), float)
-        n = nu.arange(0,N)[:, nu.newaxis]
+        r = r[...,nu.newaxis,nu.newaxis]
         l = nu.arange(0, L)[nu.newaxis,:]
-        phi[:,:] = - (r*a)**l/ ((a + r)**(2*l + 1.)) * CC[:,:]* (4*nu.pi)**0.5
-        return phi  
+        return - (r*a)**l/ ((a + r)**(2*l + 1.)) * CC* (4*nu.pi)**0.5
         
     def _compute(self, funcTilde, R, z, phi):
         """
         NAME:
            _compute
         PURPOSE:
-           evaluate the NxLxM density or potential
+           evaluate the density or potential for 1D arrays of coordinates, summing over the expansion for all points at once
         INPUT:
            funcTidle - must be _rhoTilde or _phiTilde
-           R - Cylindrical Galactocentric radius
-           z - vertical height
-           phi - azimuth
+           R - Cylindrical Galactocentric radius (1D array)
+           z - vertical height (1D array)
+           phi - azimuth (1D array)
         OUTPUT:
-           An NxLxM density or potential at (R,z, phi)
+           density or potential at (R,z, phi)
         HISTORY:
            2016-05-18 - Written - Aladdin 
+           2026-10-17 - Vectorized over the coordinates
         """
-        Acos, Asin = self._Acos, self._Asin
+        Acos, Asin = self._effectiveCoeffs()
         N, L, M = Acos.shape    
         r, theta, phi = bovy_coords.cyl_to_spher(R,z,phi)
-        
-        
-   
-        PP = lpmn(M-1,L-1,nu.cos(theta))[0].T ##Get the Legendre polynomials
+        PP = _lpmn(M,L,nu.cos(theta)) ##Get the Legendre polynomials
         func_tilde = funcTilde(r, N, L) ## Tilde of the function of interest 
-        
-        func = nu.zeros((N,L,M), float) ## The function of interest (density or potential)
-        
-        m = nu.arange(0, M)[nu.newaxis, nu.newaxis, :]
-        mcos = nu.cos(m*phi)
-        msin = nu.sin(m*phi)
-        func = func_tilde[:,:,None]*(Acos[:,:,:]*mcos + Asin[:,:,:]*msin)*PP[None,:,:]
-        return func
-        
+        m = nu.arange(0, M)[nu.newaxis, :]
+        mcos = nu.cos(m*phi[:,nu.newaxis])[:,nu.newaxis,:]
+        msin = nu.sin(m*phi[:,nu.newaxis])[:,nu.newaxis,:]
+        func = _contractN(func_tilde,Acos)*mcos
+        if self.isNonAxi:
+            func += _contractN(func_tilde,Asin)*msin
+        return nu.sum(func*PP,axis=(1,2))
         
     def _computeArray(self, funcTilde, R, z, phi):
         """
@@ -274,20 +275,49 @@ class SCFPotential(Potential):
            density or potential evaluated at (R,z, phi)
         HISTORY:
            2016-06-02 - Written - Aladdin 
+           2026-10-17 - Evaluate all points at once, in chunks
         """
         R = nu.array(R,dtype=float); z = nu.array(z,dtype=float); phi = nu.array(phi,dtype=float);
-        
         shape = (R*z*phi).shape
-        if shape == (): return nu.sum(self._compute(funcTilde, R,z,phi))
-        R = R*nu.ones(shape); z = z*nu.ones(shape); phi = phi*nu.ones(shape);
-        func = nu.zeros(shape, float)
+        R, z, phi = [(x*nu.ones(shape)).flatten() for x in [R,z,phi]]
+        func = nu.empty(R.shape, float)
+        chunk = self._chunkSize()
+        for i in range(0, len(R), chunk):
+            func[i:i+chunk] = self._compute(funcTilde, R[i:i+chunk],
+                                            z[i:i+chunk], phi[i:i+chunk])
+        if shape == (): return func[0]
+        return func.reshape(shape)
 
-        
-        li = _cartesian(shape)
-        for i in range(li.shape[0]):
-            j = nu.split(li[i], li.shape[1])
-            func[j] = nu.sum(self._compute(funcTilde, R[j][0],z[j][0],phi[j][0]))
-        return func
+    def _effectiveCoeffs(self):
+        """
+        NAME:
+           _effectiveCoeffs
+        PURPOSE:
+           return the expansion coefficients, keeping only m=0 for axisymmetric potentials
+        INPUT:
+        OUTPUT:
+           (Acos,Asin)
+        HISTORY:
+           2026-10-17 - Written
+        """
+        if self.isNonAxi:
+            return self._Acos, self._Asin
+        return self._Acos[:,:,:1], self._Asin[:,:,:1]
+
+    def _chunkSize(self):
+        """
+        NAME:
+           _chunkSize
+        PURPOSE:
+           number of points to evaluate at once, such that the intermediate NxL and LxM arrays for all points in a chunk take up a bounded amount of memory
+        INPUT:
+        OUTPUT:
+           number of points
+        HISTORY:
+           2026-10-17 - Written
+        """
+        N, L, M = self._effectiveCoeffs()[0].shape
+        return max(1, _SCF_CHUNK_ELEMENTS//max(N*L, L*(M+1)))
         
     def _dens(self, R, z, phi=0., t=0.):
         """
@@ -340,16 +370,20 @@ class SCFPotential(Potential):
            N - size of the N dimension
            L - size of the L dimension
         OUTPUT:
-           the derivative of phiTilde with respect to r
+           the derivative of phiTilde with respect to r (r.shape+(N,L))
         HISTORY:
            2016-06-06 - Written - Aladdin 
+           2026-10-17 - Vectorized over r
         """
         a = self._a
         l = nu.arange(0, L, dtype=float)[nu.newaxis, :]
-        n = nu.arange(0, N, dtype=float)[:, nu.newaxis]
+        r = nu.asarray(r, dtype=float)
         xi = self._calculateXi(r)
+        CC = _C(xi,N,L)
         dC = _dC(xi,N,L)
-        return -(4*nu.pi)**.5 * (nu.power(a*r, l)*(l*(a + r)*nu.power(r,-1) -(2*l + 1))/((a + r)**(2*l + 2))*_C(xi,N,L) + 
+        r = r[...,nu.newaxis,nu.newaxis]
+        xi = xi[...,nu.newaxis,nu.newaxis]
+        return -(4*nu.pi)**.5 * (nu.power(a*r, l)*(l*(a + r)*nu.power(r,-1) -(2*l + 1))/((a + r)**(2*l + 2))*CC + 
         a**-1*(1 - xi)**2 * (a*r)**l / (a + r)**(2*l + 1) *dC/2.)
         
         
@@ -358,45 +392,43 @@ class SCFPotential(Potential):
         NAME:
            _computeforce
         PURPOSE:
-           Evaluate the first derivative of Phi with respect to R, z and phi
+           Evaluate the first derivative of Phi with respect to r, theta and phi for 1D arrays of coordinates, summing over the expansion for all points at once
         INPUT:
-           R - Cylindrical Galactocentric radius
-           z - vertical height
-           phi - azimuth
+           R - Cylindrical Galactocentric radius (1D array)
+           z - vertical height (1D array)
+           phi - azimuth (1D array)
            t - time
         OUTPUT:
            dPhi/dr, dPhi/dtheta, dPhi/dphi
         HISTORY:
            2016-06-07 - Written - Aladdin 
+           2026-10-17 - Vectorized over the coordinates
         """
-        Acos, Asin = self._Acos, self._Asin
+        Acos, Asin = self._effectiveCoeffs()
         N, L, M = Acos.shape    
         r, theta, phi = bovy_coords.cyl_to_spher(R,z,phi)
-        new_hash= hashlib.md5(nu.array([R, z,phi])).hexdigest()
-        
-        if new_hash == self._force_hash:
-            dPhi_dr = self._cached_dPhi_dr  
-            dPhi_dtheta = self._cached_dPhi_dtheta 
-            dPhi_dphi = self._cached_dPhi_dphi
-            
-        else:        
-            PP, dPP = lpmn(M-1,L-1,nu.cos(theta)) ##Get the Legendre polynomials
-            PP = PP.T[None,:,:]
-            dPP = dPP.T[None,:,:]
-            phi_tilde = self._phiTilde(r, N, L)[:,:,nu.newaxis] 
-            dphi_tilde = self._dphiTilde(r,N,L)[:,:,nu.newaxis]
-            
-            m = nu.arange(0, M)[nu.newaxis, nu.newaxis, :]
-            mcos = nu.cos(m*phi)
-            msin = nu.sin(m*phi)
-            dPhi_dr = -nu.sum((Acos*mcos + Asin*msin)*PP*dphi_tilde)
-            dPhi_dtheta = -nu.sum((Acos*mcos + Asin*msin)*phi_tilde*dPP*(-nu.sin(theta)))
-            dPhi_dphi =-nu.sum(m*(Asin*mcos - Acos*msin)*phi_tilde*PP)
-            
-            self._force_hash = new_hash
-            self._cached_dPhi_dr = dPhi_dr
-            self._cached_dPhi_dtheta = dPhi_dtheta
-            self._cached_dPhi_dphi = dPhi_dphi
+        PP, dPP = _lpmn(M,L,nu.cos(theta),deriv=True) ##Get the Legendre polynomials
+        phi_tilde = self._phiTilde(r, N, L)
+        dphi_tilde = self._dphiTilde(r,N,L)
+        m = nu.arange(0, M)[nu.newaxis, :]
+        mcos = nu.cos(m*phi[:,nu.newaxis])[:,nu.newaxis,:]
+        msin = nu.sin(m*phi[:,nu.newaxis])[:,nu.newaxis,:]
+        # Contract phiTilde and its derivative together
+        nr = len(r)
+        Ac, dAc = nu.split(_contractN(nu.concatenate((phi_tilde,dphi_tilde)),
+                                      Acos), [nr])
+        if self.isNonAxi:
+            As, dAs = nu.split(_contractN(nu.concatenate((phi_tilde,
+                                                          dphi_tilde)),
+                                          Asin), [nr])
+            dPhi_dr = -nu.sum((dAc*mcos + dAs*msin)*PP,axis=(1,2))
+            dPhi_dtheta = -nu.sum((Ac*mcos + As*msin)*dPP,axis=(1,2))
+            dPhi_dphi = -nu.sum(m[:,nu.newaxis,:]*(As*mcos - Ac*msin)*PP,
+                                axis=(1,2))
+        else:
+            dPhi_dr = -nu.sum(dAc*mcos*PP,axis=(1,2))
+            dPhi_dtheta = -nu.sum(Ac*mcos*dPP,axis=(1,2))
+            dPhi_dphi = nu.zeros_like(dPhi_dr)
         return dPhi_dr,dPhi_dtheta,dPhi_dphi
         
     def _computeforceArray(self,dr_dx, dtheta_dx, dphi_dx, R, z, phi):
@@ -417,27 +449,36 @@ class SCFPotential(Potential):
            The forces in the x direction
         HISTORY:
            2016-06-02 - Written - Aladdin 
+           2026-10-17 - Evaluate all points at once, in chunks
         """     
         R = nu.array(R,dtype=float); z = nu.array(z,dtype=float); phi = nu.array(phi,dtype=float);
         shape = (R*z*phi).shape
-        if shape == (): 
-            dPhi_dr,dPhi_dtheta,dPhi_dphi = \
-            self._computeforce(R,z,phi)
-            return dr_dx*dPhi_dr + dtheta_dx*dPhi_dtheta +dPhi_dphi*dphi_dx
-        
-        R = R*nu.ones(shape);
-        z = z* nu.ones(shape);
-        phi = phi* nu.ones(shape);
-        force = nu.zeros(shape, float)
-        dr_dx = dr_dx*nu.ones(shape); dtheta_dx = dtheta_dx*nu.ones(shape);dphi_dx = dphi_dx*nu.ones(shape);  
-        li = _cartesian(shape)
-
-        for i in range(li.shape[0]):
-            j = nu.split(li[i], li.shape[1])
-            dPhi_dr,dPhi_dtheta,dPhi_dphi = \
-            self._computeforce(R[j][0],z[j][0],phi[j][0])
-            force[j] = dr_dx[j][0]*dPhi_dr + dtheta_dx[j][0]*dPhi_dtheta +dPhi_dphi*dphi_dx[j][0]
-        return force
+        R, z, phi = [(x*nu.ones(shape)).flatten() for x in [R,z,phi]]
+        new_hash= hashlib.md5(nu.array([R, z,phi])).hexdigest()
+        if new_hash == self._force_hash:
+            dPhi_dr = self._cached_dPhi_dr  
+            dPhi_dtheta = self._cached_dPhi_dtheta 
+            dPhi_dphi = self._cached_dPhi_dphi
+        else:
+            dPhi_dr = nu.empty(R.shape, float)
+            dPhi_dtheta = nu.empty(R.shape, float)
+            dPhi_dphi = nu.empty(R.shape, float)
+            chunk = self._chunkSize()
+            for i in range(0, len(R), chunk):
+                dPhi_dr[i:i+chunk], dPhi_dtheta[i:i+chunk], \
+                    dPhi_dphi[i:i+chunk] = \
+                    self._computeforce(R[i:i+chunk], z[i:i+chunk],
+                                       phi[i:i+chunk])
+            self._force_hash = new_hash
+            self._cached_dPhi_dr = dPhi_dr
+            self._cached_dPhi_dtheta = dPhi_dtheta
+            self._cached_dPhi_dphi = dPhi_dphi
+        force = (nu.ravel(dr_dx*nu.ones(shape))*dPhi_dr
+                 + nu.ravel(dtheta_dx*nu.ones(shape))*dPhi_dtheta
+                 + nu.ravel(dphi_dx*nu.ones(shape))*dPhi_dphi)
+        if shape == (): return force[0]
+        return force.reshape(shape)
+
     def _Rforce(self, R, z, phi=0, t=0):
         """
         NAME:
@@ -522,37 +563,95 @@ def _C(xi, N,L, alpha = lambda x: 2*x + 3./2):
     PURPOSE:
        Evaluate C_n,l (the Gegenbauer polynomial) for 0 <= l < L and 0<= n < N 
     INPUT:
-       xi - radial transformed variable
+       xi - radial transformed variable (can be an array)
        N - Size of the N dimension
        L - Size of the L dimension
        alpha = A lambda function of l. Default alpha = 2l + 3/2 
        
     OUTPUT:
-       An LxN Gegenbauer Polynomial 
+       An xi.shape+(N,L) Gegenbauer Polynomial 
     HISTORY:
        2016-05-16 - Written - Aladdin 
+       2026-10-17 - Vectorized over xi and l
     """
-    CC = nu.zeros((N,L), float) 
-     
-    for l in range(L):
-        for n in range(N):
-            a = alpha(l)
-            if n==0:
-                CC[n][l] = 1.
-                continue 
-            elif n==1: CC[n][l] = 2.*a*xi
-            if n + 1 != N:
-                CC[n+1][l] = (n + 1.)**-1. * (2*(n + a)*xi*CC[n][l] - (n + 2*a - 1)*CC[n-1][l])
-    return CC 
+    xi = nu.asarray(xi, dtype=float)
+    # Run the recurrence with xi as the last, contiguous axis
+    a = alpha(nu.arange(L, dtype=float)).reshape((L,)+(1,)*xi.ndim)
+    n = nu.arange(1, N-1, dtype=float).reshape((N-2 if N > 2 else 0,1)+(1,)*xi.ndim)
+    c1 = 2*(n + a)/(n + 1.)*xi
+    c2 = (n + 2*a - 1)/(n + 1.)
+    CC = nu.zeros((N,L)+xi.shape, float)
+    CC[0] = 1.
+    if N > 1: CC[1] = 2.*a*xi
+    for n in range(1, N-1):
+        CC[n+1] = c1[n-1]*CC[n] - c2[n-1]*CC[n-1]
+    return CC.transpose(tuple(range(2, CC.ndim))+(0,1))
     
 def _dC(xi, N, L):
     l = nu.arange(0,L)[nu.newaxis, :]
     CC = _C(xi,N + 1,L, alpha = lambda x: 2*x + 5./2)
-    CC = nu.roll(CC, 1, axis=0)[:-1,:]
-    CC[0, :] = 0
+    CC = nu.roll(CC, 1, axis=-2)[...,:-1,:]
+    CC[...,0, :] = 0
     CC *= 2*(2*l + 3./2)
     return CC
-     
+
+def _contractN(tilde, A):
+    """
+    NAME:
+       _contractN
+    PURPOSE:
+       Sum tilde_nl A_nlm over n for each point, i.e., einsum('pnl,nlm->plm'), as one matrix product for each l
+    INPUT:
+       tilde - radial functions (P,N,L)
+       A - expansion coefficients (N,L,M)
+    OUTPUT:
+       (P,L,M) array
+    HISTORY:
+       2026-10-17 - Written
+    """
+    out = nu.empty((tilde.shape[0],A.shape[1],A.shape[2]), float)
+    for l in range(A.shape[1]):
+        out[:,l,:] = nu.dot(tilde[:,:,l], A[:,l,:])
+    return out
+
+def _lpmn(M, L, x, deriv=False):
+    """
+    NAME:
+       _lpmn
+    PURPOSE:
+       Evaluate the associated Legendre functions P_lm(x) for 0 <= l < L and 0 <= m < M for an array of x, with the same (Condon-Shortley) phase as scipy.special.lpmn
+    INPUT:
+       M - Size of the M dimension
+       L - Size of the L dimension
+       x - cos(theta) (1D array)
+       deriv= (False) if True, also return the derivative with respect to theta (finite at the poles)
+    OUTPUT:
+       P_lm(x) (len(x),L,M) [, dP_lm/dtheta (len(x),L,M)]
+    HISTORY:
+       2026-10-17 - Written
+    """
+    x = nu.asarray(x, dtype=float)
+    sintheta = nu.sqrt(nu.maximum(1.-x**2.,0.))
+    Mp = M + 1 if deriv else M # need m+1 for the derivative
+    # Run the recurrence with x as the last, contiguous axis
+    PP = nu.zeros((L,Mp,len(x)), float)
+    pmm = nu.ones_like(x)
+    for m in range(min(Mp,L)):
+        if m > 0: pmm = -(2*m - 1.)*sintheta*pmm
+        PP[m,m] = pmm
+        if m + 1 < L: PP[m+1,m] = (2*m + 1.)*x*pmm
+        for l in range(m+2, L):
+            PP[l,m] = ((2*l - 1.)*x*PP[l-1,m] - (l + m - 1.)*PP[l-2,m])/(l - m)
+    PP = PP.transpose(2,0,1)
+    if not deriv: return PP
+    # dP_lm/dtheta = [P_l,m+1 - (l+m)(l-m+1) P_l,m-1]/2, with P_l,-1 = -P_l,1/(l(l+1))
+    l = nu.arange(L)[:,nu.newaxis]
+    m = nu.arange(1,M)[nu.newaxis,:]
+    dPP = nu.empty((len(x),L,M), float)
+    dPP[:,:,0] = PP[:,:,1] if Mp > 1 else 0.
+    dPP[:,:,1:] = 0.5*(PP[:,:,2:M+1] - (l + m)*(l - m + 1.)*PP[:,:,:M-1])
+    return PP[:,:,:M], dPP
+
 def scf_compute_coeffs_spherical(dens, N, a=1., radial_order=None):
         """
         NAME:
@@ -800,7 +899,7 @@ def _cartesian(arraySizes, out=None):
     if out is None:
         out = nu.zeros([n, len(arrays)], dtype=dtype)
     
-    m = n / arrays[0].size
+    m = n // arrays[0].size
     out[:,0] = nu.repeat(arrays[0], m)
     if arrays[1:]:
         _cartesian(arraySizes[1:], out=out[0:m,1:])
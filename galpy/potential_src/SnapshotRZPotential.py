@@ -6,14 +6,11 @@ from galpy.potential_src.Potential import Potential
 from galpy.potential_src import interpRZPotential
 from galpy.potential_src.interpRZPotential import scalarVectorDecorator, \
     zsymDecorator
-try: 
-    import pynbody
-    from pynbody import gravity
-    from pynbody.units import NoUnit
-except ImportError: #pragma: no cover
-    _PYNBODY_LOADED= False
-else:
-    _PYNBODY_LOADED= True    
+from galpy.util import LazyModule, module_available
+# Only import pynbody when it is first used
+_PYNBODY_LOADED= module_available('pynbody')
+pynbody= LazyModule('pynbody')
+gravity= LazyModule('pynbody.gravity')
 class SnapshotRZPotential(Potential):
     """Class that implements an axisymmetrized version of the potential of an N-body snapshot (requires `pynbody <http://pynbody.github.io>`__)
 
@@ -215,6 +212,7 @@ class InterpSnapshotRZPotential(interpRZPotential.interpRZPotential) :
         # the interpRZPotential class sets these flags
         self._enable_c = enable_c
         self.hasC = True
+        self._adaptive = False
                 
         # set up the flags for interpolated quantities
         # since the potential and force are always calculated together, 
@@ -489,12 +487,12 @@ class InterpSnapshotRZPotential(interpRZPotential.interpRZPotential) :
         self._normPhi0 = Phi0
 
         # rescale the simulation 
-        if not isinstance(self._s['pos'].units,NoUnit):
+        if not isinstance(self._s['pos'].units,pynbody.units.NoUnit):
             self._posunit = self._s['pos'].units
             self._s['pos'].convert_units('%s kpc'%R0)
         else:
             self._posunit = None
-        if not isinstance(self._s['vel'].units,NoUnit):
+        if not isinstance(self._s['vel'].units,pynbody.units.NoUnit):
             self._velunit = self._s['vel'].units
             self._s['vel'].convert_units('%s km s**-1'%Vc0)
         else:
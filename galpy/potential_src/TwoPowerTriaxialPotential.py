@@ -129,6 +129,10 @@ class TwoPowerTriaxialPotential(Potential):
                 (isinstance(normalize,(int,float)) \
                      and not isinstance(normalize,bool)): #pragma: no cover
             self.normalize(normalize)
+        # The C potential is not implemented for alpha=2, except for Jaffe
+        self.hasC= not self._glorder is None \
+            and (not self.alpha == 2 or self.beta == 4)
+        self.hasC_dxdv= False
         if not self._aligned or numpy.fabs(self._b-1.) > 10.**-10.:
             self.isNonAxi= True
         return None
@@ -209,7 +213,7 @@ class TwoPowerTriaxialPotential(Potential):
                 raise NotImplementedError('alpha=2 potential evaluation case not implemented')
             else:
                 psi_inf=\
-                    special.gamma(self.beta-2.)*special.gamma(3.-self.alpha)\
+                    special.gamma(self.beta-2.)*special.gamma(2.-self.alpha)\
                     /special.gamma(self.beta-self.alpha)
                 psi= lambda m:\
                     psi_inf-(m/self.a)**(2.-self.alpha)\
@@ -508,6 +512,31 @@ class TwoPowerTriaxialPotential(Potential):
             (phiyy-phixx)+R*numpy.cos(2.*phi)*phixy\
             +numpy.sin(phi)*Fx-numpy.cos(phi)*Fy
 
+    def _zphideriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _zphideriv
+        PURPOSE:
+           evaluate the mixed vertical, azimuthal derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed vertical, azimuthal derivative
+        HISTORY:
+           2026-10-17 - Written
+        """
+        if not self.isNonAxi:
+            phi= 0.
+        x,y,z= bovy_coords.cyl_to_rect(R,phi,z)
+        if not self._aligned:
+            raise NotImplementedError("2nd potential derivatives of TwoPowerTriaxialPotential not implemented for rotated coordinated frames (non-trivial zvec and pa)")
+        phixz= self._2ndderiv_xyz(x,y,z,0,2)
+        phiyz= self._2ndderiv_xyz(x,y,z,1,2)
+        return R*(numpy.cos(phi)*phiyz-numpy.sin(phi)*phixz)
+
     def _2ndderiv_xyz(self,x,y,z,i,j):
         """General 2nd derivative of the potential as a function of (x,y,z)
         in the aligned coordinate frame"""
@@ -111,3 +111,67 @@ class WilkinsonEvansPotential(Potential):
         """
         return self._Mh*nu.sqrt(z**2+R**2)*(z/(nu.sqrt(z**2+R**2)*nu.sqrt(z**2+R**2+self._ah**2))-z*(z**2+R**2)**((-3.0)/2.0)*(nu.sqrt(z**2+R**2+self._ah**2)+self._ah))/(self._ah*(nu.sqrt(z**2+R**2+self._ah**2)+self._ah))
 
+    def _R2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _R2deriv
+        PURPOSE:
+           evaluate the second radial derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second radial derivative
+        HISTORY:
+           2026-10-17 - Written
+        """
+        r2= R**2.+z**2.
+        dPhidr, d2Phidr2= self._rderivs(r2)
+        return (d2Phidr2*R**2.+dPhidr*z**2./nu.sqrt(r2))/r2
+
+    def _z2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _z2deriv
+        PURPOSE:
+           evaluate the second vertical derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second vertical derivative
+        HISTORY:
+           2026-10-17 - Written
+        """
+        return self._R2deriv(z,R) #Spherical potential
+
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           d2phi/dR/dz
+        HISTORY:
+           2026-10-17 - Written
+        """
+        r2= R**2.+z**2.
+        dPhidr, d2Phidr2= self._rderivs(r2)
+        return (d2Phidr2-dPhidr/nu.sqrt(r2))*R*z/r2
+
+    def _rderivs(self,r2):
+        """First and second derivative of the potential with respect to the
+        spherical radius"""
+        s= nu.sqrt(r2+self._ah**2.)
+        return (self._Mh/nu.sqrt(r2)/s,
+                -self._Mh*(2.*r2+self._ah**2.)/r2/s**3.)
@@ -0,0 +1,343 @@
+###############################################################################
+#   interp3DPotential.py: class that interpolates a general, non-axisymmetric
+#                         potential on a 3D (R,z,phi) grid
+###############################################################################
+import numpy
+from galpy.util import multi, bovy_conversion, LazyModule
+ndimage= LazyModule('scipy.ndimage')
+from galpy.potential_src.Potential import Potential, _APY_LOADED
+if _APY_LOADED:
+    from astropy import units
+class interp3DPotential(Potential):
+    """Class that interpolates a given, general (non-axisymmetric) potential on a 3D grid in :math:`(R,z,\\phi)` using tricubic B-splines for fast orbit integration. The potential and the three forces are interpolated separately; the interpolated potential rotates rigidly with pattern speed ``omegab``"""
+    def __init__(self,pot=None,
+                 rgrid=(numpy.log(0.01),numpy.log(20.),101),
+                 zgrid=(0.,1.,101),nphi=64,logR=True,zsym=True,
+                 omegab=0.,enable_c=True,nthreads=None,
+                 ro=None,vo=None):
+        """
+        NAME:
+
+           __init__
+
+        PURPOSE:
+
+           Initialize an interp3DPotential instance
+
+        INPUT:
+
+           pot - Potential or list of Potential instances to be interpolated
+
+           rgrid - R grid to be given to linspace as in rs= linspace(*rgrid)
+
+           zgrid - z grid to be given to linspace as in zs= linspace(*zgrid)
+
+           nphi= (64) number of azimuths in the periodic grid phis= 2 pi k / nphi, k= 0, ..., nphi-1
+
+           logR - if True, rgrid is in the log of R so logrs= linspace(*rgrid)
+
+           zsym= if True (default), the potential is assumed to be symmetric around z=0 (so you can use, e.g.,  zgrid=(0.,1.,101)).
+
+           omegab= (0.) pattern speed with which the potential rotates; the grid is computed at t=0 (can be Quantity)
+
+           enable_c= (True) enable use of the interpolated potential in C (e.g., for orbit integration)
+
+           nthreads= (None) number of OpenMP threads or processes used to calculate the grid (default: all available cores)
+
+           ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
+
+        OUTPUT:
+
+           instance
+
+        HISTORY:
+
+           2026-10-17 - Written
+
+        """
+        from galpy.potential import PotentialError
+        from galpy.potential_src.interpRZPotential import interpRZPotential
+        if isinstance(pot,(interp3DPotential,interpRZPotential)):
+            raise PotentialError('Cannot setup interp3DPotential with another interpolated potential')
+        # Propagate ro and vo
+        roSet= True
+        voSet= True
+        if ro is None:
+            if isinstance(pot,list):
+                ro= pot[0]._ro
+                roSet= pot[0]._roSet
+            else:
+                ro= pot._ro
+                roSet= pot._roSet
+        if vo is None:
+            if isinstance(pot,list):
+                vo= pot[0]._vo
+                voSet= pot[0]._voSet
+            else:
+                vo= pot._vo
+                voSet= pot._voSet
+        Potential.__init__(self,amp=1.,ro=ro,vo=vo)
+        # Turn off physical if it hadn't been on
+        if not roSet: self._roSet= False
+        if not voSet: self._voSet= False
+        if _APY_LOADED and isinstance(omegab,units.Quantity):
+            omegab= omegab.to(units.km/units.s/units.kpc).value\
+                /bovy_conversion.freq_in_kmskpc(self._vo,self._ro)
+        if nphi < 4:
+            raise PotentialError('interp3DPotential requires nphi >= 4')
+        self._origPot= pot
+        self._rgrid= numpy.linspace(*rgrid)
+        self._logR= logR
+        if self._logR:
+            self._logrgrid= self._rgrid
+            self._rgrid= numpy.exp(self._logrgrid)
+        self._zgrid= numpy.linspace(*zgrid)
+        self._phigrid= numpy.arange(nphi)*2.*numpy.pi/nphi
+        self._zsym= zsym
+        self._omegab= omegab
+        self._enable_c= enable_c
+        self.hasC= self._enable_c
+        self.hasC_dxdv= False
+        self.isNonAxi= True
+        # Compute the potential and forces on the grid
+        self._potGrid, self._rforceGrid, self._zforceGrid, self._phiforceGrid=\
+            _calc_grids(self._origPot,self._rgrid,self._zgrid,self._phigrid,
+                        nthreads=nthreads)
+        self._potGrid_splinecoeffs= _calc_3dsplinecoeffs(self._potGrid)
+        self._rforceGrid_splinecoeffs= _calc_3dsplinecoeffs(self._rforceGrid)
+        self._zforceGrid_splinecoeffs= _calc_3dsplinecoeffs(self._zforceGrid)
+        self._phiforceGrid_splinecoeffs=\
+            _calc_3dsplinecoeffs(self._phiforceGrid)
+        return None
+
+    def _grid_indices(self,R,z,phi,t):
+        """Fractional grid indices of (R,z,phi) at time t, and whether
+        each point lies within the (R,z) range of the grid"""
+        R,z,phi,t= numpy.broadcast_arrays(*[numpy.asarray(x,dtype='float')
+                                             for x in [R,z,phi,t]])
+        if self._zsym: z= numpy.fabs(z)
+        indx= (R >= self._rgrid[0])*(R <= self._rgrid[-1])\
+            *(z <= self._zgrid[-1])*(z >= self._zgrid[0])
+        if self._logR:
+            x= (numpy.log(R)-self._logrgrid[0])\
+                /(self._logrgrid[1]-self._logrgrid[0])
+        else:
+            x= (R-self._rgrid[0])/(self._rgrid[1]-self._rgrid[0])
+        y= (z-self._zgrid[0])/(self._zgrid[1]-self._zgrid[0])
+        w= numpy.mod(phi-self._omegab*t,2.*numpy.pi)\
+            /(self._phigrid[1]-self._phigrid[0])
+        return (x,y,w,indx)
+
+    def _interpolate(self,coeffs,quantity,R,z,phi,t,zodd=False):
+        """Evaluate the interpolated quantity, falling back onto the original
+        potential outside of the grid; zodd= quantity is odd in z"""
+        from galpy.potential_src.Potential import _evaluate_python
+        x,y,w,indx= self._grid_indices(R,z,phi,t)
+        out= numpy.empty(x.shape)
+        if numpy.any(indx):
+            out[indx]= _eval_3dspline(coeffs,x[indx],y[indx],w[indx])
+            if zodd and self._zsym:
+                zneg= indx*(numpy.broadcast_to(z,x.shape) < 0.)
+                out[zneg]*= -1.
+        if not numpy.all(indx):
+            R,z,phi,t= numpy.broadcast_arrays(R,z,phi,t)
+            origPot= self._origPot
+            if not isinstance(origPot,list): origPot= [origPot]
+            out[~indx]= _evaluate_python(origPot,quantity,
+                                         R[~indx],z[~indx],phi[~indx],
+                                         t[~indx])
+        if out.shape == ():
+            return out[()]
+        return out
+
+    def _evaluate(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _evaluate
+        PURPOSE:
+           evaluate the interpolated potential at R,z,phi
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           Phi(R,z,phi)
+        HISTORY:
+           2026-10-17 - Written
+        """
+        return self._interpolate(self._potGrid_splinecoeffs,'potential',
+                                 R,z,phi,t)
+
+    def _Rforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rforce
+        PURPOSE:
+           evaluate the interpolated radial force at R,z,phi
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the radial force
+        HISTORY:
+           2026-10-17 - Written
+        """
+        return self._interpolate(self._rforceGrid_splinecoeffs,'Rforce',
+                                 R,z,phi,t)
+
+    def _zforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _zforce
+        PURPOSE:
+           evaluate the interpolated vertical force at R,z,phi
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the vertical force
+        HISTORY:
+           2026-10-17 - Written
+        """
+        return self._interpolate(self._zforceGrid_splinecoeffs,'zforce',
+                                 R,z,phi,t,zodd=True)
+
+    def _phiforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _phiforce
+        PURPOSE:
+           evaluate the interpolated azimuthal force at R,z,phi
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the azimuthal force
+        HISTORY:
+           2026-10-17 - Written
+        """
+        return self._interpolate(self._phiforceGrid_splinecoeffs,'phiforce',
+                                 R,z,phi,t)
+
+    def OmegaP(self):
+        """
+        NAME:
+           OmegaP
+        PURPOSE:
+           return the pattern speed
+        INPUT:
+           (none)
+        OUTPUT:
+           pattern speed
+        HISTORY:
+           2026-10-17 - Written
+        """
+        return self._omegab
+
+def _calc_grids(pot,rgrid,zgrid,phigrid,nthreads=None):
+    """
+    NAME:
+       _calc_grids
+    PURPOSE:
+       calculate the potential and the forces on a 3D (R,z,phi) grid, using the parallel C implementation if possible and otherwise evaluating the azimuthal planes of the grid in parallel in python
+    INPUT:
+       pot - Potential or list of such instances
+       rgrid, zgrid, phigrid - 1D grids
+       nthreads= (None) number of OpenMP threads or processes to use
+    OUTPUT:
+       (potential,Rforce,zforce,phiforce) on the grid, each with shape (len(rgrid),len(zgrid),len(phigrid))
+    HISTORY:
+       2026-10-17 - Written
+    """
+    from galpy.potential_src.Potential import evaluate_c, _check_c, \
+        _evaluate_python
+    from galpy.potential_src.interpRZPotential import ext_loaded
+    quantities= ['potential','Rforce','zforce','phiforce']
+    if not isinstance(pot,list): pot= [pot]
+    R,z,phi= numpy.meshgrid(rgrid,zgrid,phigrid,indexing='ij')
+    if ext_loaded and _check_c(pot):
+        return evaluate_c(pot,R,z,phi=phi,quantities=quantities,
+                          nthreads=nthreads)
+    def calc_plane(ii):
+        return numpy.array([_evaluate_python(pot,quantity,
+                                             R[:,:,ii].flatten(),
+                                             z[:,:,ii].flatten(),
+                                             phi[:,:,ii].flatten(),
+                                             numpy.zeros(R[:,:,ii].size))
+                            for quantity in quantities])
+    out= numpy.array(list(multi.parallel_map(calc_plane,
+                                             list(range(len(phigrid))),
+                                             numcores=nthreads)))
+    out= out.reshape((len(phigrid),len(quantities),len(rgrid),len(zgrid)))
+    return tuple(numpy.transpose(out[:,ii],axes=(1,2,0))
+                 for ii in range(len(quantities)))
+
+def _calc_3dsplinecoeffs(array3d):
+    """
+    NAME:
+       _calc_3dsplinecoeffs
+    PURPOSE:
+       calculate cubic B-spline interpolation coefficients for a 3D array, with mirror boundary conditions along the first two axes (like interp_2d) and periodic boundary conditions along the last axis
+    INPUT:
+       array3d
+    OUTPUT:
+       new array with spline coeffs
+    HISTORY:
+       2026-10-17 - Written
+    """
+    out= ndimage.spline_filter1d(array3d,order=3,axis=0)
+    out= ndimage.spline_filter1d(out,order=3,axis=1)
+    # Periodic: invert the circulant B-spline filter using FFTs
+    nphi= array3d.shape[2]
+    kernel= numpy.zeros(nphi)
+    kernel[0]= 4./6.
+    kernel[1]+= 1./6.
+    kernel[-1]+= 1./6.
+    return numpy.real(numpy.fft.ifft(numpy.fft.fft(out,axis=2)
+                                     /numpy.fft.fft(kernel),axis=2))
+
+def _bspline_indx_weights(x,n,periodic=False):
+    """Indices and weights of the four cubic B-splines that contribute at
+    fractional grid index x for a grid of length n"""
+    if not periodic:
+        x= numpy.clip(x,0.,n-1.)
+    i= numpy.floor(x).astype(int)
+    u= x-i
+    weights= [(1.-u)**3./6.,
+              (3.*u**3.-6.*u**2.+4.)/6.,
+              (-3.*u**3.+3.*u**2.+3.*u+1.)/6.,
+              u**3./6.]
+    indices= []
+    for k in range(-1,3):
+        indx= i+k
+        if periodic:
+            indx= numpy.mod(indx,n)
+        else: # mirror
+            indx= numpy.fabs(indx).astype(int)
+            indx= numpy.where(indx > n-1,2*(n-1)-indx,indx)
+        indices.append(indx)
+    return (indices,weights)
+
+def _eval_3dspline(coeffs,x,y,w):
+    """Evaluate the tricubic B-spline with coefficients coeffs at fractional
+    grid indices (x,y,w) (1D arrays), w is periodic"""
+    nx,ny,nw= coeffs.shape
+    xindx, xweights= _bspline_indx_weights(x,nx)
+    yindx, yweights= _bspline_indx_weights(y,ny)
+    windx, wweights= _bspline_indx_weights(w,nw,periodic=True)
+    flatcoeffs= coeffs.flatten()
+    out= numpy.zeros(x.shape)
+    for ii in range(4):
+        for jj in range(4):
+            base= (xindx[ii]*ny+yindx[jj])*nw
+            xyweight= xweights[ii]*yweights[jj]
+            for kk in range(4):
+                out+= xyweight*wweights[kk]*flatcoeffs[base+windx[kk]]
+    return out
@@ -2,6 +2,8 @@ import os
 import sys
 import sysconfig
 import copy
+import hashlib
+import tempfile
 import ctypes
 import ctypes.util
 import warnings
@@ -110,7 +112,8 @@ class interpRZPotential(Potential):
                  interpepifreq=False,interpverticalfreq=False,
                  ro=None,vo=None,
                  use_c=False,enable_c=False,zsym=True,
-                 numcores=None):
+                 numcores=None,cache=None,
+                 adaptive=False,adaptive_tol=10.**-6.,adaptive_maxn=1001):
         """
         NAME:
 
@@ -140,6 +143,14 @@ class interpRZPotential(Potential):
 
            numcores= if set to an integer, use this many cores (only used for vcirc, dvcircdR, epifreq, and verticalfreq; NOT NECESSARILY FASTER, TIME TO MAKE SURE)
 
+           adaptive= (False) if True, adaptively refine the grid (given by rgrid and zgrid) by halving the intervals in (log) R and z where the error of the interpolated potential, forces, or density (against the original potential) exceeds adaptive_tol
+
+           adaptive_tol= (10.**-6.) tolerance on the interpolation error for adaptive=True, relative to the maximum absolute value of the interpolated quantity on the grid
+
+           adaptive_maxn= (1001) maximum number of grid points in R and in z for adaptive=True
+
+           cache= (None) if set to a directory, the interpolation grids are saved to and, when an interpolation of the same potential (with the same parameters) on the same grid has been set up before, loaded from a file in this directory
+
            ro=, vo= distance and velocity scales for translation into internal units (default from configuration file)
 
         OUTPUT:
@@ -152,6 +163,10 @@ class interpRZPotential(Potential):
 
            2013-01-24 - Started with new implementation - Bovy (IAS)
 
+           2026-10-17 - Added cache=
+
+           2026-10-17 - Added adaptive grid refinement
+
         """
         if isinstance(RZPot,interpRZPotential):
             from galpy.potential import PotentialError
@@ -195,16 +210,36 @@ class interpRZPotential(Potential):
         self._enable_c= enable_c*ext_loaded
         self.hasC= self._enable_c
         self._zsym= zsym
+        self._adaptive= adaptive
+        # Load the grids from the cache if they have been computed before
+        cachefile= None
+        cached= {}
+        if not cache is None:
+            cachefile= _cache_filename(cache,RZPot,rgrid,zgrid,logR,zsym,
+                                       [interpPot,interpRforce,interpzforce,
+                                        interpDens,interpvcirc,
+                                        interpdvcircdr,interpepifreq,
+                                        interpverticalfreq],
+                                       adaptive=(adaptive_tol,adaptive_maxn)
+                                           if adaptive else None)
+            if not cachefile is None and os.path.exists(cachefile):
+                with numpy.load(cachefile) as cachedata:
+                    cached= dict(cachedata.items())
+        if adaptive and not '_rgrid' in cached:
+            # Refining the grid computes the grids of the 2D quantities
+            cached.update(self._refine_grids(use_c,adaptive_tol,
+                                             adaptive_maxn))
+        if '_rgrid' in cached:
+            self._rgrid= cached['_rgrid']
+            if self._logR:
+                self._logrgrid= numpy.log(self._rgrid)
+            self._zgrid= cached['_zgrid']
         if interpPot:
-            if use_c*ext_loaded:
-                self._potGrid, err= calc_potential_c(self._origPot,self._rgrid,self._zgrid)
+            if '_potGrid' in cached:
+                self._potGrid= cached['_potGrid']
             else:
-                from galpy.potential import evaluatePotentials
-                potGrid= numpy.zeros((len(self._rgrid),len(self._zgrid)))
-                for ii in range(len(self._rgrid)):
-                    for jj in range(len(self._zgrid)):
-                        potGrid[ii,jj]= evaluatePotentials(self._origPot,self._rgrid[ii],self._zgrid[jj])
-                self._potGrid= potGrid
+                self._potGrid= _calc_grid(self._origPot,'potential',
+                                          self._rgrid,self._zgrid,use_c)
             if self._logR:
                 self._potInterp= interpolate.RectBivariateSpline(self._logrgrid,
                                                                  self._zgrid,
@@ -216,17 +251,17 @@ class interpRZPotential(Potential):
                                                                  self._potGrid,
                                                                  kx=3,ky=3,s=0.)
             if enable_c*ext_loaded:
-                self._potGrid_splinecoeffs= calc_2dsplinecoeffs_c(self._potGrid)
+                self._potGrid_splinecoeffs= cached.get(\
+                    '_potGrid_splinecoeffs',None)
+                if self._potGrid_splinecoeffs is None:
+                    self._potGrid_splinecoeffs= \
+                        _calc_splinecoeffs(self._potGrid,self._potInterp,adaptive)
         if interpRforce:
-            if use_c*ext_loaded:
-                self._rforceGrid, err= calc_potential_c(self._origPot,self._rgrid,self._zgrid,rforce=True)
+            if '_rforceGrid' in cached:
+                self._rforceGrid= cached['_rforceGrid']
             else:
-                from galpy.potential import evaluateRforces
-                rforceGrid= numpy.zeros((len(self._rgrid),len(self._zgrid)))
-                for ii in range(len(self._rgrid)):
-                    for jj in range(len(self._zgrid)):
-                        rforceGrid[ii,jj]= evaluateRforces(self._origPot,self._rgrid[ii],self._zgrid[jj])
-                self._rforceGrid= rforceGrid
+                self._rforceGrid= _calc_grid(self._origPot,'Rforce',
+                                             self._rgrid,self._zgrid,use_c)
             if self._logR:
                 self._rforceInterp= interpolate.RectBivariateSpline(self._logrgrid,
                                                                     self._zgrid,
@@ -238,17 +273,17 @@ class interpRZPotential(Potential):
                                                                     self._rforceGrid,
                                                                     kx=3,ky=3,s=0.)
             if enable_c*ext_loaded:
-                self._rforceGrid_splinecoeffs= calc_2dsplinecoeffs_c(self._rforceGrid)
+                self._rforceGrid_splinecoeffs= cached.get(\
+                    '_rforceGrid_splinecoeffs',None)
+                if self._rforceGrid_splinecoeffs is None:
+                    self._rforceGrid_splinecoeffs= \
+                        _calc_splinecoeffs(self._rforceGrid,self._rforceInterp,adaptive)
         if interpzforce:
-            if use_c*ext_loaded:
-                self._zforceGrid, err= calc_potential_c(self._origPot,self._rgrid,self._zgrid,zforce=True)
+            if '_zforceGrid' in cached:
+                self._zforceGrid= cached['_zforceGrid']
             else:
-                from galpy.potential import evaluatezforces
-                zforceGrid= numpy.zeros((len(self._rgrid),len(self._zgrid)))
-                for ii in range(len(self._rgrid)):
-                    for jj in range(len(self._zgrid)):
-                        zforceGrid[ii,jj]= evaluatezforces(self._origPot,self._rgrid[ii],self._zgrid[jj])
-                self._zforceGrid= zforceGrid
+                self._zforceGrid= _calc_grid(self._origPot,'zforce',
+                                             self._rgrid,self._zgrid,use_c)
             if self._logR:
                 self._zforceInterp= interpolate.RectBivariateSpline(self._logrgrid,
                                                                     self._zgrid,
@@ -260,14 +295,17 @@ class interpRZPotential(Potential):
                                                                     self._zforceGrid,
                                                                     kx=3,ky=3,s=0.)
             if enable_c*ext_loaded:
-                self._zforceGrid_splinecoeffs= calc_2dsplinecoeffs_c(self._zforceGrid)
+                self._zforceGrid_splinecoeffs= cached.get(\
+                    '_zforceGrid_splinecoeffs',None)
+                if self._zforceGrid_splinecoeffs is None:
+                    self._zforceGrid_splinecoeffs= \
+                        _calc_splinecoeffs(self._zforceGrid,self._zforceInterp,adaptive)
         if interpDens:
-            from galpy.potential import evaluateDensities
-            densGrid= numpy.zeros((len(self._rgrid),len(self._zgrid)))
-            for ii in range(len(self._rgrid)):
-                for jj in range(len(self._zgrid)):
-                    densGrid[ii,jj]= evaluateDensities(self._origPot,self._rgrid[ii],self._zgrid[jj])
-            self._densGrid= densGrid
+            if '_densGrid' in cached:
+                self._densGrid= cached['_densGrid']
+            else:
+                self._densGrid= _calc_grid(self._origPot,'dens',
+                                           self._rgrid,self._zgrid,use_c)
             if self._logR:
                 self._densInterp= interpolate.RectBivariateSpline(self._logrgrid,
                                                                   self._zgrid,
@@ -280,7 +318,9 @@ class interpRZPotential(Potential):
                                                                   kx=3,ky=3,s=0.)
         if interpvcirc:
             from galpy.potential import vcirc
-            if not numcores is None:
+            if '_vcircGrid' in cached:
+                self._vcircGrid= cached['_vcircGrid']
+            elif not numcores is None:
                 self._vcircGrid= multi.parallel_map((lambda x: vcirc(self._origPot,self._rgrid[x])),
                                                     list(range(len(self._rgrid))),numcores=numcores)
             else:
@@ -291,7 +331,9 @@ class interpRZPotential(Potential):
                 self._vcircInterp= interpolate.InterpolatedUnivariateSpline(self._rgrid,self._vcircGrid,k=3)
         if interpdvcircdr:
             from galpy.potential import dvcircdR
-            if not numcores is None:
+            if '_dvcircdrGrid' in cached:
+                self._dvcircdrGrid= cached['_dvcircdrGrid']
+            elif not numcores is None:
                 self._dvcircdrGrid= multi.parallel_map((lambda x: dvcircdR(self._origPot,self._rgrid[x])),
                                                        list(range(len(self._rgrid))),numcores=numcores)
             else:
@@ -302,7 +344,9 @@ class interpRZPotential(Potential):
                 self._dvcircdrInterp= interpolate.InterpolatedUnivariateSpline(self._rgrid,self._dvcircdrGrid,k=3)
         if interpepifreq:
             from galpy.potential import epifreq
-            if not numcores is None:
+            if '_epifreqGrid' in cached:
+                self._epifreqGrid= cached['_epifreqGrid']
+            elif not numcores is None:
                 self._epifreqGrid= numpy.array(multi.parallel_map((lambda x: epifreq(self._origPot,self._rgrid[x])),
                                                       list(range(len(self._rgrid))),numcores=numcores))
             else:
@@ -320,7 +364,9 @@ class interpRZPotential(Potential):
                     self._epifreqInterp= interpolate.InterpolatedUnivariateSpline(self._rgrid[indx],self._epifreqGrid[indx],k=3)
         if interpverticalfreq:
             from galpy.potential import verticalfreq
-            if not numcores is None:
+            if '_verticalfreqGrid' in cached:
+                self._verticalfreqGrid= cached['_verticalfreqGrid']
+            elif not numcores is None:
                 self._verticalfreqGrid= multi.parallel_map((lambda x: verticalfreq(self._origPot,self._rgrid[x])),
                                                        list(range(len(self._rgrid))),numcores=numcores)
             else:
@@ -329,7 +375,91 @@ class interpRZPotential(Potential):
                 self._verticalfreqInterp= interpolate.InterpolatedUnivariateSpline(self._logrgrid,self._verticalfreqGrid,k=3)
             else:
                 self._verticalfreqInterp= interpolate.InterpolatedUnivariateSpline(self._rgrid,self._verticalfreqGrid,k=3)
+        if not cachefile is None and not os.path.exists(cachefile):
+            _save_cache(cachefile,
+                        dict((name,getattr(self,name))
+                             for name in _CACHED_GRIDS if hasattr(self,name)))
         return None
+
+    def _refine_grids(self,use_c,tol,maxn):
+        """
+        NAME:
+           _refine_grids
+        PURPOSE:
+           adaptively refine the (R,z) grid, starting from the current grid, by halving the intervals where the error of the interpolated quantities at the midpoints exceeds the tolerance
+        INPUT:
+           use_c - use C to calculate the grids
+           tol - tolerance on the interpolation error, relative to the maximum absolute value of each quantity on the grid
+           maxn - maximum number of grid points in R and in z
+        OUTPUT:
+           dictionary with the refined grids (_rgrid, _zgrid) and the grids of the interpolated 2D quantities
+        HISTORY:
+           2026-10-17 - Written
+        """
+        quantities= [q for q,interp in zip(['potential','Rforce','zforce',
+                                            'dens'],
+                                           [self._interpPot,self._interpRforce,
+                                            self._interpzforce,
+                                            self._interpDens])
+                     if interp]
+        if len(quantities) == 0: return {}
+        if self._logR:
+            xgrid= self._logrgrid
+            xtoR= numpy.exp
+        else:
+            xgrid= self._rgrid
+            xtoR= lambda x: x
+        zgrid= self._zgrid
+        grids= dict((q,_calc_grid(self._origPot,q,xtoR(xgrid),zgrid,use_c))
+                    for q in quantities)
+        while True:
+            # Exact quantities on the grid refined everywhere, re-using the
+            # values on the current grid
+            xfine= _refined_grid(xgrid)
+            zfine= _refined_grid(zgrid)
+            fine= {}
+            err= numpy.zeros((len(xfine),len(zfine)))
+            for q in quantities:
+                fine[q]= numpy.empty((len(xfine),len(zfine)))
+                fine[q][::2,::2]= grids[q]
+                fine[q][1::2]= _calc_grid(self._origPot,q,xtoR(xfine[1::2]),
+                                          zfine,use_c)
+                fine[q][::2,1::2]= _calc_grid(self._origPot,q,xtoR(xgrid),
+                                              zfine[1::2],use_c)
+                # Error of the interpolation on the current grid (the C
+                # implementation uses the same splines for adaptive grids)
+                if q == 'dens':
+                    spl= interpolate.RectBivariateSpline(\
+                        xgrid,zgrid,numpy.log(grids[q]+10.**-10.),
+                        kx=3,ky=3,s=0.)
+                    interp= numpy.exp(spl(xfine,zfine))-10.**-10.
+                else:
+                    spl= interpolate.RectBivariateSpline(xgrid,zgrid,grids[q],
+                                                         kx=3,ky=3,s=0.)
+                    interp= spl(xfine,zfine)
+                err= numpy.maximum(err,numpy.fabs(interp-fine[q])\
+                                       /numpy.amax(numpy.fabs(grids[q])))
+            xrefine= numpy.amax(err[1::2],axis=1) > tol
+            zrefine= numpy.amax(err[:,1::2],axis=0) > tol
+            if not numpy.any(xrefine) and not numpy.any(zrefine): break
+            if len(xgrid)+numpy.sum(xrefine) > maxn \
+                    or len(zgrid)+numpy.sum(zrefine) > maxn:
+                warnings.warn("Adaptive refinement of the interpRZPotential grid stopped before reaching the requested tolerance, because the grid would have more than adaptive_maxn= %i points" % maxn,galpyWarning)
+                break
+            xindx= numpy.sort(numpy.hstack((numpy.arange(0,len(xfine),2),
+                                            2*numpy.arange(len(xgrid)-1)[xrefine]+1)))
+            zindx= numpy.sort(numpy.hstack((numpy.arange(0,len(zfine),2),
+                                            2*numpy.arange(len(zgrid)-1)[zrefine]+1)))
+            xgrid= xfine[xindx]
+            zgrid= zfine[zindx]
+            for q in quantities:
+                grids[q]= fine[q][numpy.ix_(xindx,zindx)]
+        out= {'_rgrid':xtoR(xgrid),'_zgrid':zgrid}
+        for q,name in zip(['potential','Rforce','zforce','dens'],
+                          ['_potGrid','_rforceGrid','_zforceGrid',
+                           '_densGrid']):
+            if q in quantities: out[name]= grids[q]
+        return out
                                                  
     @scalarVectorDecorator
     @zsymDecorator(False)
@@ -718,6 +848,178 @@ def eval_force_c(pot,R,z,zforce=False):
 
     return (out,err.value)
 
+def _evaluate_array_c(npot,pot_type,pot_args,R,z,phi,t,quant,nthreads=None):
+    """
+    NAME:
+       _evaluate_array_c
+    PURPOSE:
+       Use C to evaluate the potential, forces, and second derivatives of a parsed potential at arrays of (R,z,phi,t), in parallel using OpenMP
+    INPUT:
+       npot, pot_type, pot_args - parsed potential (from _parse_pot)
+       R, z, phi, t - 1D arrays with the same length
+       quant - list of integer codes of the quantities to evaluate (see evaluate_c)
+       nthreads= (None) number of OpenMP threads to use (default: OpenMP's default)
+    OUTPUT:
+       array with shape (len(quant),len(R))
+    HISTORY:
+       2026-10-16 - Written
+    """
+    #Set up result arrays
+    out= numpy.empty((len(quant),len(R)))
+    quant= numpy.array(quant,dtype=numpy.int32)
+
+    #Set up the C code
+    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
+    interppotential_evalFunc= _lib.eval_potential_array
+    interppotential_evalFunc.argtypes= [ctypes.c_int,
+                                        ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                                        ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                                        ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                                        ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                                        ctypes.c_int,
+                                        ndpointer(dtype=numpy.int32,flags=ndarrayFlags),
+                                        ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                                        ctypes.c_int,
+                                        ndpointer(dtype=numpy.int32,flags=ndarrayFlags),
+                                        ndpointer(dtype=numpy.float64,flags=ndarrayFlags),
+                                        ctypes.c_int]
+
+    #Array requirements
+    R= numpy.require(R,dtype=numpy.float64,requirements=['C','W'])
+    z= numpy.require(z,dtype=numpy.float64,requirements=['C','W'])
+    phi= numpy.require(phi,dtype=numpy.float64,requirements=['C','W'])
+    t= numpy.require(t,dtype=numpy.float64,requirements=['C','W'])
+    quant= numpy.require(quant,dtype=numpy.int32,requirements=['C','W'])
+    out= numpy.require(out,dtype=numpy.float64,requirements=['C','W'])
+
+    #Run the C code
+    interppotential_evalFunc(len(R),R,z,phi,t,
+                             ctypes.c_int(npot),
+                             pot_type,
+                             pot_args,
+                             ctypes.c_int(len(quant)),
+                             quant,
+                             out,
+                             ctypes.c_int(0 if nthreads is None else nthreads))
+
+    return out
+
+def _calc_grid(pot,quantity,rgrid,zgrid,use_c):
+    """
+    NAME:
+       _calc_grid
+    PURPOSE:
+       calculate the potential, a force, or the density on a (R,z) grid
+    INPUT:
+       pot - Potential or list of such instances
+       quantity - 'potential', 'Rforce', 'zforce', or 'dens'
+       rgrid, zgrid - 1D grids
+       use_c - use C to calculate the potential and forces
+    OUTPUT:
+       grid with shape (len(rgrid),len(zgrid))
+    HISTORY:
+       2026-10-17 - Written, based on code in __init__
+    """
+    if use_c*ext_loaded and not quantity == 'dens':
+        return calc_potential_c(pot,rgrid,zgrid,
+                                rforce=quantity == 'Rforce',
+                                zforce=quantity == 'zforce')[0]
+    from galpy.potential import evaluatePotentials, evaluateRforces, \
+        evaluatezforces, evaluateDensities
+    evalfunc= {'potential':evaluatePotentials,
+               'Rforce':evaluateRforces,
+               'zforce':evaluatezforces,
+               'dens':evaluateDensities}[quantity]
+    out= numpy.zeros((len(rgrid),len(zgrid)))
+    for ii in range(len(rgrid)):
+        for jj in range(len(zgrid)):
+            out[ii,jj]= evalfunc(pot,rgrid[ii],zgrid[jj])
+    return out
+
+def _calc_splinecoeffs(grid,spline,adaptive):
+    """
+    NAME:
+       _calc_splinecoeffs
+    PURPOSE:
+       calculate the spline coefficients for the C implementation: cubic B-spline coefficients for the uniform grid of the indices for regular grids, or the coefficients of the not-a-knot cubic spline on the (non-uniform) grid for adaptive grids (the same spline as the python implementation uses)
+    INPUT:
+       grid - 2D grid of the interpolated quantity
+       spline - RectBivariateSpline of the grid
+       adaptive - True if the grid is adaptive
+    OUTPUT:
+       array of spline coefficients with the same shape as grid
+    HISTORY:
+       2026-10-17 - Written
+    """
+    if adaptive:
+        return spline.get_coeffs().reshape(grid.shape)
+    else:
+        return calc_2dsplinecoeffs_c(grid)
+
+def _refined_grid(grid):
+    """Return the grid with the midpoints of all intervals inserted"""
+    out= numpy.empty(2*len(grid)-1)
+    out[::2]= grid
+    out[1::2]= 0.5*(grid[:-1]+grid[1:])
+    return out
+
+# Grids that are saved to the cache (the spline interpolants are re-computed
+# from these, which is fast)
+_CACHED_GRIDS= ['_rgrid','_zgrid','_potGrid','_rforceGrid','_zforceGrid','_densGrid',
+                '_vcircGrid','_dvcircdrGrid','_epifreqGrid',
+                '_verticalfreqGrid','_potGrid_splinecoeffs',
+                '_rforceGrid_splinecoeffs','_zforceGrid_splinecoeffs']
+def _cache_filename(cache,pot,rgrid,zgrid,logR,zsym,interp,adaptive=None):
+    """
+    NAME:
+       _cache_filename
+    PURPOSE:
+       determine the name of the file in the cache directory that holds the interpolation grids for a potential and grid specification
+    INPUT:
+       cache - cache directory
+       pot - Potential or list of such instances
+       rgrid, zgrid, logR, zsym - grid specification
+       interp - list of the interp* options
+       adaptive= options of the adaptive grid refinement
+    OUTPUT:
+       filename or None if the potential's parameters cannot be hashed (e.g., because it contains functions)
+    HISTORY:
+       2026-10-17 - Written
+    """
+    from galpy import __version__
+    from galpy.potential_src.Potential import _parameter_hash, PotentialError
+    try:
+        pothash= _parameter_hash(pot)
+    except PotentialError as e:
+        warnings.warn("Not caching the interpolation grids, because the potential's parameters cannot be hashed (%s)" % e,galpyWarning)
+        return None
+    spec= repr((__version__,
+                [float(x) for x in rgrid[:2]],int(rgrid[2]),
+                [float(x) for x in zgrid[:2]],int(zgrid[2]),
+                bool(logR),bool(zsym),[bool(x) for x in interp],
+                adaptive))
+    return os.path.join(cache,'interpRZPotential-%s-%s.npz' \
+                            % (pothash,
+                               hashlib.md5(spec.encode('utf-8')).hexdigest()))
+
+def _save_cache(cachefile,grids):
+    """Save the grids to the cache file, writing to a temporary file first
+    such that other processes never load a partially-written file"""
+    cachedir= os.path.dirname(cachefile)
+    if not os.path.exists(cachedir):
+        try:
+            os.makedirs(cachedir)
+        except OSError: # created by another process in the meantime
+            pass
+    fd, tmpfile= tempfile.mkstemp(dir=cachedir,suffix='.npz')
+    try:
+        with os.fdopen(fd,'wb') as savefile:
+            numpy.savez(savefile,**grids)
+        os.rename(tmpfile,cachefile)
+    except OSError: #pragma: no cover
+        os.remove(tmpfile)
+    return None
+
 def sign(x):
     out= numpy.ones_like(x)
     out[(x < 0.)]= -1.
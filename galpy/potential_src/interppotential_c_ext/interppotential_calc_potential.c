@@ -9,12 +9,17 @@
 #include <omp.h>
 #endif
 #define CHUNKSIZE 1
+#define DERIV_FD_EPS 1e-5
 //Potentials
 #include <galpy_potentials.h>
 #include <actionAngle.h>
 #include <integrateFullOrbit.h>
 #include <interp_2d.h>
 #include <cubic_bspline_2d_coeffs.h>
+static double evaluate_quantity(int,double,double,double,double,
+				int,struct potentialArg *);
+static double evaluate_second_derivative(int,double,double,double,double,
+					 struct potentialArg *);
 /*
   MAIN FUNCTIONS
 */
@@ -231,3 +236,138 @@ void eval_zforce(int nR,
   }
   free(potentialArgs);
 }
+/*
+  Evaluate the potential, forces, and second derivatives of a (list of)
+  potential(s) at an array of (R,z,phi,t); quant lists the quantities to
+  compute: 0: potential, 1: Rforce, 2: zforce, 3: phiforce, 4: R2deriv,
+  5: z2deriv, 6: Rzderiv, 7: phi2deriv, 8: Rphideriv, 9: dens (only for
+  potentials that set dens), 10: zphideriv; out has shape (nquant,npts)
+*/
+void eval_potential_array(int npts,
+			  double *R,
+			  double *z,
+			  double *phi,
+			  double *t,
+			  int npot,
+			  int * pot_type,
+			  double * pot_args,
+			  int nquant,
+			  int * quant,
+			  double *out,
+			  int nthreads){
+  int ii, jj, tid, max_threads;
+#ifdef _OPENMP
+  max_threads= ( nthreads > 0 ) ? nthreads : omp_get_max_threads();
+  max_threads= ( npts < max_threads ) ? npts : max_threads;
+  max_threads= ( max_threads < 1 ) ? 1 : max_threads;
+#else
+  max_threads= 1;
+#endif
+  // Each thread gets its own copy of the potential arguments, because some
+  // potentials cache intermediate results in their arguments
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( max_threads * npot * sizeof (struct potentialArg) );
+  for (jj=0; jj < max_threads; jj++)
+    parse_leapFuncArgs_Full(npot,potentialArgs+jj*npot,pot_type,pot_args);
+  //Run through the points and evaluate
+#pragma omp parallel for schedule(static) private(ii,jj,tid)	\
+  num_threads(max_threads)
+  for (ii=0; ii < npts; ii++){
+#ifdef _OPENMP
+    tid= omp_get_thread_num();
+#else
+    tid = 0;
+#endif
+    for (jj=0; jj < nquant; jj++)
+      *(out+jj*npts+ii)= evaluate_quantity(*(quant+jj),*(R+ii),*(z+ii),
+					   *(phi+ii),*(t+ii),npot,
+					   potentialArgs+tid*npot);
+  }
+  for (jj=0; jj < max_threads; jj++)
+    free_potentialArgs(npot,potentialArgs+jj*npot);
+  free(potentialArgs);
+}
+static double evaluate_quantity(int quant,double R,double z,double phi,
+				double t,int npot,
+				struct potentialArg * potentialArgs){
+  int ii;
+  double out= 0.;
+  switch ( quant ) {
+  case 0: //potential
+    for (ii=0; ii < npot; ii++)
+      out+= (potentialArgs+ii)->potentialEval(R,z,phi,t,potentialArgs+ii);
+    break;
+  case 1: //Rforce
+    out= calcRforce(R,z,phi,t,npot,potentialArgs);
+    break;
+  case 2: //zforce
+    out= calczforce(R,z,phi,t,npot,potentialArgs);
+    break;
+  case 3: //phiforce
+    out= calcPhiforce(R,z,phi,t,npot,potentialArgs);
+    break;
+  case 9: //dens
+    for (ii=0; ii < npot; ii++)
+      out+= (potentialArgs+ii)->dens(R,z,phi,t,potentialArgs+ii);
+    break;
+  default: //second derivatives
+    for (ii=0; ii < npot; ii++)
+      out+= evaluate_second_derivative(quant,R,z,phi,t,potentialArgs+ii);
+    break;
+  }
+  return out;
+}
+/*
+  Second derivative of a single potential: analytic if the potential
+  implements it, otherwise a central finite difference of its forces, with a
+  step that is relative to the spherical radius
+*/
+static double evaluate_second_derivative(int quant,double R,double z,
+					 double phi,double t,
+					 struct potentialArg * potentialArgs){
+  double (*deriv)(double,double,double,double,struct potentialArg *);
+  double (*force)(double,double,double,double,struct potentialArg *);
+  double r= sqrt(R*R+z*z);
+  double h= DERIV_FD_EPS * ( ( r > 0. ) ? r : 1. );
+  double dR= 0., dz= 0., dphi= 0.;
+  switch ( quant ) {
+  case 4: //R2deriv
+    deriv= potentialArgs->R2deriv;
+    force= potentialArgs->Rforce;
+    dR= h;
+    break;
+  case 5: //z2deriv
+    deriv= potentialArgs->z2deriv;
+    force= potentialArgs->zforce;
+    dz= h;
+    break;
+  case 6: //Rzderiv
+    deriv= potentialArgs->Rzderiv;
+    force= potentialArgs->Rforce;
+    dz= h;
+    break;
+  case 7: //phi2deriv
+    deriv= potentialArgs->phi2deriv;
+    force= potentialArgs->phiforce;
+    dphi= h= DERIV_FD_EPS;
+    break;
+  case 8: //Rphideriv
+    deriv= potentialArgs->Rphideriv;
+    force= potentialArgs->Rforce;
+    dphi= h= DERIV_FD_EPS;
+    break;
+  case 10: //zphideriv
+    deriv= potentialArgs->zphideriv;
+    force= potentialArgs->zforce;
+    dphi= h= DERIV_FD_EPS;
+    break;
+  default:
+    return 0.;
+  }
+  if ( deriv )
+    return deriv(R,z,phi,t,potentialArgs);
+  // Azimuthal derivatives of axisymmetric potentials vanish
+  if ( dphi != 0. && potentialArgs->phiforce == &ZeroForce )
+    return 0.;
+  return -0.5 * ( force(R+dR,z+dz,phi+dphi,t,potentialArgs)
+		  -force(R-dR,z-dz,phi-dphi,t,potentialArgs) ) / h;
+}
@@ -3,8 +3,8 @@ from __future__ import division, print_function
 import os, os.path
 import pickle
 import numpy as nu
-import galpy.util.bovy_plot as plot
-from galpy.util import config
+from galpy.util import config, LazyModule
+plot= LazyModule('galpy.util.bovy_plot')
 from galpy.potential_src.Potential import PotentialError
 from galpy.util.bovy_conversion import physical_conversion,\
     potential_physical_input
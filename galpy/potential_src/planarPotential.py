@@ -4,11 +4,12 @@ import os
 import pickle
 import numpy as nu
 from scipy import integrate
-import galpy.util.bovy_plot as plot
-from galpy.util import config
+from galpy.util import config, LazyModule
+plot= LazyModule('galpy.util.bovy_plot')
 from galpy.util.bovy_conversion import physical_conversion,\
     potential_physical_input, freq_in_Gyr
-from galpy.potential_src.Potential import Potential, PotentialError, lindbladR
+from galpy.potential_src.Potential import Potential, PotentialError, lindbladR, \
+    _is_parameter_attribute
 from galpy.potential_src.plotRotcurve import plotRotcurve
 from galpy.potential_src.plotEscapecurve import _INF, plotEscapecurve
 _APY_LOADED= True
@@ -44,6 +45,37 @@ class planarPotential(object):
             self._voSet= True
         return None
 
+    def __setattr__(self,name,value):
+        """
+        NAME:
+
+           __setattr__
+
+        PURPOSE:
+
+           set an attribute, bumping the version of the potential's parameters when a parameter is set (such that the arguments for the C code cached on the potential are re-computed when the amplitude or another parameter changes); attributes that cache intermediate results of force evaluations (_cached_*, _force_hash) do not count as parameters
+
+        INPUT:
+
+           name - attribute name
+
+           value - attribute value
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-16 - Written
+
+        """
+        if _is_parameter_attribute(name):
+            self.__dict__['_c_args_version']= \
+                self.__dict__.get('_c_args_version',0)+1
+        object.__setattr__(self,name,value)
+        return None
+
     def turn_physical_off(self):
         """
         NAME:
@@ -724,7 +756,7 @@ def RZToplanarPotential(RZPot):
                 out.append(pot)
             else:
                 out.append(planarPotentialFromRZPotential(pot))
-        return out
+        return _same_list_type(RZPot,out)
     elif isinstance(RZPot,Potential):
         return planarPotentialFromRZPotential(RZPot)
     elif isinstance(RZPot,planarPotential):
@@ -906,7 +938,7 @@ def toPlanarPotential(Pot):
                 out.append(planarPotentialFromFullPotential(pot))
             else:
                 out.append(planarPotentialFromRZPotential(pot))
-        return out
+        return _same_list_type(Pot,out)
     elif isinstance(Pot,Potential) and Pot.isNonAxi:
         return planarPotentialFromFullPotential(Pot)
     elif isinstance(Pot,Potential):
@@ -916,6 +948,14 @@ def toPlanarPotential(Pot):
     else:
         raise PotentialError("Input to 'toPlanarPotential' is neither an Potential-instance or a list of such instances")
 
+def _same_list_type(Pot,out):
+    """Return the list of converted potentials out as a CompositePotential if
+    the input list Pot is one"""
+    from galpy.potential_src.CompositePotential import CompositePotential
+    if isinstance(Pot,CompositePotential):
+        return CompositePotential(out)
+    return out
+
 @potential_physical_input
 @physical_conversion('energy',pop=True)
 def evaluateplanarPotentials(Pot,R,phi=None,t=0.,dR=0,dphi=0):
@@ -3,7 +3,8 @@ from __future__ import division, print_function
 import os
 import pickle
 import numpy as nu
-import galpy.util.bovy_plot as plot
+from galpy.util import LazyModule
+plot= LazyModule('galpy.util.bovy_plot')
 from galpy.util.bovy_conversion import physical_conversion,\
     potential_physical_input
 _APY_LOADED= True
@@ -0,0 +1,101 @@
+#include <math.h>
+#include <galpy_potentials.h>
+//DehnenSmoothWrapperPotential: multiplies the wrapped potentials by
+//Dehnen's smooth growth function
+//3 arguments: amp, tform, tsteady
+static double dehnenSmoothWrapper(double t,double tform, double tsteady){
+  double smooth, xi,deltat;
+  if ( t < tform )
+    smooth= 0.;
+  else if ( t < tsteady ) {
+    deltat= t-tform;
+    xi= 2.*deltat/(tsteady-tform)-1.;
+    smooth= (3./16.*pow(xi,5.)-5./8.*pow(xi,3.)+15./16.*xi+.5);
+  }
+  else
+    smooth= 1.;
+  return smooth;
+}
+double DehnenSmoothWrapperPotentialEval(double R,double z,double phi,
+					double t,
+					struct potentialArg * potentialArgs){
+  int ii;
+  double * args= potentialArgs->args;
+  struct potentialArg * wrappedPotentialArg= potentialArgs->wrappedPotentialArg;
+  double pot= 0.;
+  //Get args
+  double amp= *args++;
+  double tform= *args++;
+  double tsteady= *args;
+  //Calculate potential
+  for (ii=0; ii < potentialArgs->nwrapped; ii++){
+    pot+= wrappedPotentialArg->potentialEval(R,z,phi,t,wrappedPotentialArg);
+    wrappedPotentialArg++;
+  }
+  return amp * dehnenSmoothWrapper(t,tform,tsteady) * pot;
+}
+double DehnenSmoothWrapperPotentialRforce(double R,double z,double phi,
+					  double t,
+					  struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double tform= *args++;
+  double tsteady= *args;
+  //Calculate Rforce
+  return amp * dehnenSmoothWrapper(t,tform,tsteady)
+    * calcRforce(R,z,phi,t,potentialArgs->nwrapped,
+		 potentialArgs->wrappedPotentialArg);
+}
+double DehnenSmoothWrapperPotentialzforce(double R,double z,double phi,
+					  double t,
+					  struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double tform= *args++;
+  double tsteady= *args;
+  //Calculate zforce
+  return amp * dehnenSmoothWrapper(t,tform,tsteady)
+    * calczforce(R,z,phi,t,potentialArgs->nwrapped,
+		 potentialArgs->wrappedPotentialArg);
+}
+double DehnenSmoothWrapperPotentialphiforce(double R,double z,double phi,
+					    double t,
+					    struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double tform= *args++;
+  double tsteady= *args;
+  //Calculate phiforce
+  return amp * dehnenSmoothWrapper(t,tform,tsteady)
+    * calcPhiforce(R,z,phi,t,potentialArgs->nwrapped,
+		   potentialArgs->wrappedPotentialArg);
+}
+double DehnenSmoothWrapperPotentialPlanarRforce(double R,double phi,
+						double t,
+						struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double tform= *args++;
+  double tsteady= *args;
+  //Calculate Rforce
+  return amp * dehnenSmoothWrapper(t,tform,tsteady)
+    * calcPlanarRforce(R,phi,t,potentialArgs->nwrapped,
+		       potentialArgs->wrappedPotentialArg);
+}
+double DehnenSmoothWrapperPotentialPlanarphiforce(double R,double phi,
+						  double t,
+						  struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double tform= *args++;
+  double tsteady= *args;
+  //Calculate phiforce
+  return amp * dehnenSmoothWrapper(t,tform,tsteady)
+    * calcPlanarphiforce(R,phi,t,potentialArgs->nwrapped,
+			 potentialArgs->wrappedPotentialArg);
+}
@@ -0,0 +1,179 @@
+#include <math.h>
+#include <galpy_potentials.h>
+//FerrersPotential
+//Integrals from lambda to infinity are computed with Gauss-Legendre
+//quadrature after substituting tau= (lambda+a2)/s^2-a2, 0 < s <= 1
+inline double FerrersPotential_lowerlim(double x, double y, double z,
+					double a2, double b2, double c2){
+  // Positive root of x^2/(a2+tau)+y^2/(b2+tau)+z^2/(c2+tau) = 1, if the
+  // point is outside of the ellipsoid (zero otherwise); the LHS is convex
+  // and decreasing, so Newton's method started at zero converges
+  // monotonically
+  double x2= x * x;
+  double y2= y * y;
+  double z2= z * z;
+  double tau= 0.;
+  double f, fp, dtau;
+  int ii;
+  if ( x2 / a2 + y2 / b2 + z2 / c2 <= 1. )
+    return 0.;
+  for (ii=0; ii < 100; ii++) {
+    f= x2 / ( a2 + tau ) + y2 / ( b2 + tau ) + z2 / ( c2 + tau ) - 1.;
+    fp= x2 / ( a2 + tau ) / ( a2 + tau ) + y2 / ( b2 + tau ) / ( b2 + tau ) \
+      + z2 / ( c2 + tau ) / ( c2 + tau );
+    dtau= f / fp;
+    tau+= dtau;
+    if ( dtau <= 1e-15 * tau )
+      break;
+  }
+  return tau;
+}
+inline double FerrersPotential_B(double x, double y, double z,
+				 double a2, double b2, double c2, double tau){
+  double B= 1. - x * x / ( a2 + tau ) - y * y / ( b2 + tau )	\
+    - z * z / ( c2 + tau );
+  return B > 0. ? B : 0.;
+}
+double FerrersPotentialEval(double R,double z, double phi,
+			    double t,
+			    struct potentialArg * potentialArgs){
+  int ii;
+  double * args= potentialArgs->args;
+  //Get args: amp, a2, b2, c2, n, pa, omegab, glorder, glx, glw
+  double amp= *args++;
+  double a2= *args++;
+  double b2= *args++;
+  double c2= *args++;
+  double n= *args++;
+  double pa= *args++;
+  double omegab= *args++;
+  int glorder= (int) *args++;
+  double * glx= args;
+  double * glw= args + glorder;
+  //Calculate potential
+  double x, y;
+  double lambda, s, tau;
+  double out= 0.;
+  cyl_to_rect(R,phi-pa-omegab*t,&x,&y);
+  lambda= FerrersPotential_lowerlim(x,y,z,a2,b2,c2);
+  for (ii=0; ii < glorder; ii++) {
+    s= *(glx+ii);
+    tau= ( lambda + a2 ) / s / s - a2;
+    out+= *(glw+ii) * 2. * ( lambda + a2 ) / s / s / s			\
+      * pow(FerrersPotential_B(x,y,z,a2,b2,c2,tau),n+1.)		\
+      / sqrt ( ( a2 + tau ) * ( b2 + tau ) * ( c2 + tau ) );
+  }
+  return -amp * out / ( n + 1. );
+}
+void FerrersPotentialxyzforces_xyz(double R,double z, double phi,
+				   double t,double * args,
+				   double a2,double b2, double c2,
+				   double n,double pa, double omegab,
+				   int glorder, double * glx, double * glw){
+  int ii;
+  double x,y;
+  double lambda, s, tau, td;
+  double Fx, Fy, Fz;
+  double cp, sp;
+  if ( R != *args || z != *(args + 1) || phi != *(args + 2) \
+       || t != *(args + 3) ){
+    // Set up cache
+    *args= R;
+    *(args + 1)= z;
+    *(args + 2)= phi;
+    *(args + 3)= t;
+    // Compute forces in rectangular, aligned frame
+    cyl_to_rect(R,phi-pa-omegab*t,&x,&y);
+    lambda= FerrersPotential_lowerlim(x,y,z,a2,b2,c2);
+    Fx= 0.;
+    Fy= 0.;
+    Fz= 0.;
+    for (ii=0; ii < glorder; ii++) {
+      s= *(glx+ii);
+      tau= ( lambda + a2 ) / s / s - a2;
+      td= *(glw+ii) * 2. * ( lambda + a2 ) / s / s / s			\
+	* pow(FerrersPotential_B(x,y,z,a2,b2,c2,tau),n)			\
+	/ sqrt ( ( a2 + tau ) * ( b2 + tau ) * ( c2 + tau ) );
+      Fx+= td * x / ( a2 + tau );
+      Fy+= td * y / ( b2 + tau );
+      Fz+= td * z / ( c2 + tau );
+    }
+    cp= cos ( pa + omegab * t );
+    sp= sin ( pa + omegab * t );
+    // Rotate to rectangular, correct frame
+    *(args + 4)= -2. * ( cp * Fx - sp * Fy );
+    *(args + 5)= -2. * ( sp * Fx + cp * Fy );
+    *(args + 6)= -2. * Fz;
+  }
+}
+double FerrersPotentialRforce(double R,double z, double phi,
+			      double t,
+			      struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args: amp, a2, b2, c2, n, pa, omegab, glorder, glx, glw
+  double amp= *args++;
+  double a2= *args++;
+  double b2= *args++;
+  double c2= *args++;
+  double n= *args++;
+  double pa= *args++;
+  double omegab= *args++;
+  int glorder= (int) *args++;
+  double * glx= args;
+  double * glw= args + glorder;
+  args+= 2 * glorder;
+  //Calculate force
+  FerrersPotentialxyzforces_xyz(R,z,phi,t,args,a2,b2,c2,n,pa,omegab,
+				glorder,glx,glw);
+  return amp * ( cos ( phi ) * *(args + 4) + sin( phi ) * *(args + 5) );
+}
+double FerrersPotentialPlanarRforce(double R,double phi,double t,
+				    struct potentialArg * potentialArgs){
+  return FerrersPotentialRforce(R,0.,phi,t,potentialArgs);
+}
+double FerrersPotentialphiforce(double R,double z, double phi,
+				double t,
+				struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args: amp, a2, b2, c2, n, pa, omegab, glorder, glx, glw
+  double amp= *args++;
+  double a2= *args++;
+  double b2= *args++;
+  double c2= *args++;
+  double n= *args++;
+  double pa= *args++;
+  double omegab= *args++;
+  int glorder= (int) *args++;
+  double * glx= args;
+  double * glw= args + glorder;
+  args+= 2 * glorder;
+  //Calculate force
+  FerrersPotentialxyzforces_xyz(R,z,phi,t,args,a2,b2,c2,n,pa,omegab,
+				glorder,glx,glw);
+  return amp * R * ( -sin ( phi ) * *(args + 4) + cos( phi ) * *(args + 5) );
+}
+double FerrersPotentialPlanarphiforce(double R,double phi,double t,
+				      struct potentialArg * potentialArgs){
+  return FerrersPotentialphiforce(R,0.,phi,t,potentialArgs);
+}
+double FerrersPotentialzforce(double R,double z, double phi,
+			      double t,
+			      struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args: amp, a2, b2, c2, n, pa, omegab, glorder, glx, glw
+  double amp= *args++;
+  double a2= *args++;
+  double b2= *args++;
+  double c2= *args++;
+  double n= *args++;
+  double pa= *args++;
+  double omegab= *args++;
+  int glorder= (int) *args++;
+  double * glx= args;
+  double * glw= args + glorder;
+  args+= 2 * glorder;
+  //Calculate force
+  FerrersPotentialxyzforces_xyz(R,z,phi,t,args,a2,b2,c2,n,pa,omegab,
+				glorder,glx,glw);
+  return amp * *(args + 6);
+}
@@ -55,6 +55,39 @@ double KuzminDiskPotentialPlanarR2deriv(double R,double phi,
   double a= *args;
   //calculate R2deriv
   double denom=R*R+a*a;
-  return amp * (-pow(denom,-1.5) + 3*R*R*pow(denom, -2.5));
+  return amp * (pow(denom,-1.5) - 3.*R*R*pow(denom, -2.5));
+}
+double KuzminDiskPotentialR2deriv(double R,double z,double phi,
+				  double t,
+				  struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double a= *args;
+  //calculate R2deriv
+  double denom= R*R+pow(a+fabs(z),2.);
+  return amp * (pow(denom,-1.5) - 3.*R*R*pow(denom, -2.5));
+}
+double KuzminDiskPotentialz2deriv(double R,double z,double phi,
+				  double t,
+				  struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double a= *args;
+  //calculate z2deriv
+  double denom= R*R+pow(a+fabs(z),2.);
+  return amp * (pow(denom,-1.5) - 3.*pow(a+fabs(z),2.)*pow(denom, -2.5));
+}
+double KuzminDiskPotentialRzderiv(double R,double z,double phi,
+				  double t,
+				  struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double a= *args;
+  //calculate Rzderiv
+  double zsign= (z > 0 ) - (z < 0); //Gets the sign of z
+  return -3. * zsign * amp * R * (a + fabs(z))
+    * pow(R*R+pow(a+fabs(z),2.),-2.5);
 }
-
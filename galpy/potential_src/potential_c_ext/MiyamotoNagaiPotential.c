@@ -64,3 +64,45 @@ double MiyamotoNagaiPotentialPlanarR2deriv(double R,double phi,
   return amp * (pow(denom,-1.5) - 3. * R * R * pow(denom,-2.5));
 }
 
+double MiyamotoNagaiPotentialR2deriv(double R,double z,double phi,
+				     double t,
+				     struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double a= *args++;
+  double b= *args;
+  //calculate R2deriv
+  double denom= R*R+pow(a+pow(z*z+b*b,0.5),2.);
+  return amp * (pow(denom,-1.5) - 3. * R * R * pow(denom,-2.5));
+}
+double MiyamotoNagaiPotentialz2deriv(double R,double z,double phi,
+				     double t,
+				     struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double a= *args++;
+  double b= *args;
+  //calculate z2deriv
+  double sqrtbz= pow(b*b+z*z,.5);
+  double asqrtbz= a+sqrtbz;
+  double denom= R*R+asqrtbz*asqrtbz;
+  return amp * pow(denom,-1.5) * ( asqrtbz * b * b / pow(sqrtbz,3.)
+				   + z * z / sqrtbz / sqrtbz
+				   * ( 1. - 3. * asqrtbz * asqrtbz / denom ) );
+}
+double MiyamotoNagaiPotentialRzderiv(double R,double z,double phi,
+				     double t,
+				     struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double a= *args++;
+  double b= *args;
+  //calculate Rzderiv
+  double sqrtbz= pow(b*b+z*z,.5);
+  double asqrtbz= a+sqrtbz;
+  return - 3. * amp * R * z * asqrtbz / sqrtbz
+    * pow(R*R+asqrtbz*asqrtbz,-2.5);
+}
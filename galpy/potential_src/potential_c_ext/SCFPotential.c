@@ -170,6 +170,25 @@ inline void compute_phiTilde(double r, double a, int N, int L, double* C, double
 
 }
 
+//Compute rho_Tilde, without the factor 1/sqrt(pi)
+inline void compute_rhoTilde(double r, double a, int N, int L, double* C, double * rhoTilde)
+{
+    double rterms = a/(r*power(a + r, 3));
+    int n,l;
+    for (l = 0; l < L; l++)
+    {
+        if (l != 0)
+            rterms *= r*a/((a + r)*(a + r));
+
+        for (n = 0; n < N; n++)
+        {
+            double K = 0.5*n*(n + 4*l + 3) + (l + 1.)*(2*l + 1);
+            *(rhoTilde + l*N + n)  = K*rterms*(*(C + n + l*N));
+        }
+    }
+
+}
+
 //Computes the derivative of phiTilde with respect to r
 inline void compute_dphiTilde(double r, double a, int N, int L, double * C, double * dC, double * dphiTilde)
 {
@@ -696,6 +715,74 @@ double SCFPotentialEval(double R,double Z, double phi,
     return potential;
 }
 
+//Compute the density
+double SCFPotentialDens(double R,double Z, double phi,
+                        double t,
+                        struct potentialArg * potentialArgs)
+{
+    double * args= potentialArgs->args;
+    //Get args
+    double a = *args++;
+    int isNonAxi = (int)*args++;
+    int N = *args++;
+    int L = *args++;
+    int M = *args++;
+    double* Acos = args;
+    double* Asin;
+    if (isNonAxi==1)
+    {
+        Asin = args + N*L*M;
+    }
+    //convert R,Z to r, theta
+    double r;
+    double theta;
+    cyl_to_spher(R, Z,&r, &theta);
+    double xi;
+    calculateXi(r, a, &xi);
+
+    //Compute the gegenbauer polynomials
+    double C[N*L];
+    compute_C(xi, N, L, &C);
+
+    //Compute rhoTilde
+    double rhoTilde[L*N];
+    compute_rhoTilde(r, a, N, L, &C, &rhoTilde);
+
+    //Compute Associated Legendre Polynomials
+    int M_eff = M;
+    int size = 0;
+    if (isNonAxi==0)
+    {
+    M_eff = 1;
+    size = L;
+    } else{
+    size = L*L - L*(L-1)/2;
+    }
+    double P[size];
+    compute_P(cos(theta), L,M_eff, &P);
+
+    double density;
+    double (*RhoTilde_Pointer[1]) = {&rhoTilde};
+    double (*P_Pointer[1]) = {&P};
+    // 1/sqrt(pi) of rhoTilde, divided by the sqrt(4 pi) applied by compute
+    double Constant[1] = {1./(2.*M_PI)};
+
+    if (isNonAxi==1)
+    {
+        double (*Eq[1])(double, double, double, double, double, double, int) = {&computePhi};
+        equations e = {Eq,&RhoTilde_Pointer, &P_Pointer, &Constant};
+        computeNonAxi(a, N, L, M,r, theta, phi, Acos, Asin, 1, e, &density);
+    }
+    else
+    {
+        double (*Eq[1])(double, double, double) = {&computeAxiPhi};
+        axi_equations e = {Eq,&RhoTilde_Pointer, &P_Pointer, &Constant};
+        compute(a, N, L, M,r, theta, phi, Acos, 1, e, &density);
+    }
+
+    return density;
+}
+
 //Compute the force in the R direction
 double SCFPotentialRforce(double R,double Z, double phi,
                           double t,
@@ -1,5 +1,7 @@
 #include <stdbool.h>
 #include <math.h>
+#include <gsl/gsl_sf_gamma.h>
+#include <gsl/gsl_sf_hyperg.h>
 #include <galpy_potentials.h>
 //General routines for TwoPowerTriaxialPotentials, specific potentials below
 //TriaxialNFWPotential
@@ -28,10 +30,8 @@ inline double dens(double m, double alpha, double beta){
     return 1. / m / ( 1. + m ) / ( 1. + m ) / ( 1. + m );
   else if ( alpha == 2 && beta == 4) // Jaffe case
     return 1. / m / m / ( 1. + m ) / ( 1. + m );
-  else // not currently used
-    //LCOV_EXCL_START
+  else
     return pow ( m, -alpha) * pow ( 1. + m , alpha - beta);
-    //LCOV_EXCL_STOP
 }
 void TwoPowerTriaxialPotentialxyzforces_xyz(double x,double y, double z,
 					    double * Fx, double * Fy, 
@@ -65,7 +65,7 @@ void TwoPowerTriaxialPotentialxyzforces_xyz(double x,double y, double z,
   *(args + 4)= *Fy;
   *(args + 5)= *Fz;
 }
-double TwoPowerTriaxialPotentialRforce(double R,double z, double phi,
+double TwoPowerTriaxialPotentialRforce_ab(double R,double z, double phi,
 				       double t,
 				       double alpha, double beta,
 				       struct potentialArg * potentialArgs){
@@ -104,7 +104,7 @@ double TwoPowerTriaxialPotentialRforce(double R,double z, double phi,
     rotate_force(&Fx,&Fy,&Fz,rot);
   return amp * ( cos ( phi ) * Fx + sin( phi ) * Fy );
 }
-double TwoPowerTriaxialPotentialphiforce(double R,double z, double phi,
+double TwoPowerTriaxialPotentialphiforce_ab(double R,double z, double phi,
 					 double t,
 					 double alpha, double beta,
 					 struct potentialArg * potentialArgs){
@@ -143,7 +143,7 @@ double TwoPowerTriaxialPotentialphiforce(double R,double z, double phi,
     rotate_force(&Fx,&Fy,&Fz,rot);
   return amp * R * ( -sin ( phi ) * Fx + cos( phi ) * Fy );
 }
-double TwoPowerTriaxialPotentialzforce(double R,double z, double phi,
+double TwoPowerTriaxialPotentialzforce_ab(double R,double z, double phi,
 				       double t,
 				       double alpha, double beta,
 				       struct potentialArg * potentialArgs){
@@ -185,73 +185,113 @@ double TwoPowerTriaxialPotentialzforce(double R,double z, double phi,
 double TriaxialNFWPotentialRforce(double R,double z, double phi,
 				  double t,
 				  struct potentialArg * potentialArgs){
-  return TwoPowerTriaxialPotentialRforce(R,z,phi,t,1,3,potentialArgs);
+  return TwoPowerTriaxialPotentialRforce_ab(R,z,phi,t,1,3,potentialArgs);
 }
 double TriaxialNFWPotentialPlanarRforce(double R,double phi,double t,
 					struct potentialArg * potentialArgs){
-  return TwoPowerTriaxialPotentialRforce(R,0.,phi,t,1,3,potentialArgs);
+  return TwoPowerTriaxialPotentialRforce_ab(R,0.,phi,t,1,3,potentialArgs);
 }
 double TriaxialNFWPotentialphiforce(double R,double z, double phi,
 				    double t,
 				    struct potentialArg * potentialArgs){
-  return TwoPowerTriaxialPotentialphiforce(R,z,phi,t,1,3,potentialArgs);
+  return TwoPowerTriaxialPotentialphiforce_ab(R,z,phi,t,1,3,potentialArgs);
 }
 double TriaxialNFWPotentialPlanarphiforce(double R,double phi,double t,
 					  struct potentialArg * potentialArgs){
-  return TwoPowerTriaxialPotentialphiforce(R,0.,phi,t,1,3,potentialArgs);
+  return TwoPowerTriaxialPotentialphiforce_ab(R,0.,phi,t,1,3,potentialArgs);
 }
 double TriaxialNFWPotentialzforce(double R,double z, double phi,
 				  double t,
 				  struct potentialArg * potentialArgs){
-  return TwoPowerTriaxialPotentialzforce(R,z,phi,t,1,3,potentialArgs);
+  return TwoPowerTriaxialPotentialzforce_ab(R,z,phi,t,1,3,potentialArgs);
 }
 //Hernquist
 double TriaxialHernquistPotentialRforce(double R,double z, double phi,
 				  double t,
 				  struct potentialArg * potentialArgs){
-  return TwoPowerTriaxialPotentialRforce(R,z,phi,t,1,4,potentialArgs);
+  return TwoPowerTriaxialPotentialRforce_ab(R,z,phi,t,1,4,potentialArgs);
 }
 double TriaxialHernquistPotentialPlanarRforce(double R,double phi,double t,
 					struct potentialArg * potentialArgs){
-  return TwoPowerTriaxialPotentialRforce(R,0.,phi,t,1,4,potentialArgs);
+  return TwoPowerTriaxialPotentialRforce_ab(R,0.,phi,t,1,4,potentialArgs);
 }
 double TriaxialHernquistPotentialphiforce(double R,double z, double phi,
 				    double t,
 				    struct potentialArg * potentialArgs){
-  return TwoPowerTriaxialPotentialphiforce(R,z,phi,t,1,4,potentialArgs);
+  return TwoPowerTriaxialPotentialphiforce_ab(R,z,phi,t,1,4,potentialArgs);
 }
 double TriaxialHernquistPotentialPlanarphiforce(double R,double phi,double t,
 					  struct potentialArg * potentialArgs){
-  return TwoPowerTriaxialPotentialphiforce(R,0.,phi,t,1,4,potentialArgs);
+  return TwoPowerTriaxialPotentialphiforce_ab(R,0.,phi,t,1,4,potentialArgs);
 }
 double TriaxialHernquistPotentialzforce(double R,double z, double phi,
 				  double t,
 				  struct potentialArg * potentialArgs){
-  return TwoPowerTriaxialPotentialzforce(R,z,phi,t,1,4,potentialArgs);
+  return TwoPowerTriaxialPotentialzforce_ab(R,z,phi,t,1,4,potentialArgs);
 }
 //Jaffe
 double TriaxialJaffePotentialRforce(double R,double z, double phi,
 				  double t,
 				  struct potentialArg * potentialArgs){
-  return TwoPowerTriaxialPotentialRforce(R,z,phi,t,2,4,potentialArgs);
+  return TwoPowerTriaxialPotentialRforce_ab(R,z,phi,t,2,4,potentialArgs);
 }
 double TriaxialJaffePotentialPlanarRforce(double R,double phi,double t,
 					struct potentialArg * potentialArgs){
-  return TwoPowerTriaxialPotentialRforce(R,0.,phi,t,2,4,potentialArgs);
+  return TwoPowerTriaxialPotentialRforce_ab(R,0.,phi,t,2,4,potentialArgs);
 }
 double TriaxialJaffePotentialphiforce(double R,double z, double phi,
 				    double t,
 				    struct potentialArg * potentialArgs){
-  return TwoPowerTriaxialPotentialphiforce(R,z,phi,t,2,4,potentialArgs);
+  return TwoPowerTriaxialPotentialphiforce_ab(R,z,phi,t,2,4,potentialArgs);
 }
 double TriaxialJaffePotentialPlanarphiforce(double R,double phi,double t,
 					  struct potentialArg * potentialArgs){
-  return TwoPowerTriaxialPotentialphiforce(R,0.,phi,t,2,4,potentialArgs);
+  return TwoPowerTriaxialPotentialphiforce_ab(R,0.,phi,t,2,4,potentialArgs);
 }
 double TriaxialJaffePotentialzforce(double R,double z, double phi,
 				  double t,
 				  struct potentialArg * potentialArgs){
-  return TwoPowerTriaxialPotentialzforce(R,z,phi,t,2,4,potentialArgs);
+  return TwoPowerTriaxialPotentialzforce_ab(R,z,phi,t,2,4,potentialArgs);
+}
+//General alpha and beta, which are stored after the caching slots
+inline void TwoPowerTriaxialPotential_alphabeta(double * alpha, double * beta,
+						struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  int glorder= (int) *(args + 14);
+  *alpha= *(args + 21 + 2 * glorder);
+  *beta= *(args + 22 + 2 * glorder);
+}
+double TwoPowerTriaxialPotentialRforce(double R,double z, double phi,
+				       double t,
+				       struct potentialArg * potentialArgs){
+  double alpha, beta;
+  TwoPowerTriaxialPotential_alphabeta(&alpha,&beta,potentialArgs);
+  return TwoPowerTriaxialPotentialRforce_ab(R,z,phi,t,alpha,beta,
+					    potentialArgs);
+}
+double TwoPowerTriaxialPotentialPlanarRforce(double R,double phi,double t,
+					     struct potentialArg * potentialArgs){
+  return TwoPowerTriaxialPotentialRforce(R,0.,phi,t,potentialArgs);
+}
+double TwoPowerTriaxialPotentialphiforce(double R,double z, double phi,
+					 double t,
+					 struct potentialArg * potentialArgs){
+  double alpha, beta;
+  TwoPowerTriaxialPotential_alphabeta(&alpha,&beta,potentialArgs);
+  return TwoPowerTriaxialPotentialphiforce_ab(R,z,phi,t,alpha,beta,
+					      potentialArgs);
+}
+double TwoPowerTriaxialPotentialPlanarphiforce(double R,double phi,double t,
+					       struct potentialArg * potentialArgs){
+  return TwoPowerTriaxialPotentialphiforce(R,0.,phi,t,potentialArgs);
+}
+double TwoPowerTriaxialPotentialzforce(double R,double z, double phi,
+				       double t,
+				       struct potentialArg * potentialArgs){
+  double alpha, beta;
+  TwoPowerTriaxialPotential_alphabeta(&alpha,&beta,potentialArgs);
+  return TwoPowerTriaxialPotentialzforce_ab(R,z,phi,t,alpha,beta,
+					    potentialArgs);
 }
 // Implement the potentials separately
 //NFW
@@ -378,3 +418,51 @@ double TriaxialJaffePotentialEval(double R,double z, double phi,
   return amp * out;
 }
 
+//General alpha and beta (alpha != 2)
+inline double TwoPowerTriaxialPotential_psi(double x,double alpha,double beta){
+  // int_x^infty dens(m) m dm
+  if ( alpha < 2. )
+    return gsl_sf_beta(2.-alpha,beta-2.)				\
+      * gsl_sf_beta_inc(beta-2.,2.-alpha,1. / ( 1. + x ) );
+  else
+    return gsl_sf_gamma(beta-2.) * gsl_sf_gamma(2.-alpha)		\
+      / gsl_sf_gamma(beta-alpha)					\
+      - pow(x,2.-alpha) / ( 2. - alpha ) * pow(1.+x,alpha-beta)		\
+      * gsl_sf_hyperg_2F1(1.,beta-alpha,3.-alpha,x / ( 1. + x ) );
+}
+double TwoPowerTriaxialPotentialEval(double R,double z, double phi,
+				     double t,
+				     struct potentialArg * potentialArgs){
+  int ii;
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args++;
+  double a= *args++;
+  double b2= *args++;
+  double c2= *args++;
+  bool aligned= (bool) *args++;
+  double * rot= args;
+  args+= 9;
+  int glorder= (int) *args++;
+  double * glx= args;
+  double * glw= args + glorder;
+  double alpha= *(args + 2 * glorder + 6);
+  double beta= *(args + 2 * glorder + 7);
+  //Calculate potential
+  double x, y;
+  double s, tau;
+  double out= 0.;
+  cyl_to_rect(R,phi,&x,&y);
+  if ( !aligned ) 
+    rotate(&x,&y,&z,rot);
+  for (ii=0; ii < glorder; ii++){
+    s= *(glx+ii);
+    tau= 1. / s / s - 1.;
+    out+= *(glw+ii) * a * a						\
+      * TwoPowerTriaxialPotential_psi( sqrt ( x * x / ( 1. + tau )	\
+					      + y * y / ( b2 + tau )	\
+					      + z * z / ( c2 + tau ) ) / a,
+				       alpha,beta);
+  }
+  return amp * out;
+}
@@ -1,8 +1,33 @@
+#include <math.h>
 #include <galpy_potentials.h>
+#include <stdlib.h>
 void cyl_to_rect(double R, double phi,double *x, double *y){
   *x= R * cos ( phi );
   *y= R * sin ( phi );
 }
+void free_potentialArgs(int npot, struct potentialArg * potentialArgs){
+  int ii;
+  for (ii=0; ii < npot; ii++) {
+    if ( (potentialArgs+ii)->i2drforce )
+      interp_2d_free((potentialArgs+ii)->i2drforce) ;
+    if ( (potentialArgs+ii)->accxrforce )
+      gsl_interp_accel_free ((potentialArgs+ii)->accxrforce);
+    if ( (potentialArgs+ii)->accyrforce )
+      gsl_interp_accel_free ((potentialArgs+ii)->accyrforce);
+    if ( (potentialArgs+ii)->i2dzforce )
+      interp_2d_free((potentialArgs+ii)->i2dzforce) ;
+    if ( (potentialArgs+ii)->accxzforce )
+      gsl_interp_accel_free ((potentialArgs+ii)->accxzforce);
+    if ( (potentialArgs+ii)->accyzforce )
+      gsl_interp_accel_free ((potentialArgs+ii)->accyzforce);
+    if ( (potentialArgs+ii)->wrappedPotentialArg ) {
+      free_potentialArgs((potentialArgs+ii)->nwrapped,
+			 (potentialArgs+ii)->wrappedPotentialArg);
+      free((potentialArgs+ii)->wrappedPotentialArg);
+    }
+    free((potentialArgs+ii)->args);
+  }
+}
 double evaluatePotentials(double R, double Z, 
 			  int nargs, struct potentialArg * potentialArgs){
   int ii;
@@ -152,3 +177,28 @@ double calcPlanarRphideriv(double R, double phi, double t,
   potentialArgs-= nargs;
   return Rphideriv;
 }
+/*
+  Second derivatives of spherical potentials, computed from the first and
+  second derivative with respect to the spherical radius r, which are given
+  by the planar force and second radial derivative evaluated at R=r
+*/
+double SphericalPotentialR2deriv(double R,double Z,double phi,double t,
+				 struct potentialArg * potentialArgs){
+  double r2= R*R+Z*Z;
+  double r= sqrt(r2);
+  double dPhidr= - potentialArgs->planarRforce(r,phi,t,potentialArgs);
+  double d2Phidr2= potentialArgs->planarR2deriv(r,phi,t,potentialArgs);
+  return ( d2Phidr2 * R * R + dPhidr * Z * Z / r ) / r2;
+}
+double SphericalPotentialz2deriv(double R,double Z,double phi,double t,
+				 struct potentialArg * potentialArgs){
+  return SphericalPotentialR2deriv(Z,R,phi,t,potentialArgs);
+}
+double SphericalPotentialRzderiv(double R,double Z,double phi,double t,
+				 struct potentialArg * potentialArgs){
+  double r2= R*R+Z*Z;
+  double r= sqrt(r2);
+  double dPhidr= - potentialArgs->planarRforce(r,phi,t,potentialArgs);
+  double d2Phidr2= potentialArgs->planarR2deriv(r,phi,t,potentialArgs);
+  return ( d2Phidr2 - dPhidr / r ) * R * Z / r2;
+}
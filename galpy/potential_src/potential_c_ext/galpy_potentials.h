@@ -8,6 +8,18 @@
 extern "C" {
 #endif
 #include <interp_2d.h>
+/*
+  Macro for dealing with potentially unused variables due to OpenMP
+ */
+/* If we're not using GNU C, elide __attribute__ if it doesn't exist*/
+#ifndef __has_attribute      // Compatibility with non-clang compilers. 
+#define __has_attribute(x) 0  
+#endif
+#if defined(__GNUC__) || __has_attribute(unused)
+#  define UNUSED __attribute__((unused))
+#else
+#  define UNUSED /*NOTHING*/
+#endif
 struct potentialArg{
   double (*potentialEval)(double R, double Z, double phi, double t,
 			  struct potentialArg *);
@@ -27,12 +39,20 @@ struct potentialArg{
 		      struct potentialArg *);
   double (*Rphideriv)(double R,double Z,double phi, double t,
 		      struct potentialArg *);
+  double (*z2deriv)(double R,double Z,double phi, double t,
+		    struct potentialArg *);
+  double (*Rzderiv)(double R,double Z,double phi, double t,
+		    struct potentialArg *);
+  double (*zphideriv)(double R,double Z,double phi, double t,
+		      struct potentialArg *);
   double (*planarR2deriv)(double R,double phi, double t,
 			  struct potentialArg *);
   double (*planarphi2deriv)(double R,double phi, double t,
 			    struct potentialArg *);
   double (*planarRphideriv)(double R,double phi, double t,
 			    struct potentialArg *);
+  double (*dens)(double R,double Z,double phi, double t,
+		 struct potentialArg *); // NULL if not implemented
   int nargs;
   double * args;
   interp_2d * i2d;
@@ -44,12 +64,15 @@ struct potentialArg{
   interp_2d * i2dzforce;
   gsl_interp_accel * accxzforce;
   gsl_interp_accel * accyzforce;
+  int nwrapped;
+  struct potentialArg * wrappedPotentialArg;
 };
 /*
   Function declarations
 */
 //Utility
 void cyl_to_rect(double,double,double *,double *);
+void free_potentialArgs(int,struct potentialArg *);
 //Potential and force evaluation
 double evaluatePotentials(double,double,int, struct potentialArg *);
 double calcRforce(double,double,double,double,int,struct potentialArg *);
@@ -72,6 +95,14 @@ double calcPlanarphi2deriv(double, double, double,
 			   int, struct potentialArg *);
 double calcPlanarRphideriv(double, double, double, 
 			   int, struct potentialArg *);
+//Second derivatives of spherical potentials, from their planarRforce and
+//planarR2deriv
+double SphericalPotentialR2deriv(double,double,double,double,
+				 struct potentialArg *);
+double SphericalPotentialz2deriv(double,double,double,double,
+				 struct potentialArg *);
+double SphericalPotentialRzderiv(double,double,double,double,
+				 struct potentialArg *);
 //ZeroForce
 double ZeroPlanarForce(double,double,double,
 		       struct potentialArg *);
@@ -88,6 +119,12 @@ double LogarithmicHaloPotentialzforce(double,double,double,double,
 				    struct potentialArg *);
 double LogarithmicHaloPotentialPlanarR2deriv(double ,double, double,
 				    struct potentialArg *);
+double LogarithmicHaloPotentialR2deriv(double,double,double,double,
+				    struct potentialArg *);
+double LogarithmicHaloPotentialz2deriv(double,double,double,double,
+				    struct potentialArg *);
+double LogarithmicHaloPotentialRzderiv(double,double,double,double,
+				    struct potentialArg *);
 //DehnenBarPotential
 double DehnenBarPotentialRforce(double,double,double,
 				struct potentialArg *);
@@ -133,6 +170,12 @@ double MiyamotoNagaiPotentialzforce(double,double,double,double,
 				    struct potentialArg *);
 double MiyamotoNagaiPotentialPlanarR2deriv(double ,double, double,
 					   struct potentialArg *);
+double MiyamotoNagaiPotentialR2deriv(double,double,double,double,
+				    struct potentialArg *);
+double MiyamotoNagaiPotentialz2deriv(double,double,double,double,
+				    struct potentialArg *);
+double MiyamotoNagaiPotentialRzderiv(double,double,double,double,
+				    struct potentialArg *);
 //LopsidedDiskPotential
 double LopsidedDiskPotentialRforce(double,double,double,
 					   struct potentialArg *);
@@ -208,6 +251,12 @@ double FlattenedPowerPotentialzforce(double,double,double,double,
 				     struct potentialArg *);
 double FlattenedPowerPotentialPlanarR2deriv(double,double,double,
 					    struct potentialArg *);
+double FlattenedPowerPotentialR2deriv(double,double,double,double,
+				     struct potentialArg *);
+double FlattenedPowerPotentialz2deriv(double,double,double,double,
+				     struct potentialArg *);
+double FlattenedPowerPotentialRzderiv(double,double,double,double,
+				     struct potentialArg *);
 //interpRZPotential
 double interpRZPotentialEval(double ,double , double, double,
 			     struct potentialArg *);
@@ -260,6 +309,12 @@ double KuzminDiskPotentialzforce(double,double,double,double,
 				        struct potentialArg *);
 double KuzminDiskPotentialPlanarR2deriv(double,double,double, 
 					    struct potentialArg *);
+double KuzminDiskPotentialR2deriv(double,double,double,double,
+				  struct potentialArg *);
+double KuzminDiskPotentialz2deriv(double,double,double,double,
+				  struct potentialArg *);
+double KuzminDiskPotentialRzderiv(double,double,double,double,
+				  struct potentialArg *);
 //PlummerPotential
 double PlummerPotentialEval(double,double,double,double,
                         struct potentialArg *);
@@ -332,6 +387,19 @@ double TriaxialJaffePotentialPlanarphiforce(double,double,double,
 					    struct potentialArg *);
 double TriaxialJaffePotentialzforce(double,double,double,double,
 				    struct potentialArg *);					      
+//TwoPowerTriaxialPotential
+double TwoPowerTriaxialPotentialEval(double,double,double,double,
+				     struct potentialArg *);
+double TwoPowerTriaxialPotentialRforce(double,double,double,double,
+				       struct potentialArg *);
+double TwoPowerTriaxialPotentialPlanarRforce(double,double,double,
+					     struct potentialArg *);
+double TwoPowerTriaxialPotentialphiforce(double,double,double,double,
+					 struct potentialArg *);
+double TwoPowerTriaxialPotentialPlanarphiforce(double,double,double,
+					       struct potentialArg *);
+double TwoPowerTriaxialPotentialzforce(double,double,double,double,
+				       struct potentialArg *);
 //SCFPotential
 double SCFPotentialEval(double,double,double,double,
 				     struct potentialArg *);
@@ -341,6 +409,8 @@ double SCFPotentialzforce(double,double,double,double,
 				        struct potentialArg *);
 double SCFPotentialphiforce(double,double,double,double,
 				        struct potentialArg *);
+double SCFPotentialDens(double,double,double,double,
+			struct potentialArg *);
 				        
 double SCFPotentialPlanarRforce(double,double,double,
                         struct potentialArg *);
@@ -365,6 +435,32 @@ double SoftenedNeedleBarPotentialPlanarRforce(double,double,double,
 					      struct potentialArg *);
 double SoftenedNeedleBarPotentialPlanarphiforce(double,double,double,
 					  struct potentialArg *);
+//FerrersPotential
+double FerrersPotentialEval(double,double,double,double,
+			    struct potentialArg *);
+double FerrersPotentialRforce(double,double,double,double,
+			      struct potentialArg *);
+double FerrersPotentialzforce(double,double,double,double,
+			      struct potentialArg *);
+double FerrersPotentialphiforce(double,double,double,double,
+				struct potentialArg *);
+double FerrersPotentialPlanarRforce(double,double,double,
+				    struct potentialArg *);
+double FerrersPotentialPlanarphiforce(double,double,double,
+				      struct potentialArg *);
+//interp3DPotential
+double interp3DPotentialEval(double,double,double,double,
+			     struct potentialArg *);
+double interp3DPotentialRforce(double,double,double,double,
+			       struct potentialArg *);
+double interp3DPotentialzforce(double,double,double,double,
+			       struct potentialArg *);
+double interp3DPotentialphiforce(double,double,double,double,
+				 struct potentialArg *);
+double interp3DPotentialPlanarRforce(double,double,double,
+				     struct potentialArg *);
+double interp3DPotentialPlanarphiforce(double,double,double,
+				       struct potentialArg *);
 //DiskSCFPotential
 double DiskSCFPotentialEval(double,double,double,double,
 				      struct potentialArg *);
@@ -382,6 +478,19 @@ double WilkinsonEvansPotentialRforce(double,double, double,double,
                                     struct potentialArg * );
 double WilkinsonEvansPotentialzforce(double,double,double,double,
                                     struct potentialArg * );   
+//DehnenSmoothWrapperPotential
+double DehnenSmoothWrapperPotentialEval(double,double,double,double,
+					struct potentialArg *);
+double DehnenSmoothWrapperPotentialRforce(double,double,double,double,
+					  struct potentialArg *);
+double DehnenSmoothWrapperPotentialzforce(double,double,double,double,
+					  struct potentialArg *);
+double DehnenSmoothWrapperPotentialphiforce(double,double,double,double,
+					    struct potentialArg *);
+double DehnenSmoothWrapperPotentialPlanarRforce(double,double,double,
+						struct potentialArg *);
+double DehnenSmoothWrapperPotentialPlanarphiforce(double,double,double,
+						  struct potentialArg *);
 
 #ifdef __cplusplus
 }
@@ -0,0 +1,99 @@
+#include <math.h>
+#include <galpy_potentials.h>
+//interp3DPotential
+//Tricubic B-spline interpolation on a uniform (R or ln R, z, phi) grid;
+//mirror boundary conditions in R and z, periodic boundary conditions in phi
+inline void interp3DPotential_bspline(double x, int n, int periodic,
+				      int * indx, double * w){
+  int ii, i, k;
+  double u;
+  if ( ! periodic ) {
+    if ( x < 0. ) x= 0.;
+    if ( x > n - 1. ) x= n - 1.;
+  }
+  i= (int) floor(x);
+  u= x - i;
+  w[0]= ( 1. - u ) * ( 1. - u ) * ( 1. - u ) / 6.;
+  w[1]= ( 3. * u * u * u - 6. * u * u + 4. ) / 6.;
+  w[2]= ( -3. * u * u * u + 3. * u * u + 3. * u + 1. ) / 6.;
+  w[3]= u * u * u / 6.;
+  for (ii=0; ii < 4; ii++) {
+    k= i + ii - 1;
+    if ( periodic ) {
+      k%= n;
+      if ( k < 0 ) k+= n;
+    }
+    else {
+      if ( k < 0 ) k= -k;
+      if ( k > n - 1 ) k= 2 * ( n - 1 ) - k;
+    }
+    indx[ii]= k;
+  }
+}
+double interp3DPotential_interpolate(double R,double z, double phi,
+				     double t,double * args,int which){
+  int ii, jj, kk;
+  //Get args: nR, nz, nphi, logR, zsym, x0, dx, z0, dz, omegab, amp, coeffs
+  int nR= (int) *args++;
+  int nz= (int) *args++;
+  int nphi= (int) *args++;
+  int logR= (int) *args++;
+  int zsym= (int) *args++;
+  double x0= *args++;
+  double dx= *args++;
+  double z0= *args++;
+  double dz= *args++;
+  double omegab= *args++;
+  double amp= *args++;
+  double * coeffs= args + which * nR * nz * nphi;
+  int xindx[4], yindx[4], windx[4];
+  double xw[4], yw[4], ww[4];
+  double x, w, base, out= 0.;
+  if ( zsym ) z= fabs(z);
+  x= logR ? log(R) : R;
+  w= fmod(phi - omegab * t,2. * M_PI);
+  if ( w < 0. ) w+= 2. * M_PI;
+  interp3DPotential_bspline(( x - x0 ) / dx,nR,0,xindx,xw);
+  interp3DPotential_bspline(( z - z0 ) / dz,nz,0,yindx,yw);
+  interp3DPotential_bspline(w * nphi / 2. / M_PI,nphi,1,windx,ww);
+  for (ii=0; ii < 4; ii++)
+    for (jj=0; jj < 4; jj++) {
+      base= 0.;
+      for (kk=0; kk < 4; kk++)
+	base+= ww[kk] * *(coeffs + ( xindx[ii] * nz + yindx[jj] ) * nphi
+			  + windx[kk]);
+      out+= xw[ii] * yw[jj] * base;
+    }
+  return amp * out;
+}
+double interp3DPotentialEval(double R,double z, double phi,
+			     double t,
+			     struct potentialArg * potentialArgs){
+  return interp3DPotential_interpolate(R,z,phi,t,potentialArgs->args,0);
+}
+double interp3DPotentialRforce(double R,double z, double phi,
+			       double t,
+			       struct potentialArg * potentialArgs){
+  return interp3DPotential_interpolate(R,z,phi,t,potentialArgs->args,1);
+}
+double interp3DPotentialPlanarRforce(double R,double phi,double t,
+				     struct potentialArg * potentialArgs){
+  return interp3DPotential_interpolate(R,0.,phi,t,potentialArgs->args,1);
+}
+double interp3DPotentialzforce(double R,double z, double phi,
+			       double t,
+			       struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  int zsym= (int) *(args + 4);
+  double out= interp3DPotential_interpolate(R,z,phi,t,args,2);
+  return ( zsym && z < 0. ) ? -out : out;
+}
+double interp3DPotentialphiforce(double R,double z, double phi,
+				 double t,
+				 struct potentialArg * potentialArgs){
+  return interp3DPotential_interpolate(R,z,phi,t,potentialArgs->args,3);
+}
+double interp3DPotentialPlanarphiforce(double R,double phi,double t,
+				       struct potentialArg * potentialArgs){
+  return interp3DPotential_interpolate(R,0.,phi,t,potentialArgs->args,3);
+}
@@ -2,7 +2,68 @@
 #include <galpy_potentials.h>
 #include <interp_2d.h>
 //interpRZpotential
-//2 remaining arguments: amp, logR
+//3 remaining arguments: amp, logR, adaptive
+//For adaptive grids, the coefficients are those of the not-a-knot cubic
+//B-splines on the (non-uniform) grid (as in scipy's RectBivariateSpline),
+//otherwise those of cubic B-splines on the uniform grid of the indices
+inline double interpRZPotential_knot(double * xa, int n, int ii){
+  //Knots of the not-a-knot cubic spline on the grid xa
+  if ( ii < 4 )
+    return *xa;
+  else if ( ii >= n )
+    return *(xa+n-1);
+  else
+    return *(xa+ii-2);
+}
+void interpRZPotential_bsplines(double * xa, int n, double x,
+				int * span, double * bspl){
+  //Find the knot span and evaluate the four non-zero B-splines at x
+  int lo= 3, hi= n-1, mid, jj, rr;
+  double left[4], right[4], saved, temp;
+  x= ( x < *xa ) ? *xa : x;
+  x= ( x > *(xa+n-1) ) ? *(xa+n-1) : x;
+  while ( hi > lo ) {
+    mid= ( lo + hi + 1 ) / 2;
+    if ( interpRZPotential_knot(xa,n,mid) <= x )
+      lo= mid;
+    else
+      hi= mid - 1;
+  }
+  *span= lo;
+  bspl[0]= 1.;
+  for (jj=1; jj < 4; jj++) {
+    left[jj]= x - interpRZPotential_knot(xa,n,lo+1-jj);
+    right[jj]= interpRZPotential_knot(xa,n,lo+jj) - x;
+    saved= 0.;
+    for (rr=0; rr < jj; rr++) {
+      temp= bspl[rr] / ( right[rr+1] + left[jj-rr] );
+      bspl[rr]= saved + right[rr+1] * temp;
+      saved= left[jj-rr] * temp;
+    }
+    bspl[jj]= saved;
+  }
+}
+double interpRZPotential_eval_adaptive(interp_2d * i2d,double x, double y){
+  int ii, jj, xspan, yspan;
+  double xbspl[4], ybspl[4];
+  double out= 0.;
+  interpRZPotential_bsplines(i2d->xa,i2d->size1,x,&xspan,xbspl);
+  interpRZPotential_bsplines(i2d->ya,i2d->size2,y,&yspan,ybspl);
+  for (ii=0; ii < 4; ii++)
+    for (jj=0; jj < 4; jj++)
+      out+= xbspl[ii] * ybspl[jj]					\
+	* *(i2d->za + ( xspan - 3 + ii ) * i2d->size2 + yspan - 3 + jj);
+  return out;
+}
+inline double interpRZPotential_eval(interp_2d * i2d,double x, double y,
+				     gsl_interp_accel * accx, 
+				     gsl_interp_accel * accy,
+				     int adaptive){
+  if ( adaptive == 1 )
+    return interpRZPotential_eval_adaptive(i2d,x,y);
+  else
+    return interp_2d_eval_cubic_bspline(i2d,x,y,accx,accy);
+}
 double interpRZPotentialEval(double R,double z, double phi,
 			     double t,
 			     struct potentialArg * potentialArgs){
@@ -10,15 +71,16 @@ double interpRZPotentialEval(double R,double z, double phi,
   //Get args
   double y;
   double amp= *args++;
-  int logR= (int) *args;
+  int logR= (int) *args++;
+  int adaptive= (int) *args;
   if ( logR == 1)
     y= ( R > 0. ) ? log(R): -20.72326583694641;
   else
     y= R;
   //Calculate potential through interpolation
-  return amp * interp_2d_eval_cubic_bspline(potentialArgs->i2d,y,fabs(z),
-					    potentialArgs->accx,
-					    potentialArgs->accy);
+  return amp * interpRZPotential_eval(potentialArgs->i2d,y,fabs(z),
+				      potentialArgs->accx,
+				      potentialArgs->accy,adaptive);
 }
 double interpRZPotentialRforce(double R,double z, double phi,
 			       double t,
@@ -27,15 +89,16 @@ double interpRZPotentialRforce(double R,double z, double phi,
   //Get args
   double y;
   double amp= *args++;
-  int logR= (int) *args;
+  int logR= (int) *args++;
+  int adaptive= (int) *args;
   if ( logR == 1)
     y= ( R > 0. ) ? log(R): -20.72326583694641;
   else
     y= R;
   //Calculate potential through interpolation
-  return amp * interp_2d_eval_cubic_bspline(potentialArgs->i2drforce,y,fabs(z),
-					    potentialArgs->accxrforce,
-					    potentialArgs->accyrforce);
+  return amp * interpRZPotential_eval(potentialArgs->i2drforce,y,fabs(z),
+				      potentialArgs->accxrforce,
+				      potentialArgs->accyrforce,adaptive);
 }
 double interpRZPotentialzforce(double R,double z, double phi,
 			       double t,
@@ -44,20 +107,19 @@ double interpRZPotentialzforce(double R,double z, double phi,
   //Get args
   double y;
   double amp= *args++;
-  int logR= (int) *args;
+  int logR= (int) *args++;
+  int adaptive= (int) *args;
   if ( logR == 1)
     y= ( R > 0. ) ? log(R): -20.72326583694641;
   else
     y= R;
   //Calculate potential through interpolation
   if ( z < 0. )
-    return - amp * interp_2d_eval_cubic_bspline(potentialArgs->i2dzforce,y,
-						-z,
-						potentialArgs->accxzforce,
-						potentialArgs->accyzforce);
+    return - amp * interpRZPotential_eval(potentialArgs->i2dzforce,y,-z,
+					  potentialArgs->accxzforce,
+					  potentialArgs->accyzforce,adaptive);
   else
-    return amp * interp_2d_eval_cubic_bspline(potentialArgs->i2dzforce,y,
-					      z,
-					      potentialArgs->accxzforce,
-					      potentialArgs->accyzforce);
+    return amp * interpRZPotential_eval(potentialArgs->i2dzforce,y,z,
+					potentialArgs->accxzforce,
+					potentialArgs->accyzforce,adaptive);
 }
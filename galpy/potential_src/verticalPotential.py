@@ -1,5 +1,6 @@
 from galpy.potential_src.linearPotential import linearPotential
 from galpy.potential_src.Potential import PotentialError, Potential
+from galpy.potential_src.planarPotential import _same_list_type
 _APY_LOADED= True
 try:
     from astropy import units
@@ -101,7 +102,7 @@ def RZToverticalPotential(RZPot,R):
                 out.append(pot)
             else:
                 out.append(verticalPotential(pot,R))
-        return out
+        return _same_list_type(RZPot,out)
     elif isinstance(RZPot,Potential):
         return verticalPotential(RZPot,R)
     elif isinstance(RZPot,linearPotential):
@@ -1,8 +1,7 @@
-try:
-    import pynbody
-    _PYNBODYENABLED= True
-except ImportError:
-    _PYNBODYENABLED= False
+from galpy.util import LazyModule, module_available
+# Only import pynbody when it is first used
+_PYNBODYENABLED= module_available('pynbody')
+pynbody= LazyModule('pynbody')
 class GadgetSnapshot(object):
     """Snapshot coming out of gadget"""
     def __init__(self,*args,**kwargs):
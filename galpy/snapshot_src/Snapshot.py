@@ -1,7 +1,8 @@
 import numpy as nu
 from galpy.orbit import Orbit
 from galpy.potential_src.planarPotential import RZToplanarPotential
-import galpy.util.bovy_plot as plot
+from galpy.util import LazyModule
+plot= LazyModule('galpy.util.bovy_plot')
 from directnbody import direct_nbody
 class Snapshot(object):
     """General snapshot = collection of particles class"""
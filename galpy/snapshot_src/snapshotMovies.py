@@ -6,7 +6,8 @@ import tempfile
 import shutil
 import subprocess
 import math as m
-import galpy.util.bovy_plot as bovy_plot
+from galpy.util import LazyModule
+bovy_plot= LazyModule('galpy.util.bovy_plot')
 from Snapshot import *
 def snapshotToMovie(snap,filename,*args,**kwargs):
     """
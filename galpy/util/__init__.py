@@ -4,6 +4,7 @@ import shutil
 import warnings
 import tempfile
 import pickle
+import importlib
 import numpy
 import scipy.linalg as linalg
 class galpyWarning(Warning):
@@ -18,6 +19,49 @@ def _warning(
     else:
         print(warnings.formatwarning(message,category,filename,lineno))
 warnings.showwarning = _warning
+class LazyModule(object):
+    """Stand-in for a module that only imports the module when one of its attributes is first accessed, to avoid importing heavy (optional) dependencies such as matplotlib when galpy is imported"""
+    def __init__(self,name):
+        """
+        NAME:
+           __init__
+        PURPOSE:
+           initialize a LazyModule
+        INPUT:
+           name - full name of the module (e.g., 'galpy.util.bovy_plot')
+        OUTPUT:
+           instance
+        HISTORY:
+           2026-10-17 - Written
+        """
+        self.__dict__['_lazy_name']= name
+        self.__dict__['_lazy_module']= None
+    def _lazy_load(self):
+        if self._lazy_module is None:
+            self.__dict__['_lazy_module']= \
+                importlib.import_module(self._lazy_name)
+        return self._lazy_module
+    def __getattr__(self,attr):
+        return getattr(self._lazy_load(),attr)
+    def __setattr__(self,attr,value):
+        setattr(self._lazy_load(),attr,value)
+    def __repr__(self):
+        return "<lazily imported module '%s'>" % self._lazy_name
+def module_available(name):
+    """Return True if the module name can be imported, without importing it"""
+    try:
+        from importlib.util import find_spec
+    except ImportError: # python 2
+        import imp
+        try:
+            imp.find_module(name.split('.')[0])
+        except ImportError:
+            return False
+        return True
+    try:
+        return not find_spec(name) is None
+    except (ImportError,ValueError):
+        return False
 def save_pickles(savefilename,*args,**kwargs):
     """
     NAME:
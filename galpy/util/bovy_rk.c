@@ -91,15 +91,10 @@ void bovy_rk4(void (*func)(double t, double *q, double *a,
   long ndt= (long) (init_dt/dt);
   //Integrate the system
   double to= *t;
-  // Handle KeyboardInterrupt gracefully
-  struct sigaction action;
-  memset(&action, 0, sizeof(struct sigaction));
-  action.sa_handler= handle_sigint;
-  sigaction(SIGINT,&action,NULL);
+  // KeyboardInterrupts are caught by the handler installed by the caller
   for (ii=0; ii < (nt-1); ii++){
     if ( interrupted ) {
       *err= -10;
-      interrupted= 0; // need to reset, bc library and vars stay in memory
       break;
     }
     for (jj=0; jj < (ndt-1); jj++) {
@@ -116,9 +111,6 @@ void bovy_rk4(void (*func)(double t, double *q, double *a,
     //reset yn
     for (kk=0; kk < dim; kk++) *(yn+kk)= *(yn1+kk);
   }
-  // Back to default handler
-  action.sa_handler= SIG_DFL;
-  sigaction(SIGINT,&action,NULL);
   //Free allocated memory
   free(yn);
   free(yn1);
@@ -189,15 +181,10 @@ void bovy_rk6(void (*func)(double t, double *q, double *a,
   long ndt= (long) (init_dt/dt);
   //Integrate the system
   double to= *t;
-  // Handle KeyboardInterrupt gracefully
-  struct sigaction action;
-  memset(&action, 0, sizeof(struct sigaction));
-  action.sa_handler= handle_sigint;
-  sigaction(SIGINT,&action,NULL);
+  // KeyboardInterrupts are caught by the handler installed by the caller
   for (ii=0; ii < (nt-1); ii++){
     if ( interrupted ) {
       *err= -10;
-      interrupted= 0; // need to reset, bc library and vars stay in memory
       break;
     }
     for (jj=0; jj < (ndt-1); jj++) {
@@ -216,9 +203,6 @@ void bovy_rk6(void (*func)(double t, double *q, double *a,
     //reset yn
     for (kk=0; kk < dim; kk++) *(yn+kk)= *(yn1+kk);
   }
-  // Back to default handler
-  action.sa_handler= SIG_DFL;
-  sigaction(SIGINT,&action,NULL);
   //Free allocated memory
   free(yn);
   free(yn1);
@@ -509,15 +493,10 @@ void bovy_dopr54(void (*func)(double t, double *q, double *a,
   double to= *t;
   //set up a1
   func(to,yn,a1,nargs,potentialArgs);
-  // Handle KeyboardInterrupt gracefully
-  struct sigaction action;
-  memset(&action, 0, sizeof(struct sigaction));
-  action.sa_handler= handle_sigint;
-  sigaction(SIGINT,&action,NULL);
+  // KeyboardInterrupts are caught by the handler installed by the caller
   for (ii=0; ii < (nt-1); ii++){
     if ( interrupted ) {
       *err= -10;
-      interrupted= 0; // need to reset, bc library and vars stay in memory
       break;
     }
     bovy_dopr54_onestep(func,dim,yn,dt,&to,&dt_one,
@@ -527,9 +506,6 @@ void bovy_dopr54(void (*func)(double t, double *q, double *a,
     save_rk(dim,yn,result);
     result+= dim;
   }
-  // Back to default handler
-  action.sa_handler= SIG_DFL;
-  sigaction(SIGINT,&action,NULL);
   // Free allocated memory
   free(a);
   free(a1);
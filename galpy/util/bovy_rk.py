@@ -0,0 +1,304 @@
+#############################################################################
+#Runge-Kutta ODE integrators, vectorized over many initial conditions
+#Follows scipy.integrate.odeint inputs as much as possible
+#############################################################################
+import numpy as nu
+#Dormand-Prince 5(4) coefficients
+_DOPR54_C= [0.,1./5.,3./10.,4./5.,8./9.,1.,1.]
+_DOPR54_A= [[],
+            [1./5.],
+            [3./40.,9./40.],
+            [44./45.,-56./15.,32./9.],
+            [19372./6561.,-25360./2187.,64448./6561.,-212./729.],
+            [9017./3168.,-355./33.,46732./5247.,49./176.,-5103./18656.],
+            [35./384.,0.,500./1113.,125./192.,-2187./6784.,11./84.]]
+#Difference between the 5th and 4th order solutions
+_DOPR54_E= [71./57600.,0.,-71./16695.,71./1920.,-17253./339200.,22./525.,
+            -1./40.]
+#Dormand-Prince 8(5,3) coefficients (Hairer, Norsett, & Wanner 1993)
+_DOP853_C= [0.,
+            0.526001519587677318785587544488e-01,
+            0.789002279381515978178381316732e-01,
+            0.118350341907227396726757197510,
+            0.281649658092772603273242802490,
+            0.333333333333333333333333333333,
+            0.25,
+            0.307692307692307692307692307692,
+            0.651282051282051282051282051282,
+            0.6,
+            0.857142857142857142857142857142,
+            1.0]
+_DOP853_A= [[],
+            [5.26001519587677318785587544488e-2],
+            [1.97250569845378994544595329183e-2,
+             5.91751709536136983633785987549e-2],
+            [2.95875854768068491816892993775e-2,0.,
+             8.87627564304205475450678981324e-2],
+            [2.41365134159266685502369798665e-1,0.,
+             -8.84549479328286085344864962717e-1,
+             9.24834003261792003115737966543e-1],
+            [3.7037037037037037037037037037e-2,0.,0.,
+             1.70828608729473871279604482173e-1,
+             1.25467687566822425016691814123e-1],
+            [3.7109375e-2,0.,0.,
+             1.70252211019544039314978060272e-1,
+             6.02165389804559606850219397283e-2,
+             -1.7578125e-2],
+            [3.70920001185047927108779319836e-2,0.,0.,
+             1.70383925712239993810214054705e-1,
+             1.07262030446373284651809199168e-1,
+             -1.53194377486244017527936158236e-2,
+             8.27378916381402288758473766002e-3],
+            [6.24110958716075717114429577812e-1,0.,0.,
+             -3.36089262944694129406857109825,
+             -8.68219346841726006818189891453e-1,
+             2.75920996994467083049415600797e1,
+             2.01540675504778934086186788979e1,
+             -4.34898841810699588477366255144e1],
+            [4.77662536438264365890433908527e-1,0.,0.,
+             -2.48811461997166764192642586468,
+             -5.90290826836842996371446475743e-1,
+             2.12300514481811942347288949897e1,
+             1.52792336328824235832596922938e1,
+             -3.32882109689848629194453265587e1,
+             -2.03312017085086261358222928593e-2],
+            [-9.3714243008598732571704021658e-1,0.,0.,
+             5.18637242884406370830023853209,
+             1.09143734899672957818500254654,
+             -8.14978701074692612513997267357,
+             -1.85200656599969598641566180701e1,
+             2.27394870993505042818970056734e1,
+             2.49360555267965238987089396762,
+             -3.0467644718982195003823669022],
+            [2.27331014751653820792359768449,0.,0.,
+             -1.05344954667372501984066689879e1,
+             -2.00087205822486249909675718444,
+             -1.79589318631187989172765950534e1,
+             2.79488845294199600508499808837e1,
+             -2.85899827713502369474065508674,
+             -8.87285693353062954433549289258,
+             1.23605671757943030647266201528e1,
+             6.43392746015763530355970484046e-1]]
+_DOP853_B= [5.42937341165687622380535766363e-2,0.,0.,0.,0.,
+            4.45031289275240888144113950566,
+            1.89151789931450038304281599044,
+            -5.8012039600105847814672114227,
+            3.1116436695781989440891606237e-1,
+            -1.52160949662516078556178806805e-1,
+            2.01365400804030348374776537501e-1,
+            4.47106157277725905176885569043e-2]
+#5th and 3rd order error estimators
+_DOP853_E5= [0.1312004499419488073250102996e-1,0.,0.,0.,0.,
+             -0.1225156446376204440720569753e+1,
+             -0.4957589496572501915214079952,
+             0.1664377182454986536961530415e+1,
+             -0.3503288487499736816886487290,
+             0.3341791187130174790297318841,
+             0.8192320648511571246570742613e-1,
+             -0.2235530786388629525884427845e-1]
+_DOP853_E3= [b for b in _DOP853_B]
+_DOP853_E3[0]-= 0.244094488188976377952755905512
+_DOP853_E3[8]-= 0.733846688281611857341361741547
+_DOP853_E3[11]-= 0.220588235294117647058823529412e-1
+_MAXSTEPS= 100000 #per output interval
+def rk4(func,yo,t,args=(),rtol=1.49012e-8,atol=1.49012e-8):
+    """
+    NAME:
+       rk4
+    PURPOSE:
+       integrate an ode with a 4th order Runge-Kutta integrator with a fixed step
+    INPUT:
+       func - derivative function of (y,t,*args)
+       yo - initial condition; shape [d] or [N,d] to integrate N orbits at
+            once (func then needs to work on [N,d] arrays)
+       t - set of times at which one wants the result (equally spaced)
+       rtol, atol
+    OUTPUT:
+       y : array, shape (len(t),d) or (N,len(t),d)
+       Array containing the value of y for each desired time in t, \
+       with the initial value y0 in the first row.
+    HISTORY:
+       2026-10-16 - Written
+    """
+    #Initialize
+    yo= nu.array(yo,dtype='float')
+    out= nu.zeros(yo.shape[:-1]+(len(t),yo.shape[-1]))
+    out[...,0,:]= yo
+    #Estimate necessary step size
+    dt= t[1]-t[0] #assumes that the steps are equally spaced
+    init_dt= dt
+    dt= _rk4_estimate_step(func,yo,dt,t[0],args,rtol,atol)
+    ndt= int(init_dt/dt)
+    #Integrate
+    to= t[0]
+    for ii in range(1,len(t)):
+        for jj in range(ndt): #loop over number of sub-intervals
+            yo= _rk4_step(func,yo,dt,to,args)
+            to+= dt
+        out[...,ii,:]= yo
+    return out
+
+def _rk4_step(func,yo,dt,to,args):
+    """Take a single 4th order Runge-Kutta step dt"""
+    k1= func(yo,to,*args)
+    k2= func(yo+dt/2.*k1,to+dt/2.,*args)
+    k3= func(yo+dt/2.*k2,to+dt/2.,*args)
+    k4= func(yo+dt*k3,to+dt,*args)
+    return yo+dt/6.*(k1+2.*k2+2.*k3+k4)
+
+def _rk4_estimate_step(func,yo,dt,to,args,rtol,atol):
+    ymax= nu.amax(nu.fabs(yo),axis=-1)[...,None]+nu.zeros(yo.shape)
+    scale= atol+rtol*ymax
+    err= 2.
+    dt*= 2.
+    while err > 1.:
+        #Do one step with step dt and two with dt/2.
+        y11= _rk4_step(func,yo,dt,to,args)
+        y12= _rk4_step(func,_rk4_step(func,yo,dt/2.,to,args),dt/2.,
+                       to+dt/2.,args)
+        #Norm, the step needs to work for all orbits; orbits with a
+        #non-finite error are ignored
+        err= nu.fabs(y11-y12)/scale
+        err= nu.atleast_1d(nu.sqrt(nu.mean(err**2.,axis=-1)))
+        err= nu.amax(nu.append(err[nu.isfinite(err)],0.))
+        dt/= 2.
+    return dt
+
+def dopr54(func,yo,t,args=(),rtol=1.49012e-8,atol=1.49012e-8):
+    """
+    NAME:
+       dopr54
+    PURPOSE:
+       integrate an ode with the adaptive Dormand-Prince 5(4) integrator
+    INPUT:
+       func - derivative function of (y,t,*args)
+       yo - initial condition; shape [d] or [N,d] to integrate N orbits at
+            once (func then needs to work on [N,d] arrays); all orbits are
+            integrated with a common step, set by the orbit with the
+            largest error
+       t - set of times at which one wants the result
+       rtol, atol
+    OUTPUT:
+       (y,err)
+       y : array, shape (len(t),d) or (N,len(t),d)
+       Array containing the value of y for each desired time in t, \
+       with the initial value y0 in the first row.
+       err: if not zero: 1 means that the maximum number of steps was
+            reached in at least one of the output intervals; 2 means that
+            the integration failed for at least one orbit (its output
+            is set to NaN from that point on)
+    HISTORY:
+       2026-10-16 - Written
+    """
+    return _adaptive_integrate(func,yo,t,args,rtol,atol,_dopr54_step,5)
+
+def dop853(func,yo,t,args=(),rtol=1.49012e-8,atol=1.49012e-8):
+    """
+    NAME:
+       dop853
+    PURPOSE:
+       integrate an ode with the adaptive Dormand-Prince 8(5,3) integrator
+    INPUT:
+       func - derivative function of (y,t,*args)
+       yo - initial condition; shape [d] or [N,d] to integrate N orbits at
+            once (func then needs to work on [N,d] arrays); all orbits are
+            integrated with a common step, set by the orbit with the
+            largest error
+       t - set of times at which one wants the result
+       rtol, atol
+    OUTPUT:
+       (y,err)
+       y : array, shape (len(t),d) or (N,len(t),d)
+       Array containing the value of y for each desired time in t, \
+       with the initial value y0 in the first row.
+       err: if not zero: 1 means that the maximum number of steps was
+            reached in at least one of the output intervals; 2 means that
+            the integration failed for at least one orbit (its output
+            is set to NaN from that point on)
+    HISTORY:
+       2026-10-16 - Written
+    """
+    return _adaptive_integrate(func,yo,t,args,rtol,atol,_dop853_step,8)
+
+def _adaptive_integrate(func,yo,t,args,rtol,atol,step,order):
+    """Integrate with the adaptive Runge-Kutta step function step of order
+    order, using a common step for all orbits"""
+    #Initialize
+    yo= nu.array(yo,dtype='float')
+    out= nu.zeros(yo.shape[:-1]+(len(t),yo.shape[-1]))
+    out[...,0,:]= yo
+    failed= nu.zeros(yo.shape[:-1],dtype='bool')
+    err= 0
+    to= t[0]
+    dt= t[1]-t[0] #proposed step
+    k1= func(yo,to,*args) # First-same-as-last, re-used between steps
+    for ii in range(1,len(t)):
+        nsteps= 0
+        while to != t[ii]:
+            #Do not overshoot the next output time
+            if nu.fabs(dt) >= nu.fabs(t[ii]-to):
+                this_dt= t[ii]-to
+                last= True
+            else:
+                this_dt= dt
+                last= False
+            if to+this_dt == to: # step underflow, cannot make progress
+                out[...,ii:,:]= nu.nan
+                return (out,2)
+            ynew, knew, yerr= step(func,yo,k1,this_dt,to,args)
+            scale= atol+rtol*nu.maximum(nu.fabs(yo),nu.fabs(ynew))
+            orbErr= nu.sqrt(nu.mean((yerr/scale)**2.,axis=-1))
+            #Orbits with a non-finite error have failed, they no longer
+            #contribute to setting the step
+            newfail= True^nu.isfinite(orbErr)
+            if nu.any(newfail):
+                failed= failed+newfail
+                err= 2
+                orbErr= nu.where(failed,0.,orbErr)
+            #Norm, the step needs to work for all orbits
+            stepErr= nu.amax(orbErr)
+            nsteps+= 1
+            accept= stepErr <= 1. or nsteps > _MAXSTEPS
+            if accept:
+                if not stepErr <= 1. and err == 0: err= 1
+                if last: to= t[ii]
+                else: to+= this_dt
+                yo= ynew
+                k1= knew
+            #Adjust the step, unless this was a shortened last step
+            if not (accept and last):
+                if stepErr == 0.: fac= 5.
+                else: fac= min(5.,max(0.2,0.9*stepErr**(-1./order)))
+                dt= this_dt*fac
+        out[...,ii,:]= nu.where(failed[...,None],nu.nan,yo)
+    return (out,err)
+
+def _rk_stages(func,yo,k1,dt,to,args,a,c):
+    """Compute the stages of an explicit Runge-Kutta step, given the
+    derivative k1 at the start; returns the list of stages and the last
+    intermediate y"""
+    ks= [k1]
+    for jj in range(1,len(a)):
+        ytmp= yo+dt*sum([aa*k for aa,k in zip(a[jj],ks) if aa != 0.])
+        ks.append(func(ytmp,to+c[jj]*dt,*args))
+    return (ks,ytmp)
+
+def _dopr54_step(func,yo,k1,dt,to,args):
+    """Take a single Dormand-Prince 5(4) step, returns the new y, the derivative at the new y, and the error estimate"""
+    ks, ynew= _rk_stages(func,yo,k1,dt,to,args,_DOPR54_A,_DOPR54_C)
+    # The last stage is evaluated at the new y (first-same-as-last)
+    yerr= dt*sum([e*k for e,k in zip(_DOPR54_E,ks) if e != 0.])
+    return (ynew,ks[-1],yerr)
+
+def _dop853_step(func,yo,k1,dt,to,args):
+    """Take a single Dormand-Prince 8(5,3) step, returns the new y, the derivative at the new y, and the error estimate"""
+    ks, ytmp= _rk_stages(func,yo,k1,dt,to,args,_DOP853_A,_DOP853_C)
+    ynew= yo+dt*sum([b*k for b,k in zip(_DOP853_B,ks) if b != 0.])
+    knew= func(ynew,to+dt,*args)
+    err5= sum([e*k for e,k in zip(_DOP853_E5,ks) if e != 0.])
+    err3= sum([e*k for e,k in zip(_DOP853_E3,ks) if e != 0.])
+    #Combine the 5th and 3rd order estimates as in Hairer et al. (1993),
+    #such that the error norm is that of the 8th order estimate
+    denom= nu.hypot(nu.fabs(err5),0.1*nu.fabs(err3))
+    fac= nu.where(denom > 0.,nu.fabs(err5)/nu.where(denom > 0.,denom,1.),1.)
+    return (ynew,knew,dt*err5*fac)
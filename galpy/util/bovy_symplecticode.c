@@ -32,6 +32,7 @@ POSSIBILITY OF SUCH DAMAGE.
 #include <stdio.h>
 #include <stdlib.h>
 #include <math.h>
+#include <string.h>
 #include "signal.h"
 #include <bovy_symplecticode.h>
 #define _MAX_DT_REDUCE 10000.
@@ -40,6 +41,23 @@ void handle_sigint(int signum)
 {
   interrupted= 1;
 }
+/*
+  The integrators only check the interrupted flag; the handler is installed
+  once by their caller (e.g., around a loop over many orbits) with
+  install_sigint_handler and removed afterwards with restore_sigint_handler
+*/
+void install_sigint_handler(struct sigaction * old_action)
+{
+  struct sigaction action;
+  memset(&action, 0, sizeof(struct sigaction));
+  action.sa_handler= handle_sigint;
+  sigaction(SIGINT,&action,old_action);
+}
+void restore_sigint_handler(struct sigaction * old_action)
+{
+  sigaction(SIGINT,old_action,NULL);
+  interrupted= 0; // need to reset, bc library and vars stay in memory
+}
 inline void leapfrog_leapq(int dim, double *q,double *p,double dt,double *qn){
   int ii;
   for (ii=0; ii < dim; ii++) (*qn++)= (*q++) +dt * (*p++);
@@ -111,15 +129,10 @@ void leapfrog(void (*func)(double t, double *q, double *a,
   long ndt= (long) (init_dt/dt);
   //Integrate the system
   double to= *t;
-  // Handle KeyboardInterrupt gracefully
-  struct sigaction action;
-  memset(&action, 0, sizeof(struct sigaction));
-  action.sa_handler= handle_sigint;
-  sigaction(SIGINT,&action,NULL);
+  // KeyboardInterrupts are caught by the handler installed by the caller
   for (ii=0; ii < (nt-1); ii++){
     if ( interrupted ) {
       *err= -10;
-      interrupted= 0; // need to reset, bc library and vars stay in memory
       break;
     }
     //drift half
@@ -149,9 +162,6 @@ void leapfrog(void (*func)(double t, double *q, double *a,
     save_qp(dim,qo,po,result);
     result+= 2 * dim;
   }
-  // Back to default handler
-  action.sa_handler= SIG_DFL;
-  sigaction(SIGINT,&action,NULL);
   //Free allocated memory
   free(qo);
   free(po);
@@ -225,15 +235,10 @@ void symplec4(void (*func)(double t, double *q, double *a,
   long ndt= (long) (init_dt/dt);
   //Integrate the system
   double to= *t;
-  // Handle KeyboardInterrupt gracefully
-  struct sigaction action;
-  memset(&action, 0, sizeof(struct sigaction));
-  action.sa_handler= handle_sigint;
-  sigaction(SIGINT,&action,NULL);
+  // KeyboardInterrupts are caught by the handler installed by the caller
   for (ii=0; ii < (nt-1); ii++){
     if ( interrupted ) {
       *err= -10;
-      interrupted= 0; // need to reset, bc library and vars stay in memory
       break;
     }
     //drift for c1*dt
@@ -290,9 +295,6 @@ void symplec4(void (*func)(double t, double *q, double *a,
     save_qp(dim,qo,po,result);
     result+= 2 * dim;
   }
-  // Back to default handler
-  action.sa_handler= SIG_DFL;
-  sigaction(SIGINT,&action,NULL);
   //Free allocated memory
   free(qo);
   free(po);
@@ -374,15 +376,10 @@ void symplec6(void (*func)(double t, double *q, double *a,
   long ndt= (long) (init_dt/dt);
   //Integrate the system
   double to= *t;
-  // Handle KeyboardInterrupt gracefully
-  struct sigaction action;
-  memset(&action, 0, sizeof(struct sigaction));
-  action.sa_handler= handle_sigint;
-  sigaction(SIGINT,&action,NULL);
+  // KeyboardInterrupts are caught by the handler installed by the caller
   for (ii=0; ii < (nt-1); ii++){
     if ( interrupted ) {
       *err= -10;
-      interrupted= 0; // need to reset, bc library and vars stay in memory
       break;
     }
     //drift for c1*dt
@@ -487,9 +484,6 @@ void symplec6(void (*func)(double t, double *q, double *a,
     save_qp(dim,qo,po,result);
     result+= 2 * dim;
   }
-  // Back to default handler
-  action.sa_handler= SIG_DFL;
-  sigaction(SIGINT,&action,NULL);
   //Free allocated memory
   free(qo);
   free(po);
@@ -31,6 +31,13 @@
 #POSSIBILITY OF SUCH DAMAGE.
 #############################################################################
 import numpy as nu
+#Coefficients of the drift (c) and kick (d) steps
+_LEAPFROG_C= [0.5,0.5]
+_LEAPFROG_D= [1.]
+_SYMPLEC4_THETA= 1./(2.-2.**(1./3.))
+_SYMPLEC4_C= [_SYMPLEC4_THETA/2.,(1.-_SYMPLEC4_THETA)/2.,
+              (1.-_SYMPLEC4_THETA)/2.,_SYMPLEC4_THETA/2.]
+_SYMPLEC4_D= [_SYMPLEC4_THETA,1.-2.*_SYMPLEC4_THETA,_SYMPLEC4_THETA]
 def leapfrog(func,yo,t,args=(),rtol=1.49012e-8,atol=0.):
     """
     NAME:
@@ -39,74 +46,103 @@ def leapfrog(func,yo,t,args=(),rtol=1.49012e-8,atol=0.):
        leapfrog integrate an ode
     INPUT:
        func - force function of (y,*args)
-       yo - initial condition [q,p]
+       yo - initial condition [q,p]; shape [2d] or [N,2d] to integrate N 
+            orbits at once (func then needs to work on [N,d] arrays)
        t - set of times at which one wants the result
        rtol, atol
     OUTPUT:
-       y : array, shape (len(y0), len(t))
+       y : array, shape (len(t),2d) or (N,len(t),2d)
        Array containing the value of y for each desired time in t, \
        with the initial value y0 in the first row.
     HISTORY:
        2011-02-02 - Written - Bovy (NYU)
+       2026-10-16 - Allow multiple orbits, integrated with a common step
     """
+    return _symplectic_integrate(func,yo,t,args,rtol,atol,
+                                 _LEAPFROG_C,_LEAPFROG_D)
+
+def symplec4(func,yo,t,args=(),rtol=1.49012e-8,atol=0.):
+    """
+    NAME:
+       symplec4
+    PURPOSE:
+       integrate an ode with a 4th order symplectic integrator (Forest & Ruth 1990)
+    INPUT:
+       func - force function of (y,*args)
+       yo - initial condition [q,p]; shape [2d] or [N,2d] to integrate N 
+            orbits at once (func then needs to work on [N,d] arrays)
+       t - set of times at which one wants the result
+       rtol, atol
+    OUTPUT:
+       y : array, shape (len(t),2d) or (N,len(t),2d)
+       Array containing the value of y for each desired time in t, \
+       with the initial value y0 in the first row.
+    HISTORY:
+       2026-10-16 - Written
+    """
+    return _symplectic_integrate(func,yo,t,args,rtol,atol,
+                                 _SYMPLEC4_C,_SYMPLEC4_D)
+
+def _symplectic_integrate(func,yo,t,args,rtol,atol,c,d):
+    """Integrate with the drift-kick-...-drift integrator with drift 
+    coefficients c and kick coefficients d, using a fixed step"""
     #Initialize
-    qo= yo[0:len(yo)//2]
-    po= yo[len(yo)//2:len(yo)]
-    out= nu.zeros((len(t),len(yo)))
-    out[0,:]= yo
+    yo= nu.array(yo,dtype='float')
+    ndim= yo.shape[-1]//2
+    qo= yo[...,:ndim]
+    po= yo[...,ndim:]
+    out= nu.zeros(yo.shape[:-1]+(len(t),yo.shape[-1]))
+    out[...,0,:]= yo
     #Estimate necessary step size
     dt= t[1]-t[0] #assumes that the steps are equally spaced
     init_dt= dt
-    dt= _leapfrog_estimate_step(func,qo,po,dt,t[0],args,rtol,atol)
+    dt= _symplectic_estimate_step(func,qo,po,dt,t[0],args,rtol,atol,c,d)
     ndt= int(init_dt/dt)
     #Integrate
     to= t[0]
     for ii in range(1,len(t)):
         for jj in range(ndt): #loop over number of sub-intervals
-            #This could be made faster by combining the drifts
-            #drift
-            q12= leapfrog_leapq(qo,po,dt/2.)
-            #kick
-            force= func(q12,*args,t=to+dt/2)
-            po= leapfrog_leapp(po,dt,force)
-            #drift
-            qo= leapfrog_leapq(q12,po,dt/2.)
+            qo,po= _symplectic_step(func,qo,po,dt,to,args,c,d)
             #Get ready for next
             to+= dt
-        out[ii,0:len(yo)//2]= qo
-        out[ii,len(yo)//2:len(yo)]= po
+        out[...,ii,:ndim]= qo
+        out[...,ii,ndim:]= po
     return out
 
+def _symplectic_step(func,qo,po,dt,to,args,c,d):
+    """Take a single step dt"""
+    tq= to
+    for ii in range(len(d)):
+        #drift
+        qo= leapfrog_leapq(qo,po,c[ii]*dt)
+        tq+= c[ii]*dt
+        #kick
+        force= func(qo,*args,t=tq)
+        po= leapfrog_leapp(po,d[ii]*dt,force)
+    #drift
+    qo= leapfrog_leapq(qo,po,c[-1]*dt)
+    return (qo,po)
+
 def leapfrog_leapq(q,p,dt):
     return q+dt*p
 
 def leapfrog_leapp(p,dt,force):
     return p+dt*force
 
-def _leapfrog_estimate_step(func,qo,po,dt,to,args,rtol,atol):
-    qmax= nu.amax(nu.fabs(qo))+nu.zeros(len(qo))
-    pmax= nu.amax(nu.fabs(po))+nu.zeros(len(po))
-    scale= atol+rtol*nu.array([qmax,pmax]).flatten()
+def _symplectic_estimate_step(func,qo,po,dt,to,args,rtol,atol,c,d):
+    qmax= nu.amax(nu.fabs(qo),axis=-1)[...,None]+nu.zeros(qo.shape)
+    pmax= nu.amax(nu.fabs(po),axis=-1)[...,None]+nu.zeros(po.shape)
+    scale= atol+rtol*nu.concatenate((qmax,pmax),axis=-1)
+    scale[scale == 0.]= rtol # e.g., for orbits that start at rest
     err= 2.
     dt*= 2.
     while err > 1.:
-        #Do one leapfrog step with step dt and one with dt/2.
-        #dt
-        q12= leapfrog_leapq(qo,po,dt/2.)
-        force= func(q12,*args,t=to+dt/2)
-        p11= leapfrog_leapp(po,dt,force)
-        q11= leapfrog_leapq(q12,p11,dt/2.)
-        #dt/2.
-        q12= leapfrog_leapq(qo,po,dt/4.)
-        force= func(q12,*args,t=to+dt/4)
-        ptmp= leapfrog_leapp(po,dt/2.,force)
-        qtmp= leapfrog_leapq(q12,ptmp,dt/2.)#Take full step combining two half
-        force= func(qtmp,*args,t=to+3.*dt/4)
-        p12= leapfrog_leapp(ptmp,dt/2.,force)
-        q12= leapfrog_leapq(qtmp,p12,dt/4.)
-        #Norm
-        delta= nu.array([nu.fabs(q11-q12),nu.fabs(p11-p12)]).flatten()
-        err= nu.sqrt(nu.mean((delta/scale)**2.))
+        #Do one step with step dt and two with dt/2.
+        q11,p11= _symplectic_step(func,qo,po,dt,to,args,c,d)
+        qtmp,ptmp= _symplectic_step(func,qo,po,dt/2.,to,args,c,d)
+        q12,p12= _symplectic_step(func,qtmp,ptmp,dt/2.,to+dt/2.,args,c,d)
+        #Norm, the step needs to work for all orbits
+        delta= nu.concatenate((nu.fabs(q11-q12),nu.fabs(p11-p12)),axis=-1)
+        err= nu.amax(nu.sqrt(nu.mean((delta/scale)**2.,axis=-1)))
         dt/= 2.
     return dt
-
@@ -299,6 +299,64 @@ def test_actionAngleSpherical_otherIsochrone_angles():
     assert daz < 10.**-6., 'actionAngleSpherical applied to isochrone potential fails for az at %g%%' % (daz*100.)
     return None
 
+#Test the C implementation of actionAngleSpherical against the isochrone
+def test_actionAngleSpherical_otherIsochrone_c():
+    from galpy.potential import IsochronePotential
+    from galpy.actionAngle import actionAngleSpherical, \
+        actionAngleIsochrone
+    ip= IsochronePotential(normalize=1.,b=1.2)
+    aAI= actionAngleIsochrone(ip=ip)
+    aAS= actionAngleSpherical(pot=ip,c=True,order=20)
+    R= numpy.array([1.1,0.9,1.5,0.7])
+    vR= numpy.array([0.3,-0.2,0.1,0.4])
+    vT= numpy.array([1.2,0.8,-0.9,1.1])
+    z= numpy.array([0.2,-0.3,0.1,0.5])
+    vz= numpy.array([0.5,0.1,-0.3,0.2])
+    phi= numpy.array([2.,0.5,4.,1.])
+    jiO= aAI.actionsFreqsAngles(R,vR,vT,z,vz,phi)
+    jiaO= aAS.actionsFreqsAngles(R,vR,vT,z,vz,phi)
+    for ii,name in enumerate(['Jr','Lz','Jz','Or','Op','Oz']):
+        d= numpy.fabs((jiO[ii]-jiaO[ii])/jiO[ii])
+        assert numpy.all(d < 10.**-6.), 'actionAngleSpherical in C applied to isochrone potential fails for %s at %g%%' % (name,numpy.amax(d)*100.)
+    for ii,name in zip(range(6,9),['ar','ap','az']):
+        d= numpy.fabs(jiO[ii]-jiaO[ii])
+        d[d > numpy.pi]= 2.*numpy.pi-d[d > numpy.pi]
+        assert numpy.all(d < 10.**-6.), 'actionAngleSpherical in C applied to isochrone potential fails for %s at %g' % (name,numpy.amax(d))
+    # Actions and frequencies only
+    jiaO= aAS.actionsFreqs(R,vR,vT,z,vz)
+    for ii,name in enumerate(['Jr','Lz','Jz','Or','Op','Oz']):
+        d= numpy.fabs((jiO[ii]-jiaO[ii])/jiO[ii])
+        assert numpy.all(d < 10.**-6.), 'actionAngleSpherical in C applied to isochrone potential fails for %s at %g%%' % (name,numpy.amax(d)*100.)
+    djr= numpy.fabs((jiO[0]-aAS(R,vR,vT,z,vz)[0])/jiO[0])
+    assert numpy.all(djr < 10.**-6.), 'actionAngleSpherical in C applied to isochrone potential fails for Jr at %g%%' % (numpy.amax(djr)*100.)
+    return None
+
+#Test that the C and Python implementations of actionAngleSpherical agree
+def test_actionAngleSpherical_c_vs_python():
+    from galpy.potential import NFWPotential, HernquistPotential
+    from galpy.actionAngle import actionAngleSpherical
+    pot= [HernquistPotential(normalize=0.5,a=1.),
+          NFWPotential(normalize=0.5,a=3.)]
+    aASc= actionAngleSpherical(pot=pot,c=True)
+    aASp= actionAngleSpherical(pot=pot)
+    R= numpy.array([1.1,0.9,1.5,1.])
+    vR= numpy.array([0.3,-0.2,0.1,0.])
+    vT= numpy.array([1.,0.8,-0.9,0.7])
+    z= numpy.array([0.2,-0.3,0.1,0.])
+    vz= numpy.array([0.5,0.1,-0.3,0.7])
+    phi= numpy.array([2.,0.5,4.,0.3])
+    jc= aASc.actionsFreqsAngles(R,vR,vT,z,vz,phi)
+    jp= aASp.actionsFreqsAngles(R,vR,vT,z,vz,phi)
+    for ii in range(6):
+        assert numpy.all(numpy.fabs(jc[ii]-jp[ii]) < 10.**-5.), 'actionAngleSpherical in C does not agree with the Python implementation'
+    for ii in range(6,9):
+        d= numpy.fabs(jc[ii]-jp[ii])
+        d[d > numpy.pi]= 2.*numpy.pi-d[d > numpy.pi]
+        assert numpy.all(d < 10.**-5.), 'actionAngleSpherical in C does not agree with the Python implementation'
+    # c= in the call overrides the object's c=
+    assert numpy.all(numpy.fabs(aASc(R,vR,vT,z,vz,c=False)[0]-jp[0]) < 10.**-10.), 'actionAngleSpherical with c=False in the call does not use Python'
+    return None
+
 #Basic sanity checking of the actionAngleAdiabatic actions
 def test_actionAngleAdiabatic_basic_actions():
     from galpy.actionAngle import actionAngleAdiabatic
@@ -642,6 +700,31 @@ def test_actionAngleStaeckel_basic_actions_u0_c():
     assert numpy.fabs(js[2]) < 2.*10.**-4., 'Close-to-circular orbit in the MWPotential does not have small Jz'
     return None
 
+# Test that computing u0 within the C code gives the same actions, frequencies, and angles as computing it separately first
+def test_actionAngleStaeckel_u0_c_vs_calcu0():
+    from galpy.actionAngle import actionAngleStaeckel
+    from galpy.actionAngle_src import actionAngleStaeckel_c
+    from galpy.potential import MWPotential, evaluatePotentials
+    aAS= actionAngleStaeckel(pot=MWPotential,delta=0.71,c=True,useu0=True)
+    R= numpy.array([1.,1.1,0.9,0.8])
+    vR= numpy.array([0.1,0.,-0.2,0.05])
+    vT= numpy.array([1.,0.9,1.1,0.95])
+    z= numpy.array([0.1,-0.05,0.,0.2])
+    vz= numpy.array([0.05,0.1,-0.1,0.])
+    phi= numpy.array([0.,1.,2.,3.])
+    E= evaluatePotentials(MWPotential,R,z)+0.5*(vR**2.+vT**2.+vz**2.)
+    u0= actionAngleStaeckel_c.actionAngleStaeckel_calcu0(E,R*vT,
+                                                         MWPotential,0.71)[0]
+    for c,d in zip(aAS(R,vR,vT,z,vz),aAS(R,vR,vT,z,vz,u0=u0)):
+        assert numpy.all(numpy.fabs(c-d) < 10.**-6.), 'actionAngleStaeckel with u0 computed in C does not agree with that using u0 computed separately'
+    for c,d in zip(aAS.actionsFreqs(R,vR,vT,z,vz),
+                   aAS.actionsFreqs(R,vR,vT,z,vz,u0=u0)):
+        assert numpy.all(numpy.fabs(c-d) < 10.**-6.), 'actionAngleStaeckel actionsFreqs with u0 computed in C does not agree with that using u0 computed separately'
+    for c,d in zip(aAS.actionsFreqsAngles(R,vR,vT,z,vz,phi),
+                   aAS.actionsFreqsAngles(R,vR,vT,z,vz,phi,u0=u0)):
+        assert numpy.all(numpy.fabs(c-d) < 10.**-6.), 'actionAngleStaeckel actionsFreqsAngles with u0 computed in C does not agree with that using u0 computed separately'
+    return None
+
 #Basic sanity checking of the actionAngleStaeckel actions, w/ u0, and interppot
 def test_actionAngleStaeckel_basic_actions_u0_interppot_c():
     from galpy.actionAngle import actionAngleStaeckel
@@ -1433,6 +1516,50 @@ def test_actionAngleIsochroneApprox_otherIsochrone_integratedOrbit_angles():
     assert daz < 10.**-4., 'actionAngleIsochroneApprox applied to isochrone potential fails for az at %f%%' % (daz*100.)
     return None
 
+#Test that actionAngleIsochroneApprox gives the same result when integrating a list of orbits in a pool of threads
+def test_actionAngleIsochroneApprox_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    from galpy.potential import LogarithmicHaloPotential
+    from galpy.actionAngle import actionAngleIsochroneApprox
+    from galpy.orbit import Orbit
+    lp= LogarithmicHaloPotential(normalize=1.,q=0.9)
+    aAI= actionAngleIsochroneApprox(pot=lp,b=0.8,tintJ=50.,ntintJ=2000)
+    vxvvs= [[1.1,0.3,1.2,0.2,0.5,2.],[0.9,-0.1,0.8,-0.1,0.2,1.],
+            [1.3,0.1,1.,0.3,-0.1,0.5]]
+    acfs= numpy.array(aAI.actionsFreqsAngles([Orbit(v) for v in vxvvs]))
+    acfst= numpy.array(aAI.actionsFreqsAngles([Orbit(v) for v in vxvvs],
+                                              numcores=2))
+    assert numpy.all(numpy.fabs(acfs-acfst) < 10.**-10.), 'actionAngleIsochroneApprox with numcores= does not agree with the serial calculation'
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        jt= numpy.array(aAI([Orbit(v) for v in vxvvs],executor=executor))
+    assert numpy.all(numpy.fabs(numpy.array(aAI([Orbit(v) for v in vxvvs]))-jt) < 10.**-10.), 'actionAngleIsochroneApprox with executor= does not agree with the serial calculation'
+    return None
+
+#Check that actionAngleIsochroneApprox gives the same answer for arrays of 
+#phase-space points, integrated all at once and in chunks, as for Orbits
+def test_actionAngleIsochroneApprox_arrays_chunks():
+    from galpy.potential import LogarithmicHaloPotential
+    from galpy.actionAngle import actionAngleIsochroneApprox
+    from galpy.orbit import Orbit
+    lp= LogarithmicHaloPotential(normalize=1.,q=0.9)
+    aAI= actionAngleIsochroneApprox(pot=lp,b=0.8,tintJ=50.,ntintJ=2000,
+                                    integrate_method='odeint')
+    aAIc= actionAngleIsochroneApprox(pot=lp,b=0.8,tintJ=50.,ntintJ=2000,
+                                     integrate_method='odeint',chunksize=2)
+    vxvvs= numpy.array([[1.1,0.3,1.2,0.2,0.5,2.],[0.9,-0.1,0.8,-0.1,0.2,1.],
+                        [1.3,0.1,1.,0.3,-0.1,0.5]])
+    acfso= numpy.array(aAI.actionsFreqsAngles([Orbit(v) for v in vxvvs]))
+    acfs= numpy.array(aAI.actionsFreqsAngles(*vxvvs.T))
+    acfsc= numpy.array(aAIc.actionsFreqsAngles(*vxvvs.T))
+    assert numpy.all(numpy.fabs(acfs-acfso) < 10.**-10.), 'actionAngleIsochroneApprox for arrays does not agree with that for Orbits'
+    assert numpy.all(numpy.fabs(acfsc-acfso) < 10.**-10.), 'actionAngleIsochroneApprox in chunks does not agree with that for Orbits'
+    acfsc= numpy.array(aAIc.actionsFreqsAngles(*vxvvs.T,_firstFlip=True))
+    assert numpy.all(numpy.fabs(acfsc-acfso) < 10.**-4.), 'actionAngleIsochroneApprox in chunks w/ _firstFlip does not agree with that for Orbits'
+    jc= numpy.array(aAIc([Orbit(v) for v in vxvvs]))
+    j= numpy.array(aAI(*vxvvs.T))
+    assert numpy.all(numpy.fabs(jc-j) < 10.**-10.), 'actionAngleIsochroneApprox actions in chunks do not agree with those for arrays'
+    return None
+
 #Check that actionAngleIsochroneApprox gives the same answer for different setups
 def test_actionAngleIsochroneApprox_diffsetups(): 
     from galpy.potential import LogarithmicHaloPotential, \
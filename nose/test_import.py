@@ -21,3 +21,27 @@ def test_util_import():
     import galpy.util.bovy_coords
     import galpy.util.bovy_conversion
         
+
+# Import-time benchmark: importing galpy's main modules should not import 
+# plotting backends or optional dependencies, which are only loaded when 
+# they are first used
+_IMPORT_BENCHMARK= """
+import sys, time
+start= time.time()
+import galpy.potential, galpy.orbit, galpy.actionAngle
+print(time.time()-start)
+for module in ['matplotlib','galpy.util.bovy_plot','pynbody',
+               'galpy.actionAngle_src.actionAngleTorus_c','scipy.ndimage']:
+    print(module in sys.modules)
+"""
+def test_import_time():
+    import sys
+    import subprocess
+    out= subprocess.check_output([sys.executable,'-c',_IMPORT_BENCHMARK])
+    out= out.decode().strip().split('\n')[-6:]
+    print("Importing galpy.potential, galpy.orbit, and galpy.actionAngle took %.2f s" % float(out[0]))
+    assert not 'True' in out[1:], 'Importing galpy imports plotting backends or optional dependencies that should only be loaded on first use'
+    # Lazily-loaded modules work on first use
+    from galpy.actionAngle_src.actionAngleTorus import actionAngleTorus_c
+    assert isinstance(actionAngleTorus_c._ext_loaded,bool), 'Lazily-loaded actionAngleTorus_c module does not load on first use'
+    return None
@@ -949,3 +949,209 @@ def test_interpolation_potential_verticalfreq_notinterpolated():
         assert vfdiff < 10.**-10., 'RZPot interpolation w/ interpRZPotential fails when the potential was not interpolated at R = %g by %g' % (r,vfdiff)
     return None
 
+
+def test_interp3d_errors():
+    #Test that when we set up an interp3DPotential w/ another interpolated potential, we get an error
+    ip= potential.interp3DPotential(pot=potential.MWPotential,
+                                    rgrid=(0.01,2.,11),logR=False,
+                                    zgrid=(0.,0.2,11),nphi=8)
+    try:
+        potential.interp3DPotential(pot=ip,rgrid=(0.01,2.,11),logR=False,
+                                    zgrid=(0.,0.2,11),nphi=8)
+    except potential.PotentialError: pass
+    else: raise AssertionError('Setting up an interp3DPotential w/ another interp3DPotential did not raise PotentialError')
+    return None
+
+def test_interp3d_nodes():
+    # At the grid points, the interpolation should be exact
+    bp= [potential.SoftenedNeedleBarPotential(normalize=0.3,omegab=0.),
+         potential.MiyamotoNagaiPotential(normalize=0.7,a=0.5,b=0.3)]
+    ip= potential.interp3DPotential(pot=bp,
+                                    rgrid=(numpy.log(0.1),numpy.log(2.),21),
+                                    zgrid=(0.,1.,11),nphi=16)
+    R,z,phi= numpy.meshgrid(ip._rgrid[::4],ip._zgrid[::3],ip._phigrid[::5],
+                            indexing='ij')
+    R,z,phi= R.flatten(), z.flatten(), phi.flatten()
+    assert numpy.all(numpy.fabs(ip(R,z,phi)
+                                -potential.evaluatePotentials(bp,R,z,phi=phi)) < 10.**-10.), 'interp3DPotential does not reproduce the potential at the grid points'
+    assert numpy.all(numpy.fabs(ip.Rforce(R,-z,phi)
+                                -potential.evaluateRforces(bp,R,-z,phi=phi)) < 10.**-10.), 'interp3DPotential does not reproduce the radial force at the grid points'
+    assert numpy.all(numpy.fabs(ip.zforce(R,-z,phi)
+                                -potential.evaluatezforces(bp,R,-z,phi=phi)) < 10.**-10.), 'interp3DPotential does not reproduce the vertical force at the grid points'
+    assert numpy.all(numpy.fabs(ip.phiforce(R,z,phi)
+                                -potential.evaluatephiforces(bp,R,z,phi=phi)) < 10.**-10.), 'interp3DPotential does not reproduce the azimuthal force at the grid points'
+    return None
+
+def test_interp3d_accuracy():
+    bp= [potential.SoftenedNeedleBarPotential(normalize=0.3,omegab=0.),
+         potential.MiyamotoNagaiPotential(normalize=0.7,a=0.5,b=0.3)]
+    ip= potential.interp3DPotential(pot=bp,rgrid=(0.05,2.,101),logR=False,
+                                    zgrid=(-0.5,0.5,51),zsym=False,nphi=64)
+    numpy.random.seed(1)
+    R= numpy.random.uniform(0.2,1.9,101)
+    z= numpy.random.uniform(-0.4,0.4,101)
+    phi= numpy.random.uniform(-3.,9.,101)
+    for func,evalfunc,name in \
+            [(ip,potential.evaluatePotentials,'potential'),
+             (ip.Rforce,potential.evaluateRforces,'Rforce'),
+             (ip.zforce,potential.evaluatezforces,'zforce'),
+             (ip.phiforce,potential.evaluatephiforces,'phiforce')]:
+        exact= evalfunc(bp,R,z,phi=phi)
+        assert numpy.all(numpy.fabs(func(R,z,phi)-exact) \
+                             < 10.**-3.*numpy.amax(numpy.fabs(exact))), \
+            'interp3DPotential interpolation of the %s is inaccurate' % name
+    return None
+
+def test_interp3d_outsidegrid():
+    ip= potential.interp3DPotential(pot=potential.MWPotential,
+                                    rgrid=(0.01,2.,11),logR=False,
+                                    zgrid=(0.,0.2,11),nphi=8)
+    rs= [0.005,2.5]
+    zs= [-0.3,0.3]
+    for r in rs:
+        for z in zs:
+            assert numpy.fabs(ip(r,z,0.3)-potential.evaluatePotentials(potential.MWPotential,r,z)) < 10.**-10., 'interp3DPotential fails outside the grid at (R,z) = (%g,%g)' % (r,z)
+            assert numpy.fabs(ip.zforce(r,z,0.3)-potential.evaluatezforces(potential.MWPotential,r,z)) < 10.**-10., 'interp3DPotential fails outside the grid at (R,z) = (%g,%g)' % (r,z)
+    return None
+
+def test_interp3d_omegab():
+    # A rotating, interpolated potential should equal the rotating potential
+    bp= potential.SoftenedNeedleBarPotential(normalize=0.3,omegab=1.3,pa=0.)
+    ip= potential.interp3DPotential(pot=bp,rgrid=(0.05,2.,101),logR=False,
+                                    zgrid=(0.,0.5,26),nphi=64,omegab=1.3)
+    assert numpy.fabs(ip.OmegaP()-1.3) < 10.**-10., 'interp3DPotential does not return the correct pattern speed'
+    for t in [-2.,0.7,3.]:
+        assert numpy.fabs(ip.phiforce(0.8,0.1,0.4,t=t)-bp.phiforce(0.8,0.1,0.4,t=t)) < 10.**-3., 'Rotating interp3DPotential does not agree with the rotating potential'
+    return None
+
+def test_interp3d_orbit_c():
+    # Integrating an orbit in C and in python should give the same result
+    from galpy.orbit import Orbit
+    bp= [potential.SoftenedNeedleBarPotential(normalize=0.3,omegab=0.),
+         potential.MiyamotoNagaiPotential(normalize=0.7,a=0.5,b=0.3)]
+    ip= potential.interp3DPotential(pot=bp,rgrid=(0.05,2.,51),logR=False,
+                                    zgrid=(0.,0.5,26),nphi=32)
+    ts= numpy.linspace(0.,10.,1001)
+    o= Orbit([1.,0.1,0.9,0.05,0.,0.])
+    oc= o()
+    o.integrate(ts,ip,method='leapfrog')
+    oc.integrate(ts,ip,method='leapfrog_c')
+    assert numpy.all(numpy.fabs(o.x(ts)-oc.x(ts)) < 10.**-6.), 'Orbit integration in interp3DPotential in C does not agree with that in python'
+    assert numpy.all(numpy.fabs(o.z(ts)-oc.z(ts)) < 10.**-6.), 'Orbit integration in interp3DPotential in C does not agree with that in python'
+    return None
+
+def test_interpolation_potential_cache():
+    # Test that the grids are saved to and loaded from the cache
+    import os, shutil, tempfile
+    cachedir= tempfile.mkdtemp()
+    try:
+        kwargs= {'rgrid':(0.01,2.,51),'zgrid':(0.,0.2,21),'logR':False,
+                 'interpPot':True,'interpRforce':True,'interpvcirc':True,
+                 'zsym':True,'cache':cachedir}
+        rzpot= potential.interpRZPotential(RZPot=potential.MWPotential,
+                                           **kwargs)
+        assert len(os.listdir(cachedir)) == 1, 'interpRZPotential did not save its grids to the cache'
+        rzpot_cached= potential.interpRZPotential(RZPot=potential.MWPotential,
+                                                  **kwargs)
+        assert len(os.listdir(cachedir)) == 1, 'interpRZPotential saved its grids to the cache twice'
+        assert numpy.all(rzpot_cached._potGrid == rzpot._potGrid), 'interpRZPotential grid loaded from the cache is not the same as the computed grid'
+        rs= numpy.linspace(0.1,1.9,11)
+        zs= numpy.linspace(-0.15,0.15,11)
+        assert numpy.all(numpy.fabs(rzpot_cached(rs,zs)-rzpot(rs,zs)) < 10.**-14.), 'interpRZPotential potential loaded from the cache does not agree with the computed potential'
+        assert numpy.all(numpy.fabs(rzpot_cached.Rforce(rs,zs)-rzpot.Rforce(rs,zs)) < 10.**-14.), 'interpRZPotential Rforce loaded from the cache does not agree with the computed Rforce'
+        assert numpy.all(numpy.fabs(rzpot_cached.vcirc(rs)-rzpot.vcirc(rs)) < 10.**-14.), 'interpRZPotential vcirc loaded from the cache does not agree with the computed vcirc'
+        # Different parameters or grids should not use the cached grids
+        mp= potential.MiyamotoNagaiPotential(a=0.5,b=0.05,normalize=1.)
+        potential.interpRZPotential(RZPot=mp,**kwargs)
+        mp._amp*= 1.5
+        rzpot_mp= potential.interpRZPotential(RZPot=mp,**kwargs)
+        assert len(os.listdir(cachedir)) == 3, 'interpRZPotential did not save new grids to the cache when the parameters of the potential changed'
+        assert numpy.fabs(rzpot_mp(0.5,0.1)-mp(0.5,0.1)) < 10.**-6., 'interpRZPotential loaded the wrong grids from the cache'
+        kwargs['zgrid']= (0.,0.3,21)
+        potential.interpRZPotential(RZPot=mp,**kwargs)
+        assert len(os.listdir(cachedir)) == 4, 'interpRZPotential did not save new grids to the cache when the grid changed'
+    finally:
+        shutil.rmtree(cachedir)
+    return None
+
+def test_interpolation_potential_adaptive():
+    # Test that the adaptive grid reaches the requested accuracy with fewer
+    # points than a uniform grid
+    pot= [potential.MiyamotoNagaiPotential(a=0.5,b=0.02,normalize=.6),
+          potential.HernquistPotential(a=0.1,normalize=0.4)]
+    rzpot= potential.interpRZPotential(RZPot=pot,
+                                       rgrid=(numpy.log(0.01),numpy.log(3.),9),
+                                       zgrid=(0.,0.5,9),
+                                       interpPot=True,interpRforce=True,
+                                       interpzforce=True,zsym=True,
+                                       adaptive=True,adaptive_tol=10.**-4.)
+    assert len(rzpot._rgrid) < 201 and len(rzpot._zgrid) < 201, 'Adaptive interpRZPotential grid is unexpectedly large'
+    assert numpy.all(numpy.diff(rzpot._rgrid) > 0.) \
+        and numpy.all(numpy.diff(rzpot._zgrid) > 0.), 'Adaptive interpRZPotential grid is not sorted'
+    uzpot= potential.interpRZPotential(RZPot=pot,
+                                       rgrid=(numpy.log(0.01),numpy.log(3.),
+                                              len(rzpot._rgrid)),
+                                       zgrid=(0.,0.5,len(rzpot._zgrid)),
+                                       interpPot=True,interpRforce=True,
+                                       interpzforce=True,zsym=True)
+    numpy.random.seed(1)
+    rs= numpy.exp(numpy.random.uniform(numpy.log(0.01),numpy.log(3.),1001))
+    zs= numpy.random.uniform(-0.5,0.5,1001)
+    for func,evalfunc,name in [('__call__',potential.evaluatePotentials,
+                                'potential'),
+                               ('Rforce',potential.evaluateRforces,'Rforce'),
+                               ('zforce',potential.evaluatezforces,'zforce')]:
+        exact= evalfunc(pot,rs,zs)
+        scale= numpy.amax(numpy.fabs(exact))
+        aerr= numpy.amax(numpy.fabs(getattr(rzpot,func)(rs,zs)-exact))/scale
+        uerr= numpy.amax(numpy.fabs(getattr(uzpot,func)(rs,zs)-exact))/scale
+        assert aerr < 10.**-3., 'Adaptive interpRZPotential interpolation of the %s is not accurate' % name
+        assert aerr < uerr, 'Adaptive interpRZPotential interpolation of the %s is not more accurate than the interpolation on a uniform grid with the same number of points' % name
+    return None
+
+def test_interpolation_potential_adaptive_c():
+    # Test that the C implementation evaluates the same splines on an
+    # adaptive grid as python
+    pot= [potential.MiyamotoNagaiPotential(a=0.5,b=0.05,normalize=.6),
+          potential.HernquistPotential(a=0.3,normalize=0.4)]
+    kwargs= {'rgrid':(0.01,2.,9),'zgrid':(0.,0.3,9),'logR':False,
+             'interpRforce':True,'interpzforce':True,'zsym':True,
+             'adaptive':True,'adaptive_tol':10.**-4.}
+    rzpot= potential.interpRZPotential(RZPot=pot,enable_c=False,**kwargs)
+    rzpot_c= potential.interpRZPotential(RZPot=pot,enable_c=True,**kwargs)
+    assert numpy.all(rzpot._rgrid == rzpot_c._rgrid) \
+        and numpy.all(rzpot._zgrid == rzpot_c._zgrid), 'Adaptive interpRZPotential grid depends on enable_c'
+    rs= numpy.linspace(0.02,1.99,21)
+    zs= numpy.linspace(-0.29,0.29,21)
+    assert numpy.all(numpy.fabs(rzpot_c.Rforce(rs,zs)-rzpot.Rforce(rs,zs)) < 10.**-10.), 'Adaptive interpRZPotential Rforce in C does not agree with that in python'
+    assert numpy.all(numpy.fabs(rzpot_c.zforce(rs,zs)-rzpot.zforce(rs,zs)) < 10.**-10.), 'Adaptive interpRZPotential zforce in C does not agree with that in python'
+    # Orbit integration in C should agree with that in python
+    from galpy.orbit import Orbit
+    ts= numpy.linspace(0.,10.,1001)
+    o= Orbit([1.,0.1,1.1,0.,0.1])
+    oc= o()
+    o.integrate(ts,rzpot,method='leapfrog')
+    oc.integrate(ts,rzpot_c,method='leapfrog_c')
+    assert numpy.all(numpy.fabs(o.R(ts)-oc.R(ts)) < 10.**-6.), 'Orbit integration in an adaptive interpRZPotential in C does not agree with that in python'
+    assert numpy.all(numpy.fabs(o.z(ts)-oc.z(ts)) < 10.**-6.), 'Orbit integration in an adaptive interpRZPotential in C does not agree with that in python'
+    return None
+
+def test_interpolation_potential_adaptive_maxn():
+    import warnings
+    from galpy.util import galpyWarning
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always",galpyWarning)
+        rzpot= potential.interpRZPotential(RZPot=potential.MWPotential,
+                                           rgrid=(0.01,2.,5),
+                                           zgrid=(0.,0.2,5),logR=False,
+                                           interpPot=True,zsym=True,
+                                           adaptive=True,
+                                           adaptive_tol=10.**-12.,
+                                           adaptive_maxn=11)
+        raisedWarning= False
+        for wa in w:
+            raisedWarning= (str(wa.message) == "Adaptive refinement of the interpRZPotential grid stopped before reaching the requested tolerance, because the grid would have more than adaptive_maxn= 11 points")
+            if raisedWarning: break
+        assert raisedWarning, 'interpRZPotential with adaptive=True did not raise a warning when reaching adaptive_maxn'
+    assert len(rzpot._rgrid) <= 11 and len(rzpot._zgrid) <= 11, 'Adaptive interpRZPotential grid is larger than adaptive_maxn'
+    return None
@@ -100,8 +100,9 @@ def test_energy_jacobi_conservation():
     pots.append('sech2DiskSCFPotential')
     pots.append('expwholeDiskSCFPotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
-             'interpRZPotential', 'linearPotential', 'planarAxiPotential',
+             'MovingObjectPotential','DehnenSmoothWrapperPotential',
+             'interpRZPotential', 'interp3DPotential', 'CompositePotential',
+             'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential']
     if False: #_TRAVIS: #travis CI
@@ -439,8 +440,9 @@ def test_liouville_planar():
     #pots.append('mockFlatSteadyLogSpiralPotential')
     #pots.append('mockFlatTransientLogSpiralPotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
-             'interpRZPotential', 'linearPotential', 'planarAxiPotential',
+             'MovingObjectPotential','DehnenSmoothWrapperPotential',
+             'interpRZPotential', 'interp3DPotential', 'CompositePotential',
+             'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential']
     #rmpots.append('BurkertPotential')
@@ -549,8 +551,9 @@ def test_eccentricity():
     pots.append('testMWPotential')
     pots.append('testplanarMWPotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
-             'interpRZPotential', 'linearPotential', 'planarAxiPotential',
+             'MovingObjectPotential','DehnenSmoothWrapperPotential',
+             'interpRZPotential', 'interp3DPotential', 'CompositePotential',
+             'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential']
     if False: #_TRAVIS: #travis CI
@@ -669,8 +672,9 @@ def test_pericenter():
     pots.append('testMWPotential')
     pots.append('testplanarMWPotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
-             'interpRZPotential', 'linearPotential', 'planarAxiPotential',
+             'MovingObjectPotential','DehnenSmoothWrapperPotential',
+             'interpRZPotential', 'interp3DPotential', 'CompositePotential',
+             'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential']
     if False: #_TRAVIS: #travis CI
@@ -788,8 +792,9 @@ def test_apocenter():
     pots.append('testMWPotential')
     pots.append('testplanarMWPotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
-             'interpRZPotential', 'linearPotential', 'planarAxiPotential',
+             'MovingObjectPotential','DehnenSmoothWrapperPotential',
+             'interpRZPotential', 'interp3DPotential', 'CompositePotential',
+             'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential']
     if False: #_TRAVIS: #travis CI
@@ -907,8 +912,9 @@ def test_zmax():
                and not 'evaluate' in p)]
     pots.append('testMWPotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
-             'interpRZPotential', 'linearPotential', 'planarAxiPotential',
+             'MovingObjectPotential','DehnenSmoothWrapperPotential',
+             'interpRZPotential', 'interp3DPotential', 'CompositePotential',
+             'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential']
     if False: #_TRAVIS: #travis CI
@@ -1013,8 +1019,9 @@ def test_analytic_ecc_rperi_rap():
     pots.append('testMWPotential')
     pots.append('testplanarMWPotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
-             'interpRZPotential', 'linearPotential', 'planarAxiPotential',
+             'MovingObjectPotential','DehnenSmoothWrapperPotential',
+             'interpRZPotential', 'interp3DPotential', 'CompositePotential',
+             'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential']
     if False: #_TRAVIS: #travis CI
@@ -1219,8 +1226,9 @@ def test_analytic_zmax():
                and not 'evaluate' in p)]
     pots.append('testMWPotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
-             'interpRZPotential', 'linearPotential', 'planarAxiPotential',
+             'MovingObjectPotential','DehnenSmoothWrapperPotential',
+             'interpRZPotential', 'interp3DPotential', 'CompositePotential',
+             'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential']
     if False: #_TRAVIS: #travis CI
@@ -2544,6 +2552,51 @@ def test_orbitfit_custom():
     assert numpy.all(compf < 10.**-4.), 'Orbit fit in radec space does not work'
     return None
 
+# Test orbit fit using the gradient of the likelihood
+def test_orbitfit_gradient():
+    from galpy.orbit import Orbit
+    from galpy.orbit_src.FullOrbit import _fitOrbitIntegrator, \
+        _fit_orbit_mlogl_grad
+    lp= potential.LogarithmicHaloPotential(normalize=1.,q=0.9)
+    o= Orbit([0.8,0.3,1.3,0.4,0.2,2.])
+    ts= numpy.linspace(0.,1.,1001)
+    o.integrate(ts,lp)
+    #Create orbit points from this integrated orbit, each 100th point
+    vxvv= o._orb.orbit[::100,:]
+    #The gradient agrees with a finite difference of the likelihood
+    tintegrator= _fitOrbitIntegrator(lp,1.5,1000)
+    args= (vxvv,None,False,False,False,None,None,tintegrator,None,None,None)
+    x0= numpy.array([0.81,0.29,1.31,0.41,0.19,2.01])
+    grad= _fit_orbit_mlogl_grad(x0,*args)[1]
+    for ii in range(6):
+        dx= numpy.zeros(6)
+        dx[ii]= 10.**-6.
+        fd= 0.5*(_fit_orbit_mlogl_grad(x0+dx,*args)[0]
+                 -_fit_orbit_mlogl_grad(x0-dx,*args)[0])/dx[ii]
+        assert numpy.fabs((grad[ii]-fd)/fd) < 10.**-4., 'Gradient of the orbit-fit likelihood does not agree with a finite difference'
+    #now fit, using another orbit instance
+    of= o()
+    of.fit(vxvv,pot=lp,tintJ=1.5,gradient=True)
+    assert numpy.all(comp_orbfit(of,vxvv,numpy.linspace(0.,2.,1001),lp) < 10.**-7.), 'Orbit fit in configuration space using the gradient of the likelihood does not work'
+    return None
+
+# Test fitting many orbits at once
+def test_orbitsfit():
+    from galpy.orbit import Orbit, Orbits
+    lp= potential.LogarithmicHaloPotential(normalize=1.,q=0.9)
+    orbs= Orbits([[0.8,0.3,1.3,0.4,0.2,2.],[1.1,-0.1,0.9,0.1,0.1,0.5]])
+    ts= numpy.linspace(0.,1.,1001)
+    orbs.integrate(ts,lp)
+    #Create orbit points from these integrated orbits, each 100th point
+    vxvv= [orbs.getOrbit()[ii,::100,:] for ii in range(len(orbs))]
+    #now fit, starting from the integrated orbits
+    maxLogL= orbs.fit(vxvv,pot=lp,tintJ=1.5,gradient=True,numcores=2)
+    assert maxLogL.shape == (2,), 'Orbits.fit does not return the maximum log likelihood of each orbit'
+    for ii in range(len(orbs)):
+        assert numpy.all(comp_orbfit(orbs[ii],vxvv[ii],
+                                     numpy.linspace(0.,2.,1001),lp) < 10.**-7.), 'Orbits.fit does not work'
+    return None
+
 def comp_orbfit(of,vxvv,ts,pot,lb=False,radec=False,ro=None,vo=None):
     """Compare the output of the orbit fit properly, ro and vo only implemented for radec"""
     from galpy.util import bovy_coords
@@ -3132,6 +3185,450 @@ def test_orbitint_pythonfallback():
             assert raisedWarning, "Orbit integration did not raise fallback warning"
     return None
 
+# Test that integrating multiple orbits in a single C call gives the same 
+# result as integrating them one by one
+def test_integrate_multiple_orbits_c():
+    from galpy.potential import MWPotential2014, LogarithmicHaloPotential, \
+        DehnenBarPotential
+    from galpy.orbit_src.FullOrbit import _integrateFullOrbit
+    from galpy.orbit_src.planarOrbit import _integrateOrbit
+    from galpy.orbit_src.integrateFullOrbit import integrateFullOrbit_c
+    numpy.random.seed(1)
+    vxvv= numpy.array([1.,0.,1.,0.,0.,0.])\
+        +0.1*numpy.random.normal(size=(11,6))
+    ts= numpy.linspace(0.,10.,101)
+    for integrator in ['dopr54_c','leapfrog_c','rk4_c','rk6_c',
+                       'symplec4_c','symplec6_c']:
+        out= _integrateFullOrbit(vxvv,MWPotential2014,ts,integrator,None)
+        assert out.shape == (11,101,6), 'Multiple-orbit integration does not return output of the expected shape'
+        for ii in range(len(vxvv)):
+            assert numpy.all(numpy.fabs(out[ii]-_integrateFullOrbit(vxvv[ii],MWPotential2014,ts,integrator,None)) < 10.**-10.), 'Integrating multiple orbits at once with %s does not agree with integrating them one by one' % integrator
+    # Also check that the error codes are returned per orbit
+    tmp_out, err= integrateFullOrbit_c(MWPotential2014,vxvv,ts,'dopr54_c')
+    assert err.shape == (11,), 'Multiple-orbit integration does not return an error code per orbit'
+    assert numpy.all(err == 0), 'Multiple-orbit integration returned an error'
+    # Planar, non-axisymmetric
+    lp= [LogarithmicHaloPotential(normalize=1.).toPlanar(),
+         DehnenBarPotential()]
+    vxvv= vxvv[:,[0,1,2,5]]
+    for integrator in ['dopr54_c','leapfrog_c','rk4_c','rk6_c',
+                       'symplec4_c','symplec6_c']:
+        out, msg= _integrateOrbit(vxvv,lp,ts,integrator,None)
+        assert out.shape == (11,101,4), 'Multiple-orbit integration does not return output of the expected shape'
+        for ii in range(len(vxvv)):
+            assert numpy.all(numpy.fabs(out[ii]-_integrateOrbit(vxvv[ii],lp,ts,integrator,None)[0]) < 10.**-10.), 'Integrating multiple planar orbits at once with %s does not agree with integrating them one by one' % integrator
+    return None
+
+# Test that the Orbits container gives the same results as individual Orbits
+def test_orbits_container():
+    from galpy.orbit import Orbit, Orbits
+    from galpy.potential import MWPotential2014, LogarithmicHaloPotential
+    numpy.random.seed(1)
+    vxvv= numpy.array([1.,0.,1.,0.,0.,0.])\
+        +0.1*numpy.random.normal(size=(5,6))
+    ts= numpy.linspace(0.,10.,1001)
+    lp= LogarithmicHaloPotential(normalize=1.)
+    cols= {6:[0,1,2,3,4,5],5:[0,1,2,3,4],4:[0,1,2,5]}
+    for ndim, pot in zip([6,5,4],[MWPotential2014,MWPotential2014,lp]):
+        os= Orbits(vxvv[:,cols[ndim]])
+        assert len(os) == 5, 'Orbits has the wrong length'
+        os.integrate(ts,pot,method='dopr54_c')
+        assert os.getOrbit().shape == (5,len(ts),ndim), 'Orbits.getOrbit does not return an array of the expected shape'
+        assert os.R().shape == (5,), 'Orbits.R() does not return the initial radii'
+        assert os.R(ts).shape == (5,len(ts)), 'Orbits.R(ts) does not return an array of the expected shape'
+        assert os.vR(1.).shape == (5,), 'Orbits.vR(t) does not return an array of the expected shape'
+        for ii in range(len(orbs)):
+            o= Orbit(list(os.vxvv[ii]))
+            o.integrate(ts,pot,method='dopr54_c')
+            # at the integration times
+            assert numpy.all(numpy.fabs(o.R(ts)-os.R(ts)[ii]) < 10.**-10.), 'Orbits.R does not agree with Orbit.R'
+            assert numpy.all(numpy.fabs(o.vT(ts)-os.vT(ts)[ii]) < 10.**-10.), 'Orbits.vT does not agree with Orbit.vT'
+            assert numpy.all(numpy.fabs(o.E(ts)-os.E(ts)[ii]) < 10.**-10.), 'Orbits.E does not agree with Orbit.E'
+            # interpolated
+            assert numpy.fabs(o.vR(5.0321)-os.vR(5.0321)[ii]) < 10.**-8., 'Orbits.vR does not agree with Orbit.vR when interpolating'
+            if ndim == 5: continue
+            assert numpy.all(numpy.fabs(o.x(ts)-os.x(ts)[ii]) < 10.**-10.), 'Orbits.x does not agree with Orbit.x'
+            assert numpy.all(numpy.fabs(o.vy(ts)-os.vy(ts)[ii]) < 10.**-10.), 'Orbits.vy does not agree with Orbit.vy'
+            assert numpy.fabs(o.phi(5.0321)-os.phi(5.0321)[ii]) < 10.**-8., 'Orbits.phi does not agree with Orbit.phi when interpolating'
+            # Single orbit from indexing
+            assert numpy.all(numpy.fabs(os[ii].R(ts)-o.R(ts)) < 10.**-10.), 'Indexing Orbits does not return the correct Orbit'
+        # Slicing returns views
+        sos= os[1:3]
+        assert len(sos) == 2, 'Slicing Orbits does not return the expected number of orbits'
+        assert numpy.may_share_memory(sos.getOrbit(),os.getOrbit()), 'Slicing Orbits does not return a view'
+        assert numpy.all(sos.R(ts) == os.R(ts)[1:3]), 'Slicing Orbits does not return the correct orbits'
+    # Physical output
+    os= Orbits(vxvv,ro=8.,vo=220.)
+    os.integrate(ts,MWPotential2014)
+    assert numpy.all(numpy.fabs(os.R(ts)-8.*os.R(ts,use_physical=False)) < 10.**-10.), 'Orbits.R does not return physical output'
+    assert numpy.all(numpy.fabs(os.vR(ts)-220.*os.vR(ts,use_physical=False)) < 10.**-10.), 'Orbits.vR does not return physical output'
+    # Initialization from a list of Orbit instances
+    os2= Orbits([Orbit(list(v)) for v in vxvv])
+    assert numpy.all(os2.vxvv == vxvv), 'Orbits initialized from a list of Orbit instances does not have the correct initial conditions'
+    return None
+
+# Test that integrating an Orbits instance in a pool of threads gives the same
+# result as integrating it in a single call
+def test_orbits_integrate_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    from galpy.orbit import Orbits
+    from galpy.potential import MWPotential2014, LogarithmicHaloPotential
+    numpy.random.seed(2)
+    vxvv= numpy.array([1.,0.,1.,0.,0.,0.])\
+        +0.1*numpy.random.normal(size=(7,6))
+    ts= numpy.linspace(0.,10.,1001)
+    lp= LogarithmicHaloPotential(normalize=1.)
+    cols= {6:[0,1,2,3,4,5],5:[0,1,2,3,4],4:[0,1,2,5]}
+    for ndim, pot in zip([6,5,4],[MWPotential2014,MWPotential2014,lp]):
+        os= Orbits(vxvv[:,cols[ndim]])
+        os.integrate(ts,pot,method='dopr54_c')
+        ost= Orbits(vxvv[:,cols[ndim]])
+        ost.integrate(ts,pot,method='dopr54_c',numcores=3)
+        assert numpy.all(numpy.fabs(os.getOrbit()-ost.getOrbit()) < 10.**-10.), 'Integrating Orbits in a pool of threads does not agree with integrating them at once'
+        ose= Orbits(vxvv[:,cols[ndim]])
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            ose.integrate(ts,pot,method='dopr54_c',executor=executor)
+        assert numpy.all(numpy.fabs(os.getOrbit()-ose.getOrbit()) < 10.**-10.), 'Integrating Orbits using an executor does not agree with integrating them at once'
+    return None
+
+# Test that the vectorized python integrators, which integrate all orbits at
+# once, agree with integrating each orbit separately with odeint
+def test_orbits_integrate_python_vectorized():
+    from galpy.orbit import Orbit, Orbits
+    from galpy.potential import MWPotential2014, LogarithmicHaloPotential, \
+        FerrersPotential
+    numpy.random.seed(3)
+    vxvv= numpy.array([1.,0.,1.,0.,0.,0.])\
+        +0.1*numpy.random.normal(size=(5,6))
+    ts= numpy.linspace(0.,10.,201)
+    lp= LogarithmicHaloPotential(normalize=1.,q=0.9)
+    cols= {6:[0,1,2,3,4,5],5:[0,1,2,3,4],4:[0,1,2,5]}
+    for ndim, pot in zip([6,5,4],[MWPotential2014,MWPotential2014,
+                                  lp.toPlanar()]):
+        for method in ['leapfrog','symplec4','rk4','dopr54','dop853']:
+            os= Orbits(vxvv[:,cols[ndim]])
+            os.integrate(ts,pot,method=method)
+            for ii in range(len(vxvv)):
+                o= Orbit(vxvv[ii,cols[ndim]])
+                o.integrate(ts,pot,method='odeint')
+                assert numpy.all(numpy.fabs(os.R(ts)[ii]-o.R(ts)) < 10.**-4.) \
+                    and numpy.all(numpy.fabs(os.vR(ts)[ii]-o.vR(ts)) < 10.**-4.) \
+                    and numpy.all(numpy.fabs(os.vT(ts)[ii]-o.vT(ts)) < 10.**-4.), 'Integrating Orbits with the vectorized %s integrator does not agree with integrating each orbit separately' % method
+                if ndim == 5: continue
+                # Compare x rather than phi, because phi wraps
+                assert numpy.all(numpy.fabs(os.x(ts)[ii]-o.x(ts)) < 10.**-4.), 'Integrating Orbits with the vectorized %s integrator does not agree with integrating each orbit separately' % method
+    # FerrersPotential cannot be evaluated for arrays, so its forces are
+    # evaluated one orbit at a time
+    fp= FerrersPotential(normalize=.2,a=0.5,b=0.35,c=0.25)
+    ts= numpy.linspace(0.,1.,11)
+    os= Orbits(vxvv[:2])
+    os.integrate(ts,[lp,fp],method='dopr54')
+    for ii in range(2):
+        o= Orbit(vxvv[ii])
+        o.integrate(ts,[lp,fp],method='odeint')
+        assert numpy.all(numpy.fabs(os.x(ts)[ii]-o.x(ts)) < 10.**-4.) \
+            and numpy.all(numpy.fabs(os.vR(ts)[ii]-o.vR(ts)) < 10.**-4.), 'Integrating Orbits with the vectorized dopr54 integrator does not agree with integrating each orbit separately for a potential that cannot be evaluated for arrays'
+    return None
+
+# Test that the observed coordinates, orbital parameters, and actions of an
+# Orbits instance agree with those of the individual Orbits
+def test_orbits_accessors():
+    from galpy.orbit import Orbit, Orbits
+    from galpy.potential import MWPotential2014, IsochronePotential
+    numpy.random.seed(4)
+    vxvv= numpy.array([1.,0.,1.,0.,0.,0.])\
+        +0.1*numpy.random.normal(size=(3,6))
+    ts= numpy.linspace(0.,10.,101)
+    ip= IsochronePotential(normalize=1.,b=1.2)
+    os= Orbits(vxvv,ro=8.,vo=220.)
+    os.integrate(ts,MWPotential2014,method='dop853')
+    oobs= Orbit([1.,0.,1.,0.,0.,0.])
+    oobs.integrate(ts,MWPotential2014,method='dop853')
+    for ii in range(len(vxvv)):
+        o= Orbit(list(vxvv[ii]),ro=8.,vo=220.)
+        o.integrate(ts,MWPotential2014,method='dop853')
+        for attr in ['ra','dec','ll','bb','dist','pmra','pmdec','pmll',
+                     'pmbb','vlos','vra','vdec','vll','vbb',
+                     'helioX','helioY','helioZ','U','V','W']:
+            assert numpy.all(numpy.fabs(getattr(os,attr)(ts)[ii]
+                                        -getattr(o,attr)(ts)) < 10.**-6.), 'Orbits.%s does not agree with Orbit.%s' % (attr,attr)
+            assert numpy.fabs(getattr(os,attr)()[ii]-getattr(o,attr)()) < 10.**-8., 'Orbits.%s does not agree with Orbit.%s at the initial condition' % (attr,attr)
+            obs= [8.,0.,0.,0.,230.,0.]
+            assert numpy.all(numpy.fabs(getattr(os,attr)(ts,obs=obs,ro=8.5,vo=230.)[ii]-getattr(o,attr)(ts,obs=obs,ro=8.5,vo=230.)) < 10.**-6.), 'Orbits.%s does not agree with Orbit.%s for a different observer' % (attr,attr)
+            # Observer on an orbit
+            assert numpy.all(numpy.fabs(getattr(os,attr)(ts,obs=oobs)[ii,:3]-numpy.array([getattr(o,attr)(t,obs=oobs) for t in ts[:3]])) < 10.**-6.), 'Orbits.%s does not agree with Orbit.%s for an observer on an orbit' % (attr,attr)
+        for attr in ['e','rap','rperi','zmax']:
+            assert numpy.fabs(getattr(os,attr)()[ii]-getattr(o,attr)()) < 10.**-8., 'Orbits.%s does not agree with Orbit.%s' % (attr,attr)
+            assert numpy.fabs(getattr(os,attr)(analytic=True)[ii]-getattr(o,attr)(analytic=True)) < 10.**-8., 'Orbits.%s does not agree with Orbit.%s for analytic=True' % (attr,attr)
+        for attr in ['jr','jp','jz']:
+            assert numpy.fabs(getattr(os,attr)()[ii]-getattr(o,attr)()) < 10.**-8., 'Orbits.%s does not agree with Orbit.%s' % (attr,attr)
+        for attr in ['jr','jp','jz','wr','wp','wz','Tr','Tp','TrTp','Tz',
+                     'Or','Op','Oz']:
+            assert numpy.fabs(getattr(os,attr)(pot=ip,type='spherical')[ii]-getattr(o,attr)(pot=ip,type='spherical')) < 10.**-8., 'Orbits.%s does not agree with Orbit.%s' % (attr,attr)
+    return None
+
+# Test that the arguments for the C code cached on the potential are updated
+# when the potential changes
+def test_parse_pot_cache():
+    from galpy.orbit import Orbit
+    from galpy.potential import LogarithmicHaloPotential, \
+        MiyamotoNagaiPotential
+    from galpy.orbit_src.integrateFullOrbit import _parse_pot
+    from galpy.orbit_src.integratePlanarOrbit import \
+        _parse_pot as _parse_planar_pot
+    lp= LogarithmicHaloPotential(normalize=1.,q=0.9)
+    mp= MiyamotoNagaiPotential(normalize=.5,a=0.5,b=0.05)
+    npot, pot_type, pot_args= _parse_pot([lp,mp])
+    assert hasattr(lp,'_c_args_cache'), 'Parsed arguments for C not cached on the potential'
+    npot2, pot_type2, pot_args2= _parse_pot([lp,mp])
+    assert npot == npot2 and numpy.all(pot_type == pot_type2) \
+        and numpy.all(pot_args == pot_args2), 'Cached arguments for C differ from the original ones'
+    ts= numpy.linspace(0.,10.,101)
+    for o,ptype in zip([Orbit([1.,0.1,1.1,0.1,0.,0.]),
+                        Orbit([1.,0.1,1.1,0.])],['full','planar']):
+        o.integrate(ts,[lp,mp],method='dopr54_c')
+        # Change the amplitude and a parameter, should invalidate the cache
+        lp._amp*= 2.
+        mp._a= 0.6
+        assert not numpy.all(_parse_pot([lp,mp])[2] == pot_args), 'Changing the amplitude of a potential does not update its cached arguments for C'
+        o.integrate(ts,[lp,mp],method='dopr54_c')
+        lpn= LogarithmicHaloPotential(amp=lp._amp,q=0.9)
+        mpn= MiyamotoNagaiPotential(amp=mp._amp,a=0.6,b=0.05)
+        on= o()
+        on.integrate(ts,[lpn,mpn],method='dopr54_c')
+        assert numpy.all(numpy.fabs(o.R(ts)-on.R(ts)) < 10.**-10.), 'Orbit integration does not use the updated %s potential after changing its parameters' % ptype
+        lp._amp/= 2.
+        mp._a= 0.5
+    # Planar wrappers cache on the underlying potential
+    _parse_planar_pot(lp.toPlanar())
+    assert ('planar',) in lp._c_args_cache, 'Parsed planar arguments for C not cached on the underlying 3D potential'
+    return None
+
+# Test that the arguments for the C code cached on a potential are updated
+# when a potential that it contains or an array parameter changes, but not
+# when a force evaluation caches intermediate results
+def test_parse_pot_cache_parameters():
+    from galpy.potential import MN3ExponentialDiskPotential, SCFPotential, \
+        DoubleExponentialDiskPotential, TriaxialNFWPotential
+    from galpy.potential_src.Potential import _parameter_state
+    from galpy.orbit_src.integrateFullOrbit import _parse_pot
+    # Sub-potentials
+    mn= MN3ExponentialDiskPotential(normalize=1.,hr=0.3,hz=0.05)
+    pot_args= _parse_pot(mn)[2]
+    mn._mn3[0]._amp*= 2.
+    assert not numpy.all(_parse_pot(mn)[2] == pot_args), 'Changing the amplitude of a sub-potential does not update the cached arguments for C'
+    mn._mn3[0]._amp/= 2.
+    assert numpy.all(_parse_pot(mn)[2] == pot_args), 'Changing the amplitude of a sub-potential back does not update the cached arguments for C'
+    # In-place changes of array parameters, also in sub-potentials
+    sp= SCFPotential(Acos=numpy.ones((3,1,1)),a=1.)
+    pot_args= _parse_pot(sp)[2]
+    sp._Acos*= 2.
+    assert not numpy.all(_parse_pot(sp)[2] == pot_args), 'Changing an array parameter in place does not update the cached arguments for C'
+    # Sub-potential stored as an attribute
+    dp= DoubleExponentialDiskPotential(normalize=1.,hr=0.3,hz=0.05)
+    state= _parameter_state(dp)
+    dp._kp._amp*= 2.
+    assert _parameter_state(dp) != state, 'Changing the amplitude of a sub-potential does not change the state of the parameters of a potential'
+    # Caching intermediate results of force evaluations does not invalidate
+    tp= TriaxialNFWPotential(normalize=1.,b=0.8,c=0.6)
+    _parse_pot(tp)
+    cached= tp._c_args_cache[('full',False,False)]
+    tp.Rforce(1.1,0.1,phi=0.3)
+    assert hasattr(tp,'_cached_Fx'), 'Force evaluation of TriaxialNFWPotential does not cache its intermediate results'
+    _parse_pot(tp)
+    assert tp._c_args_cache[('full',False,False)] is cached, 'Caching the intermediate results of a force evaluation invalidates the cached arguments for C'
+    return None
+
+# Test that the dense output of an orbit integrated on a coarse time grid
+# agrees with an orbit integrated on a fine time grid
+def test_orbit_dense_output():
+    from galpy.orbit import Orbit, Orbits
+    from galpy.potential import MWPotential2014, LogarithmicHaloPotential, \
+        DehnenBarPotential
+    lp= LogarithmicHaloPotential(normalize=1.,q=0.9)
+    tc= numpy.linspace(0.,10.,101)
+    tf= numpy.linspace(0.,10.,2001)
+    ts= tf[1:-1:13]
+    for vxvv, pot, method in \
+            [([1.,0.1,1.1,0.1,0.2,0.3],MWPotential2014,'dop853'),
+             ([1.,0.1,1.1,0.1,0.2],MWPotential2014,'dop853'),
+             ([1.,0.1,1.1,0.3],[lp,DehnenBarPotential()],'dop853'),
+             ([1.,0.1,1.1],lp,'dop853'),
+             ([1.,0.1],lp.toVertical(1.),'odeint')]:
+        for sign in [1.,-1.]: # also backward
+            o= Orbit(vxvv)
+            o.integrate(sign*tc,pot,method=method,dense_output=True)
+            of= Orbit(vxvv)
+            of.integrate(sign*tf,pot,method=method)
+            assert numpy.all(numpy.fabs(o._orb(sign*tc[2:4])-o.getOrbit()[2:4].T) < 10.**-10.), 'Dense output of an orbit does not agree with the orbit at the integration times'
+            assert numpy.all(numpy.fabs(o._orb(sign*ts)-of._orb(sign*ts)) < 10.**-5.), 'Dense output of an orbit does not agree with integrating on a fine time grid for a %iD orbit' % len(vxvv)
+            assert numpy.all(numpy.fabs(o._orb(sign*ts[3])-of._orb(sign*ts[3])) < 10.**-5.), 'Dense output of an orbit does not agree with integrating on a fine time grid for a %iD orbit' % len(vxvv)
+    # Requesting times outside of the integrated range should raise an error
+    try:
+        o._orb(-11.)
+    except ValueError: pass
+    else: raise AssertionError('Dense output of an orbit does not raise ValueError for a time outside of the integrated range')
+    # Orbits and slices of Orbits
+    vxvv= numpy.array([[1.,0.1,1.1,0.1,0.2,0.3],[1.2,-0.1,0.9,0.,0.1,2.]])
+    os= Orbits(vxvv)
+    os.integrate(tc,MWPotential2014,method='dop853',dense_output=True)
+    for ii in range(len(vxvv)):
+        of= Orbit(list(vxvv[ii]))
+        of.integrate(tf,MWPotential2014,method='dop853')
+        assert numpy.all(numpy.fabs(os(ts)[ii]-of._orb(ts).T) < 10.**-5.), 'Dense output of Orbits does not agree with integrating on a fine time grid'
+        assert numpy.all(numpy.fabs(os[ii]._orb(ts)-of._orb(ts)) < 10.**-5.), 'Dense output of an Orbit taken from Orbits does not agree with integrating on a fine time grid'
+        assert numpy.all(numpy.fabs(os[ii:ii+1](ts)[0]-of._orb(ts).T) < 10.**-5.), 'Dense output of a slice of Orbits does not agree with integrating on a fine time grid'
+    return None
+
+# Test that the events found using the dense output give precise peri- and
+# apocenters for orbits integrated on a coarse time grid
+def test_orbit_events():
+    from galpy.orbit import Orbit, Orbits
+    from galpy.potential import IsochronePotential
+    ip= IsochronePotential(normalize=1.,b=1.2)
+    tc= numpy.linspace(0.,30.,61)
+    for vxvv in [[1.,0.1,1.1,0.,0.,0.],[1.,0.1,1.1,0.,0.],[1.,0.1,1.1,0.],
+                 [1.,0.1,1.1]]:
+        o= Orbit(vxvv)
+        o.integrate(tc,ip,method='dop853',dense_output=True)
+        assert numpy.fabs(o.rperi()-o.rperi(analytic=True,pot=ip)) < 10.**-5., 'Pericenter from the dense output does not agree with the analytic pericenter'
+        assert numpy.fabs(o.rap()-o.rap(analytic=True,pot=ip)) < 10.**-5., 'Apocenter from the dense output does not agree with the analytic apocenter'
+        assert numpy.fabs(o.e()-o.e(analytic=True,pot=ip)) < 10.**-5., 'Eccentricity from the dense output does not agree with the analytic eccentricity'
+        # Events: pericenters are separated by the radial period
+        tperi, vxvvperi= o.events('rperi')
+        assert numpy.all(numpy.fabs(numpy.diff(tperi)-o.Tr(pot=ip,type='spherical')) < 10.**-3.), 'Pericenter events are not separated by the radial period'
+        assert numpy.all(numpy.fabs(vxvvperi[:,1]) < 10.**-8.), 'vR is not zero at pericenter events'
+        # Function events
+        tap= o.events(lambda t,vxvv: vxvv[:,1],direction=-1)[0]
+        assert numpy.all(numpy.fabs(tap-o.events('rap')[0]) < 10.**-8.), 'Apocenter events from a function do not agree with named apocenter events'
+    # zmax, also for Orbits
+    vxvv= numpy.array([[1.,0.1,1.1,0.1,0.2,0.],[1.2,0.,1.,0.,0.3,1.]])
+    tf= numpy.linspace(0.,30.,30001)
+    os= Orbits(vxvv)
+    os.integrate(tc,ip,method='dop853',dense_output=True)
+    ofs= Orbits(vxvv)
+    ofs.integrate(tf,ip,method='dop853')
+    for attr in ['rperi','rap','zmax','e']:
+        assert numpy.all(numpy.fabs(getattr(os,attr)()-getattr(ofs,attr)()) < 10.**-5.), 'Orbits.%s from the dense output does not agree with integrating on a fine time grid' % attr
+    evs= os.events('zcross')
+    for ii in range(len(vxvv)):
+        o= Orbit(list(vxvv[ii]))
+        o.integrate(tc,ip,method='dop853',dense_output=True)
+        assert numpy.fabs(o.zmax()-ofs.zmax()[ii]) < 10.**-5., 'Orbit.zmax from the dense output does not agree with integrating on a fine time grid'
+        assert numpy.all(numpy.fabs(evs[ii][0]-o.events('zcross')[0]) < 10.**-8.), 'Orbits.events does not agree with Orbit.events'
+        assert numpy.all(numpy.fabs(evs[ii][1][:,3]) < 10.**-8.), 'z is not zero at disk crossing events'
+    return None
+
+def test_orbit_rotating_frame():
+    from galpy.orbit import Orbit, Orbits
+    from galpy.potential import DehnenBarPotential, \
+        DehnenSmoothWrapperPotential, LogarithmicHaloPotential, \
+        SoftenedNeedleBarPotential
+    from galpy.util import bovy_conversion
+    lp= LogarithmicHaloPotential(normalize=1.,q=0.9)
+    # Bar that rotates with the frame, grown with the smooth wrapper
+    sp= DehnenSmoothWrapperPotential(\
+        pot=SoftenedNeedleBarPotential(amp=0.05,b=0.3,omegab=1.3),
+        tform=1.,tsteady=2.)
+    dp= DehnenBarPotential(omegab=1.3,rb=0.8,Af=0.01,tform=0.1,tsteady=0.2)
+    ts= numpy.linspace(0.,10.,101)
+    for pot, vxvv in zip([[lp,sp],[lp,dp]],
+                         [[1.,0.1,1.1,0.1,0.05,0.],[1.,0.1,1.1,0.]]):
+        for method in ['dop853','rk4']:
+            o= Orbit(vxvv)
+            o.integrate(ts,pot,method=method)
+            orot= Orbit(vxvv)
+            orot.integrate(ts,pot,method=method,OmegaP=1.3)
+            # Output is in the inertial frame
+            assert numpy.all(numpy.fabs(o.x(ts)-orot.x(ts)) < 10.**-5.), 'Orbit integrated in a rotating frame does not agree with the orbit integrated in the inertial frame'
+            assert numpy.all(numpy.fabs(o.vy(ts)-orot.vy(ts)) < 10.**-5.), 'Orbit integrated in a rotating frame does not agree with the orbit integrated in the inertial frame'
+    # Orbits
+    vxvv= numpy.array([[1.,0.1,1.1,0.1,0.05,0.],[1.2,0.,0.9,0.,0.1,1.]])
+    os= Orbits(vxvv)
+    os.integrate(ts,[lp,sp],method='dop853')
+    osrot= Orbits(vxvv)
+    osrot.integrate(ts,[lp,sp],method='dop853',OmegaP=1.3)
+    assert numpy.all(numpy.fabs(os.getOrbit()-osrot.getOrbit()) < 10.**-5.), 'Orbits integrated in a rotating frame do not agree with the orbits integrated in the inertial frame'
+    # OmegaP as a Quantity
+    try:
+        from astropy import units
+    except ImportError: pass
+    else:
+        o= Orbit([1.,0.1,1.1,0.])
+        o.integrate(ts,[lp,dp],method='dop853',OmegaP=1.3)
+        oq= Orbit([1.,0.1,1.1,0.])
+        oq.integrate(ts,[lp,dp],method='dop853',
+                     OmegaP=1.3*bovy_conversion.freq_in_kmskpc(220.,8.)\
+                         *units.km/units.s/units.kpc)
+        assert numpy.all(numpy.fabs(o.x(ts)-oq.x(ts)) < 10.**-8.), 'Orbit integrated in a rotating frame with OmegaP given as a Quantity does not agree with OmegaP given in natural units'
+    # Integrators that are not Runge-Kutta and orbits that are not in a plane
+    # or in 3D are not supported
+    o= Orbit([1.,0.1,1.1,0.])
+    for method in ['symplec4','leapfrog_c']:
+        try:
+            o.integrate(ts,lp,method=method,OmegaP=1.3)
+        except ValueError: pass
+        else: raise AssertionError('Integrating in a rotating frame with a method that is not Runge-Kutta does not raise a ValueError')
+    o= Orbit([1.,0.1,1.1,0.1,0.])
+    try:
+        o.integrate(ts,lp,method='dop853',OmegaP=1.3)
+    except ValueError: pass
+    else: raise AssertionError('Integrating a 5D orbit in a rotating frame does not raise a ValueError')
+    return None
+
+def test_integrate_dxdv_3d():
+    from galpy.orbit import Orbit, Orbits
+    from galpy.potential import MWPotential2014
+    ts= numpy.linspace(0.,10.,101)
+    vxvv= [1.,0.1,1.1,0.1,0.05,0.3]
+    # Compare to a finite difference of two orbits
+    for ii in range(6):
+        dxdv= numpy.zeros(6)
+        dxdv[ii]= 1.
+        eps= 10.**-5.
+        op= Orbit(list(numpy.array(vxvv)+eps*dxdv))
+        op.integrate(ts,MWPotential2014,method='dop853')
+        om= Orbit(list(numpy.array(vxvv)-eps*dxdv))
+        om.integrate(ts,MWPotential2014,method='dop853')
+        fd= 0.5*(op.getOrbit()-om.getOrbit())/eps
+        for method in ['dopr54_c','dop853','odeint']:
+            o= Orbit(vxvv)
+            o.integrate_dxdv(dxdv,ts,MWPotential2014,method=method)
+            assert numpy.all(numpy.fabs(fd-o.getOrbit_dxdv()) < 10.**-4.), 'integrate_dxdv for a 3D orbit does not agree with a finite difference of two orbits'
+    # Rectangular output and input
+    o= Orbit(vxvv)
+    o.integrate_dxdv([0.1,0.2,0.3,0.4,0.5,0.6],ts,MWPotential2014,
+                     method='dopr54_c',rectOut=True)
+    orect= Orbit(vxvv)
+    orect.integrate_dxdv(o.getOrbit_dxdv()[0],ts,MWPotential2014,
+                         method='dopr54_c',rectIn=True)
+    ocyl= Orbit(vxvv)
+    ocyl.integrate_dxdv([0.1,0.2,0.3,0.4,0.5,0.6],ts,MWPotential2014,
+                        method='dopr54_c')
+    assert numpy.all(numpy.fabs(orect.getOrbit_dxdv()-ocyl.getOrbit_dxdv()) < 10.**-8.), 'integrate_dxdv with rectangular input does not agree with cylindrical input'
+    # An orbit in the plane agrees with the planar integrate_dxdv
+    o= Orbit([1.,0.1,1.1,0.,0.,0.3])
+    o.integrate_dxdv([0.1,0.2,0.3,0.,0.,0.4],ts,MWPotential2014,
+                     method='dopr54_c')
+    op= Orbit([1.,0.1,1.1,0.3])
+    op.integrate_dxdv([0.1,0.2,0.3,0.4],ts,MWPotential2014,method='dopr54_c')
+    assert numpy.all(numpy.fabs(o.getOrbit_dxdv()[:,[0,1,2,5]]-op.getOrbit_dxdv()) < 10.**-6.), 'integrate_dxdv for a 3D orbit in the plane does not agree with that for the planar orbit'
+    # Orbits, all at once
+    os= Orbits([vxvv,[1.2,0.,0.9,0.,0.1,1.]])
+    os.integrate_dxdv(numpy.eye(6)[:2],ts,MWPotential2014,method='dopr54_c')
+    for ii in range(2):
+        o= Orbit(list(os.vxvv[ii]))
+        o.integrate_dxdv(numpy.eye(6)[ii],ts,MWPotential2014,method='dopr54_c')
+        assert numpy.all(numpy.fabs(os.getOrbit_dxdv()[ii]-o.getOrbit_dxdv()) < 10.**-5.), 'Orbits.integrate_dxdv does not agree with Orbit.integrate_dxdv'
+        assert numpy.all(numpy.fabs(os[ii].getOrbit_dxdv()-o.getOrbit_dxdv()) < 10.**-5.), 'Orbits.integrate_dxdv does not agree with Orbit.integrate_dxdv'
+    # Symplectic integrators are not supported
+    o= Orbit(vxvv)
+    try:
+        o.integrate_dxdv(numpy.eye(6)[0],ts,MWPotential2014,method='symplec4_c')
+    except TypeError: pass
+    else: raise AssertionError("integrate_dxdv with symplectic integrator should have raised TypeError, but didn't")
+    return None
+
 # Test that the functions that supposedly *always* return output in physical 
 # units actually do so; see issue #294
 def test_intrinsic_physical_output():
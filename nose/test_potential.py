@@ -27,8 +27,9 @@ def test_normalize_potential():
     pots.append('specialMN3ExponentialDiskPotentialPD')
     pots.append('specialMN3ExponentialDiskPotentialSECH')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
-             'interpRZPotential', 'linearPotential', 'planarAxiPotential',
+             'MovingObjectPotential','DehnenSmoothWrapperPotential',
+             'interpRZPotential', 'interp3DPotential', 'CompositePotential',
+             'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential']
     if False: #_TRAVIS: #travis CI
@@ -91,6 +92,9 @@ def test_forceAsDeriv_potential():
     pots.append('mockDehnenBarPotentialT1')
     pots.append('mockDehnenBarPotentialTm1')
     pots.append('mockDehnenBarPotentialTm5')
+    pots.append('mockDehnenSmoothBarPotentialT1')
+    pots.append('mockDehnenSmoothBarPotentialTm1')
+    pots.append('mockDehnenSmoothBarPotentialTm5')
     pots.append('mockEllipticalDiskPotentialT1')
     pots.append('mockEllipticalDiskPotentialTm1')
     pots.append('mockEllipticalDiskPotentialTm5')
@@ -127,9 +131,11 @@ def test_forceAsDeriv_potential():
     pots.append('sech2DiskSCFPotential')
     pots.append('expwholeDiskSCFPotential')
     pots.append('nonaxiDiskSCFPotential')
+    pots.append('mockDehnenSmoothSoftenedNeedleBarPotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
-             'interpRZPotential', 'linearPotential', 'planarAxiPotential',
+             'MovingObjectPotential','DehnenSmoothWrapperPotential',
+             'interpRZPotential', 'interp3DPotential', 'CompositePotential',
+             'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential']
     if False: #_TRAVIS: #travis CI
@@ -257,6 +263,9 @@ def test_2ndDeriv_potential():
     pots.append('mockDehnenBarPotentialT1')
     pots.append('mockDehnenBarPotentialTm1')
     pots.append('mockDehnenBarPotentialTm5')
+    pots.append('mockDehnenSmoothBarPotentialT1')
+    pots.append('mockDehnenSmoothBarPotentialTm1')
+    pots.append('mockDehnenSmoothBarPotentialTm5')
     pots.append('mockEllipticalDiskPotentialT1')
     pots.append('mockEllipticalDiskPotentialTm1')
     pots.append('mockEllipticalDiskPotentialTm5')
@@ -280,8 +289,9 @@ def test_2ndDeriv_potential():
     pots.append('JaffeTwoPowerTriaxialPotential')
     pots.append('mockAxisymmetricFerrersPotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
-             'interpRZPotential', 'linearPotential', 'planarAxiPotential',
+             'MovingObjectPotential','DehnenSmoothWrapperPotential',
+             'interpRZPotential', 'interp3DPotential', 'CompositePotential',
+             'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential']
     if False: #_TRAVIS: #travis CI
@@ -490,8 +500,9 @@ def test_poisson_potential():
     pots.append('NFWTwoPowerTriaxialPotential')
     pots.append('JaffeTwoPowerTriaxialPotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
-             'interpRZPotential', 'linearPotential', 'planarAxiPotential',
+             'MovingObjectPotential','DehnenSmoothWrapperPotential',
+             'interpRZPotential', 'interp3DPotential', 'CompositePotential',
+             'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential']
     if False: #_TRAVIS: #travis CI
@@ -567,6 +578,9 @@ def test_evaluateAndDerivs_potential():
     pots.append('mockDehnenBarPotentialT1')
     pots.append('mockDehnenBarPotentialTm1')
     pots.append('mockDehnenBarPotentialTm5')
+    pots.append('mockDehnenSmoothBarPotentialT1')
+    pots.append('mockDehnenSmoothBarPotentialTm1')
+    pots.append('mockDehnenSmoothBarPotentialTm5')
     pots.append('mockEllipticalDiskPotentialT1')
     pots.append('mockEllipticalDiskPotentialTm1')
     pots.append('mockEllipticalDiskPotentialTm5')
@@ -593,8 +607,9 @@ def test_evaluateAndDerivs_potential():
     pots.append('expwholeDiskSCFPotential')
     pots.append('nonaxiDiskSCFPotential')
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
-             'interpRZPotential', 'linearPotential', 'planarAxiPotential',
+             'MovingObjectPotential','DehnenSmoothWrapperPotential',
+             'interpRZPotential', 'interp3DPotential', 'CompositePotential',
+             'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential']
     if False: #_TRAVIS: #travis CI
@@ -831,6 +846,31 @@ def test_mass_axi():
     else: raise AssertionError('mass for non-axisymmetric potential should have raised NotImplementedError, but did not')
     return None
 
+# Check that the batched Hankel transforms of DoubleExponentialDiskPotential
+# agree with evaluating one point at a time, also across the switch to the
+# Kepler potential at large R
+def test_DoubleExponentialDisk_arrays():
+    dp= potential.DoubleExponentialDiskPotential(normalize=1.,hr=0.3,hz=0.05)
+    Rs= numpy.array([[0.,0.2,0.7],[1.,2.5,7.]])
+    zs= numpy.array([[0.1,-0.3,0.],[0.05,-0.05,1.]])
+    for func in ['__call__','Rforce','zforce','R2deriv','z2deriv','Rzderiv']:
+        if func == '__call__': f= dp
+        else: f= getattr(dp,func)
+        if func in ['Rforce','R2deriv','Rzderiv']:
+            tRs= Rs+0.01 # avoid R=0
+        else:
+            tRs= Rs
+        arr= f(tRs,zs)
+        assert arr.shape == Rs.shape, 'DoubleExponentialDiskPotential %s does not return an array with the shape of the input' % func
+        for ii in range(Rs.shape[0]):
+            for jj in range(Rs.shape[1]):
+                assert numpy.fabs(arr[ii,jj]-f(tRs[ii,jj],zs[ii,jj])) < 10.**-12.*numpy.fabs(arr).max(), 'DoubleExponentialDiskPotential %s evaluated for an array does not agree with evaluating one point at a time' % func
+    # Broadcasting of a scalar z
+    assert numpy.all(numpy.fabs(dp.Rforce(Rs[0]+0.01,0.1)
+                                -dp.Rforce(Rs[0]+0.01,0.1*numpy.ones(3)))
+                     < 10.**-14.), 'DoubleExponentialDiskPotential Rforce does not broadcast a scalar z'
+    return None
+
 # Check that toVertical and toPlanar work
 def test_toVertical_toPlanar():
     #Grab all of the potentials
@@ -839,8 +879,9 @@ def test_toVertical_toPlanar():
                and not 'FullTo' in p and not 'toPlanar' in p
                and not 'evaluate' in p)]
     rmpots= ['Potential','MWPotential','MWPotential2014',
-             'MovingObjectPotential',
-             'interpRZPotential', 'linearPotential', 'planarAxiPotential',
+             'MovingObjectPotential','DehnenSmoothWrapperPotential',
+             'interpRZPotential', 'interp3DPotential', 'CompositePotential',
+             'linearPotential', 'planarAxiPotential',
              'planarPotential', 'verticalPotential','PotentialError',
              'SnapshotRZPotential','InterpSnapshotRZPotential']
     if False: #_TRAVIS: #travis CI
@@ -1620,6 +1661,37 @@ def test_TwoPowerTriaxialPotential_vs_TwoPowerSphericalPotential():
                 [numpy.sqrt(tnp.Rforce(r,0.)/np.Rforce(r,0.)) for r in rs])-1.) < 10.**tol), 'Vcirc not the same for Jaffe and spherical version of TriaxialJaffe'
     return None
 
+# Test that the potential of TwoPowerTriaxialPotential with spherical
+# parameters is the same as that of TwoPowerSphericalPotential (incl. zero
+# at infinity)
+def test_TwoPowerTriaxialPotential_vs_TwoPowerSphericalPotential_potential():
+    tol= -8.
+    rs= numpy.linspace(0.1,25.,21)
+    for alpha,beta in zip([1.5,0.5,2.5],[3.5,2.5,4.2]):
+        tnp= potential.TwoPowerTriaxialPotential(normalize=1.,b=1.,c=1.,
+                                                 a=1.5,alpha=alpha,beta=beta,
+                                                 glorder=None)
+        np= potential.TwoPowerSphericalPotential(normalize=1.,a=1.5,
+                                                 alpha=alpha,beta=beta)
+        assert numpy.all(numpy.fabs(numpy.array(\
+                    [tnp(r,0.)/np(r,0.) for r in rs])-1.) < 10.**tol), 'Potential not the same for TwoPowerSphericalPotential and spherical version of TwoPowerTriaxialPotential for alpha,beta = %g,%g' % (alpha,beta)
+    return None
+
+# Test that the Gauss-Legendre evaluation of FerrersPotential, which is the
+# one implemented in C, agrees with the direct integration
+def test_FerrersPotential_glorder():
+    fp= potential.FerrersPotential(normalize=.2,a=0.8,b=0.35,c=0.25,
+                                   pa=0.3,omegab=0.5)
+    fpq= potential.FerrersPotential(normalize=.2,a=0.8,b=0.35,c=0.25,
+                                    pa=0.3,omegab=0.5,glorder=None)
+    assert fp.hasC and not fpq.hasC, 'FerrersPotential hasC not set correctly'
+    for R,z,phi,t in zip([0.3,0.7,1.5,3.],[0.05,0.2,-0.3,1.],
+                         [0.2,1.3,2.5,-1.],[0.,1.,-2.,5.]):
+        for func in ['__call__','Rforce','zforce','phiforce']:
+            assert numpy.fabs(getattr(fp,func)(R,z,phi=phi,t=t)
+                              -getattr(fpq,func)(R,z,phi=phi,t=t)) < 10.**-8., 'Gauss-Legendre %s of FerrersPotential does not agree with direct integration' % func
+    return None
+
 # Test that TwoPowerTriaxial setup raises an error for bad values of alpha
 # and beta
 @raises(IOError)
@@ -1857,6 +1929,220 @@ def test_DiskSCFPotential_againstDoubleExp_dens():
     assert numpy.all(numpy.fabs((dp.dens(testR,testzs)-dscfp.dens(testR,testzs))/dscfp.dens(testRs,testz)) < 10.**-1.), "DiskSCFPotential for double-exponential disk does not agree with DoubleExponentialDiskPotential"
     return None
 
+def test_DehnenSmoothWrapperPotential_againstDehnenBar():
+    # Test that growing a fully-grown DehnenBarPotential with the wrapper
+    # gives the DehnenBarPotential that grows itself
+    dpn= potential.DehnenBarPotential(tform=-100.,tsteady=1.)
+    Tb= 2.*numpy.pi/dpn.OmegaP()
+    dp= potential.DehnenBarPotential(tform=-1.,tsteady=2.)
+    dwp= potential.DehnenSmoothWrapperPotential(pot=dpn,tform=-Tb,
+                                                tsteady=2.*Tb)
+    assert isinstance(dwp,potential.planarPotential), "DehnenSmoothWrapperPotential of a planarPotential is not a planarPotential"
+    assert dwp.isNonAxi, "DehnenSmoothWrapperPotential of a non-axisymmetric potential is not non-axisymmetric"
+    for t in [-2.*Tb,-0.5*Tb,0.,0.5*Tb,2.*Tb]:
+        for R,phi in [(0.5,0.2),(0.9,-1.),(1.5,2.)]:
+            assert numpy.fabs(dp(R,phi=phi,t=t)-dwp(R,phi=phi,t=t)) < 10.**-10., "DehnenSmoothWrapperPotential does not agree with DehnenBarPotential"
+            assert numpy.fabs(dp.Rforce(R,phi=phi,t=t)-dwp.Rforce(R,phi=phi,t=t)) < 10.**-10., "DehnenSmoothWrapperPotential does not agree with DehnenBarPotential"
+            assert numpy.fabs(dp.phiforce(R,phi=phi,t=t)-dwp.phiforce(R,phi=phi,t=t)) < 10.**-10., "DehnenSmoothWrapperPotential does not agree with DehnenBarPotential"
+            assert numpy.fabs(dp.R2deriv(R,phi=phi,t=t)-dwp.R2deriv(R,phi=phi,t=t)) < 10.**-10., "DehnenSmoothWrapperPotential does not agree with DehnenBarPotential"
+    return None
+
+def test_DehnenSmoothWrapperPotential_3d():
+    # Test that the wrapper grows 3D potentials, also when given as a list
+    sp= potential.SoftenedNeedleBarPotential(b=0.1,omegab=1.3)
+    mp= potential.MiyamotoNagaiPotential(normalize=1.)
+    dwp= potential.DehnenSmoothWrapperPotential(amp=2.,pot=[sp,mp],tform=-1.,
+                                                tsteady=2.)
+    assert isinstance(dwp,potential.Potential), "DehnenSmoothWrapperPotential of a Potential is not a Potential"
+    assert dwp.isNonAxi, "DehnenSmoothWrapperPotential of a non-axisymmetric potential is not non-axisymmetric"
+    assert dwp.hasC, "DehnenSmoothWrapperPotential of potentials with C implementations does not have a C implementation"
+    for t,smooth in [(-2.,0.),(0.,0.5),(1.,1.),(3.,1.)]:
+        assert numpy.fabs(dwp.Rforce(0.9,0.1,phi=0.3,t=t)-2.*smooth*(sp.Rforce(0.9,0.1,phi=0.3,t=t)+mp.Rforce(0.9,0.1,phi=0.3,t=t))) < 10.**-10., "DehnenSmoothWrapperPotential does not grow the wrapped potential as expected"
+        assert numpy.fabs(dwp.zforce(0.9,0.1,phi=0.3,t=t)-2.*smooth*(sp.zforce(0.9,0.1,phi=0.3,t=t)+mp.zforce(0.9,0.1,phi=0.3,t=t))) < 10.**-10., "DehnenSmoothWrapperPotential does not grow the wrapped potential as expected"
+        assert numpy.fabs(dwp.phiforce(0.9,0.1,phi=0.3,t=t)-2.*smooth*sp.phiforce(0.9,0.1,phi=0.3,t=t)) < 10.**-10., "DehnenSmoothWrapperPotential does not grow the wrapped potential as expected"
+        assert numpy.fabs(dwp.dens(0.9,0.1,phi=0.3,t=t)-2.*smooth*(sp.dens(0.9,0.1,phi=0.3,t=t)+mp.dens(0.9,0.1,phi=0.3,t=t))) < 10.**-10., "DehnenSmoothWrapperPotential does not grow the wrapped potential as expected"
+    # Arrays of positions
+    Rs= numpy.linspace(0.5,1.5,11)
+    assert numpy.all(numpy.fabs(dwp.Rforce(Rs,0.1,phi=0.3,t=0.)-numpy.array([dwp.Rforce(R,0.1,phi=0.3,t=0.) for R in Rs])) < 10.**-10.), "DehnenSmoothWrapperPotential does not evaluate arrays correctly"
+    return None
+
+def test_evaluate_c():
+    # Test that evaluate_c agrees with the python evaluation functions
+    from galpy.potential import MWPotential2014
+    tnp= potential.TriaxialNFWPotential(b=0.8,c=0.6,normalize=0.5)
+    dwp= potential.DehnenSmoothWrapperPotential(\
+        pot=potential.SoftenedNeedleBarPotential(omegab=1.,normalize=0.3),
+        tform=-2.,tsteady=3.)
+    Rs= numpy.linspace(0.3,2.,7)
+    zs= numpy.linspace(-0.5,0.5,5)
+    phis= numpy.linspace(0.,2.*numpy.pi,7)
+    R,z= numpy.meshgrid(Rs,zs,indexing='ij')
+    for pot,phi,t in [(MWPotential2014,None,0.),
+                      ([tnp,potential.MiyamotoNagaiPotential(normalize=.5)],
+                       phis[:,None],0.),
+                      (dwp,phis[:,None],numpy.linspace(-3.,4.,5)[None,:])]:
+        quants= ['potential','Rforce','zforce','phiforce',
+                 'R2deriv','z2deriv','Rzderiv']
+        out= potential.evaluate_c(pot,R,z,phi=phi,t=t,quantities=quants)
+        assert len(out) == len(quants), 'evaluate_c does not return all requested quantities'
+        bphi= numpy.zeros_like(R) if phi is None \
+            else numpy.broadcast_to(phi,R.shape)
+        bt= numpy.broadcast_to(t,R.shape)
+        for ii in range(R.shape[0]):
+            for jj in range(R.shape[1]):
+                args= (pot,R[ii,jj],z[ii,jj])
+                kwargs= {'phi':bphi[ii,jj],'t':bt[ii,jj]}
+                assert numpy.fabs(out[0][ii,jj]-potential.evaluatePotentials(*args,**kwargs)) < 10.**-8., 'evaluate_c does not agree with evaluatePotentials'
+                assert numpy.fabs(out[1][ii,jj]-potential.evaluateRforces(*args,**kwargs)) < 10.**-8., 'evaluate_c does not agree with evaluateRforces'
+                assert numpy.fabs(out[2][ii,jj]-potential.evaluatezforces(*args,**kwargs)) < 10.**-8., 'evaluate_c does not agree with evaluatezforces'
+                assert numpy.fabs(out[3][ii,jj]-potential.evaluatephiforces(*args,**kwargs)) < 10.**-8., 'evaluate_c does not agree with evaluatephiforces'
+                if pot is dwp: continue # no python 2nd derivs for the bar
+                assert numpy.fabs(out[4][ii,jj]-potential.evaluateR2derivs(*args,**kwargs)) < 10.**-6., 'evaluate_c does not agree with evaluateR2derivs'
+                assert numpy.fabs(out[5][ii,jj]-potential.evaluatez2derivs(*args,**kwargs)) < 10.**-6., 'evaluate_c does not agree with evaluatez2derivs'
+                if pot is MWPotential2014:
+                    assert numpy.fabs(out[6][ii,jj]-potential.evaluateRzderivs(*args,**kwargs)) < 10.**-6., 'evaluate_c does not agree with evaluateRzderivs'
+    # Single quantity returns an array
+    out= potential.evaluate_c(MWPotential2014,Rs,0.1,quantities='Rforce')
+    assert out.shape == Rs.shape, 'evaluate_c does not return an array with the shape of the input'
+    # Errors
+    try:
+        potential.evaluate_c(MWPotential2014,Rs,0.1,quantities='vcirc')
+    except potential.PotentialError: pass
+    else: raise AssertionError('evaluate_c with an unknown quantity did not raise PotentialError')
+    try:
+        potential.evaluate_c(tnp,Rs,0.1)
+    except potential.PotentialError: pass
+    else: raise AssertionError('evaluate_c for a non-axisymmetric potential without phi did not raise PotentialError')
+    return None
+
+def test_CompositePotential():
+    # Test that a CompositePotential behaves like the list of its potentials
+    import pickle
+    from galpy.potential import MWPotential2014
+    cp= potential.CompositePotential(MWPotential2014)
+    assert isinstance(cp,list), 'CompositePotential is not a list'
+    assert len(cp) == 3, 'CompositePotential does not contain all potentials'
+    assert cp.dim == 3, 'CompositePotential does not have the right dimension'
+    assert not cp.isNonAxi, 'CompositePotential of axisymmetric potentials is non-axisymmetric'
+    assert cp.hasC, 'CompositePotential of potentials with C implementations does not have a C implementation'
+    Rs= numpy.linspace(0.3,2.,7)
+    for R in Rs:
+        assert numpy.fabs(potential.evaluatePotentials(cp,R,0.1)-potential.evaluatePotentials(MWPotential2014,R,0.1)) < 10.**-14., 'CompositePotential does not evaluate to the same potential as its list'
+        assert numpy.fabs(potential.evaluateRforces(cp,R,0.1)-potential.evaluateRforces(MWPotential2014,R,0.1)) < 10.**-14., 'CompositePotential does not evaluate to the same Rforce as its list'
+        assert numpy.fabs(potential.evaluatezforces(cp,R,0.1)-potential.evaluatezforces(MWPotential2014,R,0.1)) < 10.**-14., 'CompositePotential does not evaluate to the same zforce as its list'
+        assert numpy.fabs(potential.vcirc(cp,R)-potential.vcirc(MWPotential2014,R)) < 10.**-14., 'CompositePotential does not evaluate to the same vcirc as its list'
+    # Fast path agrees with evaluate_c
+    quants= ['potential','Rforce','zforce','dens']
+    out= cp.evaluate(Rs,0.1,quantities=quants)
+    cout= potential.evaluate_c(MWPotential2014,Rs,0.1,quantities=quants)
+    for o,co in zip(out,cout):
+        assert numpy.all(numpy.fabs(o-co) < 10.**-14.), 'CompositePotential.evaluate does not agree with evaluate_c'
+    assert cp.evaluate(Rs,0.1,quantities='Rforce').shape == Rs.shape, 'CompositePotential.evaluate does not return an array with the shape of the input'
+    # Nested lists are flattened and non-axisymmetry is detected
+    tnp= potential.TriaxialNFWPotential(b=0.8,c=0.6,normalize=0.5)
+    ncp= potential.CompositePotential([cp,[tnp]])
+    assert len(ncp) == 4, 'CompositePotential does not flatten nested lists'
+    assert ncp.isNonAxi, 'CompositePotential with a non-axisymmetric potential is axisymmetric'
+    try:
+        ncp.evaluate(Rs,0.1)
+    except potential.PotentialError: pass
+    else: raise AssertionError('CompositePotential.evaluate for a non-axisymmetric potential without phi did not raise PotentialError')
+    assert numpy.all(numpy.fabs(ncp.evaluate(Rs,0.1,phi=0.3,quantities='phiforce')-potential.evaluate_c(ncp,Rs,0.1,phi=0.3,quantities='phiforce')) < 10.**-14.), 'CompositePotential.evaluate does not agree with evaluate_c'
+    # Conversion to planar and vertical potentials
+    pcp= potential.toPlanarPotential(cp)
+    assert isinstance(pcp,potential.CompositePotential) and pcp.dim == 2, 'toPlanarPotential of a CompositePotential does not return a planar CompositePotential'
+    assert numpy.fabs(potential.evaluateplanarRforces(pcp,1.2)-potential.evaluateRforces(cp,1.2,0.)) < 10.**-14., 'planar CompositePotential does not evaluate to the same Rforce as the 3D CompositePotential'
+    vcp= potential.RZToverticalPotential(cp,1.2)
+    assert isinstance(vcp,potential.CompositePotential) and vcp.dim == 1, 'RZToverticalPotential of a CompositePotential does not return a vertical CompositePotential'
+    # The list of potentials is frozen
+    for func,args in [('append',(tnp,)),('extend',([tnp],)),
+                      ('insert',(0,tnp)),('pop',()),('remove',(cp[0],)),
+                      ('reverse',()),('__setitem__',(0,tnp)),
+                      ('__delitem__',(0,))]:
+        try:
+            getattr(cp,func)(*args)
+        except TypeError: pass
+        else: raise AssertionError('CompositePotential.%s did not raise TypeError' % func)
+    try:
+        cp+= [tnp]
+    except TypeError: pass
+    else: raise AssertionError('Adding to a CompositePotential in place did not raise TypeError')
+    assert len(cp) == 3, 'CompositePotential was changed'
+    # Pickling
+    pcp= pickle.loads(pickle.dumps(cp))
+    assert isinstance(pcp,potential.CompositePotential) and len(pcp) == 3, 'CompositePotential does not survive pickling'
+    assert numpy.fabs(potential.evaluatePotentials(pcp,1.1,0.1)-potential.evaluatePotentials(cp,1.1,0.1)) < 10.**-14., 'Pickled CompositePotential does not evaluate to the same potential'
+    # Errors
+    try:
+        potential.CompositePotential([])
+    except potential.PotentialError: pass
+    else: raise AssertionError('Empty CompositePotential did not raise PotentialError')
+    try:
+        potential.CompositePotential([tnp,tnp.toPlanar()])
+    except potential.PotentialError: pass
+    else: raise AssertionError('CompositePotential of potentials with different dimensions did not raise PotentialError')
+    return None
+
+def test_hessian():
+    # Test that the Hessian agrees with finite differences of the 
+    # rectangular forces
+    from galpy.potential import MWPotential2014
+    tnp= potential.TwoPowerTriaxialPotential(alpha=1.5,beta=3.5,b=0.8,c=0.6,
+                                             normalize=1.)
+    fp= potential.FerrersPotential(a=1.2,b=0.4,c=0.3,n=2,omegab=1.1,pa=0.3,
+                                   normalize=0.3)
+    dwp= potential.DehnenSmoothWrapperPotential(\
+        pot=potential.SoftenedNeedleBarPotential(omegab=1.,normalize=0.3),
+        tform=-2.,tsteady=3.)
+    wep= potential.WilkinsonEvansPotential(Mh=2.,ah=1.3)
+    R= numpy.array([0.5,1.,1.5])
+    z= numpy.array([-0.3,0.1,0.4])
+    phi= numpy.array([0.2,2.,4.])
+    t= numpy.array([-1.,0.,2.])
+    h= 10.**-5.
+    for pot in [MWPotential2014,tnp,fp,dwp,wep,[tnp,wep]]:
+        hess= potential.evaluateHessians(pot,R,z,phi=phi,t=t)
+        assert hess.shape == (3,3,3), 'evaluateHessians does not return an array with shape (N,3,3)'
+        for ii in range(len(R)):
+            xyz= numpy.array([R[ii]*numpy.cos(phi[ii]),R[ii]*numpy.sin(phi[ii]),
+                              z[ii]])
+            for jj in range(3):
+                dxyz= numpy.zeros(3)
+                dxyz[jj]= h
+                fdhess= -(_rectforces(pot,xyz+dxyz,t[ii])
+                          -_rectforces(pot,xyz-dxyz,t[ii]))/2./h
+                assert numpy.all(numpy.fabs(hess[ii,:,jj]-fdhess) < 10.**-5.), 'Hessian does not agree with finite differences of the rectangular forces for %s' % pot
+            assert numpy.all(numpy.fabs(hess[ii]-hess[ii].T) < 10.**-10.), 'Hessian is not symmetric'
+    # The trace of the Hessian is 4 pi G dens
+    hess= potential.evaluateHessians(MWPotential2014,R,z)
+    assert numpy.all(numpy.fabs(numpy.trace(hess,axis1=-2,axis2=-1)
+                                -4.*numpy.pi*potential.evaluateDensities(MWPotential2014,R,z)) < 10.**-8.), 'Trace of the Hessian does not equal 4 pi G dens'
+    # The Hessian method of a single potential, for a scalar and a grid
+    assert fp.hessian(1.,0.1,phi=2.,t=1.).shape == (3,3), 'Potential.hessian does not return a 3x3 array for scalar input'
+    assert numpy.all(numpy.fabs(tnp.hessian(R[:,None],z[None,:],phi=1.)[:,1]
+                                -potential.evaluateHessians(tnp,R,z[1],phi=1.)) < 10.**-10.), 'Potential.hessian does not agree with evaluateHessians'
+    # zphideriv
+    for pot in [tnp,fp]:
+        assert numpy.fabs(pot.zphideriv(1.,0.1,phi=2.,t=1.)+(pot.zforce(1.,0.1,phi=2.+h,t=1.)-pot.zforce(1.,0.1,phi=2.-h,t=1.))/2./h) < 10.**-6., 'zphideriv does not agree with a finite difference of the vertical force'
+        assert numpy.fabs(potential.evaluate_c(pot,1.,0.1,phi=2.,t=1.,
+                                               quantities='zphideriv')
+                          -pot.zphideriv(1.,0.1,phi=2.,t=1.)) < 10.**-6., 'evaluate_c does not agree with zphideriv'
+    assert potential.MiyamotoNagaiPotential().zphideriv(1.,0.1) == 0., 'zphideriv of an axisymmetric potential is not zero'
+    # Errors
+    try:
+        potential.evaluateHessians(tnp,R,z)
+    except potential.PotentialError: pass
+    else: raise AssertionError('evaluateHessians for a non-axisymmetric potential without phi did not raise PotentialError')
+    return None
+
+def _rectforces(pot,xyz,t):
+    R, phi= numpy.sqrt(xyz[0]**2.+xyz[1]**2.), numpy.arctan2(xyz[1],xyz[0])
+    FR= potential.evaluateRforces(pot,R,xyz[2],phi=phi,t=t)
+    Fphi= potential.evaluatephiforces(pot,R,xyz[2],phi=phi,t=t)/R
+    return numpy.array([numpy.cos(phi)*FR-numpy.sin(phi)*Fphi,
+                        numpy.sin(phi)*FR+numpy.cos(phi)*Fphi,
+                        potential.evaluatezforces(pot,R,xyz[2],phi=phi,t=t)])
+
 def test_plotting():
     import tempfile
     #Some tests of the plotting routines, to make sure they don't fail
@@ -2310,6 +2596,34 @@ class mockDehnenBarPotentialTm5(DehnenBarPotential):
                                     barphi=25.*numpy.pi/180.,beta=0.,
                                     tform=-5.,tsteady=4.,
                                     alpha=0.01,Af=0.04)
+from galpy.potential_src.DehnenSmoothWrapperPotential import \
+    planarDehnenSmoothWrapperPotential
+class mockDehnenSmoothBarPotentialT1(planarDehnenSmoothWrapperPotential):
+    def __init__(self):
+        dpn= DehnenBarPotential(omegab=1.9,rb=0.4,
+                                barphi=25.*numpy.pi/180.,beta=0.,
+                                alpha=0.01,Af=0.04)
+        planarDehnenSmoothWrapperPotential.__init__(self,pot=dpn,
+                                                    tform=0.5,tsteady=0.5)
+class mockDehnenSmoothBarPotentialTm1(planarDehnenSmoothWrapperPotential):
+    def __init__(self):
+        dpn= DehnenBarPotential(omegab=1.9,rb=0.6,
+                                barphi=25.*numpy.pi/180.,beta=0.,
+                                alpha=0.01,Af=0.04)
+        planarDehnenSmoothWrapperPotential.__init__(self,pot=dpn,
+                                                    tform=-1.,tsteady=2.)
+class mockDehnenSmoothBarPotentialTm5(planarDehnenSmoothWrapperPotential):
+    def __init__(self):
+        dpn= DehnenBarPotential(omegab=1.9,rb=0.4,
+                                barphi=25.*numpy.pi/180.,beta=0.,
+                                alpha=0.01,Af=0.04)
+        planarDehnenSmoothWrapperPotential.__init__(self,pot=dpn,
+                                                    tform=-5.,tsteady=4.)
+class mockDehnenSmoothSoftenedNeedleBarPotential(potential.DehnenSmoothWrapperPotential):
+    def __init__(self):
+        potential.DehnenSmoothWrapperPotential.__init__(\
+            self,pot=potential.SoftenedNeedleBarPotential(b=0.1,omegab=1.3),
+            tform=-1.,tsteady=2.)
 class mockEllipticalDiskPotentialT1(EllipticalDiskPotential):
     def __init__(self):
         EllipticalDiskPotential.__init__(self,amp=1.,phib=25.*numpy.pi/180.,
@@ -365,6 +365,99 @@ def test_phiforceMatches_nfw():
     scf = SCFPotential(amp=1, Acos=Acos, Asin=Asin)
     assertmsg = "Comparing the azimuth force of NFW Potential with SCF fails at R={0}, Z={1}, phi={2}"
     compareFunctions(nfw.phiforce,scf.phiforce, assertmsg)
+
+## Tests that the vectorized evaluation agrees with a direct, point-by-point summation of the expansion using scipy's Legendre and Gegenbauer functions
+def test_vectorized_matches_direct_summation():
+    from scipy.special import lpmn, eval_gegenbauer, gammaln
+    numpy.random.seed(1)
+    N, L = 5, 4
+    Acos = numpy.tril(numpy.random.normal(size=(N,L,L))); Acos[0,0,0] = 1.
+    Asin = numpy.tril(numpy.random.normal(size=(N,L,L))); Asin[:,:,0] = 0.
+    a = 1.3
+    scf = SCFPotential(amp=2., Acos=Acos, Asin=Asin, a=a)
+    def direct(R,z,phi,dens):
+        r = numpy.sqrt(R**2.+z**2.); costheta = z/r; xi = (r-a)/(r+a)
+        P = lpmn(L-1,L-1,costheta)[0].T
+        out = 0.
+        for n in range(N):
+            for l in range(L):
+                C = eval_gegenbauer(n,2*l+1.5,xi)
+                if dens:
+                    K = 0.5*n*(n+4*l+3)+(l+1.)*(2*l+1.)
+                    radial = K/numpy.sqrt(numpy.pi)*(a*r)**l/((r/a)*(a+r)**(2*l+3.))*C
+                else:
+                    radial = -numpy.sqrt(4.*numpy.pi)*(a*r)**l/(a+r)**(2*l+1.)*C
+                for m in range(l+1):
+                    NN = numpy.sqrt((2*l+1.)/4./numpy.pi*numpy.exp(gammaln(l-m+1)-gammaln(l+m+1)))*(2.-(m == 0))
+                    out += NN*P[l,m]*radial*(Acos[n,l,m]*numpy.cos(m*phi)+Asin[n,l,m]*numpy.sin(m*phi))
+        return out
+    R = numpy.array([0.3,1.,2.5,0.8]); z = numpy.array([0.2,-0.7,1.1,0.])
+    phi = numpy.array([0.1,2.,-1.,4.])
+    pot = scf(R,z,phi)
+    dens = scf.dens(R,z,phi)
+    Rforce = scf.Rforce(R,z,phi)
+    zforce = scf.zforce(R,z,phi)
+    phiforce = scf.phiforce(R,z,phi)
+    dx = 10.**-6.
+    for ii in range(len(R)):
+        assert numpy.fabs(pot[ii]-direct(R[ii],z[ii],phi[ii],False)) < 10.**-10., "Vectorized SCF potential does not agree with the direct summation"
+        assert numpy.fabs(dens[ii]-direct(R[ii],z[ii],phi[ii],True)) < 10.**-10., "Vectorized SCF density does not agree with the direct summation"
+        assert numpy.fabs(Rforce[ii]+(direct(R[ii]+dx,z[ii],phi[ii],False)-direct(R[ii]-dx,z[ii],phi[ii],False))/2./dx) < 10.**-6., "Vectorized SCF Rforce does not agree with the derivative of the direct summation"
+        assert numpy.fabs(zforce[ii]+(direct(R[ii],z[ii]+dx,phi[ii],False)-direct(R[ii],z[ii]-dx,phi[ii],False))/2./dx) < 10.**-6., "Vectorized SCF zforce does not agree with the derivative of the direct summation"
+        assert numpy.fabs(phiforce[ii]+(direct(R[ii],z[ii],phi[ii]+dx,False)-direct(R[ii],z[ii],phi[ii]-dx,False))/2./dx) < 10.**-6., "Vectorized SCF phiforce does not agree with the derivative of the direct summation"
+    return None
+
+## Tests that the forces are finite on the z axis and continuous there
+def test_force_zaxis():
+    numpy.random.seed(2)
+    Acos = numpy.tril(numpy.random.normal(size=(4,4,4)))*0.1; Acos[0,0,0] = 1.
+    Asin = numpy.tril(numpy.random.normal(size=(4,4,4)))*0.1; Asin[:,:,0] = 0.
+    scf = SCFPotential(Acos=Acos, Asin=Asin)
+    for z in [0.5,-1.5]:
+        assert numpy.fabs(scf.zforce(0.,z,0.)-scf.zforce(10.**-8.,z,0.)) < 10.**-6., "SCF zforce on the z axis is not continuous"
+        assert numpy.isfinite(scf.Rforce(0.,z,0.)), "SCF Rforce on the z axis is not finite"
+    return None
+
+## Tests that large arrays, evaluated in chunks, give the same result as evaluating point by point
+def test_chunked_evaluation():
+    from galpy.potential_src import SCFPotential as scfmodule
+    numpy.random.seed(3)
+    Acos = numpy.tril(numpy.random.normal(size=(3,3,3)))*0.1; Acos[0,0,0] = 1.
+    Asin = numpy.tril(numpy.random.normal(size=(3,3,3)))*0.1; Asin[:,:,0] = 0.
+    scf = SCFPotential(Acos=Acos, Asin=Asin)
+    R = numpy.random.uniform(0.1,2.,(7,5)); z = numpy.random.uniform(-1.,1.,(7,5))
+    phi = numpy.random.uniform(0.,2.*numpy.pi,(7,5))
+    oldchunk = scfmodule._SCF_CHUNK_ELEMENTS
+    scfmodule._SCF_CHUNK_ELEMENTS = 40 # -> chunks of 3 points
+    try:
+        pot = scf(R,z,phi); zforce = scf.zforce(R,z,phi)
+    finally:
+        scfmodule._SCF_CHUNK_ELEMENTS = oldchunk
+    assert pot.shape == R.shape, "Chunked SCF evaluation does not return the shape of the input"
+    assert numpy.all(numpy.fabs(pot-scf(R,z,phi)) < EPS), "Chunked SCF potential evaluation differs from the unchunked one"
+    assert numpy.all(numpy.fabs(zforce-scf.zforce(R,z,phi)) < EPS), "Chunked SCF zforce evaluation differs from the unchunked one"
+    return None
+
+## Tests that evaluate_c computes the density of an SCF potential
+def test_evaluate_c_dens():
+    numpy.random.seed(4)
+    Acos = numpy.tril(numpy.random.normal(size=(4,3,3)))*0.1; Acos[0,0,0] = 1.
+    Asin = numpy.tril(numpy.random.normal(size=(4,3,3)))*0.1; Asin[:,:,0] = 0.
+    scf = SCFPotential(amp=3., Acos=Acos, Asin=Asin, a=0.8)
+    R = numpy.random.uniform(0.1,2.,11); z = numpy.random.uniform(-1.,1.,11)
+    phi = numpy.random.uniform(0.,2.*numpy.pi,11)
+    dens, pot = potential.evaluate_c(scf,R,z,phi=phi,
+                                     quantities=['dens','potential'])
+    assert numpy.all(numpy.fabs(dens-scf.dens(R,z,phi))
+                     < 10.**-10.*numpy.fabs(scf.dens(R,z,phi))), "evaluate_c does not compute the SCF density correctly"
+    assert numpy.all(numpy.fabs(pot-scf(R,z,phi))
+                     < 10.**-10.*numpy.fabs(scf(R,z,phi))), "evaluate_c does not compute the SCF potential correctly"
+    # Also with a potential without a C implementation of the density
+    hp = potential.HernquistPotential(a=0.5)
+    dens = potential.evaluate_c([scf,hp],R,z,phi=phi,quantities='dens')
+    assert numpy.all(numpy.fabs(dens-scf.dens(R,z,phi)-hp.dens(R,z,phi))
+                     < 10.**-10.*numpy.fabs(dens)), "evaluate_c does not compute the density of a list of potentials correctly"
+    return None
  
 ##############GENERIC FUNCTIONS BELOW###############
 
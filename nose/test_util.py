@@ -64,3 +64,39 @@ def test_quadpack():
     int= dblquad(lambda y,x: 4.*x*y,0.,1.,lambda z: 0.,lambda z: 1.)
     assert numpy.fabs(int[0]-1.) < int[1], 'bovy_quadpack.dblquad did not work as expected'
     return None
+
+# Test the vectorized Runge-Kutta integrators on a harmonic oscillator
+def test_rk_harmonic_oscillator():
+    from galpy.util import bovy_rk
+    func= lambda y,t: numpy.concatenate((y[...,1:],-y[...,:1]),axis=-1)
+    ts= numpy.linspace(0.,10.,101)
+    yo= numpy.array([[1.,0.],[0.5,0.3],[2.,-1.]])
+    exact= yo[:,0,None]*numpy.cos(ts)+yo[:,1,None]*numpy.sin(ts)
+    out= bovy_rk.rk4(func,yo,ts,rtol=10.**-8.,atol=10.**-8.)
+    assert numpy.all(numpy.fabs(out[...,0]-exact) < 10.**-6.), 'bovy_rk.rk4 did not work as expected'
+    for integrator in [bovy_rk.dopr54,bovy_rk.dop853]:
+        out, err= integrator(func,yo,ts,rtol=10.**-10.,atol=10.**-10.)
+        assert err == 0, 'bovy_rk.%s returned an error for a simple problem' % integrator.__name__
+        assert numpy.all(numpy.fabs(out[...,0]-exact) < 10.**-8.), 'bovy_rk.%s did not work as expected' % integrator.__name__
+        # Single initial condition
+        out, err= integrator(func,yo[1],ts,rtol=10.**-10.,atol=10.**-10.)
+        assert numpy.all(numpy.fabs(out[:,0]-exact[1]) < 10.**-8.), 'bovy_rk.%s did not work as expected for a single initial condition' % integrator.__name__
+    return None
+
+# Test that an orbit for which the derivative becomes NaN does not stall the
+# integration of the other orbits
+def test_rk_nan_orbit():
+    from galpy.util import bovy_rk
+    def func(y,t):
+        out= numpy.concatenate((y[...,1:],-y[...,:1]),axis=-1)
+        out[1]= numpy.where(t > 2.,numpy.nan,out[1])
+        return out
+    ts= numpy.linspace(0.,10.,101)
+    yo= numpy.array([[1.,0.],[0.5,0.3],[2.,-1.]])
+    exact= yo[:,0,None]*numpy.cos(ts)+yo[:,1,None]*numpy.sin(ts)
+    for integrator in [bovy_rk.dopr54,bovy_rk.dop853]:
+        out, err= integrator(func,yo,ts)
+        assert err == 2, 'bovy_rk.%s did not flag a failed orbit' % integrator.__name__
+        assert numpy.all(numpy.isnan(out[1,-1])), 'bovy_rk.%s did not set the output of a failed orbit to NaN' % integrator.__name__
+        assert numpy.all(numpy.fabs(out[[0,2],:,0]-exact[[0,2]]) < 10.**-6.), 'bovy_rk.%s did not integrate the other orbits correctly when one orbit failed' % integrator.__name__
+    return None
@@ -112,6 +112,8 @@ orbit_int_c_src.extend(glob.glob('galpy/util/interp_2d/*.c'))
 orbit_libraries=['m']
 if float(gsl_version[0]) >= 1.:
     orbit_libraries.extend(['gsl','gslcblas'])
+if 'gomp' in pot_libraries: # orbits are integrated in parallel with OpenMP
+    orbit_libraries.append('gomp')
 
 orbit_include_dirs= ['galpy/util',
                      'galpy/util/interp_2d',